@@ -0,0 +1,10 @@
+"""
+Micro benchmarks of the telemetry hot paths.
+
+Run the benchmarks from the root of the repository with
+
+    python -m benchmarks run
+    python -m benchmarks compare benchmarks/baselines/baseline.json
+
+See benchmarks/README.rst.
+"""
@@ -0,0 +1,116 @@
+"""
+Command line interface of the benchmarks.
+
+Usage
+
+    python -m benchmarks run [-k PATTERN] [--repeat N] [--save FILE]
+    python -m benchmarks compare BASELINE [--current FILE] [--threshold 0.25]
+
+`run` prints the time per call of each benchmark and optionally saves the
+results as json. `compare` compares the results with a saved baseline, the
+benchmarks are run when no current results file is given. The command exits
+with status 1 when a benchmark is slower than the baseline by more than the
+threshold. Both commands exit with status 1 when a benchmark exceeds its
+time budget.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .runner import (
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    BenchmarkResult,
+    check_budgets,
+    compare_results,
+    run_benchmarks,
+)
+
+
+def _print_result(name: str, result: BenchmarkResult) -> None:
+    print(f"{name:<50} {result.min_ns:>14,.0f} ns {result.median_ns:>14,.0f} ns")
+
+
+def _run(args: argparse.Namespace) -> Dict[str, Any]:
+    print(f"{'benchmark':<50} {'min':>17} {'median':>17}")
+    results = run_benchmarks(args.k, args.repeat, report=_print_result)
+    if getattr(args, "save", None):
+        Path(args.save).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"results saved in {args.save}")
+    return results
+
+
+def _check_budgets(current: Dict[str, Any]) -> int:
+    over_budget = check_budgets(current)
+    for comparison in over_budget:
+        print(
+            f"{comparison.name:<50} {comparison.current_ns:>14,.0f} ns "
+            f"over the budget of {comparison.baseline_ns:,.0f} ns"
+        )
+    if over_budget:
+        print(f"\n{len(over_budget)} benchmark(s) over their budget")
+        return 1
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(Path(args.baseline).read_text())
+    if args.current:
+        current = json.loads(Path(args.current).read_text())
+    else:
+        current = _run(args)
+
+    print(f"\n{'benchmark':<50} {'baseline':>17} {'current':>17} {'ratio':>7}")
+    regressions = []
+    for comparison in compare_results(baseline, current):
+        is_regression = comparison.is_regression(args.threshold)
+        if is_regression:
+            regressions.append(comparison.name)
+        print(
+            f"{comparison.name:<50} {comparison.baseline_ns:>14,.0f} ns "
+            f"{comparison.current_ns:>14,.0f} ns {comparison.ratio:>6.2f}x"
+            f"{'  REGRESSION' if is_regression else ''}"
+        )
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than the baseline")
+        return 1
+    return _check_budgets(current)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    sub_parsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub_parsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--save", help="json file to save the results in")
+
+    compare_parser = sub_parsers.add_parser(
+        "compare", help="compare the benchmarks with a baseline"
+    )
+    compare_parser.add_argument("baseline", help="json file with the baseline")
+    compare_parser.add_argument(
+        "--current", help="json file with the results, runs the benchmarks if omitted"
+    )
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown before a benchmark is a regression",
+    )
+
+    for sub_parser in (run_parser, compare_parser):
+        sub_parser.add_argument("-k", default="*", help="glob pattern of benchmarks")
+        sub_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return _check_budgets(_run(args))
+    return _compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""Benchmarks of adding up telemetry models."""
+
+from typing import Any, Callable
+
+from pipeline_telemetry.data_classes import TelemetryModel
+
+from .data import TELEMETRY_MODEL_PARAMS, telemetry_model
+from .runner import benchmark
+
+TIMED = Callable[[], Any]
+
+
+@benchmark(number=1000)
+def telemetry_model_add() -> TIMED:
+    aggregated_telemetry = TelemetryModel(**TELEMETRY_MODEL_PARAMS)
+    telemetry_to_add = telemetry_model()
+    return lambda: aggregated_telemetry + telemetry_to_add
+
+
+@benchmark(number=1000)
+def telemetry_data_add() -> TIMED:
+    telemetry_data = telemetry_model().telemetry
+    sub_process_data, sub_process_data_to_add = (
+        telemetry_data["RETRIEVE_RAW_DATA"].copy_counters(),
+        telemetry_data["RETRIEVE_RAW_DATA"],
+    )
+    return lambda: sub_process_data + sub_process_data_to_add
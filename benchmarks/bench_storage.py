@@ -0,0 +1,77 @@
+"""
+Benchmarks of the in memory storage and of the daily aggregation of
+NR_OF_RECORDS telemetry records.
+"""
+
+import json
+from datetime import timedelta
+from typing import Any, Callable, Iterator
+
+from pipeline_telemetry import DailyAggregator, TelemetrySelector
+from pipeline_telemetry.storage.memory import TelemetryInMemoryStorage
+
+from .data import AGGREGATION_DAY, TELEMETRY_MODEL_PARAMS, telemetry_models_of_a_day
+from .runner import benchmark
+
+TIMED = Callable[[], Any]
+
+SELECT_PARAMS = TELEMETRY_MODEL_PARAMS | {
+    "from_date_time": AGGREGATION_DAY,
+    "to_date_time": AGGREGATION_DAY + timedelta(days=1),
+}
+
+
+def _storage_with_a_day_of_telemetry() -> TelemetryInMemoryStorage:
+    """Returns a new in memory storage with the telemetry models of a day."""
+    TelemetryInMemoryStorage.close_db()
+    storage = TelemetryInMemoryStorage()
+    storage.store_telemetry_batch(telemetry_models_of_a_day())
+    return storage
+
+
+@benchmark(number=1000)
+def in_memory_store_telemetry() -> Iterator[TIMED]:
+    TelemetryInMemoryStorage.close_db()
+    storage = TelemetryInMemoryStorage()
+    telemetry = telemetry_models_of_a_day()[0]
+    yield lambda: storage.store_telemetry(telemetry)
+    TelemetryInMemoryStorage.close_db()
+
+
+@benchmark(number=20)
+def in_memory_select_records() -> Iterator[TIMED]:
+    storage = _storage_with_a_day_of_telemetry()
+    yield lambda: list(storage.select_records(**SELECT_PARAMS))
+    TelemetryInMemoryStorage.close_db()
+
+
+@benchmark(number=1000)
+def telemetry_storage_to_object() -> Iterator[TIMED]:
+    storage = _storage_with_a_day_of_telemetry()
+    record = next(iter(storage.select_records(**SELECT_PARAMS)))
+    # the method pops the telemetry from the record, so a copy is converted
+    telemetry_json = json.dumps(record["telemetry"])
+    yield lambda: storage._telemetry_storage_to_object(
+        record | {"telemetry": json.loads(telemetry_json)}
+    )
+    TelemetryInMemoryStorage.close_db()
+
+
+@benchmark(number=5)
+def daily_aggregation() -> Iterator[TIMED]:
+    storage = _storage_with_a_day_of_telemetry()
+    aggregator = DailyAggregator(
+        telemetry_selector=TelemetrySelector(
+            **{
+                key: value
+                for key, value in TELEMETRY_MODEL_PARAMS.items()
+                if key != "telemetry_type"
+            }
+        ),
+        telemetry_storage=storage,
+    )
+    start_date = AGGREGATION_DAY.date()
+    yield lambda: aggregator.aggregate(
+        start_date=start_date, end_date=start_date + timedelta(days=1)
+    )
+    TelemetryInMemoryStorage.close_db()
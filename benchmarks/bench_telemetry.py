@@ -0,0 +1,85 @@
+"""Benchmarks of creating a Telemetry object and increasing its counters."""
+
+from typing import Any, Callable, Iterator
+
+from pipeline_telemetry import Telemetry, TelemetryMixin, add_telemetry
+from pipeline_telemetry.switch import telemetry_disabled
+
+from .data import (
+    API_RESPONSE,
+    SUB_PROCESS,
+    TELEMETRY_COUNTER,
+    TELEMETRY_PARAMS,
+    TELEMETRY_RULES,
+)
+from .runner import benchmark
+
+TIMED = Callable[[], Any]
+
+
+@benchmark(number=200)
+def telemetry_init() -> TIMED:
+    return lambda: Telemetry(**TELEMETRY_PARAMS)
+
+
+@benchmark(number=200)
+def telemetry_init_with_rules() -> TIMED:
+    return lambda: Telemetry(telemetry_rules=TELEMETRY_RULES, **TELEMETRY_PARAMS)
+
+
+@benchmark(number=10_000)
+def increase_sub_process_base_count() -> TIMED:
+    telemetry = Telemetry(**TELEMETRY_PARAMS)
+    return lambda: telemetry.increase_sub_process_base_count(SUB_PROCESS)
+
+
+@benchmark(number=10_000)
+def increase_sub_process_fail_count() -> TIMED:
+    telemetry = Telemetry(**TELEMETRY_PARAMS)
+    return lambda: telemetry.increase_sub_process_fail_count(SUB_PROCESS)
+
+
+@benchmark(number=10_000)
+def increase_sub_process_custom_count() -> TIMED:
+    telemetry = Telemetry(**TELEMETRY_PARAMS)
+    return lambda: telemetry.increase_sub_process_custom_count("items", SUB_PROCESS)
+
+
+@benchmark(number=10_000)
+def increase_io_time() -> TIMED:
+    telemetry = Telemetry(**TELEMETRY_PARAMS)
+    return lambda: telemetry.increase_io_time(0.01)
+
+
+@benchmark(number=1000)
+def add_with_telemetry_rules() -> TIMED:
+    telemetry = Telemetry(telemetry_rules=TELEMETRY_RULES, **TELEMETRY_PARAMS)
+    return lambda: telemetry.add(SUB_PROCESS, API_RESPONSE, errors=[])
+
+
+class _Pipeline(TelemetryMixin):
+    @add_telemetry(TELEMETRY_PARAMS)
+    def handle_request(self) -> None:
+        pass
+
+
+@benchmark(number=10_000)
+def telemetry_counter_add_to() -> TIMED:
+    pipeline = _Pipeline()
+    pipeline._telemetry = Telemetry(**TELEMETRY_PARAMS)
+    return lambda: TELEMETRY_COUNTER.add_to(pipeline)
+
+
+@benchmark(number=200)
+def decorated_method() -> TIMED:
+    return _Pipeline().handle_request
+
+
+# a decorated method of a disabled process type must stay a near direct call
+DISABLED_OVERHEAD_BUDGET_NS = 2000
+
+
+@benchmark(number=10_000, budget_ns=DISABLED_OVERHEAD_BUDGET_NS)
+def disabled_decorated_method() -> Iterator[TIMED]:
+    with telemetry_disabled():
+        yield _Pipeline().handle_request
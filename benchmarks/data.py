@@ -0,0 +1,76 @@
+"""Module with the data used by the benchmarks."""
+
+from datetime import datetime, timedelta
+from typing import List
+
+from pipeline_telemetry import ProcessTypes, TelemetryCounter
+from pipeline_telemetry.data_classes import TelemetryData, TelemetryModel
+from pipeline_telemetry.settings import settings as st
+
+SUB_PROCESS = "RETRIEVE_RAW_DATA"
+
+TELEMETRY_PARAMS = {
+    "category": "WEATHER",
+    "sub_category": "DAILY_PREDICTIONS",
+    "source_name": "load_weather_data",
+    "process_type": ProcessTypes.CREATE_DATA_FROM_URL,
+}
+
+TELEMETRY_MODEL_PARAMS = {
+    "telemetry_type": st.SINGLE_TELEMETRY_TYPE,
+    "category": "WEATHER",
+    "sub_category": "DAILY_PREDICTIONS",
+    "source_name": "load_weather_data",
+    "process_type": ProcessTypes.CREATE_DATA_FROM_URL.name,
+}
+
+TELEMETRY_RULES = {
+    SUB_PROCESS: {
+        "has_key": {"field_name": "data.items"},
+        "validate_entries": {"field_name": "data.items", "expected_count": 25},
+        "entries_have_key": {"field_name": "data.items", "must_have_key": "id"},
+    }
+}
+
+# api response with 25 items of which one item has no id
+API_RESPONSE = {
+    "data": {
+        "items": [{"id": nr, "temperature": 20.5} for nr in range(24)]
+        + [{"temperature": 20.5}]
+    }
+}
+
+TELEMETRY_COUNTER = TelemetryCounter(
+    process_type=ProcessTypes.CREATE_DATA_FROM_URL,
+    sub_process=SUB_PROCESS,
+    counter_name="items",
+)
+
+# nr of telemetry records of a day in the aggregation benchmarks
+NR_OF_RECORDS = 500
+
+AGGREGATION_DAY = datetime(2024, 1, 1)
+
+
+def telemetry_model(start_date_time: datetime = AGGREGATION_DAY) -> TelemetryModel:
+    """Returns a telemetry model with counters for two sub processes."""
+    return TelemetryModel(
+        start_date_time=start_date_time,
+        run_time_in_seconds=1.5,
+        telemetry={
+            SUB_PROCESS: TelemetryData(
+                base_counter=10,
+                fail_counter=1,
+                counters={"items": 250},
+                errors={"ENTRY_HAS_NO_KEY": 10},
+            ),
+            "DATA_STORAGE": TelemetryData(base_counter=10),
+        },
+        **TELEMETRY_MODEL_PARAMS,
+    )
+
+
+def telemetry_models_of_a_day() -> List[TelemetryModel]:
+    """Returns NR_OF_RECORDS telemetry models spread over AGGREGATION_DAY."""
+    step = timedelta(days=1) / NR_OF_RECORDS
+    return [telemetry_model(AGGREGATION_DAY + nr * step) for nr in range(NR_OF_RECORDS)]
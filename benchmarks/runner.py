@@ -0,0 +1,185 @@
+"""
+Module to run the benchmarks and compare the results with a baseline.
+
+A benchmark is a setup function decorated with `benchmark`. The setup function
+prepares the data and returns the callable that is timed, so the setup is not
+part of the measured time. A setup function that needs to clean up after the
+benchmark yields the callable instead. The benchmarks are defined in the
+bench_*.py modules of this package.
+
+functions:
+    - benchmark: decorator to register a benchmark
+    - run_benchmarks: runs the registered benchmarks
+    - compare_results: compares benchmark results with a baseline
+    - check_budgets: returns the benchmarks that exceed their time budget
+"""
+
+import importlib
+import pkgutil
+import platform
+import statistics
+import sys
+import timeit
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatch
+from typing import Any, Callable, Dict, Generator, List, Optional
+
+DEFAULT_REPEAT = 5
+# max slowdown of a benchmark compared to the baseline, 0.25 is 25% slower
+DEFAULT_THRESHOLD = 0.25
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """Dataclass with a registered benchmark."""
+
+    name: str
+    # returns or yields the callable to time
+    setup: Callable[[], Any]
+    number: int
+    # max min time per call in nanoseconds, independent of a baseline
+    budget_ns: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Dataclass with the time per call of a benchmark in nanoseconds."""
+
+    min_ns: float
+    median_ns: float
+    number: int
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Dataclass with the comparison of a benchmark result with its baseline."""
+
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(number: int = 1000, budget_ns: Optional[float] = None) -> Callable:
+    """
+    Decorator to register a benchmark. The decorated setup function returns
+    the callable that is timed, the callable is called number times per run.
+    The benchmark is named after the module and the setup function. A
+    benchmark with a budget_ns fails when its min time per call exceeds it.
+    """
+
+    def register(setup: Callable) -> Callable:
+        module_name = setup.__module__.rsplit(".", 1)[-1].removeprefix("bench_")
+        name = f"{module_name}.{setup.__name__}"
+        BENCHMARKS[name] = Benchmark(
+            name=name, setup=setup, number=number, budget_ns=budget_ns
+        )
+        return setup
+
+    return register
+
+
+def load_benchmarks() -> Dict[str, Benchmark]:
+    """Imports the bench_*.py modules to register their benchmarks."""
+    package = importlib.import_module(__package__)
+    for module_info in pkgutil.iter_modules(package.__path__):
+        if module_info.name.startswith("bench_"):
+            importlib.import_module(f"{__package__}.{module_info.name}")
+    return BENCHMARKS
+
+
+def run_benchmark(bench: Benchmark, repeat: int = DEFAULT_REPEAT) -> BenchmarkResult:
+    """Runs a benchmark repeat times and returns the time per call."""
+    setup_result = bench.setup()
+    if not isinstance(setup_result, Generator):
+        return _time(setup_result, bench.number, repeat)
+
+    setup_generator = setup_result
+    try:
+        return _time(next(setup_generator), bench.number, repeat)
+    finally:
+        # resume the setup function to clean up
+        next(setup_generator, None)
+
+
+def _time(
+    timed_callable: Callable[[], Any], number: int, repeat: int
+) -> BenchmarkResult:
+    """Returns the min and median time per call of repeat runs."""
+    run_times = timeit.repeat(timed_callable, number=number, repeat=repeat)
+    times_per_call = [run_time / number * 1e9 for run_time in run_times]
+    return BenchmarkResult(
+        min_ns=min(times_per_call),
+        median_ns=statistics.median(times_per_call),
+        number=number,
+    )
+
+
+def run_benchmarks(
+    pattern: str = "*",
+    repeat: int = DEFAULT_REPEAT,
+    report: Optional[Callable[[str, BenchmarkResult], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Runs the benchmarks with a name that matches pattern and returns the
+    results with the python version and platform they were measured on.
+    """
+    results: Dict[str, Any] = {}
+    for name, bench in sorted(load_benchmarks().items()):
+        if not fnmatch(name, pattern):
+            continue
+        result = run_benchmark(bench, repeat)
+        if report:
+            report(name, result)
+        results[name] = asdict(result)
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any]
+) -> List[Comparison]:
+    """
+    Compares the min time per call of the benchmarks in both baseline and
+    current. The min time is the least disturbed by other processes.
+    """
+    baseline_results = baseline["results"]
+    return [
+        Comparison(
+            name=name,
+            baseline_ns=baseline_results[name]["min_ns"],
+            current_ns=result["min_ns"],
+        )
+        for name, result in sorted(current["results"].items())
+        if name in baseline_results
+    ]
+
+
+def check_budgets(current: Dict[str, Any]) -> List[Comparison]:
+    """
+    Returns the benchmarks in current with a min time per call above the
+    budget_ns of the registered benchmark.
+    """
+    benchmarks = load_benchmarks()
+    over_budget = []
+    for name, result in sorted(current["results"].items()):
+        budget_ns = benchmarks[name].budget_ns if name in benchmarks else None
+        if budget_ns is not None and result["min_ns"] > budget_ns:
+            over_budget.append(
+                Comparison(
+                    name=name, baseline_ns=budget_ns, current_ns=result["min_ns"]
+                )
+            )
+    return over_budget
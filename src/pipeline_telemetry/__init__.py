@@ -29,25 +29,50 @@ Arguments
         is added to the telemetry object. With these rules you can define custom
         conditional counts and errors that can be applied to the provided data.
         See telemetry rules section for more detail
-    -
+    - sampling_policies (dict):
+        optional sampling policy per sub process. Only the sampled data of
+        these sub processes is validated with the telemetry rules and the
+        error counts are extrapolated.
+    - parallel_validation (ParallelValidation):
+        optional executor to validate the entries of large list fields in
+        chunks.
 
 decorators:
     - add_mongo_telemetry: Add telemetry
     - add_mongo_single_usage_telemetry: Add single usage telemetry
+    - add_async_telemetry: Add telemetry to coroutine methods
+    - add_async_single_usage_telemetry: Add single usage telemetry to coroutine
+      methods
+
+Telemetry can be switched off globally or per process type with
+disable_telemetry, the decorators then call the method directly and the
+helpers use the NULL_TELEMETRY object.
 
 """
 
 from errors import ListErrors
 
 from .aggregator import (
+    AggregationResult,
+    AggregationRunner,
+    CascadeResult,
     DailyAggregator,
     DailyMongoAggregator,
+    MonthlyAggregator,
+    MonthlyMongoAggregator,
     PartialToSingleAggregator,
     PartialToSingleMongoAggregator,
+    QuarterlyAggregator,
+    QuarterlyMongoAggregator,
+    RollupCascade,
     TelemetryAggregator,
     TelemetrySelector,
+    WeeklyAggregator,
+    WeeklyMongoAggregator,
 )
 from .decorator import (
+    add_async_single_usage_telemetry,
+    add_async_telemetry,
     add_mongo_single_usage_telemetry,
     add_mongo_telemetry,
     add_single_usage_telemetry,
@@ -63,28 +88,84 @@ from .helper import (
 )
 from .main import Telemetry
 from .mixin import TelemetryMixin
+from .scope import get_active_telemetry, telemetry_scope
 from .settings.data_class import ProcessType, TelemetryCounter
 from .settings.process_type import ProcessTypes, ProcessTypesMeta
 from .settings.settings import BaseEnumerator, DefaultProcessTypes
 from .settings.telemetry_errors import ValidationErrors
+from .storage.asynchronous import (
+    AbstractAsyncExecutorStorage,
+    AbstractAsyncTelemetryStorage,
+    TelemetryMongoAsyncStorage,
+)
 from .storage.mongo_bunnet import (
     TelemetryBunnetModel,
     TelemetryBunnetStorage,
     init_database,
 )
-from .validators import DictValidator, EntriesHaveKey, HasKey, ValidateEntries
+from .storage.write_behind import (
+    AbstractWriteBehindStorage,
+    TelemetryMongoWriteBehindStorage,
+    WriteBehindStats,
+)
+from .switch import (
+    NULL_TELEMETRY,
+    NullTelemetry,
+    disable_telemetry,
+    enable_telemetry,
+    is_any_telemetry_disabled,
+    is_telemetry_enabled,
+    telemetry_disabled,
+)
+from .validators import (
+    AbstractSamplingPolicy,
+    ColumnExists,
+    ColumnNotNull,
+    ColumnRowCount,
+    ColumnValuesInRange,
+    ColumnValuesInSet,
+    DictValidator,
+    EntriesHaveKey,
+    FirstThenRateSampling,
+    FixedRateSampling,
+    HasKey,
+    ParallelValidation,
+    ReservoirSampling,
+    ValidateEntries,
+)
 
 __all__ = [
+    "AggregationResult",
+    "AggregationRunner",
+    "CascadeResult",
+    "RollupCascade",
     "DailyAggregator",
     "DailyMongoAggregator",
     "PartialToSingleAggregator",
     "PartialToSingleMongoAggregator",
+    "WeeklyAggregator",
+    "WeeklyMongoAggregator",
+    "MonthlyAggregator",
+    "MonthlyMongoAggregator",
+    "QuarterlyAggregator",
+    "QuarterlyMongoAggregator",
     "TelemetryAggregator",
     "TelemetrySelector",
+    "add_async_single_usage_telemetry",
+    "add_async_telemetry",
     "add_mongo_single_usage_telemetry",
     "add_mongo_telemetry",
     "add_single_usage_telemetry",
     "add_telemetry",
+    "get_active_telemetry",
+    "telemetry_scope",
+    "disable_telemetry",
+    "enable_telemetry",
+    "is_any_telemetry_disabled",
+    "is_telemetry_enabled",
+    "telemetry_disabled",
+    "NullTelemetry",
+    "NULL_TELEMETRY",
     "add_errors_from_return_value",
     "add_telemetry_counters_from_return_value",
     "increase_base_count",
@@ -100,6 +181,17 @@ __all__ = [
     "init_database",
     "TelemetryBunnetModel",
     "TelemetryBunnetStorage",
+    "AbstractWriteBehindStorage",
+    "TelemetryMongoWriteBehindStorage",
+    "WriteBehindStats",
+    "AbstractAsyncExecutorStorage",
+    "AbstractAsyncTelemetryStorage",
+    "TelemetryMongoAsyncStorage",
+    "AbstractSamplingPolicy",
+    "FixedRateSampling",
+    "ReservoirSampling",
+    "FirstThenRateSampling",
+    "ParallelValidation",
 ]
 
 ProcessTypes.register_process_types(DefaultProcessTypes)
@@ -108,3 +200,8 @@ ListErrors.register_errors(ValidationErrors)
 DictValidator.register_instruction(ValidateEntries)
 DictValidator.register_instruction(HasKey)
 DictValidator.register_instruction(EntriesHaveKey)
+DictValidator.register_instruction(ColumnExists)
+DictValidator.register_instruction(ColumnNotNull)
+DictValidator.register_instruction(ColumnRowCount)
+DictValidator.register_instruction(ColumnValuesInSet)
+DictValidator.register_instruction(ColumnValuesInRange)
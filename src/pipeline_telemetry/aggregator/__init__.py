@@ -1,10 +1,18 @@
+from .cascade import CascadeResult, RollupCascade
 from .helper import TelemetryAggregator, TelemetrySelector
 from .mongo_aggregator import (
     DailyAggregator,
     DailyMongoAggregator,
+    MonthlyAggregator,
+    MonthlyMongoAggregator,
     PartialToSingleAggregator,
     PartialToSingleMongoAggregator,
+    QuarterlyAggregator,
+    QuarterlyMongoAggregator,
+    WeeklyAggregator,
+    WeeklyMongoAggregator,
 )
+from .runner import AggregationResult, AggregationRunner
 
 __all__ = [
     "TelemetryAggregator",
@@ -13,4 +21,14 @@ __all__ = [
     "DailyMongoAggregator",
     "PartialToSingleAggregator",
     "PartialToSingleMongoAggregator",
+    "WeeklyAggregator",
+    "WeeklyMongoAggregator",
+    "MonthlyAggregator",
+    "MonthlyMongoAggregator",
+    "QuarterlyAggregator",
+    "QuarterlyMongoAggregator",
+    "AggregationResult",
+    "AggregationRunner",
+    "CascadeResult",
+    "RollupCascade",
 ]
@@ -16,20 +16,40 @@ Usage
 """
 
 from abc import ABC
+from bisect import bisect_right
 from datetime import date, datetime, timedelta
-from typing import Iterator, Protocol, Type
+from typing import Iterable, Iterator, List, Optional, Protocol, Type
 
 from pipeline_telemetry.data_classes import TelemetryModel
 from pipeline_telemetry.settings import exceptions
 from pipeline_telemetry.settings import settings as st
-from pipeline_telemetry.settings.date_ranges import DateTimeRange, get_daily_date_ranges
-
-from .helper import TelemetryAggregator, TelemetryListArgs, TelemetrySelector
+from pipeline_telemetry.settings.date_ranges import (
+    DateTimeRange,
+    get_daily_date_ranges,
+    get_monthly_date_ranges,
+    get_quarterly_date_ranges,
+    get_weekly_date_ranges,
+)
+
+from .helper import (
+    TelemetryAggregator,
+    TelemetryListArgs,
+    TelemetryRollupAggregator,
+    TelemetrySelector,
+)
 
 DATE_TIME_RANGE_GENERATOR = {
+    st.SINGLE_TELEMETRY_TYPE: get_daily_date_ranges,
     st.DAILY_AGGR_TELEMETRY_TYPE: get_daily_date_ranges,
+    st.WEEKLY_AGGR_TELEMETRY_TYPE: get_weekly_date_ranges,
+    st.MONTHLY_AGGR_TELEMETRY_TYPE: get_monthly_date_ranges,
+    st.QUARTERLY_AGGR_TELEMETRY_TYPE: get_quarterly_date_ranges,
 }
 
+# smallest step after the watermark, used to select only the telemetry objects
+# with a start_date_time after the watermark in an incremental aggregation
+WATERMARK_STEP = timedelta(microseconds=1)
+
 
 class TelemetryStorage(Protocol):
     def telemetry_list(
@@ -48,10 +68,77 @@ class TelemetryStorage(Protocol):
         """
         ...
 
+    def aggregation_count(
+        self,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> int:
+        """
+        Method to return the base counter of the aggregation stats of the
+        aggregation of the telemetry records selected with the provided
+        arguments, counted in the database.
+        """
+        ...
+
     def store_telemetry(self, telemetry: TelemetryModel) -> None:
         """public method to persist telemetry object"""
         ...
 
+    def store_telemetry_batch(self, telemetry_list: Iterable[TelemetryModel]) -> None:
+        """public method to persist multiple telemetry objects"""
+        ...
+
+    def store_aggregated_telemetry(self, telemetry: TelemetryModel) -> None:
+        """public method to persist and replace an aggregated telemetry object"""
+        ...
+
+    def store_aggregated_telemetry_batch(
+        self, telemetry_list: Iterable[TelemetryModel]
+    ) -> None:
+        """public method to persist and replace multiple aggregated telemetry objects"""
+        ...
+
+
+class AggregatingTelemetryStorage(TelemetryStorage, Protocol):
+    def aggregate_telemetry(
+        self,
+        telemetry: TelemetryModel,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> TelemetryModel:
+        """
+        Method to add up the telemetry records selected with the provided
+        arguments in the database and add the result to telemetry.
+        """
+        ...
+
+    def aggregate_telemetry_per_date_time_range(
+        self,
+        telemetry: TelemetryModel,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        date_time_ranges: List[DateTimeRange],
+    ) -> List[TelemetryModel]:
+        """
+        Method to add up the telemetry records per date time range in the
+        database with a single query. Returns a copy of telemetry with the
+        aggregation result for each date time range.
+        """
+        ...
+
 
 class AbstractAggregator(ABC):
     """
@@ -68,11 +155,11 @@ class AbstractAggregator(ABC):
 
     FROM_TELEMETRY_TYPE: str
     TO_TELEMETRY_TYPE: str
+    TELEMETRY_AGGREGATOR: Type[TelemetryAggregator] = TelemetryAggregator
 
     __telemetry_selector: TelemetrySelector
     __target_telemetry: TelemetryModel
     __telemetry_storage: TelemetryStorage
-    __aggregator: Type[TelemetryAggregator] = TelemetryAggregator
 
     def __init__(
         self, telemetry_selector: TelemetrySelector, telemetry_storage: TelemetryStorage
@@ -89,14 +176,223 @@ class AbstractAggregator(ABC):
     def storage_class(self):
         return self.__telemetry_storage
 
-    def aggregate(self, start_date: date, end_date: date) -> None:
-        """Method to run all aggregations in the given time period."""
+    def aggregate(
+        self,
+        start_date: date,
+        end_date: date,
+        single_query: bool = False,
+        incremental: bool = False,
+    ) -> None:
+        """Method to run all aggregations in the given time period.
+
+        Args:
+            start_date (date): first date in the aggregation period
+            end_date (date): end date of the aggregation period (not included)
+            single_query (bool):
+                When True all telemetry objects in the period are retrieved
+                with a single query and all aggregations are stored with a
+                single bulk upsert. Otherwise a query and a write is done for
+                each aggregation.
+            incremental (bool):
+                When True only the telemetry objects with a start_date_time
+                after the watermark of an existing aggregation are added to
+                that aggregation, which then replaces the stored aggregation.
+                The full aggregation is run again when the number of stored
+                telemetry objects up to the watermark changed, i.e. when
+                telemetry objects were stored late.
+                Aggregations without new telemetry objects are not stored
+                again. single_query is not used in incremental mode.
+        """
         date_time_ranges = self._get_date_ranges(
             start_date=start_date, end_date=end_date
         )
+        if incremental:
+            self._aggregate_incremental(date_time_ranges)
+            return
+
+        if single_query:
+            self._aggregate_with_single_query(list(date_time_ranges))
+            return
+
+        for date_time_range in date_time_ranges:
+            aggregated_telemetry = self._run_aggregation(date_time_range)
+            self.__telemetry_storage.store_aggregated_telemetry(aggregated_telemetry)
+
+    def aggregate_date_time_range(
+        self, date_time_range: DateTimeRange, incremental: bool = False
+    ) -> Optional[TelemetryModel]:
+        """
+        Method to run the aggregation for a single date time range and return
+        the aggregated telemetry model without storing it.
+
+        Returns:
+            Optional[TelemetryModel]:
+                the aggregated telemetry model or, in incremental mode, None
+                when the stored aggregation did not change
+        """
+        if incremental:
+            return self._run_incremental_aggregation(date_time_range)
+        return self._run_aggregation(date_time_range)
+
+    def _aggregate_incremental(self, date_time_ranges: Iterable[DateTimeRange]) -> None:
+        """
+        Method to run and store the incremental aggregation for each date time
+        range that has new telemetry objects.
+        """
         for date_time_range in date_time_ranges:
+            aggregated_telemetry = self._run_incremental_aggregation(date_time_range)
+            if aggregated_telemetry:
+                self.__telemetry_storage.store_aggregated_telemetry(
+                    aggregated_telemetry
+                )
+
+    def _run_incremental_aggregation(
+        self, date_time_range: DateTimeRange
+    ) -> Optional[TelemetryModel]:
+        """
+        Method to add the telemetry objects after the watermark of the existing
+        aggregation to that aggregation. Without an existing aggregation (or
+        one without watermark) the full aggregation is run, as it is when
+        telemetry objects up to the watermark were stored late.
+
+        Returns:
+            Optional[TelemetryModel]:
+                the aggregated telemetry model or None when there are no new
+                telemetry objects to add to the existing aggregation
+        """
+        existing_telemetry = self._existing_aggregated_telemetry(date_time_range)
+        if not existing_telemetry or not existing_telemetry.watermark:
             aggregated_telemetry = self._run_aggregation(date_time_range)
-            self.__telemetry_storage.store_telemetry(aggregated_telemetry)
+            if existing_telemetry and not aggregated_telemetry.watermark:
+                # the stored aggregation of a period without telemetry
+                return None
+            return aggregated_telemetry
+
+        watermark = existing_telemetry.watermark
+        if self._has_late_telemetry(existing_telemetry, watermark, date_time_range):
+            return self._run_aggregation(date_time_range)
+
+        aggregated_telemetry = self._run_aggregation(
+            DateTimeRange(
+                from_date=watermark + WATERMARK_STEP, to_date=date_time_range.to_date
+            ),
+            initial_telemetry=existing_telemetry,
+        )
+        if aggregated_telemetry.watermark == watermark:
+            return None
+
+        return self._set_start_date_time_for_aggregated_telemetry(
+            aggregated_telemetry, date_time_range
+        )
+
+    def _has_late_telemetry(
+        self,
+        existing_telemetry: TelemetryModel,
+        watermark: datetime,
+        date_time_range: DateTimeRange,
+    ) -> bool:
+        """
+        Method to check if telemetry objects with a start_date_time up to the
+        watermark were stored after the existing aggregation. These telemetry
+        objects are not selected after the watermark, so the aggregation count
+        of the telemetry objects up to the watermark is compared with the base
+        counter of the aggregation stats of the existing aggregation.
+        """
+        aggregation_data = existing_telemetry.telemetry.get(st.AGGREGATION_KEY)
+        aggregated_count = aggregation_data.base_counter if aggregation_data else 0
+        aggregation_count = self._aggregation_count(
+            DateTimeRange(
+                from_date=date_time_range.from_date,
+                to_date=watermark + WATERMARK_STEP,
+            )
+        )
+        return aggregation_count != aggregated_count
+
+    def _aggregation_count(self, date_time_range: DateTimeRange) -> int:
+        """
+        Method to return the base counter of the aggregation stats of an
+        aggregation of the date time range, counted by the storage class.
+        """
+        telemetry_list_params = self._telememtry_list_params(date_time_range)._asdict()
+        return self.__telemetry_storage.aggregation_count(**telemetry_list_params)
+
+    def _existing_aggregated_telemetry(
+        self, date_time_range: DateTimeRange
+    ) -> Optional[TelemetryModel]:
+        """
+        Method to return the stored aggregation for the date time range, if
+        any. Aggregations are stored with the from_date of their date time
+        range as start_date_time.
+        """
+        telemetry_list_params = self._telememtry_list_params(date_time_range)._asdict()
+        telemetry_list_params[st.TELEMETRY_TYPE_KEY] = self.TO_TELEMETRY_TYPE
+        for telemetry in self.__telemetry_storage.telemetry_list(
+            **telemetry_list_params
+        ):
+            if telemetry.start_date_time == date_time_range.from_date:
+                return telemetry
+        return None
+
+    def _aggregate_with_single_query(
+        self, date_time_ranges: List[DateTimeRange]
+    ) -> None:
+        """
+        Method to run and store the aggregations for all date time ranges with
+        a single query and a single bulk upsert.
+        """
+        if not date_time_ranges:
+            return
+
+        aggregated_telemetry_list = self._run_aggregation_per_date_time_range(
+            date_time_ranges
+        )
+        self.__telemetry_storage.store_aggregated_telemetry_batch(
+            self._set_start_date_time_for_aggregated_telemetry(
+                aggregated_telemetry, date_time_range
+            )
+            for aggregated_telemetry, date_time_range in zip(
+                aggregated_telemetry_list, date_time_ranges
+            )
+        )
+
+    def _run_aggregation_per_date_time_range(
+        self, date_time_ranges: List[DateTimeRange]
+    ) -> List[TelemetryModel]:
+        """
+        Method to retrieve all telemetry objects for the consecutive
+        date_time_ranges with one query and add each of them to the aggregated
+        telemetry model of the date time range it belongs to.
+
+        Returns:
+            List[TelemetryModel]:
+                aggregated telemetry model for each date time range
+        """
+        query_date_time_range = DateTimeRange(
+            from_date=date_time_ranges[0].from_date,
+            to_date=date_time_ranges[-1].to_date,
+        )
+        telemetry_list_params = self._telememtry_list_params(
+            query_date_time_range
+        )._asdict()
+        telemetry_objects = self.__telemetry_storage.telemetry_list(
+            **telemetry_list_params
+        )
+
+        aggregators = [
+            self.TELEMETRY_AGGREGATOR(self.__target_telemetry.telemetry_copy())
+            for _ in date_time_ranges
+        ]
+        from_date_times = [
+            date_time_range.from_date for date_time_range in date_time_ranges
+        ]
+        for telemetry in telemetry_objects:
+            start_date_time = telemetry.start_date_time
+            index = bisect_right(from_date_times, start_date_time) - 1
+            if index < 0 or start_date_time >= date_time_ranges[index].to_date:
+                continue
+            aggregators[index].add(telemetry)
+
+        return [aggregator.telemetry for aggregator in aggregators]
 
     def _get_date_ranges(
         self, start_date: date, end_date: date
@@ -111,9 +407,15 @@ class AbstractAggregator(ABC):
 
         return generator(start_date=start_date, end_date=end_date)
 
-    def _run_aggregation(self, date_time_range: DateTimeRange) -> TelemetryModel:
+    def _run_aggregation(
+        self,
+        date_time_range: DateTimeRange,
+        initial_telemetry: Optional[TelemetryModel] = None,
+    ) -> TelemetryModel:
         """
         Method to run the actual aggregation and return the aggregated telemetry model.
+        The telemetry objects are added to initial_telemetry when provided or
+        else to a copy of the target telemetry model.
         """
         # gather the database instances to be aggregated
         telemetry_list_params = self._telememtry_list_params(date_time_range)._asdict()
@@ -121,8 +423,10 @@ class AbstractAggregator(ABC):
             **telemetry_list_params
         )
 
-        initial_telemetry_obj = self.__target_telemetry.telemetry_copy()
-        aggregator = self.__aggregator(initial_telemetry_obj)
+        initial_telemetry_obj = (
+            initial_telemetry or self.__target_telemetry.telemetry_copy()
+        )
+        aggregator = self.TELEMETRY_AGGREGATOR(initial_telemetry_obj)
         aggregated_telemetry = aggregator.aggregate(telemetry_objects)
 
         return self._set_start_date_time_for_aggregated_telemetry(
@@ -202,7 +506,8 @@ class DailyAggregator(AbstractAggregator):
 class PartialToSingleAggregator(AbstractAggregator):
     """
     Aggregator to aggregate all PARTIAL TELEMETRY objects for a single day
-    into a telemetry objetc of type SINGLE AGGREGATION.
+    into a telemetry objetc of type SINGLE AGGREGATION. The aggregation has
+    the start of the day as start_date_time.
 
     When initializig the class a TelemetrySelector should provided that
     determine which telemnetry objects are in scope
@@ -214,3 +519,76 @@ class PartialToSingleAggregator(AbstractAggregator):
 
     FROM_TELEMETRY_TYPE = st.PARTIAL_AGGR_TELEMETRY_TYPE
     TO_TELEMETRY_TYPE = st.SINGLE_TELEMETRY_TYPE
+
+
+class AbstractRollupAggregator(AbstractAggregator):
+    """
+    Aggregator to roll up the DAILY AGGREGATION objects in a period (week,
+    month, quarter) into a single aggregation for that period instead of
+    adding up all SINGLE TELEMETRY objects again.
+
+    The daily aggregations are added with add_aggregated_telemetry so the
+    result equals the aggregation of all telemetry objects in the period.
+    In incremental mode the period is rolled up again from the daily
+    aggregations and only stored when the watermark changed.
+    """
+
+    FROM_TELEMETRY_TYPE = st.DAILY_AGGR_TELEMETRY_TYPE
+    TELEMETRY_AGGREGATOR = TelemetryRollupAggregator
+
+    def _run_incremental_aggregation(
+        self, date_time_range: DateTimeRange
+    ) -> Optional[TelemetryModel]:
+        """
+        Method to roll up the daily aggregations of the period. Returns None
+        when no daily aggregation was updated since the stored roll up.
+        """
+        # daily aggregations are replaced when updated, so their start date
+        # time can not be used to select only the updated daily aggregations.
+        # Late telemetry changes the counters of a daily aggregation without
+        # changing its watermark, so the counters are compared as well.
+        existing_telemetry = self._existing_aggregated_telemetry(date_time_range)
+        aggregated_telemetry = self._run_aggregation(date_time_range)
+        if (
+            existing_telemetry
+            and existing_telemetry.watermark == aggregated_telemetry.watermark
+            and existing_telemetry.telemetry == aggregated_telemetry.telemetry
+        ):
+            return None
+        return aggregated_telemetry
+
+
+class WeeklyAggregator(AbstractRollupAggregator):
+    """
+    Aggregator to roll up the DAILY AGGREGATION objects of a week (monday to
+    sunday) into a telemetry object of type WEEKLY AGGREGATION.
+
+    - aggregate: makes weekly aggregations for the weeks from start_date to
+      end_date
+    """
+
+    TO_TELEMETRY_TYPE = st.WEEKLY_AGGR_TELEMETRY_TYPE
+
+
+class MonthlyAggregator(AbstractRollupAggregator):
+    """
+    Aggregator to roll up the DAILY AGGREGATION objects of a month into a
+    telemetry object of type MONTHLY AGGREGATION.
+
+    - aggregate: makes monthly aggregations for the months from start_date to
+      end_date
+    """
+
+    TO_TELEMETRY_TYPE = st.MONTHLY_AGGR_TELEMETRY_TYPE
+
+
+class QuarterlyAggregator(AbstractRollupAggregator):
+    """
+    Aggregator to roll up the DAILY AGGREGATION objects of a quarter into a
+    telemetry object of type QUARTERLY AGGREGATION.
+
+    - aggregate: makes quarterly aggregations for the quarters from start_date
+      to end_date
+    """
+
+    TO_TELEMETRY_TYPE = st.QUARTERLY_AGGR_TELEMETRY_TYPE
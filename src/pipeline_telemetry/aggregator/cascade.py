@@ -0,0 +1,395 @@
+"""
+Module to define the RollupCascade class.
+
+The RollupCascade runs a chain of aggregators for a date window in dependency
+order, by default:
+
+PARTIAL AGGREGATION -> SINGLE TELEMETRY -> DAILY AGGREGATION -> WEEKLY,
+MONTHLY and QUARTERLY AGGREGATION
+
+An aggregator depends on the aggregator whose TO_TELEMETRY_TYPE is its
+FROM_TELEMETRY_TYPE. The first levels run incrementally over the date window.
+A higher level only recomputes the periods that contain an aggregation that
+was stored by a lower level during the run. Periods without telemetry are
+not stored. The aggregations stored by a
+level are kept in memory and are used by the next level instead of reading
+them back from the storage.
+
+Usage
+
+>>> cascade = RollupCascade(telemetry_storage=TelemetryInMemoryStorage())
+>>> results = cascade.run(telemetry_selectors, start_date, end_date)
+>>> weekly = results[0].aggregations[st.WEEKLY_AGGR_TELEMETRY_TYPE]
+
+The aggregator classes must take a telemetry_storage (like DailyAggregator or
+DailyMongoPipelineAggregator), the storage specific aggregators like
+DailyMongoAggregator can not be used.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Set,
+    Tuple,
+    Type,
+)
+
+from pipeline_telemetry.data_classes import TelemetryModel
+from pipeline_telemetry.settings import exceptions
+from pipeline_telemetry.settings import settings as st
+from pipeline_telemetry.settings.date_ranges import DateTimeRange
+
+from .aggregator import (
+    DATE_TIME_RANGE_GENERATOR,
+    AbstractAggregator,
+    AbstractRollupAggregator,
+    DailyAggregator,
+    MonthlyAggregator,
+    PartialToSingleAggregator,
+    QuarterlyAggregator,
+    TelemetryStorage,
+    WeeklyAggregator,
+)
+from .helper import TelemetrySelector
+
+DEFAULT_CASCADE_AGGREGATORS: List[Type[AbstractAggregator]] = [
+    PartialToSingleAggregator,
+    DailyAggregator,
+    WeeklyAggregator,
+    MonthlyAggregator,
+    QuarterlyAggregator,
+]
+
+
+def order_aggregator_classes(
+    aggregator_classes: Iterable[Type[AbstractAggregator]],
+) -> List[Type[AbstractAggregator]]:
+    """
+    Returns the aggregator classes ordered such that an aggregator comes
+    after the aggregator that creates its FROM_TELEMETRY_TYPE.
+    """
+    remaining = list(aggregator_classes)
+    ordered: List[Type[AbstractAggregator]] = []
+    while remaining:
+        created_types = {aggregator.TO_TELEMETRY_TYPE for aggregator in remaining}
+        ready = [
+            aggregator
+            for aggregator in remaining
+            if aggregator.FROM_TELEMETRY_TYPE not in created_types
+        ]
+        if not ready:
+            raise exceptions.CircularAggregatorDependency(
+                [aggregator.__name__ for aggregator in remaining]
+            )
+        ordered.extend(ready)
+        remaining = [aggregator for aggregator in remaining if aggregator not in ready]
+    return ordered
+
+
+class CascadeResult(NamedTuple):
+    """Named tuple with the outcome of the cascade for one selector.
+
+    - telemetry_selector: the selector for which the cascade was run
+    - aggregations: the stored aggregations per telemetry type
+    """
+
+    telemetry_selector: TelemetrySelector
+    aggregations: Dict[str, List[TelemetryModel]]
+
+
+class AggregationFilter(NamedTuple):
+    """Named tuple with the fields that select a unique stored aggregation."""
+
+    telemetry_type: str
+    category: str
+    sub_category: str
+    source_name: str
+    process_type: str
+    start_date_time: datetime
+
+    @classmethod
+    def from_telemetry(cls, telemetry: TelemetryModel) -> "AggregationFilter":
+        return cls(
+            telemetry_type=telemetry.telemetry_type,
+            category=telemetry.category,
+            sub_category=telemetry.sub_category,
+            source_name=telemetry.source_name,
+            process_type=telemetry.process_type,
+            start_date_time=telemetry.start_date_time,
+        )
+
+
+class CascadeStorage(TelemetryStorage):
+    """
+    Storage wrapper that keeps the aggregations stored during a cascade in
+    memory, keyed by the filter that selects the unique stored aggregation.
+
+    telemetry_list returns the aggregations from memory when all aggregations
+    of the requested period are in memory. Otherwise the storage is queried
+    and the aggregations in memory replace the stored ones. All other
+    attributes are those of the wrapped storage.
+    """
+
+    __telemetry_storage: TelemetryStorage
+    __aggregations: Dict[AggregationFilter, TelemetryModel]
+
+    def __init__(self, telemetry_storage: TelemetryStorage) -> None:
+        self.__telemetry_storage = telemetry_storage
+        self.__aggregations = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__telemetry_storage, name)
+
+    @property
+    def aggregations(self) -> Dict[str, List[TelemetryModel]]:
+        aggregations: Dict[str, List[TelemetryModel]] = {}
+        for aggregation_filter, telemetry in self.__aggregations.items():
+            aggregations.setdefault(aggregation_filter.telemetry_type, []).append(
+                telemetry
+            )
+        return aggregations
+
+    def stored_date_times(self, telemetry_type: str) -> List[datetime]:
+        """Returns the start_date_time of the stored aggregations."""
+        return [
+            aggregation_filter.start_date_time
+            for aggregation_filter in self.__aggregations
+            if aggregation_filter.telemetry_type == telemetry_type
+        ]
+
+    def store_telemetry(self, telemetry: TelemetryModel) -> None:
+        """public method to persist telemetry object"""
+        self.__telemetry_storage.store_telemetry(telemetry)
+
+    def store_telemetry_batch(self, telemetry_list: Iterable[TelemetryModel]) -> None:
+        """public method to persist multiple telemetry objects"""
+        self.__telemetry_storage.store_telemetry_batch(telemetry_list)
+
+    def store_aggregated_telemetry(self, telemetry: TelemetryModel) -> None:
+        """public method to persist and replace an aggregated telemetry object"""
+        self.__telemetry_storage.store_aggregated_telemetry(telemetry)
+        self.__aggregations[AggregationFilter.from_telemetry(telemetry)] = telemetry
+
+    def store_aggregated_telemetry_batch(
+        self, telemetry_list: Iterable[TelemetryModel]
+    ) -> None:
+        """public method to persist and replace multiple aggregated telemetry objects"""
+        telemetry_list = list(telemetry_list)
+        self.__telemetry_storage.store_aggregated_telemetry_batch(telemetry_list)
+        for telemetry in telemetry_list:
+            self.__aggregations[AggregationFilter.from_telemetry(telemetry)] = telemetry
+
+    def telemetry_list(
+        self,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> Iterator[TelemetryModel]:
+        """
+        Method to return an iteraror TelemetryModel instances from memory and,
+        when not all are in memory, from the storage.
+        """
+        selector = (telemetry_type, category, sub_category, source_name, process_type)
+        in_memory = {
+            aggregation_filter.start_date_time: telemetry
+            for aggregation_filter, telemetry in self.__aggregations.items()
+            if aggregation_filter[:5] == selector
+            and from_date_time <= aggregation_filter.start_date_time < to_date_time
+        }
+        if not self._all_in_memory(
+            telemetry_type, in_memory, from_date_time, to_date_time
+        ):
+            for telemetry in self.__telemetry_storage.telemetry_list(
+                telemetry_type=telemetry_type,
+                category=category,
+                sub_category=sub_category,
+                source_name=source_name,
+                process_type=process_type,
+                from_date_time=from_date_time,
+                to_date_time=to_date_time,
+            ):
+                if telemetry.start_date_time not in in_memory:
+                    yield telemetry
+        yield from in_memory.values()
+
+    def aggregation_count(
+        self,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> int:
+        """
+        Method to return the aggregation count of the storage, the aggregations
+        in memory are also stored in the storage.
+        """
+        return self.__telemetry_storage.aggregation_count(
+            telemetry_type=telemetry_type,
+            category=category,
+            sub_category=sub_category,
+            source_name=source_name,
+            process_type=process_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        )
+
+    @staticmethod
+    def _all_in_memory(
+        telemetry_type: str,
+        in_memory: Dict[datetime, TelemetryModel],
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> bool:
+        """
+        Returns True when the aggregation of every period of telemetry_type
+        from from_date_time to to_date_time is in memory. Telemetry types that
+        are not unique per period (like SINGLE TELEMETRY) are never complete.
+        """
+        if telemetry_type not in st.AGGR_DATE_TIME_RANGE_METHODS:
+            return False
+
+        date_time_ranges = DATE_TIME_RANGE_GENERATOR[telemetry_type](
+            start_date=from_date_time.date(), end_date=to_date_time.date()
+        )
+        return all(
+            date_time_range.from_date in in_memory
+            for date_time_range in date_time_ranges
+        )
+
+
+class RollupCascade:
+    """
+    Class to run a chain of aggregators for a date window in dependency
+    order and only recompute the higher level periods whose input changed.
+
+    public methods:
+    - run: run the cascade for all telemetry selectors
+    """
+
+    __telemetry_storage: TelemetryStorage
+    __aggregator_classes: List[Type[AbstractAggregator]]
+
+    def __init__(
+        self,
+        telemetry_storage: TelemetryStorage,
+        aggregator_classes: Iterable[
+            Type[AbstractAggregator]
+        ] = DEFAULT_CASCADE_AGGREGATORS,
+    ) -> None:
+        """
+        Args:
+            telemetry_storage: storage to read and store the telemetry
+            aggregator_classes:
+                the aggregators to run, in any order. They are run in the
+                order of their FROM_TELEMETRY_TYPE and TO_TELEMETRY_TYPE.
+        """
+        self.__telemetry_storage = telemetry_storage
+        self.__aggregator_classes = order_aggregator_classes(aggregator_classes)
+
+    @property
+    def aggregator_classes(self) -> List[Type[AbstractAggregator]]:
+        return self.__aggregator_classes
+
+    def run(
+        self,
+        telemetry_selectors: Iterable[TelemetrySelector],
+        start_date: date,
+        end_date: date,
+    ) -> List[CascadeResult]:
+        """
+        Runs the cascade from start_date to end_date (not included) for each
+        telemetry selector.
+
+        Returns:
+            List[CascadeResult]:
+                the stored aggregations for each telemetry selector in the
+                order of telemetry_selectors
+        """
+        return [
+            self._run_for_selector(telemetry_selector, start_date, end_date)
+            for telemetry_selector in telemetry_selectors
+        ]
+
+    def _run_for_selector(
+        self, telemetry_selector: TelemetrySelector, start_date: date, end_date: date
+    ) -> CascadeResult:
+        """Runs all aggregators of the cascade for one telemetry selector."""
+        cascade_storage = CascadeStorage(self.__telemetry_storage)
+        created_types: Set[str] = set()
+        for aggregator_class in self.__aggregator_classes:
+            aggregator = aggregator_class(
+                telemetry_selector=telemetry_selector,
+                telemetry_storage=cascade_storage,
+            )
+            for date_time_range, incremental in self._date_time_ranges(
+                aggregator,
+                cascade_storage,
+                aggregator.FROM_TELEMETRY_TYPE in created_types,
+                start_date,
+                end_date,
+            ):
+                aggregated_telemetry = aggregator.aggregate_date_time_range(
+                    date_time_range, incremental=incremental
+                )
+                # periods without telemetry have no watermark and are not stored
+                if aggregated_telemetry and aggregated_telemetry.watermark:
+                    cascade_storage.store_aggregated_telemetry(aggregated_telemetry)
+            created_types.add(aggregator.TO_TELEMETRY_TYPE)
+
+        return CascadeResult(
+            telemetry_selector=telemetry_selector,
+            aggregations=cascade_storage.aggregations,
+        )
+
+    @staticmethod
+    def _date_time_ranges(
+        aggregator: AbstractAggregator,
+        cascade_storage: CascadeStorage,
+        input_created_in_cascade: bool,
+        start_date: date,
+        end_date: date,
+    ) -> List[Tuple[DateTimeRange, bool]]:
+        """
+        Returns the date time ranges to aggregate and whether to aggregate
+        them incrementally.
+
+        The periods that contain an input aggregation that was stored in the
+        cascade are aggregated in full. A roll up of aggregations created in
+        the cascade only aggregates those periods, other aggregators also
+        aggregate all periods of the date window incrementally as they may
+        have new telemetry.
+        """
+        date_time_ranges: Dict[DateTimeRange, bool] = {}
+        if not (
+            input_created_in_cascade
+            and isinstance(aggregator, AbstractRollupAggregator)
+        ):
+            for date_time_range in aggregator._get_date_ranges(
+                start_date=start_date, end_date=end_date
+            ):
+                date_time_ranges[date_time_range] = True
+
+        for date_time in cascade_storage.stored_date_times(
+            aggregator.FROM_TELEMETRY_TYPE
+        ):
+            date_time_range = next(
+                aggregator._get_date_ranges(
+                    start_date=date_time.date(),
+                    end_date=date_time.date() + timedelta(days=1),
+                )
+            )
+            date_time_ranges[date_time_range] = False
+
+        return sorted(date_time_ranges.items())
@@ -22,31 +22,7 @@ Single day date range generators.
 from datetime import datetime
 from typing import NamedTuple, Protocol
 
-from pipeline_telemetry.data_classes import TelemetryModel
-
-
-class TelemetrySelector(NamedTuple):
-    """Named tuple to define mandatory attributed for a Telemetry selection.
-
-    This object should be used as input to the Telemetry Aggregator
-
-    >>> telemetry_selector = TelemetrySelector(
-        category, sub_category, source_name, process_type)
-    >>> aggregator = AggregatorClass(
-            telemetry_selector=telemetry_selector,
-            telemetry_storage=TelemetryStorageClass()
-        )
-
-    The `telemtry_selector` defines what telemetry objects are in scope.
-    The `aggregator` object defines what kind of aggregation is done (by
-    selecting the AggregatorClass) and provides you with metods to run the
-    aggergation for a specific period.
-    """
-
-    category: str
-    sub_category: str
-    source_name: str
-    process_type: str
+from pipeline_telemetry.data_classes import TelemetryModel, TelemetrySelector  # noqa
 
 
 class TelemetryListArgs(NamedTuple):
@@ -71,7 +47,24 @@ class TelemetryAggregator:
     def __init__(self, telemetry: TelemetryModel) -> None:
         self.__telemetry = telemetry
 
+    @property
+    def telemetry(self) -> TelemetryModel:
+        return self.__telemetry
+
+    def add(self, telemetry: TelemetryModel) -> None:
+        self.__telemetry += telemetry
+
     def aggregate(self, telemetry_list: TelemetryList) -> TelemetryModel:
         for telemetry in telemetry_list:
-            self.__telemetry += telemetry
+            self.add(telemetry)
         return self.__telemetry
+
+
+class TelemetryRollupAggregator(TelemetryAggregator):
+    """
+    Aggregator to add up aggregated telemetry objects (for example daily
+    aggregations into a weekly aggregation) with add_aggregated_telemetry.
+    """
+
+    def add(self, telemetry: TelemetryModel) -> None:
+        self.telemetry.add_aggregated_telemetry(telemetry)
@@ -12,19 +12,95 @@ class.
             telemetry_selector=telemetry_selector
         )
 
+The Mongo aggregators add up the telemetry objects with a MongoDB aggregation
+pipeline so that only the aggregated result is retrieved from the database.
+The weekly, monthly and quarterly aggregators roll up the daily aggregations
+of the period, which are few enough to be added up in python.
+
 available classes:
 - DailyMongoAggregator
+- PartialToSingleMongoAggregator
+- WeeklyMongoAggregator
+- MonthlyMongoAggregator
+- QuarterlyMongoAggregator
 
 """
 
 from abc import ABC
+from typing import List, Optional
 
+from pipeline_telemetry.data_classes import TelemetryModel
+from pipeline_telemetry.settings.date_ranges import DateTimeRange
 from pipeline_telemetry.storage import TelemetryMongoStorage
 
-from .aggregator import AbstractAggregator, DailyAggregator, PartialToSingleAggregator
+from .aggregator import (
+    AbstractAggregator,
+    DailyAggregator,
+    MonthlyAggregator,
+    PartialToSingleAggregator,
+    QuarterlyAggregator,
+    WeeklyAggregator,
+)
 from .helper import TelemetrySelector
 
 
+class AbstractMongoPipelineAggregator(AbstractAggregator):
+    """
+    Aggregator that adds up the telemetry objects in the database with the
+    aggregate_telemetry method of the storage class (for example the MongoDB
+    aggregation pipeline of TelemetryMongoStorage) instead of retrieving and
+    adding up all telemetry objects in python. The storage class must
+    implement the AggregatingTelemetryStorage protocol.
+    """
+
+    def _run_aggregation(
+        self,
+        date_time_range: DateTimeRange,
+        initial_telemetry: Optional[TelemetryModel] = None,
+    ) -> TelemetryModel:
+        """
+        Method to run the aggregation in the database and return the aggregated
+        telemetry model.
+        """
+        telemetry_list_params = self._telememtry_list_params(date_time_range)._asdict()
+        aggregated_telemetry = self.storage_class.aggregate_telemetry(
+            telemetry=initial_telemetry or self.target_telemetry.telemetry_copy(),
+            **telemetry_list_params,
+        )
+
+        return self._set_start_date_time_for_aggregated_telemetry(
+            aggregated_telemetry, date_time_range
+        )
+
+    def _run_aggregation_per_date_time_range(
+        self, date_time_ranges: List[DateTimeRange]
+    ) -> List[TelemetryModel]:
+        """
+        Method to run the aggregation for all date_time_ranges with a single
+        query in the database and return the aggregated telemetry models.
+        """
+        telemetry_list_params = self._telememtry_list_params(
+            date_time_ranges[0]
+        )._asdict()
+        telemetry_list_params.pop("from_date_time")
+        telemetry_list_params.pop("to_date_time")
+        return self.storage_class.aggregate_telemetry_per_date_time_range(
+            telemetry=self.target_telemetry.telemetry_copy(),
+            date_time_ranges=date_time_ranges,
+            **telemetry_list_params,
+        )
+
+
+class DailyMongoPipelineAggregator(AbstractMongoPipelineAggregator, DailyAggregator):
+    """DailyAggregator that runs the aggregation in the database."""
+
+
+class PartialToSingleMongoPipelineAggregator(
+    AbstractMongoPipelineAggregator, PartialToSingleAggregator
+):
+    """PartialToSingleAggregator that runs the aggregation in the database."""
+
+
 class AbstractMongoAggregator(ABC):
     """Class to return a DailyAggregator class with TelemetryMongoStorage.
 
@@ -60,7 +136,7 @@ class DailyMongoAggregator(AbstractMongoAggregator):
         )
     """
 
-    AGGREGATOR_CLASS = DailyAggregator
+    AGGREGATOR_CLASS = DailyMongoPipelineAggregator
 
 
 class PartialToSingleMongoAggregator(AbstractMongoAggregator):
@@ -72,4 +148,22 @@ class PartialToSingleMongoAggregator(AbstractMongoAggregator):
     to TelemetryMongoStorage and can not be provided as argument.
     """
 
-    AGGREGATOR_CLASS = PartialToSingleAggregator
+    AGGREGATOR_CLASS = PartialToSingleMongoPipelineAggregator
+
+
+class WeeklyMongoAggregator(AbstractMongoAggregator):
+    """Class to return a WeeklyAggregator class with TelemetryMongoStorage."""
+
+    AGGREGATOR_CLASS = WeeklyAggregator
+
+
+class MonthlyMongoAggregator(AbstractMongoAggregator):
+    """Class to return a MonthlyAggregator class with TelemetryMongoStorage."""
+
+    AGGREGATOR_CLASS = MonthlyAggregator
+
+
+class QuarterlyMongoAggregator(AbstractMongoAggregator):
+    """Class to return a QuarterlyAggregator class with TelemetryMongoStorage."""
+
+    AGGREGATOR_CLASS = QuarterlyAggregator
@@ -0,0 +1,190 @@
+"""
+Module to define the AggregationRunner class.
+
+The AggregationRunner runs the same aggregation for a list of
+TelemetrySelectors concurrently on a thread or process pool and reports the
+run time and error (if any) for each TelemetrySelector.
+
+Usage
+
+>>> runner = AggregationRunner(DailyMongoAggregator, max_workers=8)
+>>> results = runner.aggregate(telemetry_selectors, start_date, end_date)
+>>> failed = [result for result in results if result.error]
+>>> # or aggregate all selectors found in the storage for the period
+>>> results = runner.aggregate_all(
+        TelemetryMongoStorage(), st.SINGLE_TELEMETRY_TYPE, start_date, end_date)
+
+The aggregator class is either an aggregator class that needs a storage class
+instance (like DailyAggregator) in which case the storage_class must be
+provided, or a storage specific aggregator class (like DailyMongoAggregator)
+that only needs a TelemetrySelector.
+A new storage class instance is created for each aggregation. When using a
+process pool the aggregator and storage class must be importable from the
+worker processes, i.e. defined at module level.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Callable, List, NamedTuple, Optional, Type, Union
+
+from pipeline_telemetry.storage import AbstractTelemetryStorage
+
+from .helper import TelemetrySelector
+
+
+class AggregationResult(NamedTuple):
+    """Named tuple with the outcome of the aggregation for one selector.
+
+    - telemetry_selector: the selector for which the aggregation was run
+    - run_time_in_seconds: duration of the aggregation
+    - error: description of the exception raised by the aggregation, if any
+    """
+
+    telemetry_selector: TelemetrySelector
+    run_time_in_seconds: float
+    error: Optional[str] = None
+
+
+def run_aggregation(
+    aggregator_class: Callable[..., Any],
+    storage_class: Optional[Callable[[], Any]],
+    telemetry_selector: TelemetrySelector,
+    start_date: date,
+    end_date: date,
+    single_query: bool,
+    incremental: bool = False,
+) -> AggregationResult:
+    """
+    Runs the aggregation for a single telemetry selector and returns the
+    run time and error. Defined at module level to allow it to be run in a
+    process pool.
+    """
+    start_time = time.perf_counter()
+    try:
+        if storage_class:
+            aggregator = aggregator_class(
+                telemetry_selector=telemetry_selector,
+                telemetry_storage=storage_class(),
+            )
+        else:
+            aggregator = aggregator_class(telemetry_selector=telemetry_selector)
+        aggregator.aggregate(
+            start_date=start_date,
+            end_date=end_date,
+            single_query=single_query,
+            incremental=incremental,
+        )
+    except Exception as exception:
+        # exceptions are returned as text as not all exceptions can be pickled
+        return AggregationResult(
+            telemetry_selector=telemetry_selector,
+            run_time_in_seconds=time.perf_counter() - start_time,
+            error=f"{exception.__class__.__name__}: {exception}",
+        )
+
+    return AggregationResult(
+        telemetry_selector=telemetry_selector,
+        run_time_in_seconds=time.perf_counter() - start_time,
+    )
+
+
+class AggregationRunner:
+    """
+    Class to run an aggregation for many TelemetrySelectors concurrently.
+
+    public methods:
+    - aggregate: run the aggregation for all telemetry selectors
+    - aggregate_all: run the aggregation for the telemetry selectors found in
+      the storage
+    """
+
+    __aggregator_class: Callable[..., Any]
+    __storage_class: Optional[Callable[[], Any]]
+    __max_workers: Optional[int]
+    __executor_class: Union[Type[ThreadPoolExecutor], Type[ProcessPoolExecutor]]
+
+    def __init__(
+        self,
+        aggregator_class: Callable[..., Any],
+        storage_class: Optional[Callable[[], Any]] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+    ) -> None:
+        """
+        Args:
+            aggregator_class: aggregator class to run for each selector
+            storage_class:
+                storage class to instantiate for each aggregation, not needed
+                for storage specific aggregators like DailyMongoAggregator
+            max_workers: size of the pool, defaults to the executor default
+            use_processes: use a process pool instead of a thread pool
+        """
+        self.__aggregator_class = aggregator_class
+        self.__storage_class = storage_class
+        self.__max_workers = max_workers
+        self.__executor_class = (
+            ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        )
+
+    def aggregate(
+        self,
+        telemetry_selectors: List[TelemetrySelector],
+        start_date: date,
+        end_date: date,
+        single_query: bool = False,
+        incremental: bool = False,
+    ) -> List[AggregationResult]:
+        """
+        Runs the aggregation from start_date to end_date for all telemetry
+        selectors concurrently. single_query and incremental are passed on to
+        the aggregate method of the aggregator.
+
+        Returns:
+            List[AggregationResult]:
+                result for each telemetry selector in the order of
+                telemetry_selectors
+        """
+        with self.__executor_class(max_workers=self.__max_workers) as executor:
+            futures = [
+                executor.submit(
+                    run_aggregation,
+                    self.__aggregator_class,
+                    self.__storage_class,
+                    telemetry_selector,
+                    start_date,
+                    end_date,
+                    single_query,
+                    incremental,
+                )
+                for telemetry_selector in telemetry_selectors
+            ]
+            return [future.result() for future in futures]
+
+    def aggregate_all(
+        self,
+        telemetry_storage: AbstractTelemetryStorage,
+        telemetry_type: str,
+        start_date: date,
+        end_date: date,
+        single_query: bool = False,
+        incremental: bool = False,
+    ) -> List[AggregationResult]:
+        """
+        Runs the aggregation from start_date to end_date for all telemetry
+        selectors of the telemetry records of telemetry_type (the telemetry
+        type the aggregator aggregates from) in the telemetry_storage in that
+        period.
+        """
+        telemetry_selectors = telemetry_storage.distinct_selectors(
+            telemetry_type=telemetry_type,
+            from_date_time=datetime.combine(start_date, datetime.min.time()),
+            to_date_time=datetime.combine(end_date, datetime.min.time()),
+        )
+        return self.aggregate(
+            telemetry_selectors=telemetry_selectors,
+            start_date=start_date,
+            end_date=end_date,
+            single_query=single_query,
+            incremental=incremental,
+        )
@@ -1,5 +1,6 @@
 """ """
 
-from .telemetry_models import TelemetryData, TelemetryModel
+from .telemetry_models import TelemetryData, TelemetryModel, TelemetryShard
+from .telemetry_selector import TelemetrySelector
 
-__all__ = ["TelemetryData", "TelemetryModel"]
+__all__ = ["TelemetryData", "TelemetryModel", "TelemetryShard", "TelemetrySelector"]
@@ -0,0 +1,152 @@
+"""
+Module to provide the counter store of an open Telemetry object.
+
+While a Telemetry object is open its counters are increased in plain
+__slots__ objects instead of in the pydantic TelemetryData models, so
+increasing a counter is a single attribute or dict update. The counters are
+materialised into TelemetryData models when the telemetry is closed or when
+the telemetry model is accessed.
+
+classes:
+    - SubProcessCounters: the counters of a sub process
+    - CounterStore: the counters per sub process and the io time
+"""
+
+from collections import defaultdict
+from typing import DefaultDict, Dict, Union
+
+from ..settings import settings as st
+from .telemetry_models import TelemetryData, TelemetryShard
+
+
+class SubProcessCounters:
+    """Class with the counters of a sub process, see TelemetryData."""
+
+    __slots__ = ("base_counter", "fail_counter", "counters", "errors")
+
+    base_counter: int
+    fail_counter: int
+    counters: DefaultDict[str, int]
+    errors: DefaultDict[str, int]
+
+    def __init__(self) -> None:
+        self.base_counter = 0
+        self.fail_counter = 0
+        self.counters = defaultdict(int)
+        self.errors = defaultdict(int)
+
+    def increase_base_count(self, increment: int) -> None:
+        self.base_counter += increment
+
+    def increase_fail_count(self, increment: int) -> None:
+        self.fail_counter += increment
+
+    def increase_error_count(self, increment: int, error_code_key: str) -> None:
+        self.errors[error_code_key] += increment
+
+    def increase_error_counts(self, error_counts: Dict[str, int]) -> None:
+        """Increase the error counters with the increments per error code key."""
+        errors = self.errors
+        for error_code_key, increment in error_counts.items():
+            errors[error_code_key] += increment
+
+    def increase_custom_count(self, increment: int, counter: str) -> None:
+        self.counters[counter] += increment
+
+    def increase_sample_counts(
+        self, base_increment: int, sampled_increment: int
+    ) -> None:
+        """
+        Increase the nr of records offered to the sampling policy and the nr
+        of sampled records.
+        """
+        self.counters[st.SAMPLING_BASE_COUNT_KEY] += base_increment
+        self.counters[st.SAMPLED_COUNT_KEY] += sampled_increment
+
+    def add(self, counters: Union["SubProcessCounters", TelemetryData]) -> None:
+        """Adds the counters of a SubProcessCounters or TelemetryData object."""
+        self.base_counter += counters.base_counter
+        self.fail_counter += counters.fail_counter
+        for counter, increment in counters.counters.items():
+            self.counters[counter] += increment
+        self.increase_error_counts(counters.errors)
+
+    def add_changes(
+        self, telemetry_data: TelemetryData, materialised: "SubProcessCounters"
+    ) -> None:
+        """
+        Adds the changes made to telemetry_data since it was materialised from
+        the materialised counters.
+        """
+        self.base_counter += telemetry_data.base_counter - materialised.base_counter
+        self.fail_counter += telemetry_data.fail_counter - materialised.fail_counter
+        for counter, value in telemetry_data.counters.items():
+            if increment := value - materialised.counters.get(counter, 0):
+                self.counters[counter] += increment
+        for error_code_key, value in telemetry_data.errors.items():
+            if increment := value - materialised.errors.get(error_code_key, 0):
+                self.errors[error_code_key] += increment
+
+    def copy(self) -> "SubProcessCounters":
+        """
+        Returns a copy of the counters. The counter dicts are copied at once,
+        so a copy can be made while another thread increases the counters.
+        """
+        counters_copy = SubProcessCounters()
+        counters_copy.base_counter = self.base_counter
+        counters_copy.fail_counter = self.fail_counter
+        counters_copy.counters = defaultdict(int, self.counters)
+        counters_copy.errors = defaultdict(int, self.errors)
+        return counters_copy
+
+    def to_telemetry_data(self) -> TelemetryData:
+        """Returns a TelemetryData model with a copy of the counters."""
+        return TelemetryData.model_construct(
+            base_counter=self.base_counter,
+            fail_counter=self.fail_counter,
+            counters=defaultdict(int, self.counters),
+            errors=defaultdict(int, self.errors),
+        )
+
+
+class CounterStore:
+    """
+    Class with the counters per sub process and the io time of an open
+    Telemetry object, or of one of its thread shards in concurrent mode.
+
+    attributes:
+    - telemetry (dict): counters per sub process
+    - io_time_in_seconds (float): io time
+    """
+
+    __slots__ = ("telemetry", "io_time_in_seconds")
+
+    telemetry: Dict[str, SubProcessCounters]
+    io_time_in_seconds: float
+
+    def __init__(self) -> None:
+        self.telemetry = {}
+        self.io_time_in_seconds = 0
+
+    def get_sub_process_counters(self, sub_process: str) -> SubProcessCounters:
+        try:
+            return self.telemetry[sub_process]
+        except KeyError:
+            counters = self.telemetry[sub_process] = SubProcessCounters()
+            return counters
+
+    def increase_io_time(self, incremental_io_time: float) -> None:
+        self.io_time_in_seconds += incremental_io_time
+
+    def add(self, store: Union["CounterStore", TelemetryShard]) -> None:
+        """Adds the counters and io time of another store or of a shard."""
+        for sub_process, counters in store.telemetry.items():
+            self.get_sub_process_counters(sub_process).add(counters)
+        self.io_time_in_seconds += store.io_time_in_seconds
+
+    def to_telemetry_data(self) -> Dict[str, TelemetryData]:
+        """Returns a TelemetryData model per sub process."""
+        return {
+            sub_process: counters.to_telemetry_data()
+            for sub_process, counters in list(self.telemetry.items())
+        }
@@ -9,11 +9,15 @@ Dataclasses defined in Module
 - TelemetryModel: Data class to define the Telemetry object category, type,
                   source etc. Holds the reference to the actual counters defined
                   in TelemetryData dataclass.
+
+- TelemetryShard: Data class with the counters of a part of the work of a
+                  Telemetry object (for example of one thread or of a child
+                  process) that are merged into the Telemetry object.
 """
 
 from collections import defaultdict
 from datetime import datetime
-from typing import DefaultDict, Dict
+from typing import DefaultDict, Dict, Optional
 
 from errors import ErrorCode
 from pydantic import BaseModel, Field, field_validator
@@ -37,6 +41,14 @@ class TelemetryData(BaseModel):
     - increase_fail_count
     - increase_custom_count
     - increase_error_count
+    - increase_error_counts
+    - increase_sample_counts
+    - copy_counters
+
+    For sub processes with a sampling policy the nr of records offered to the
+    policy and the nr of sampled records are kept as the custom counters
+    `sampling_base_count` and `sampled_count`, the error counters hold the
+    error counts extrapolated from the sampled records.
 
     counters can be added in which case base, fail, custom and error counters
     will be summed up seperately. Add method will return self with added
@@ -65,10 +77,53 @@ class TelemetryData(BaseModel):
     def _increase_error_count(self, increment: int, error_code_key: str) -> None:
         self.errors[error_code_key] += increment
 
+    def increase_error_counts(self, error_counts: Dict[str, int]) -> None:
+        """Increase the error counters with the increments per error code key."""
+        for error_code_key, increment in error_counts.items():
+            self._increase_error_count(
+                increment=increment, error_code_key=error_code_key
+            )
+
     def increase_custom_count(self, increment: int, counter: str) -> None:
         """Increase a custom counter with a given increment."""
         self.counters[counter] += increment
 
+    def increase_sample_counts(
+        self, base_increment: int, sampled_increment: int
+    ) -> None:
+        """
+        Increase the nr of records offered to the sampling policy and the nr
+        of sampled records.
+        """
+        self.increase_custom_count(
+            increment=base_increment, counter=st.SAMPLING_BASE_COUNT_KEY
+        )
+        self.increase_custom_count(
+            increment=sampled_increment, counter=st.SAMPLED_COUNT_KEY
+        )
+
+    @property
+    def sampling_base_count(self) -> int:
+        """Returns the nr of records offered to the sampling policy."""
+        return self.counters.get(st.SAMPLING_BASE_COUNT_KEY, 0)
+
+    @property
+    def sampled_count(self) -> int:
+        """Returns the nr of sampled (validated) records."""
+        return self.counters.get(st.SAMPLED_COUNT_KEY, 0)
+
+    def copy_counters(self) -> "TelemetryData":
+        """
+        Returns a copy of the counters. The counter dicts are copied at once,
+        so a copy can be made while another thread increases the counters.
+        """
+        return TelemetryData(
+            base_counter=self.base_counter,
+            fail_counter=self.fail_counter,
+            counters=defaultdict(int, self.counters),
+            errors=defaultdict(int, self.errors),
+        )
+
     def __add__(self, telemetry_data: "TelemetryData") -> "TelemetryData":
         """
         Add telemetry_data object to self by adding up all counters seperately.
@@ -95,6 +150,7 @@ class TelemetryModel(BaseModel):
     io_time_in_seconds: float = 0
     traffic_light: str = st.DEFAULT_TRAFIC_LIGHT_COLOR
     telemetry: Dict[str, TelemetryData] = Field(default_factory=dict)
+    watermark: Optional[datetime] = None
 
     def telemetry_copy(self) -> "TelemetryModel":
         """
@@ -134,18 +190,43 @@ class TelemetryModel(BaseModel):
         """Sets traffic light attribute to red."""
         self.traffic_light = st.TRAFIC_LIGHT_COLOR_RED
 
+    def raise_traffic_light(self, traffic_light: str) -> None:
+        """Sets traffic light attribute to traffic_light if it is more severe."""
+        severity = st.TRAFIC_LIGHT_COLORS_BY_SEVERITY.index
+        if severity(traffic_light) > severity(self.traffic_light):
+            self.traffic_light = traffic_light
+
     def __add__(self, telemetry_model_to_add: "TelemetryModel") -> "TelemetryModel":
         """
         Method to add to telemetry model instances.
         Adding a 2 telemetry model instances implies adding all telemetry data
         objects and adding iotime, run time and traffic light attributes to a
-        specific counter.
+        specific counter. The watermark is set to the latest start_date_time
+        of the added telemetry model instances.
         """
         self.__add_base_count()
         self.__add_sub_process(telemetry_model_to_add=telemetry_model_to_add)
         self.__add_traffic_light(telemetry_model_to_add=telemetry_model_to_add)
         self.__add_io_time(telemetry_model_to_add=telemetry_model_to_add)
         self.__add_run_time(telemetry_model_to_add=telemetry_model_to_add)
+        self.__add_watermark(telemetry_model_to_add=telemetry_model_to_add)
+        return self
+
+    def add_aggregated_telemetry(
+        self, aggregated_telemetry: "TelemetryModel"
+    ) -> "TelemetryModel":
+        """
+        Method to add an aggregated telemetry model instance (for example a
+        daily aggregation) to an aggregation over a longer period.
+        Only the telemetry data objects are added, including the aggregation
+        stats, so adding up aggregations gives the same result as adding up
+        all telemetry model instances in those aggregations. The watermark is
+        set to the latest watermark of the added aggregations.
+        """
+        self.__add_sub_process(telemetry_model_to_add=aggregated_telemetry)
+        self.update_watermark(
+            aggregated_telemetry.watermark or aggregated_telemetry.start_date_time
+        )
         return self
 
     def __add_base_count(self) -> None:
@@ -197,7 +278,49 @@ class TelemetryModel(BaseModel):
             increment=round(run_time_in_seconds), counter=st.RUN_TIME
         )
 
+    def __add_watermark(self, telemetry_model_to_add: "TelemetryModel") -> None:
+        """
+        Sub method for the __add__ method to move the watermark to the
+        start_date_time of the TelemetryModel instance to be added when it is
+        later than the current watermark.
+        """
+        self.update_watermark(telemetry_model_to_add.start_date_time)
+
+    def update_watermark(self, start_date_time: datetime) -> None:
+        """Sets watermark to start_date_time if it is later than the watermark."""
+        if self.watermark is None or start_date_time > self.watermark:
+            self.watermark = start_date_time
+
     def get_sub_process_data(self, sub_process: str) -> TelemetryData:
         if not self.telemetry.get(sub_process):
             self.telemetry[sub_process] = TelemetryData()
         return self.telemetry[sub_process]
+
+
+class TelemetryShard(BaseModel):
+    """
+    Class to define the counters of a part of the work of a Telemetry object,
+    like the counters of one thread or of a child process. A shard is merged
+    into the Telemetry object by adding its telemetry data objects and its io
+    time, and by raising the traffic light to the traffic light of the shard.
+    Unlike adding TelemetryModel instances the aggregation counters are not
+    increased. Shards can be pickled to return them from a child process.
+
+    attributes:
+    - telemetry (dict): telemetry data object per sub process
+    - io_time_in_seconds (float): io time of the shard
+    - traffic_light (str): traffic light of the shard
+    """
+
+    telemetry: Dict[str, TelemetryData] = Field(default_factory=dict)
+    io_time_in_seconds: float = 0
+    traffic_light: str = st.DEFAULT_TRAFIC_LIGHT_COLOR
+
+    def get_sub_process_data(self, sub_process: str) -> TelemetryData:
+        if sub_process not in self.telemetry:
+            self.telemetry[sub_process] = TelemetryData()
+        return self.telemetry[sub_process]
+
+    def increase_io_time(self, incremental_io_time: float) -> None:
+        """Increases the io time of the shard."""
+        self.io_time_in_seconds += incremental_io_time
@@ -0,0 +1,38 @@
+"""
+Module to provide the TelemetrySelector class
+
+Named tuple defined in Module
+
+- TelemetrySelector: Named tuple to define the category, sub category, source
+                     and process type of the telemetry objects in scope of an
+                     aggregation.
+"""
+
+from typing import NamedTuple
+
+
+class TelemetrySelector(NamedTuple):
+    """Named tuple to define mandatory attributed for a Telemetry selection.
+
+    This object should be used as input to the Telemetry Aggregator
+
+    >>> telemetry_selector = TelemetrySelector(
+        category, sub_category, source_name, process_type)
+    >>> aggregator = AggregatorClass(
+            telemetry_selector=telemetry_selector,
+            telemetry_storage=TelemetryStorageClass()
+        )
+
+    The `telemtry_selector` defines what telemetry objects are in scope.
+    The `aggregator` object defines what kind of aggregation is done (by
+    selecting the AggregatorClass) and provides you with metods to run the
+    aggergation for a specific period.
+
+    The telemetry selectors available in a storage class can be retrieved with
+    the `distinct_selectors` method of the storage class.
+    """
+
+    category: str
+    sub_category: str
+    source_name: str
+    process_type: str
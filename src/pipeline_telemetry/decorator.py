@@ -5,14 +5,26 @@ decorators:
     - add_mongo_telemetry
     - add_single_usage_telemetry
     - add_mongo_single_usage_telemetry
+    - add_async_telemetry
+    - add_async_single_usage_telemetry
+
+When telemetry is disabled for the process type of a decorator, see
+switch.py, the decorated method is called directly without a telemetry scope.
 """
 
+import inspect
 from functools import wraps
-from typing import Callable, Optional, Type
+from typing import Any, Callable, Optional, Type, Union
 
 from .main import Telemetry
+from .scope import _ACTIVE_TELEMETRY, _NO_SCOPES, get_scoped_telemetry
 from .settings import exceptions
-from .storage import AbstractTelemetryStorage, TelemetryMongoStorage
+from .storage import (
+    AbstractAsyncTelemetryStorage,
+    AbstractTelemetryStorage,
+    TelemetryMongoStorage,
+)
+from .switch import is_telemetry_enabled
 
 
 def add_telemetry(telemetry_params: dict) -> Callable:
@@ -30,20 +42,25 @@ def add_telemetry(telemetry_params: dict) -> Callable:
                 Storage class to be used to store telemetry instances. Defaults
                 to TelemetryInMemoryStorage which stores only in memory.
     """
+    process_type = telemetry_params.get("process_type")
 
     def wrapper(method):
+        _raise_exception_if_coroutine_function(method)
+
         @wraps(method)
         def wrapped_method(self, *args, **kwargs):
             """
             Wrapper for method where result log should be added
             """
-            if (not hasattr(self, "_telemetry")) or (not self._telemetry):
-                self._telemetry = Telemetry(**telemetry_params)
-                result = method(self, *args, **kwargs)
-                self._telemetry.save_and_close()
-                self._telemetry = None
-            else:
+            if get_scoped_telemetry(self):
+                return method(self, *args, **kwargs)
+
+            if not is_telemetry_enabled(process_type):
+                return method(self, *args, **kwargs)
+
+            with _DecoratorScope(self, Telemetry(**telemetry_params)) as telemetry:
                 result = method(self, *args, **kwargs)
+                telemetry.save_and_close()
 
             return result
 
@@ -64,23 +81,28 @@ def add_mongo_telemetry(telemetry_params: dict) -> Callable:
             - process_type (ProcessType): process type definition
             - telemetry_rules (dict): telemetry rules definition dict
     """
+    process_type = telemetry_params.get("process_type")
 
     def wrapper(method):
+        _raise_exception_if_coroutine_function(method)
+
         @wraps(method)
         def wrapped_method(self, *args, **kwargs):
             """
             Wrapper for method where result log should be added
             """
-            if (not hasattr(self, "_telemetry")) or (not self._telemetry):
-                tel_params = telemetry_params.copy() | {
-                    "storage_class": TelemetryMongoStorage
-                }
-                self._telemetry = Telemetry(**tel_params)
-                result = method(self, *args, **kwargs)
-                self._telemetry.save_and_close()
-                self._telemetry = None
-            else:
+            if get_scoped_telemetry(self):
+                return method(self, *args, **kwargs)
+
+            if not is_telemetry_enabled(process_type):
+                return method(self, *args, **kwargs)
+
+            tel_params = telemetry_params.copy() | {
+                "storage_class": TelemetryMongoStorage
+            }
+            with _DecoratorScope(self, Telemetry(**tel_params)) as telemetry:
                 result = method(self, *args, **kwargs)
+                telemetry.save_and_close()
             return result
 
         return wrapped_method
@@ -132,35 +154,202 @@ def add_single_usage_telemetry(
     """
 
     def wrapper(method):
+        _raise_exception_if_coroutine_function(method)
+
         @wraps(method)
         def wrapped_method(self, *args, **kwargs):
             """
             Wrapper for method where result log should be added
             """
-            telemetry_params = getattr(self, "TELEMETRY_PARAMS", False)
-            if not telemetry_params:
-                raise exceptions.ClassTelemetryParamsNotDefined(self)
+            if not _is_single_usage_telemetry_enabled(self):
+                return method(self, *args, **kwargs)
+
+            with _DecoratorScope(
+                self, _create_single_usage_telemetry(self, sub_process, storage_class)
+            ) as telemetry:
+                result = method(self, *args, **kwargs)
+                telemetry.save_and_close()
 
-            if not isinstance(telemetry_params, dict):
-                raise exceptions.ClassTelemetryParamsNotOfTypeDict(self)
+            return result
 
-            storage_class_params = (
-                {"storage_class": storage_class} if storage_class else {}
-            )
+        return wrapped_method
 
-            tel_params = telemetry_params | storage_class_params
-            self._telemetry = Telemetry(**tel_params)
+    return wrapper
 
-            # only if sub_process was defined set the base count for that
-            # subprocess
-            if sub_process:
-                self._telemetry.increase_sub_process_base_count(sub_process=sub_process)
-            result = method(self, *args, **kwargs)
-            self._telemetry.save_and_close()
-            self._telemetry = None
+
+def add_async_telemetry(telemetry_params: dict) -> Callable:
+    """
+    Decorator method to add a telemetry to the class from which the
+    decorator was called for coroutine methods. Works like add_telemetry, the
+    telemetry object is closed with async_save_and_close after the coroutine
+    that created the object is finished.
+
+    Args:
+        telemetry_params (dict:
+            - source_name (str): free format process name
+            - process_type (ProcessType): process type definition
+            - telemetry_rules (dict): telemetry rules definition dict
+            - storage_class (AbstractAsyncTelemetryStorage, optional):
+                Storage class to be used to store telemetry instances. Only
+                an async storage class does not block the event loop. Defaults
+                to TelemetryInMemoryStorage which stores only in memory.
+    """
+    process_type = telemetry_params.get("process_type")
+
+    def wrapper(method):
+        @wraps(method)
+        async def wrapped_method(self, *args, **kwargs):
+            """
+            Wrapper for coroutine method where result log should be added
+            """
+            if get_scoped_telemetry(self):
+                return await method(self, *args, **kwargs)
+
+            if not is_telemetry_enabled(process_type):
+                return await method(self, *args, **kwargs)
+
+            with _DecoratorScope(self, Telemetry(**telemetry_params)) as telemetry:
+                result = await method(self, *args, **kwargs)
+                await telemetry.async_save_and_close()
 
             return result
 
         return wrapped_method
 
     return wrapper
+
+
+def add_async_single_usage_telemetry(
+    sub_process: Optional[str] = None,
+    storage_class: Optional[
+        Union[Type[AbstractTelemetryStorage], Type[AbstractAsyncTelemetryStorage]]
+    ] = None,
+) -> object:
+    """
+    Decorator method to add a telemetry to the class from which the
+    decorator was called for coroutine methods. Works like
+    add_single_usage_telemetry, the telemetry object is closed with
+    async_save_and_close after the coroutine is finished.
+
+    Args:
+        - sub_process (str):
+            one of the sub_processes defined with the process_type. A
+            counter with value 1 will be created for this sub_process.
+            This field is optional, if not provided no counter will be
+            added to the telemetry object
+        - storage_class (AbstractAsyncTelemetryStorage):
+            Storage class to be used for persisting telemetry objects
+    """
+
+    def wrapper(method):
+        @wraps(method)
+        async def wrapped_method(self, *args, **kwargs):
+            """
+            Wrapper for coroutine method where result log should be added
+            """
+            if not _is_single_usage_telemetry_enabled(self):
+                return await method(self, *args, **kwargs)
+
+            with _DecoratorScope(
+                self, _create_single_usage_telemetry(self, sub_process, storage_class)
+            ) as telemetry:
+                result = await method(self, *args, **kwargs)
+                await telemetry.async_save_and_close()
+
+            return result
+
+        return wrapped_method
+
+    return wrapper
+
+
+def _create_single_usage_telemetry(
+    instance: object,
+    sub_process: Optional[str],
+    storage_class: Optional[
+        Union[Type[AbstractTelemetryStorage], Type[AbstractAsyncTelemetryStorage]]
+    ],
+) -> Telemetry:
+    """
+    Returns a new telemetry object with the TELEMETRY_PARAMS of the class
+    instance for the single usage decorators.
+    """
+    telemetry_params = getattr(instance, "TELEMETRY_PARAMS", False)
+    if not telemetry_params:
+        raise exceptions.ClassTelemetryParamsNotDefined(instance)
+
+    if not isinstance(telemetry_params, dict):
+        raise exceptions.ClassTelemetryParamsNotOfTypeDict(instance)
+
+    storage_class_params = {"storage_class": storage_class} if storage_class else {}
+
+    telemetry = Telemetry(**(telemetry_params | storage_class_params))
+
+    # only if sub_process was defined set the base count for that
+    # subprocess
+    if sub_process:
+        telemetry.increase_sub_process_base_count(sub_process=sub_process)
+    return telemetry
+
+
+def _is_single_usage_telemetry_enabled(instance: object) -> bool:
+    """
+    Returns True when telemetry is enabled for the process type in the
+    TELEMETRY_PARAMS of the class instance. Invalid TELEMETRY_PARAMS are
+    reported when the telemetry object is created.
+    """
+    telemetry_params = getattr(instance, "TELEMETRY_PARAMS", None)
+    if not isinstance(telemetry_params, dict):
+        return is_telemetry_enabled()
+    return is_telemetry_enabled(telemetry_params.get("process_type"))
+
+
+class _DecoratorScope:
+    """
+    Makes telemetry the active telemetry of the decorated instance in the
+    current context. The telemetry is also set as `_telemetry` attribute of
+    the instance for methods that use the attribute directly, that attribute
+    is shared by concurrent calls though. On exit the previous `_telemetry`
+    attribute is restored when the attribute still holds telemetry, the
+    closed telemetry of a finished concurrent call is not restored.
+
+    The decorators enter a scope on every call with telemetry, so it is a
+    __slots__ class that sets the scope itself instead of a generator based
+    context manager around telemetry_scope.
+    """
+
+    __slots__ = ("instance", "telemetry", "_token", "_previous_telemetry")
+
+    def __init__(self, instance: Any, telemetry: Telemetry) -> None:
+        self.instance = instance
+        self.telemetry = telemetry
+
+    def __enter__(self) -> Telemetry:
+        telemetry = self.telemetry
+        # the instance dict is used directly, as the TelemetryMixin property
+        # returns the active telemetry of the scope
+        instance_dict = self.instance.__dict__
+        self._previous_telemetry = instance_dict.get("_telemetry")
+        self._token = _ACTIVE_TELEMETRY.set(
+            {**_ACTIVE_TELEMETRY.get(_NO_SCOPES), id(self.instance): telemetry}
+        )
+        instance_dict["_telemetry"] = telemetry
+        return telemetry
+
+    def __exit__(self, *exc_info: Any) -> None:
+        instance_dict = self.instance.__dict__
+        if instance_dict.get("_telemetry") is self.telemetry:
+            previous_telemetry = self._previous_telemetry
+            if getattr(previous_telemetry, "closed", False):
+                previous_telemetry = None
+            instance_dict["_telemetry"] = previous_telemetry
+        _ACTIVE_TELEMETRY.reset(self._token)
+
+
+def _raise_exception_if_coroutine_function(method: Callable) -> None:
+    """
+    The synchronous decorators would close the telemetry object before the
+    coroutine runs, so coroutine methods must use the async decorators.
+    """
+    if inspect.iscoroutinefunction(method):
+        raise exceptions.CoroutineMethodNotSupported(method.__qualname__)
@@ -4,8 +4,8 @@ from typing import Any, List, Union
 
 from errors import ReturnValueWithStatus
 
+from .scope import get_active_telemetry
 from .settings import exceptions
-from .settings import settings as st
 from .settings.data_class import TelemetryCounter
 
 
@@ -19,9 +19,9 @@ def add_errors_from_return_value(
 ) -> None:
     """
     Helper method to add the errors from a ReturnValueWithStatus instance to the
-    telemetry instance of the object_with_telemetry.
+    active telemetry instance of the object_with_telemetry.
     """
-    object_with_telemetry._telemetry.add(
+    get_active_telemetry(object_with_telemetry).add(
         sub_process=sub_process, data=[], errors=return_value.errors
     )
 
@@ -31,12 +31,13 @@ def add_telemetry_counters_from_return_value(
 ) -> List[Any]:
     """
     Helper method to add the TelemetryCounters from a ReturnValueWithStatus
-    instance to the telemetry instance of the object_with_telemetry.
+    instance to the active telemetry instance of the object_with_telemetry.
     """
+    telemetry = get_active_telemetry(object_with_telemetry)
     result_without_telemetry_counters = []
     for item in return_value.result:
         if is_telemetry_counter(item):
-            object_with_telemetry._telemetry.add_telemetry_counter(item)
+            telemetry.add_telemetry_counter(item)
         else:
             result_without_telemetry_counters.append(item)
 
@@ -71,7 +72,7 @@ def increase_base_count(
     """
     Helper method to increase base count for a sub_process
     """
-    object_with_telemetry._telemetry.increase_sub_process_base_count(
+    get_active_telemetry(object_with_telemetry).increase_sub_process_base_count(
         sub_process=sub_process, increment=increment
     )
 
@@ -82,7 +83,7 @@ def increase_fail_count(
     """
     Helper method to increase base count for a sub_process
     """
-    object_with_telemetry._telemetry.increase_sub_process_fail_count(
+    get_active_telemetry(object_with_telemetry).increase_sub_process_fail_count(
         sub_process=sub_process, increment=increment
     )
 
@@ -99,10 +100,9 @@ def _raise_exception_if_telemetry_closed(method):
 
     def wrapper(self, *args, **kwargs):
         """
-        Wrapper to check if run_time has been set
-        If so the telemetry object is closed
+        Wrapper to check if the telemetry object is closed
         """
-        if getattr(self.telemetry, st.RUN_TIME):
+        if self._closed:
             raise exceptions.TelemetryObjectAlreadyClosed()
 
         return method(self, *args, **kwargs)
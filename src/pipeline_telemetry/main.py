@@ -6,26 +6,63 @@ classes
 
 """
 
+import threading
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Type
+from typing import Dict, Iterable, List, Optional, Sequence, Type, Union
 
 from errors import ErrorCode
 
-from .data_classes.telemetry_models import TelemetryData, TelemetryModel
+from .data_classes.counters import CounterStore, SubProcessCounters
+from .data_classes.telemetry_models import (
+    TelemetryData,
+    TelemetryModel,
+    TelemetryShard,
+)
 from .helper import _raise_exception_if_telemetry_closed
 from .settings import exceptions
 from .settings import settings as st
 from .settings.data_class import ProcessType, TelemetryCounter
 from .settings.process_type import ProcessTypes
+from .storage.asynchronous import AbstractAsyncTelemetryStorage
 from .storage.generic import AbstractTelemetryStorage
 from .storage.memory import TelemetryInMemoryStorage
-from .validators.dict_validator import DictValidator
+from .validators.dict_validator import CompiledRuleSet
+from .validators.parallel import ParallelValidation
+from .validators.sampling import AbstractSamplingPolicy, Sampler
 
 
 class Telemetry:
+    """
+    Class to collect the telemetry of a pipeline process.
+
+    While the telemetry object is open the counters are increased in a
+    CounterStore of __slots__ objects. They are materialised into the
+    TelemetryModel when the telemetry object is closed and when the telemetry
+    model or its data is accessed. Changes made to the materialised counters
+    are written back to the CounterStore at the next materialisation.
+
+    In concurrent mode each thread adds its counters to its own CounterStore
+    shard, so threads do not have to share or lock counters. The shards are
+    merged into the telemetry object by save_and_close.
+    """
+
     _telemetry: TelemetryModel
+    _counters: CounterStore
+    _materialised_counters: Dict[str, SubProcessCounters]
+    _materialised_io_time: float
+    _closed: bool
     _telemetry_rules: dict
-    _storage_class: Type[AbstractTelemetryStorage]
+    _compiled_rules: CompiledRuleSet
+    _samplers: Dict[str, Sampler]
+    _parallel_validation: Optional[ParallelValidation]
+    _concurrent: bool
+    _thread_local: threading.local
+    _thread_shards: List[CounterStore]
+    _lock: threading.Lock
+    _storage_class: Union[
+        Type[AbstractTelemetryStorage], Type[AbstractAsyncTelemetryStorage]
+    ]
     _available_process_types: Type[ProcessTypes] = ProcessTypes
     _process_type: ProcessType
     _available_telemetry_types = st.TELEMETRY_TYPES
@@ -38,12 +75,28 @@ class Telemetry:
         process_type: ProcessType,
         telemetry_type: str = st.DEFAULT_TELEMETRY_TYPE,
         telemetry_rules: Optional[dict] = None,
-        storage_class: Type[AbstractTelemetryStorage] = TelemetryInMemoryStorage,
+        storage_class: Union[
+            Type[AbstractTelemetryStorage], Type[AbstractAsyncTelemetryStorage]
+        ] = TelemetryInMemoryStorage,
+        sampling_policies: Optional[Dict[str, AbstractSamplingPolicy]] = None,
+        parallel_validation: Optional[ParallelValidation] = None,
+        concurrent: bool = False,
     ):
         self._process_type = process_type
         self._validate_process_type()
         self._storage_class = storage_class
         self._telemetry_rules = telemetry_rules or {}
+        self._compiled_rules = CompiledRuleSet(self._telemetry_rules)
+        self._samplers = self._create_samplers(sampling_policies or {})
+        self._parallel_validation = parallel_validation
+        self._concurrent = concurrent
+        self._thread_local = threading.local()
+        self._thread_shards = []
+        self._lock = threading.Lock()
+        self._counters = CounterStore()
+        self._materialised_counters = {}
+        self._materialised_io_time = 0
+        self._closed = False
         self._telemetry = TelemetryModel(
             telemetry_type=telemetry_type,
             category=category,
@@ -70,7 +123,9 @@ class Telemetry:
         )
 
     @property
-    def storage_class(self) -> Type[AbstractTelemetryStorage]:
+    def storage_class(
+        self,
+    ) -> Union[Type[AbstractTelemetryStorage], Type[AbstractAsyncTelemetryStorage]]:
         """Storage_class property."""
         return self._storage_class
 
@@ -92,31 +147,48 @@ class Telemetry:
     @property
     def source_name(self) -> str:
         """Source_name property."""
-        return getattr(self.telemetry, st.SOURCE_NAME_KEY)
+        return getattr(self._telemetry, st.SOURCE_NAME_KEY)
 
     @property
     def start_date_time(self) -> datetime:
         """start_date_time property."""
-        return getattr(self.telemetry, st.START_TIME)
+        return getattr(self._telemetry, st.START_TIME)
 
     @property
     def io_time_in_seconds(self) -> float:
-        """io_time property."""
-        return getattr(self.telemetry, st.IO_TIME_KEY)
+        """io_time property, includes the io time of the thread shards."""
+        return self._counters.io_time_in_seconds + sum(
+            shard.io_time_in_seconds for shard in list(self._thread_shards)
+        )
+
+    @property
+    def concurrent(self) -> bool:
+        """Concurrent property."""
+        return self._concurrent
 
     @property
     def run_time(self) -> float:
         """run_time property."""
-        return getattr(self.telemetry, st.RUN_TIME)
+        return getattr(self._telemetry, st.RUN_TIME)
 
     @property
     def traffic_light(self) -> str:
         """Traffic_light property."""
-        return getattr(self.telemetry, st.TRAFFIC_LIGHT_KEY)
+        return getattr(self._telemetry, st.TRAFFIC_LIGHT_KEY)
+
+    @property
+    def closed(self) -> bool:
+        """Closed property, True after save_and_close or close_as_shard."""
+        return self._closed
 
     @property
     def telemetry(self) -> TelemetryModel:
-        """Telemetry property."""
+        """
+        Telemetry property, while the telemetry object is open the counters
+        are materialised into the telemetry model first.
+        """
+        if not self._closed:
+            self._materialise()
         return self._telemetry
 
     @property
@@ -139,14 +211,97 @@ class Telemetry:
 
         Returns:
             dict: telemetry result
+
+        Raises:
+            AsyncStorageClassRequiresAwait: when the storage class is async
         """
-        if self.run_time:
-            raise exceptions.TelemetryObjectAlreadyClosed()
-        self._set_runtime()
+        if self.has_async_storage_class:
+            raise exceptions.AsyncStorageClassRequiresAwait(
+                self._storage_class.__name__
+            )
+        self._close()
         self._storage_class().store_telemetry(self.telemetry)
 
         return self.telemetry
 
+    async def async_save_and_close(self) -> TelemetryModel:
+        """
+        Closes and stores the telemetry instance and returns the telemetry
+        value. Only an async storage class stores the telemetry without
+        blocking the event loop, a synchronous storage class (for example
+        TelemetryInMemoryStorage, which can not be used from other threads)
+        stores the telemetry directly.
+
+        Returns:
+            dict: telemetry result
+        """
+        self._close()
+        storage = self._storage_class()
+        if isinstance(storage, AbstractAsyncTelemetryStorage):
+            await storage.store_telemetry(self.telemetry)
+        else:
+            storage.store_telemetry(self.telemetry)
+
+        return self.telemetry
+
+    @property
+    def has_async_storage_class(self) -> bool:
+        """Returns True when the storage class stores telemetry with coroutines."""
+        return issubclass(self._storage_class, AbstractAsyncTelemetryStorage)
+
+    def _close(self) -> None:
+        """
+        Merges the thread shards, materialises the counters and sets the run
+        time of the telemetry.
+        """
+        if self._closed:
+            raise exceptions.TelemetryObjectAlreadyClosed()
+        self._merge_thread_shards()
+        self._materialise()
+        self._set_runtime()
+        self._closed = True
+
+    def _materialise(self) -> None:
+        """
+        Sets the counters and io time of the telemetry model, in concurrent
+        mode including those of the thread shards. Changes made to the
+        telemetry model since the previous materialisation are written back to
+        the counter store first, so they are not lost.
+        """
+        with self._lock:
+            telemetry_data = getattr(self._telemetry, st.TELEMETRY_FIELD_KEY)
+            for sub_process in list(
+                dict.fromkeys([*telemetry_data, *self._counters.telemetry])
+            ):
+                self._materialise_sub_process(sub_process)
+            self._counters.increase_io_time(
+                getattr(self._telemetry, st.IO_TIME_KEY) - self._materialised_io_time
+            )
+            self._materialised_io_time = self.io_time_in_seconds
+            setattr(self._telemetry, st.IO_TIME_KEY, self._materialised_io_time)
+
+    def _materialise_sub_process(self, sub_process: str) -> TelemetryData:
+        """
+        Writes the changes made to the telemetry data of a sub process back to
+        the counter store and sets the telemetry data to the counters of the
+        sub process.
+        """
+        telemetry_data = getattr(self._telemetry, st.TELEMETRY_FIELD_KEY)
+        if sub_process in telemetry_data:
+            self._counters.get_sub_process_counters(sub_process).add_changes(
+                telemetry_data[sub_process],
+                self._materialised_counters.get(sub_process) or SubProcessCounters(),
+            )
+        counters = (
+            self._merged_sub_process_counters(sub_process)
+            if self._concurrent
+            else self._counters.telemetry[sub_process].copy()
+        )
+        self._materialised_counters[sub_process] = counters
+        telemetry_data[sub_process] = counters.to_telemetry_data()
+        return telemetry_data[sub_process]
+
+    @_raise_exception_if_telemetry_closed
     def add_telemetry_counter(
         self, telemetry_counter: TelemetryCounter, increment: Optional[int] = None
     ) -> None:
@@ -160,26 +315,12 @@ class Telemetry:
                 TelemetryCounter (which defaults to 1)
         """
         telemetry_counter.validate_sub_process()
-        sub_process = telemetry_counter.sub_process
-        counter_name = telemetry_counter.counter_name
+        counters = self._sub_process_counters(telemetry_counter.sub_process)
         increment = increment or telemetry_counter.increment
-
-        if self._sub_process_not_yet_initialized(sub_process):
-            self._initialize_sub_process(sub_process)
-
-        if telemetry_counter.error:
-            self.increase_sub_process_error_count(
-                sub_process=sub_process,
-                error_code=telemetry_counter.error,
-                increment=increment,
-            )
-
+        if telemetry_counter.is_error_counter:
+            counters.increase_error_count(increment, telemetry_counter.counter_key)
         else:
-            self.increase_sub_process_custom_count(
-                sub_process=sub_process,
-                custom_counter=counter_name,
-                increment=increment,
-            )
+            counters.increase_custom_count(increment, telemetry_counter.counter_key)
 
     @_raise_exception_if_telemetry_closed
     def add(self, sub_process: str, data: dict, errors: List[ErrorCode]) -> None:
@@ -189,6 +330,11 @@ class Telemetry:
         Data validation errors are retrieved from data validation defined in
         telemetry rules.
 
+        When the sub process has a sampling policy the data is only validated
+        when it is sampled and the validation errors are extrapolated. With
+        parallel validation the entries of large list fields are validated in
+        chunks in an executor.
+
         Method does not update BASE_COUNT.
 
         :param sub_process: applicable subprocess for the errors
@@ -200,29 +346,140 @@ class Telemetry:
         :type errors: list of Errorcodes
         :returns: None
         """
-        if self._sub_process_not_yet_initialized(sub_process):
-            self._initialize_sub_process(sub_process)
-        validation_errors = self._validate_data(sub_process, data)
         # add data validation errors
-        self._add_errors(sub_process, validation_errors)
+        if sub_process in self._samplers:
+            self._add_sampled_validation_errors(sub_process, data)
+        else:
+            self._sub_process_counters(sub_process).increase_error_counts(
+                self._count_validation_errors(sub_process, data)
+            )
 
         # add data process errors
         if errors:
             self._add_errors(sub_process, errors)
 
-    def _validate_data(self, sub_process: str, data: dict) -> List[ErrorCode]:
-        """Validates the data provided by a subprocess.
+    @_raise_exception_if_telemetry_closed
+    def add_many(self, sub_process: str, records: Sequence[dict]) -> None:
+        """
+        Add the data validation errors of a batch of records to a telemetry
+        sub process.
+        Each telemetry rule of the sub process is evaluated across all
+        (sampled) records and the error counts are added directly to the sub
+        process.
+
+        Method does not update BASE_COUNT.
+
+        :param sub_process: applicable subprocess for the errors
+        :type sub_process: str
+        :param records: data generated by subproces for which telemetry
+                        needs to be generated
+        :param type: list of dicts
+        :returns: None
+        """
+        if sub_process in self._samplers:
+            self._add_sampled_validation_error_counts(sub_process, records)
+        else:
+            error_counts = self._compiled_rules.validate_many(sub_process, records)
+            self._sub_process_counters(sub_process).increase_error_counts(error_counts)
+
+    def _add_sampled_validation_errors(self, sub_process: str, data: dict) -> None:
+        """Validates the data when it is sampled and adds the extrapolated
+        validation errors to the sub process.
+
+        :param sub_process: applicable subprocess with a sampling policy
+        :type sub_process: str
+        :param data: data provided by subprocess
+        :type data: dict
+        :returns: None
+        """
+        sampler = self._sampler(sub_process)
+        counters = self._sub_process_counters(sub_process)
+        weight = sampler.sample()
+        counters.increase_sample_counts(
+            base_increment=1, sampled_increment=int(weight is not None)
+        )
+        if weight is None:
+            return
+
+        error_counts = self._count_validation_errors(sub_process, data)
+        counters.increase_error_counts(sampler.extrapolate(error_counts, weight))
+
+    def _add_sampled_validation_error_counts(
+        self, sub_process: str, records: Sequence[dict]
+    ) -> None:
+        """Validates the sampled records of a batch and adds the extrapolated
+        validation error counts to the sub process.
+
+        The sampled records are validated in batches of records with the same
+        weight.
+
+        :param sub_process: applicable subprocess with a sampling policy
+        :type sub_process: str
+        :param records: data provided by subprocess
+        :type records: list of dicts
+        :returns: None
+        """
+        sampler = self._sampler(sub_process)
+        counters = self._sub_process_counters(sub_process)
+        samples: Dict[float, List[dict]] = defaultdict(list)
+        for record in records:
+            if (weight := sampler.sample()) is not None:
+                samples[weight].append(record)
+        counters.increase_sample_counts(
+            base_increment=len(records),
+            sampled_increment=sum(len(sample) for sample in samples.values()),
+        )
+        for weight, sample in samples.items():
+            error_counts = self._compiled_rules.validate_many(sub_process, sample)
+            counters.increase_error_counts(sampler.extrapolate(error_counts, weight))
+
+    def _sampler(self, sub_process: str) -> Sampler:
+        """Returns the sampler of a sub process, in concurrent mode each
+        thread has its own sampler."""
+        if not self._concurrent:
+            return self._samplers[sub_process]
+
+        thread_samplers = self._thread_local.__dict__.setdefault("samplers", {})
+        if sub_process not in thread_samplers:
+            thread_samplers[sub_process] = Sampler(
+                self._samplers[sub_process].sampling_policy
+            )
+        return thread_samplers[sub_process]
 
-        Data is validated based upon telemetry rules for the subprocces
+    def _create_samplers(
+        self, sampling_policies: Dict[str, AbstractSamplingPolicy]
+    ) -> Dict[str, Sampler]:
+        """Returns a sampler for each sub process with a sampling policy.
+
+        Raises:
+            InvalidSubProcess: when sub process is not valid for process type
+            InvalidSamplingPolicy: when the policy is not a sampling policy
+        """
+        samplers = {}
+        for sub_process, sampling_policy in sampling_policies.items():
+            if not self._process_type.has_sub_process(sub_process):
+                raise exceptions.InvalidSubProcess(sub_process, self._process_type)
+            samplers[sub_process] = Sampler(sampling_policy)
+        return samplers
+
+    def _count_validation_errors(self, sub_process: str, data: dict) -> Dict[str, int]:
+        """Returns the number of validation errors per error code key.
+
+        The errors are counted per rule without creating an ErrorCode for
+        each error. With parallel validation the entries of large list fields
+        are validated in chunks in the executor.
 
         :param sub_process: applicable subprocess
         :typesub_process: str
         :param data: data provided by subprocess
         :type data: dict
-        :returns: list of Errorcodes
+        :returns: dict with the number of errors per error code key
         """
-        telemetry_rules = self._telemetry_rules.get(sub_process, {})
-        return DictValidator().validate(data, telemetry_rules)
+        if self._parallel_validation:
+            return self._compiled_rules.validate_parallel(
+                sub_process, data, self._parallel_validation
+            )
+        return self._compiled_rules.validate_many(sub_process, [data])
 
     def _add_errors(self, sub_process: str, errors: list[ErrorCode]) -> None:
         """Adds the error to a telemetry sub process.
@@ -241,21 +498,26 @@ class Telemetry:
     @_raise_exception_if_telemetry_closed
     def set_orange_traffic_light(self) -> None:
         """Sets traffic light attribute to orange."""
-        self.telemetry.set_orange_traffic_light()
+        self._telemetry.set_orange_traffic_light()
 
     @_raise_exception_if_telemetry_closed
     def set_red_traffic_light(self) -> None:
         """Sets traffic light attribute to red."""
-        self.telemetry.set_red_traffic_light()
+        self._telemetry.set_red_traffic_light()
 
     def _set_runtime(self) -> None:
         """Method to calculate and set the runtime seconds (in str)."""
         run_time = datetime.now() - self.start_date_time
-        setattr(self.telemetry, st.RUN_TIME, round(run_time.total_seconds(), 2))
+        setattr(self._telemetry, st.RUN_TIME, round(run_time.total_seconds(), 2))
 
     def get(self, sub_process: str) -> TelemetryData:
         """Returns the data object for a sub process.
 
+        While the telemetry object is open the counters are materialised into
+        the data object first, in concurrent mode including the counters of
+        all thread shards. Changes made to the data object are kept, counters
+        increased later are only in the data object returned by a next call.
+
         Args:
             sub_process (str): name of sub_process name
 
@@ -269,7 +531,99 @@ class Telemetry:
         if self._sub_process_not_yet_initialized(sub_process):
             raise exceptions.BaseCountForSubProcessNotAdded(sub_process)
 
-        return self.telemetry_data[sub_process]
+        if self._closed:
+            return self.telemetry_data[sub_process]
+        with self._lock:
+            return self._materialise_sub_process(sub_process)
+
+    def _sub_process_counters(self, sub_process: str) -> SubProcessCounters:
+        """Returns the counters of a sub process to increase, the sub process
+        is initialized when needed.
+
+        In concurrent mode these are the counters in the shard of the current
+        thread.
+        """
+        if sub_process not in self._counters.telemetry:
+            self._initialize_sub_process(sub_process)
+        if self._concurrent:
+            return self._thread_shard().get_sub_process_counters(sub_process)
+        return self._counters.telemetry[sub_process]
+
+    def _merged_sub_process_counters(self, sub_process: str) -> SubProcessCounters:
+        """Returns a copy of the counters of a sub process with the counters
+        of the thread shards added."""
+        merged_counters = self._counters.telemetry[sub_process].copy()
+        for shard in list(self._thread_shards):
+            if shard_counters := shard.telemetry.get(sub_process):
+                merged_counters.add(shard_counters.copy())
+        return merged_counters
+
+    def _thread_shard(self) -> CounterStore:
+        """Returns the shard of the current thread, creates it when needed."""
+        try:
+            return self._thread_local.shard
+        except AttributeError:
+            shard = CounterStore()
+            self._thread_local.shard = shard
+            with self._lock:
+                self._thread_shards.append(shard)
+            return shard
+
+    def _merge_thread_shards(self) -> None:
+        """Adds the counters of all thread shards to the telemetry object."""
+        with self._lock:
+            thread_shards, self._thread_shards = self._thread_shards, []
+            self._thread_local = threading.local()
+        for shard in thread_shards:
+            self._counters.add(shard)
+
+    def _add_shard(self, shard: TelemetryShard) -> None:
+        """Adds the counters, io time and traffic light of a shard to the
+        telemetry object."""
+        self._counters.add(shard)
+        self._telemetry.raise_traffic_light(shard.traffic_light)
+
+    def close_as_shard(self) -> TelemetryShard:
+        """
+        Closes the telemetry instance without storing it and returns its
+        counters as a TelemetryShard. Use this in a child process and merge the
+        shard into the telemetry instance of the parent process with
+        merge_shards, so a single telemetry object is stored.
+
+        Returns:
+            TelemetryShard: the counters, io time and traffic light
+        """
+        self._close()
+        return TelemetryShard(
+            telemetry=self.telemetry_data,
+            io_time_in_seconds=self.io_time_in_seconds,
+            traffic_light=self.traffic_light,
+        )
+
+    @_raise_exception_if_telemetry_closed
+    def merge_shards(self, shards: Iterable[TelemetryShard]) -> None:
+        """
+        Adds the counters, io time and traffic light of shards returned by
+        child processes to the telemetry instance. Unlike adding telemetry
+        objects the aggregation counters are not increased.
+
+        Args:
+            shards (Iterable[TelemetryShard]): shards of the child processes
+
+        Raises:
+            InvalidSubProcess:
+                when a shard has a sub process that is not defined in the
+                process type, none of the shards is merged then
+        """
+        shards = list(shards)
+        for shard in shards:
+            for sub_process in shard.telemetry:
+                if not self._process_type.has_sub_process(sub_process):
+                    raise exceptions.InvalidSubProcess(sub_process, self._process_type)
+
+        with self._lock:
+            for shard in shards:
+                self._add_shard(shard)
 
     @_raise_exception_if_telemetry_closed
     def increase_io_time(self, incremental_io_time: float) -> None:
@@ -279,9 +633,11 @@ class Telemetry:
         Args:
             io_time (float): io_time that needs to be added to the total io_time
         """
-        current_io_time = getattr(self._telemetry, st.IO_TIME_KEY)
-        increased_io_time = current_io_time + incremental_io_time
-        setattr(self._telemetry, st.IO_TIME_KEY, increased_io_time)
+        if self._concurrent:
+            self._thread_shard().increase_io_time(incremental_io_time)
+            return
+
+        self._counters.io_time_in_seconds += incremental_io_time
 
     @_raise_exception_if_telemetry_closed
     def increase_sub_process_base_count(
@@ -293,10 +649,7 @@ class Telemetry:
         Args:
             sub_process (str): name of subprocess
         """
-        if self._sub_process_not_yet_initialized(sub_process):
-            self._initialize_sub_process(sub_process)
-
-        self.get(sub_process).increase_base_count(increment)
+        self._sub_process_counters(sub_process).increase_base_count(increment)
 
     @_raise_exception_if_telemetry_closed
     def increase_sub_process_fail_count(
@@ -308,10 +661,7 @@ class Telemetry:
         Args:
             sub_process (str): name of subprocess
         """
-        if self._sub_process_not_yet_initialized(sub_process):
-            self._initialize_sub_process(sub_process)
-
-        self.get(sub_process).increase_fail_count(increment)
+        self._sub_process_counters(sub_process).increase_fail_count(increment)
 
     @_raise_exception_if_telemetry_closed
     def increase_sub_process_error_count(
@@ -329,11 +679,11 @@ class Telemetry:
             BaseCountForSubProcessNotAdded: if subprocess has not yet been
                                             created
         """
-        if self._sub_process_not_yet_initialized(sub_process):
+        if sub_process not in self._counters.telemetry:
             raise exceptions.BaseCountForSubProcessNotAdded(sub_process)
 
-        self.get(sub_process).increase_error_count(
-            increment=increment, error_code=error_code
+        self._sub_process_counters(sub_process).increase_error_count(
+            increment=increment, error_code_key=error_code.code
         )
 
     @_raise_exception_if_telemetry_closed
@@ -352,10 +702,7 @@ class Telemetry:
             BaseCountForSubProcessNotAdded: if subprocess has not yet been
                                             created
         """
-        if self._sub_process_not_yet_initialized(sub_process):
-            self._initialize_sub_process(sub_process)
-
-        self.get(sub_process).increase_custom_count(
+        self._sub_process_counters(sub_process).increase_custom_count(
             increment=increment, counter=custom_counter
         )
 
@@ -368,7 +715,7 @@ class Telemetry:
         Returns:
             bool: True if sub_process is inialized, False otherwise
         """
-        return sub_process in self.telemetry_data
+        return sub_process in self._counters.telemetry
 
     def _sub_process_not_yet_initialized(self, sub_process: str) -> bool:
         """Returns True if provided sub_process is not yet initialized
@@ -394,10 +741,16 @@ class Telemetry:
         Args:
             sub_process (str): sub process name
         """
-        if sub_process not in self.sub_process_types:
+        if not self._process_type.has_sub_process(sub_process):
             raise exceptions.InvalidSubProcess(sub_process, self._process_type)
 
-        if sub_process in self.telemetry_data:
+        if self._concurrent:
+            # another thread may have initialized the sub process meanwhile
+            with self._lock:
+                self._counters.telemetry.setdefault(sub_process, SubProcessCounters())
+            return
+
+        if sub_process in self._counters.telemetry:
             raise exceptions.SubProcessAlreadyInitialized(sub_process)
 
-        self.telemetry_data.update(**{sub_process: TelemetryData()})
+        self._counters.telemetry[sub_process] = SubProcessCounters()
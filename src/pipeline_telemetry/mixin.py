@@ -3,7 +3,7 @@ Module to define TelemetryMixin class for adding methods to
 a class that allow easy Telemetry updates
 """
 
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union, cast
 
 from errors import ReturnValueWithStatus
 
@@ -12,11 +12,37 @@ from .helper import (
     add_telemetry_counters_from_return_value,
 )
 from .main import Telemetry
+from .scope import get_active_telemetry, get_scoped_telemetry
 from .settings.data_class import TelemetryCounter
+from .switch import NULL_TELEMETRY, is_any_telemetry_disabled
 
 
 class TelemetryMixin:
-    _telemetry: Telemetry
+    """
+    Mixin class with methods to update the active telemetry of the instance.
+
+    The `_telemetry` attribute returns the active telemetry of the instance in
+    the current context, so concurrent calls of decorated methods on the same
+    instance each use their own telemetry object.
+    """
+
+    @property
+    def _telemetry(self) -> Optional[Telemetry]:
+        """
+        Returns the active telemetry of the instance in the current context,
+        or the telemetry assigned to the instance when no scope is active.
+        NULL_TELEMETRY is returned when the instance has no telemetry while
+        telemetry is disabled.
+        """
+        telemetry = get_scoped_telemetry(self) or self.__dict__.get("_telemetry")
+        if telemetry is None and is_any_telemetry_disabled():
+            # NullTelemetry has the methods of Telemetry the callers use
+            return cast(Telemetry, NULL_TELEMETRY)
+        return telemetry
+
+    @_telemetry.setter
+    def _telemetry(self, telemetry: Optional[Telemetry]) -> None:
+        self.__dict__["_telemetry"] = telemetry
 
     def process_errors_from_return_value(
         self, sub_process: str, return_value: ReturnValueWithStatus
@@ -85,4 +111,4 @@ class TelemetryMixin:
             source_name (str): The source_name that should be added to the
                                telemetry object.
         """
-        self._telemetry.telemetry.source_name = source_name
+        get_active_telemetry(self).telemetry.source_name = source_name
@@ -0,0 +1,85 @@
+"""
+Module to define the active telemetry scope.
+
+The telemetry decorators make the telemetry object they create the active
+telemetry of the decorated object in the current context (thread or asyncio
+task). Concurrent calls of decorated methods of a shared object each get their
+own active telemetry, so they do not overwrite each others counters.
+
+functions:
+    - get_scoped_telemetry: returns the active telemetry scope of an object
+    - get_active_telemetry: returns the active telemetry of an object
+    - telemetry_scope: context manager that sets the active telemetry
+
+Usage
+
+>>> with telemetry_scope(pipeline, Telemetry(**telemetry_params)):
+...     increase_base_count(pipeline, "RETRIEVE_RAW_DATA")
+
+Objects without an active telemetry in the current context fall back to their
+`_telemetry` attribute. New threads do not inherit the active telemetry of the
+thread that started them.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, cast
+
+from .settings import exceptions
+from .switch import NULL_TELEMETRY, is_any_telemetry_disabled
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .main import Telemetry
+
+# active telemetry per id of the object with telemetry, the dict is replaced
+# and never changed so the contexts do not share changes
+_ACTIVE_TELEMETRY: ContextVar[Dict[int, "Telemetry"]] = ContextVar("active_telemetry")
+# returned when no scope was set in the current context, never changed
+_NO_SCOPES: Dict[int, "Telemetry"] = {}
+
+
+def get_scoped_telemetry(object_with_telemetry: Any) -> Optional["Telemetry"]:
+    """
+    Returns the active telemetry of object_with_telemetry in the current
+    context, or None when no telemetry scope is active for the object.
+    """
+    return _ACTIVE_TELEMETRY.get(_NO_SCOPES).get(id(object_with_telemetry))
+
+
+def get_active_telemetry(object_with_telemetry: Any) -> "Telemetry":
+    """
+    Returns the active telemetry of object_with_telemetry in the current
+    context, or its `_telemetry` attribute when no telemetry scope is active.
+    When the object has no telemetry while telemetry is disabled, see
+    switch.py, NULL_TELEMETRY is returned.
+
+    Raises:
+        NoActiveTelemetry: when the object has no telemetry
+    """
+    telemetry = get_scoped_telemetry(object_with_telemetry) or getattr(
+        object_with_telemetry, "_telemetry", None
+    )
+    if not telemetry:
+        if is_any_telemetry_disabled():
+            # NullTelemetry has the methods of Telemetry the callers use
+            return cast("Telemetry", NULL_TELEMETRY)
+        raise exceptions.NoActiveTelemetry(object_with_telemetry)
+    return telemetry
+
+
+@contextmanager
+def telemetry_scope(
+    object_with_telemetry: Any, telemetry: "Telemetry"
+) -> Iterator["Telemetry"]:
+    """
+    Context manager to make telemetry the active telemetry of
+    object_with_telemetry in the current context. The previous active
+    telemetry is restored on exit.
+    """
+    token = _ACTIVE_TELEMETRY.set(
+        _ACTIVE_TELEMETRY.get(_NO_SCOPES) | {id(object_with_telemetry): telemetry}
+    )
+    try:
+        yield telemetry
+    finally:
+        _ACTIVE_TELEMETRY.reset(token)
@@ -1,9 +1,12 @@
 from .date_ranges import DateRange, DateTimeRange
 from .settings import (
     AGGR_DATE_TIME_RANGE_METHODS,
+    AGGREGATION_KEY,
     CATEGORY_KEY,
+    DEFAULT_STORE_BATCH_SIZE,
     DEFAULT_TRAFIC_LIGHT_COLOR,
     PROCESS_TYPE_KEY,
+    SINGLE_TELEMETRY_TYPE,
     SOURCE_NAME_KEY,
     START_TIME,
     SUB_CATEGORY_KEY,
@@ -14,9 +17,12 @@ from .settings import (
 
 __all__ = [
     "AGGR_DATE_TIME_RANGE_METHODS",
+    "AGGREGATION_KEY",
     "CATEGORY_KEY",
+    "DEFAULT_STORE_BATCH_SIZE",
     "DEFAULT_TRAFIC_LIGHT_COLOR",
     "PROCESS_TYPE_KEY",
+    "SINGLE_TELEMETRY_TYPE",
     "SOURCE_NAME_KEY",
     "START_TIME",
     "SUB_CATEGORY_KEY",
@@ -5,15 +5,40 @@ from typing import Any, List, Optional
 
 from errors import ErrorCode
 
+from pipeline_telemetry.scope import get_active_telemetry
 from pipeline_telemetry.settings import exceptions
 
 
 @dataclass(frozen=True)
 class ProcessType:
-    """Immutable dataclass to define a process type and its subtypes."""
+    """Immutable dataclass to define a process type and its subtypes.
+
+    The subtypes are also kept in a frozenset, so checking if a sub process
+    belongs to the process type does not scan the list of subtypes.
+    """
 
     process_type: str
     subtypes: list = field(default_factory=lambda: [])
+    # resolved in __post_init__
+    subtype_set: frozenset = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "subtype_set", frozenset(self.subtypes))
+        object.__setattr__(
+            self, "_hash", hash((self.process_type, tuple(self.subtypes)))
+        )
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        # string hashes differ per process, so resolve again when unpickled
+        return (self.__class__, (self.process_type, self.subtypes))
+
+    def has_sub_process(self, sub_process: str) -> bool:
+        """Returns True when sub_process is a subtype of the process type."""
+        return sub_process in self.subtype_set
 
     @property
     def name(self) -> str:
@@ -28,7 +53,12 @@ class ProcessType:
 
 @dataclass(frozen=True)
 class TelemetryCounter:
-    """Immutable dataclass to define a process type and its subtypes."""
+    """Immutable dataclass to define a process type and its subtypes.
+
+    The counter is resolved once when it is created: the validity of the
+    sub process, the key of the counter and the hash are cached, so adding
+    the same counter many times does not repeat that work.
+    """
 
     sub_process: str
     process_types: Optional[List[ProcessType]] = None
@@ -36,8 +66,45 @@ class TelemetryCounter:
     counter_name: Optional[str] = None
     increment: int = 1
     error: Optional[ErrorCode] = None
+    # resolved in __post_init__
+    counter_key: str = field(init=False, repr=False, compare=False)
+    is_error_counter: bool = field(init=False, repr=False, compare=False)
+    _sub_process_is_valid: bool = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "_sub_process_is_valid",
+            any(
+                process_type.has_sub_process(self.sub_process)
+                for process_type in self.all_process_types
+            ),
+        )
+        object.__setattr__(self, "is_error_counter", bool(self.error))
+        object.__setattr__(
+            self, "counter_key", self.error.code if self.error else self.counter_name
+        )
+        object.__setattr__(self, "_hash", self._compute_hash())
 
     def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        # string hashes differ per process, so resolve again when unpickled
+        return (
+            self.__class__,
+            (
+                self.sub_process,
+                self.process_types,
+                self.process_type,
+                self.counter_name,
+                self.increment,
+                self.error,
+            ),
+        )
+
+    def _compute_hash(self) -> int:
         hash_list = [
             process_type.process_type for process_type in self.process_types or []
         ]
@@ -55,22 +122,18 @@ class TelemetryCounter:
         self, object_with_telemetry: Any, increment: Optional[int] = None
     ) -> None:
         """
-        Method to add to add self (the TelemetryCounter) to an object telemetry
-        instance
+        Method to add to add self (the TelemetryCounter) to the active
+        telemetry instance of an object
         """
-        object_with_telemetry._telemetry.add_telemetry_counter(
-            telemetry_counter=self, increment=increment
+        get_active_telemetry(object_with_telemetry).add_telemetry_counter(
+            self, increment
         )
 
     def validate_sub_process(self) -> None:
         """
         Raises exception if sub_process not define in ProcessType in scope.
         """
-        subtypes = []
-        for process_type in self.all_process_types:
-            subtypes.extend(process_type.subtypes)
-
-        if self.sub_process not in subtypes:
+        if not self._sub_process_is_valid:
             raise exceptions.InvalidSubProcessForProcessType
 
     @property
@@ -1,7 +1,7 @@
 """ """
 
 from datetime import date, datetime, timedelta
-from typing import Iterator, NamedTuple
+from typing import Callable, Iterator, NamedTuple
 
 
 class DateRange(NamedTuple):
@@ -101,3 +101,75 @@ def get_weekly_date_range_for_single_date(date: date) -> DateTimeRange:
     return date_range_to_date_time_range(
         DateRange(from_date=first_day_of_week, to_date=first_day_next_week)
     )
+
+
+def get_quarterly_date_range_for_single_date(date: date) -> DateTimeRange:
+    """
+    Return single quarterly date range for a given date.
+    """
+    first_month_of_quarter = 3 * ((date.month - 1) // 3) + 1
+    first_day_of_quarter = date.replace(month=first_month_of_quarter, day=1)
+    first_day_next_quarter = first_day_of_quarter
+    for _ in range(3):
+        first_day_next_quarter = (first_day_next_quarter + timedelta(days=32)).replace(
+            day=1
+        )
+    return date_range_to_date_time_range(
+        DateRange(from_date=first_day_of_quarter, to_date=first_day_next_quarter)
+    )
+
+
+def period_date_range_generator(
+    start_date: date,
+    end_date: date,
+    date_range_for_single_date: Callable[[date], DateTimeRange],
+) -> Iterator[DateTimeRange]:
+    """Iterator for consecutive date time ranges of a period (week, month etc.)
+
+    Args:
+        start_date (date): start date
+        end_date (date): end date (not included)
+        date_range_for_single_date (Callable):
+            method returning the date time range of the period for a date
+
+    Yields:
+        Iterator[DateTimeRange]:
+            date time range for each period from the period that contains
+            start_date up to and including the period that contains the day
+            before end_date
+    """
+    while start_date < end_date:
+        date_time_range = date_range_for_single_date(start_date)
+        yield date_time_range
+        start_date = date_time_range.to_date.date()
+
+
+def get_weekly_date_ranges(start_date: date, end_date: date) -> Iterator[DateTimeRange]:
+    """
+    Iterator to return weekly date ranges from start_date to end_date.
+    """
+    return period_date_range_generator(
+        start_date, end_date, get_weekly_date_range_for_single_date
+    )
+
+
+def get_monthly_date_ranges(
+    start_date: date, end_date: date
+) -> Iterator[DateTimeRange]:
+    """
+    Iterator to return monthly date ranges from start_date to end_date.
+    """
+    return period_date_range_generator(
+        start_date, end_date, get_monthly_date_range_for_single_date
+    )
+
+
+def get_quarterly_date_ranges(
+    start_date: date, end_date: date
+) -> Iterator[DateTimeRange]:
+    """
+    Iterator to return quarterly date ranges from start_date to end_date.
+    """
+    return period_date_range_generator(
+        start_date, end_date, get_quarterly_date_range_for_single_date
+    )
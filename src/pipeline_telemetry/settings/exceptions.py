@@ -13,6 +13,13 @@ exceptions
 - ProcessTypeMustBeOfClassProcessType
 - ProcessTypeNotRegistered
 - RequestedDataTimeRangeMethodNotFound
+- UnknownOverflowPolicy
+- WriteBehindWorkerStopped
+- CircularAggregatorDependency
+- InvalidSamplingPolicy
+- AsyncStorageClassRequiresAwait
+- CoroutineMethodNotSupported
+- NoActiveTelemetry
 """
 
 from typing import List
@@ -204,3 +211,75 @@ class RequestedDataTimeRangeMethodNotFound(Exception):
     def __init__(self, telemetry_aggr_type: str):
         message = f"No date_time_range method found for {telemetry_aggr_type}."
         super().__init__(message)
+
+
+class UnknownOverflowPolicy(Exception):
+    def __init__(self, overflow_policy: str, available_policies: List[str]):
+        message = "".join(
+            [
+                f"Unknown overflow policy `{overflow_policy}`, must be one of: ",
+                f"{', '.join(available_policies)}.",
+            ]
+        )
+        super().__init__(message)
+
+
+class WriteBehindWorkerStopped(Exception):
+    def __init__(self, pending: int):
+        message = "".join(
+            [
+                "Write behind worker thread stopped with ",
+                f"{pending} telemetry object(s) pending.",
+            ]
+        )
+        super().__init__(message)
+
+
+class CircularAggregatorDependency(Exception):
+    def __init__(self, aggregator_names: List[str]):
+        message = "".join(
+            [
+                "Aggregators can not be ordered on from and to telemetry type: ",
+                f"{', '.join(aggregator_names)}.",
+            ]
+        )
+        super().__init__(message)
+
+
+class InvalidSamplingPolicy(Exception):
+    def __init__(self, reason: str):
+        message = f"Invalid sampling policy: {reason}."
+        super().__init__(message)
+
+
+class AsyncStorageClassRequiresAwait(Exception):
+    def __init__(self, class_name: str):
+        message = "".join(
+            [
+                f"StorageClass `{class_name}` is async, close the telemetry ",
+                "object with `await async_save_and_close()`.",
+            ]
+        )
+        super().__init__(message)
+
+
+class CoroutineMethodNotSupported(Exception):
+    def __init__(self, method_name: str):
+        message = "".join(
+            [
+                f"Method `{method_name}` is a coroutine function, use the async ",
+                "telemetry decorators.",
+            ]
+        )
+        super().__init__(message)
+
+
+class NoActiveTelemetry(Exception):
+    def __init__(self, object_with_telemetry: object):
+        message = "".join(
+            [
+                f"No active telemetry for `{object_with_telemetry}`, call a method ",
+                "with a telemetry decorator or set the `_telemetry` attribute.",
+            ]
+        )
+        super().__init__(message)
@@ -1,6 +1,6 @@
 """Module to define ProcesTypes class."""
 
-from typing import List, Type
+from typing import Dict, List, Optional, Set, Type
 
 from pipeline_telemetry.settings import exceptions
 from pipeline_telemetry.settings.data_class import ProcessType
@@ -8,9 +8,17 @@ from pipeline_telemetry.settings.settings import BaseEnumerator
 
 
 class ProcessTypes:
-    """Singleton Class for registering process_types"""
+    """Singleton Class for registering process_types
+
+    Next to the list of registered process types the class keeps hashed
+    indexes of the process types by key and by name, so looking up or
+    checking a process type does not scan the list.
+    """
 
     _process_types: List[ProcessType] = []
+    _process_types_by_key: Dict[str, ProcessType] = {}
+    _process_types_by_name: Dict[str, ProcessType] = {}
+    _registered_process_types: Set[ProcessType] = set()
 
     def __new__(cls):
         return cls
@@ -24,6 +32,9 @@ class ProcessTypes:
             raise exceptions.ProcessTypeMustBeOfClassProcessType
         setattr(cls, process_type_key, process_type)
         cls._process_types.append(process_type)
+        cls._process_types_by_key[process_type_key] = process_type
+        cls._process_types_by_name[process_type.name] = process_type
+        cls._registered_process_types.add(process_type)
 
     @classmethod
     def register_process_types(cls, process_types: Type[BaseEnumerator]) -> None:
@@ -50,7 +61,17 @@ class ProcessTypes:
         Returns:
             Bool: True of process_type is registered else False
         """
-        return process_type in cls._process_types
+        return process_type in cls._registered_process_types
+
+    @classmethod
+    def get_by_key(cls, process_type_key: str) -> Optional[ProcessType]:
+        """Returns the process type registered with process_type_key or None."""
+        return cls._process_types_by_key.get(process_type_key)
+
+    @classmethod
+    def get_by_name(cls, name: str) -> Optional[ProcessType]:
+        """Returns the last registered process type with name or None."""
+        return cls._process_types_by_name.get(name)
 
 
 class ProcessTypesMeta(type):
@@ -78,18 +99,20 @@ class ProcessTypesMeta(type):
         class_dict["_process_types"] = process_types
         return type.__new__(cls, name, bases_with_proces_types, class_dict)
 
-    # Empty methods defined in meta class to ensure typing and autocompletion is working
+    # Methods defined in meta class to ensure typing and autocompletion is
+    # working. Classes created with the meta class get the ProcessTypes methods
+    # as they derive from ProcessTypes, the methods here delegate to them.
     @classmethod
     def register_process_type(
         cls, process_type_key: str, process_type: ProcessType
     ) -> None:
         """Class method to register a single process type."""
-        ...
+        ProcessTypes.register_process_type(process_type_key, process_type)
 
     @classmethod
     def register_process_types(cls, process_types: type[BaseEnumerator]) -> None:
         """Class method to register new errors from enumerator."""
-        ...
+        ProcessTypes.register_process_types(process_types)
 
     @classmethod
     def is_registered(cls, process_type: ProcessType) -> bool:
@@ -101,4 +124,14 @@ class ProcessTypesMeta(type):
         Returns:
             Bool: True of process_type is registered else False
         """
-        raise NotImplementedError
+        return ProcessTypes.is_registered(process_type)
+
+    @classmethod
+    def get_by_key(cls, process_type_key: str) -> Optional[ProcessType]:
+        """Returns the process type registered with process_type_key or None."""
+        return ProcessTypes.get_by_key(process_type_key)
+
+    @classmethod
+    def get_by_name(cls, name: str) -> Optional[ProcessType]:
+        """Returns the last registered process type with name or None."""
+        return ProcessTypes.get_by_name(name)
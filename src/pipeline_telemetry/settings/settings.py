@@ -19,6 +19,7 @@ AGGR_DATE_TIME_RANGE_METHODS: dict[str, Callable] = {
     DAILY_AGGR_TELEMETRY_TYPE: dr.get_daily_date_range_for_single_date,
     WEEKLY_AGGR_TELEMETRY_TYPE: dr.get_weekly_date_range_for_single_date,
     MONTHLY_AGGR_TELEMETRY_TYPE: dr.get_monthly_date_range_for_single_date,
+    QUARTERLY_AGGR_TELEMETRY_TYPE: dr.get_quarterly_date_range_for_single_date,
 }
 
 DEFAULT_TELEMETRY_TYPE = SINGLE_TELEMETRY_TYPE
@@ -39,6 +40,12 @@ TRAFIC_LIGHT_COLOR_GREEN = "GREEN"
 TRAFIC_LIGHT_COLOR_ORANGE = "ORANGE"
 TRAFIC_LIGHT_COLOR_RED = "RED"
 DEFAULT_TRAFIC_LIGHT_COLOR: str = TRAFIC_LIGHT_COLOR_GREEN
+# traffic light colors from least to most severe
+TRAFIC_LIGHT_COLORS_BY_SEVERITY = [
+    TRAFIC_LIGHT_COLOR_GREEN,
+    TRAFIC_LIGHT_COLOR_ORANGE,
+    TRAFIC_LIGHT_COLOR_RED,
+]
 
 
 BASE_COUNT_KEY = "base_counter"
@@ -55,8 +62,42 @@ TRAFFIC_LIGHT_KEY = "traffic_light"
 TELEMETRY_TYPE_KEY = "telemetry_type"
 IO_TIME_KEY = "io_time_in_seconds"
 TELEMETRY_FIELD_KEY = "telemetry"
+WATERMARK_KEY = "watermark"
+# set to True on the stored documents of daily up to quarterly aggregations
+PERIOD_AGGREGATION_KEY = "period_aggregation"
 AGGREGATION_KEY = "telemetry_aggregation_stats"
 
+# Custom counters of a sub process with a sampling policy: the nr of records
+# offered to the sampling policy and the nr of records that were validated.
+# The error counts of the sub process are extrapolated from the sample.
+SAMPLING_BASE_COUNT_KEY = "sampling_base_count"
+SAMPLED_COUNT_KEY = "sampled_count"
+
+# Overflow policies for the write behind queue used by write behind storage
+# classes. The policy determines what happens when a telemetry object is
+# stored while the queue is full.
+OVERFLOW_POLICY_BLOCK = "block"
+OVERFLOW_POLICY_DROP_NEWEST = "drop_newest"
+OVERFLOW_POLICY_DROP_OLDEST = "drop_oldest"
+OVERFLOW_POLICIES: List[str] = [
+    OVERFLOW_POLICY_BLOCK,
+    OVERFLOW_POLICY_DROP_NEWEST,
+    OVERFLOW_POLICY_DROP_OLDEST,
+]
+DEFAULT_OVERFLOW_POLICY = OVERFLOW_POLICY_BLOCK
+DEFAULT_WRITE_BEHIND_QUEUE_SIZE = 10_000
+# Seconds between the checks whether the write behind worker is still running
+# while waiting for the queue to be processed.
+WRITE_BEHIND_WORKER_CHECK_INTERVAL = 1.0
+
+# Max nr of telemetry objects written to storage in a single bulk write
+DEFAULT_STORE_BATCH_SIZE = 1_000
+
+# Parallel validation: the entries of a list field are only validated in an
+# executor from this nr of entries, in chunks of this size
+DEFAULT_PARALLEL_VALIDATION_THRESHOLD = 100_000
+DEFAULT_VALIDATION_CHUNK_SIZE = 25_000
+
 DEFAULT_CREATE_DATA_SUB_PROCESS_TYPES = [
     "RETRIEVE_RAW_DATA",
     "DATA_CONVERSION",
@@ -45,3 +45,40 @@ class ValidationErrors(FunctionalErrorsBaseClass):
         code="ENTRIES_HAVE_KEY_ERR_004",
         description="Entry that needs to have a key is not a dict",
     )
+
+    COLUMN_BATCH_NOT_FOUND = ErrorCode(
+        code="COLUMNS_ERR_001",
+        description="Field does not contain a column batch",
+    )
+
+    COLUMN_NOT_FOUND = ErrorCode(
+        code="COLUMNS_ERR_002", description="Column missing in column batch"
+    )
+
+    NULL_VALUE_IN_COLUMN = ErrorCode(
+        code="COLUMNS_ERR_003", description="Column contains a null value"
+    )
+
+    UNEXPECTED_NR_OF_ROWS = ErrorCode(
+        code="COLUMNS_ERR_004",
+        description="Column batch contains unexpected nr of rows",
+    )
+
+    VALUE_NOT_IN_SET = ErrorCode(
+        code="COLUMNS_ERR_005", description="Column value not in allowed values"
+    )
+
+    VALUE_OUT_OF_RANGE = ErrorCode(
+        code="COLUMNS_ERR_006",
+        description="Column value is not a number or out of range",
+    )
+
+    COLUMN_OF_WRONG_TYPE = ErrorCode(
+        code="COLUMNS_ERR_007",
+        description="Column does not contain a sequence of values",
+    )
+
+    COLUMNS_OF_UNEQUAL_LENGTH = ErrorCode(
+        code="COLUMNS_ERR_008",
+        description="Columns of column batch have unequal lengths",
+    )
@@ -1,2 +1,13 @@
+from .asynchronous import (  # noqa
+    AbstractAsyncExecutorStorage,
+    AbstractAsyncTelemetryStorage,
+    TelemetryMongoAsyncStorage,
+)
 from .generic import AbstractTelemetryStorage  # noqa
 from .mongo import TelemetryMongoStorage  # noqa
+from .write_behind import (  # noqa
+    AbstractWriteBehindStorage,
+    TelemetryMongoWriteBehindStorage,
+    TelemetryWriteBehindQueue,
+    WriteBehindStats,
+)
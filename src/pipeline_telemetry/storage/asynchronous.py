@@ -0,0 +1,113 @@
+"""Module to provide async storage classes.
+
+An async storage class persists telemetry objects with coroutines, so a
+telemetry object can be closed with `async_save_and_close` without blocking
+the event loop of an asyncio application.
+
+Usage
+
+>>> from pipeline_telemetry import TelemetryMongoAsyncStorage, add_async_telemetry
+>>> @add_async_telemetry(
+        telemetry_params | {"storage_class": TelemetryMongoAsyncStorage})
+    async def decorated_method(self):
+        ...
+
+Custom async storage classes can be defined by subclassing
+AbstractAsyncTelemetryStorage and implementing store_telemetry as a coroutine,
+for example with an async MongoDB driver. Existing storage classes can be used
+by subclassing AbstractAsyncExecutorStorage and setting the STORAGE_CLASS
+attribute, the telemetry objects are then persisted with STORAGE_CLASS in an
+executor. The STORAGE_CLASS must support being used from a thread other than
+the one that created it.
+
+Only persisting telemetry objects is async, for selecting telemetry objects
+and aggregations use the synchronous storage classes.
+"""
+
+import asyncio
+from abc import ABCMeta, abstractmethod
+from concurrent.futures import Executor
+from typing import Iterable, Optional, Type
+
+from ..data_classes import TelemetryModel
+from ..settings import settings as st
+from .generic import AbstractTelemetryStorage
+from .mongo import TelemetryMongoStorage
+
+
+class AbstractAsyncTelemetryStorage(metaclass=ABCMeta):
+    """Abstract Async Telemetry Storage class
+
+    implements the store_telemetry coroutine that persists a given telemetry
+    object
+
+    Any class that stores the telemetry objects with coroutines should be
+    subclassed from this Abstract Class
+    """
+
+    @abstractmethod
+    async def store_telemetry(self, telemetry: TelemetryModel) -> None:
+        """public coroutine to persist telemetry object"""
+
+    async def store_telemetry_batch(
+        self,
+        telemetry_list: Iterable[TelemetryModel],
+        batch_size: int = st.DEFAULT_STORE_BATCH_SIZE,
+    ) -> None:
+        """
+        Public coroutine to persist multiple telemetry objects.
+
+        Storage classes that support bulk writes should override this method
+        and write the telemetry objects in chunks of batch_size. By default
+        each telemetry object is stored with store_telemetry.
+        """
+        for telemetry in telemetry_list:
+            await self.store_telemetry(telemetry)
+
+
+class AbstractAsyncExecutorStorage(AbstractAsyncTelemetryStorage):
+    """
+    Abstract async storage class that persists telemetry objects with
+    STORAGE_CLASS in an executor.
+
+    class attributes:
+    - STORAGE_CLASS: storage class used to persist telemetry in the executor
+    - EXECUTOR: executor to run STORAGE_CLASS in, defaults to the default
+      executor of the event loop
+    """
+
+    STORAGE_CLASS: Type[AbstractTelemetryStorage]
+    EXECUTOR: Optional[Executor] = None
+
+    async def store_telemetry(self, telemetry: TelemetryModel) -> None:
+        """public coroutine to persist telemetry object in the executor"""
+        await asyncio.get_running_loop().run_in_executor(
+            self.EXECUTOR, self.STORAGE_CLASS().store_telemetry, telemetry
+        )
+
+    async def store_telemetry_batch(
+        self,
+        telemetry_list: Iterable[TelemetryModel],
+        batch_size: int = st.DEFAULT_STORE_BATCH_SIZE,
+    ) -> None:
+        """
+        Public coroutine to persist multiple telemetry objects with
+        store_telemetry_batch of STORAGE_CLASS in the executor.
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            self.EXECUTOR,
+            self.STORAGE_CLASS().store_telemetry_batch,
+            list(telemetry_list),
+            batch_size,
+        )
+
+
+class TelemetryMongoAsyncStorage(AbstractAsyncExecutorStorage):
+    """
+    Async storage class that persists telemetry objects in MongoDB using
+    TelemetryMongoStorage in the default executor of the event loop.
+    This class can be used as storage_class argument when creating
+    an instance of Telemetry.
+    """
+
+    STORAGE_CLASS = TelemetryMongoStorage
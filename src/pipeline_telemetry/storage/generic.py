@@ -1,14 +1,18 @@
 """Module to define abstract storage class"""
 
 from abc import ABCMeta, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, Iterator, TypedDict
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, TypedDict
 
-from ..data_classes import TelemetryData, TelemetryModel
+from ..data_classes import TelemetryData, TelemetryModel, TelemetrySelector
 from ..settings import (
     AGGR_DATE_TIME_RANGE_METHODS,
+    AGGREGATION_KEY,
     CATEGORY_KEY,
+    DEFAULT_STORE_BATCH_SIZE,
     PROCESS_TYPE_KEY,
+    SINGLE_TELEMETRY_TYPE,
     SOURCE_NAME_KEY,
     START_TIME,
     SUB_CATEGORY_KEY,
@@ -18,6 +22,15 @@ from ..settings.date_ranges import DateTimeRange
 from ..settings.exceptions import RequestedDataTimeRangeMethodNotFound
 
 
+def chunked(
+    telemetry_list: Iterable[TelemetryModel], chunk_size: int
+) -> Iterator[List[TelemetryModel]]:
+    """Iterator to return the telemetry objects in lists of chunk_size."""
+    telemetry_iterator = iter(telemetry_list)
+    while chunk := list(islice(telemetry_iterator, chunk_size)):
+        yield chunk
+
+
 class UniqueAggregatedTelemetryKeys(TypedDict):
     """
     Class to define what query params are needed to define a unique
@@ -50,6 +63,45 @@ class AbstractTelemetryStorage(metaclass=ABCMeta):
     def store_telemetry(self, telemetry: TelemetryModel) -> None:
         """public method to persist telemetry object"""
 
+    def store_aggregated_telemetry(self, telemetry: TelemetryModel) -> None:
+        """
+        Public method to persist an aggregated telemetry object, replacing the
+        existing aggregation for the same selector and date time range.
+        """
+        self._remove_existing_aggregation_telemetry(telemetry)
+        self.store_telemetry(telemetry)
+
+    def store_telemetry_batch(
+        self,
+        telemetry_list: Iterable[TelemetryModel],
+        batch_size: int = DEFAULT_STORE_BATCH_SIZE,
+    ) -> None:
+        """
+        Public method to persist multiple telemetry objects.
+
+        Storage classes that support bulk writes should override this method
+        and write the telemetry objects in chunks of batch_size. By default
+        each telemetry object is stored with store_telemetry.
+        """
+        for telemetry in telemetry_list:
+            self.store_telemetry(telemetry)
+
+    def store_aggregated_telemetry_batch(
+        self,
+        telemetry_list: Iterable[TelemetryModel],
+        batch_size: int = DEFAULT_STORE_BATCH_SIZE,
+    ) -> None:
+        """
+        Public method to persist multiple aggregated telemetry objects,
+        replacing the existing aggregations as in store_aggregated_telemetry.
+
+        Storage classes that support bulk writes should override this method
+        and upsert the aggregations in chunks of batch_size. By default each
+        aggregation is stored with store_aggregated_telemetry.
+        """
+        for telemetry in telemetry_list:
+            self.store_aggregated_telemetry(telemetry)
+
     @abstractmethod
     def select_records(
         self,
@@ -65,6 +117,59 @@ class AbstractTelemetryStorage(metaclass=ABCMeta):
         Select telemetry records unique to a single process and source for as specific time period.
         """
 
+    def aggregation_count(
+        self,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> int:
+        """
+        Returns the base counter of the aggregation stats of the aggregation of
+        the selected telemetry records, i.e. the number of records plus the
+        number of records aggregated in them, as in TelemetryModel.__add__.
+
+        Storage classes should override this method with a query that counts
+        in the database instead of converting every record.
+        """
+        aggregation_count = 0
+        for telemetry in self.telemetry_list(
+            telemetry_type=telemetry_type,
+            category=category,
+            sub_category=sub_category,
+            source_name=source_name,
+            process_type=process_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        ):
+            aggregation_data = telemetry.telemetry.get(AGGREGATION_KEY)
+            aggregation_count += 1 + (
+                aggregation_data.base_counter if aggregation_data else 0
+            )
+        return aggregation_count
+
+    def distinct_selectors(
+        self,
+        telemetry_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> List[TelemetrySelector]:
+        """
+        Returns the distinct combinations of category, sub category, source
+        and process type of the telemetry records of telemetry_type in a
+        specific time period, sorted on category, sub category, source and
+        process type.
+
+        Storage classes should implement this method with a query that can
+        be answered from an index.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not implement distinct_selectors"
+        )
+
     @abstractmethod
     def _remove_existing_aggregation_telemetry(self, telemetry: TelemetryModel) -> None:
         """
@@ -133,10 +238,19 @@ class AbstractTelemetryStorage(metaclass=ABCMeta):
         For example for a monthly aggregation the input date of 2022-10-10
         will be converted into a datetime range of (2022-10-01, 2022-11-01).
         For a daily aggegration this would result in (2022-10-10, 2022-10-11).
-        etc.
+        etc. A SINGLE TELEMETRY aggregation (of partial telemetry) only covers
+        its own start_date_time.
         """
         start_date_time = getattr(telemetry, START_TIME)
         telemetry_type = getattr(telemetry, TELEMETRY_TYPE_KEY)
+        if telemetry_type == SINGLE_TELEMETRY_TYPE:
+            # a single aggregation of partial telemetry is only unique for its
+            # own start_date_time, other SINGLE TELEMETRY objects are kept
+            return DateTimeRange(
+                from_date=start_date_time,
+                to_date=start_date_time + timedelta(microseconds=1),
+            )
+
         date_time_range_method = AGGR_DATE_TIME_RANGE_METHODS.get(telemetry_type)
         if not date_time_range_method:
             raise RequestedDataTimeRangeMethodNotFound(telemetry_type)
@@ -3,9 +3,9 @@
 import json
 import sqlite3
 from datetime import datetime
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional
 
-from ..data_classes import TelemetryModel
+from ..data_classes import TelemetryModel, TelemetrySelector
 from ..settings import exceptions
 from ..settings import settings as st
 from .generic import AbstractTelemetryStorage
@@ -70,7 +70,10 @@ class TelemetryInMemoryStorage(AbstractTelemetryStorage):
             source_name varchar(40), process_type varchar(40),
             start_date_time timestamp, run_time_in_seconds varchar(20),
             telemetry json, traffic_light varchar(10),
-            io_time_in_seconds real)"""
+            io_time_in_seconds real, watermark timestamp);
+            CREATE INDEX telemetry_selector ON telemetry (telemetry_type,
+            start_date_time, category, sub_category, source_name,
+            process_type);"""
         )
 
     def store_telemetry(self, telemetry: TelemetryModel) -> None:
@@ -87,13 +90,14 @@ class TelemetryInMemoryStorage(AbstractTelemetryStorage):
         run_time_in_seconds = getattr(telemetry, st.RUN_TIME)
         traffic_light = getattr(telemetry, st.TRAFFIC_LIGHT_KEY)
         io_time_in_seconds = getattr(telemetry, st.IO_TIME_KEY)
+        watermark = getattr(telemetry, st.WATERMARK_KEY)
         telemetry_dict = {
             k: v.__dict__ for k, v in getattr(telemetry, st.TELEMETRY_FIELD_KEY).items()
         }
         telemetry_json = json.dumps(telemetry_dict)
 
         self.db_cursor.execute(
-            "insert into telemetry values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            "insert into telemetry values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
             [
                 telemetry_type,
                 category,
@@ -105,6 +109,7 @@ class TelemetryInMemoryStorage(AbstractTelemetryStorage):
                 telemetry_json,
                 traffic_light,
                 str(io_time_in_seconds),
+                watermark.isoformat() if watermark else None,
             ],
         )
 
@@ -132,12 +137,80 @@ class TelemetryInMemoryStorage(AbstractTelemetryStorage):
             f"sub_category='{sub_category}' AND "
             f"source_name='{source_name}' AND "
             f"process_type='{process_type}' AND "
-            f"start_date_time >= '{from_date_time}' AND "
-            f"start_date_time < '{to_date_time}'"
+            f"start_date_time >= '{from_date_time.isoformat()}' AND "
+            f"start_date_time < '{to_date_time.isoformat()}'"
         )
 
         return self.db_cursor.execute(select_statement)
 
+    def aggregation_count(
+        self,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> int:
+        """
+        Returns the base counter of the aggregation stats of the aggregation of
+        the selected telemetry records, counted with a single SQL query that
+        adds the base counter of the aggregation stats of each record.
+        The telemetry records are selected as in select_records.
+        """
+        if not self.db_cursor:
+            raise exceptions.StorageNotInitialized
+
+        aggregated_count = (
+            f"json_extract(telemetry, '$.{st.AGGREGATION_KEY}.{st.BASE_COUNT_KEY}')"
+        )
+        select_statement = (
+            f"SELECT COUNT(*) + COALESCE(SUM({aggregated_count}), 0) "
+            "AS aggregation_count FROM telemetry WHERE "
+            f"telemetry_type='{telemetry_type}' AND "
+            f"category='{category}' AND "
+            f"sub_category='{sub_category}' AND "
+            f"source_name='{source_name}' AND "
+            f"process_type='{process_type}' AND "
+            f"start_date_time >= '{from_date_time.isoformat()}' AND "
+            f"start_date_time < '{to_date_time.isoformat()}'"
+        )
+        return self.db_cursor.execute(select_statement).fetchone()["aggregation_count"]
+
+    def distinct_selectors(
+        self,
+        telemetry_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> List[TelemetrySelector]:
+        """
+        Returns the distinct telemetry selectors of the telemetry records of
+        telemetry_type in a specific time period. The query is answered from
+        the telemetry_selector index.
+        """
+        if not self.db_cursor:
+            raise exceptions.StorageNotInitialized
+
+        select_statement = (
+            "SELECT DISTINCT category, sub_category, source_name, process_type "
+            "FROM telemetry WHERE "
+            f"telemetry_type='{telemetry_type}' AND "
+            f"start_date_time >= '{from_date_time.isoformat()}' AND "
+            f"start_date_time < '{to_date_time.isoformat()}' "
+            "ORDER BY category, sub_category, source_name, process_type"
+        )
+
+        return [
+            TelemetrySelector(
+                category=record[st.CATEGORY_KEY],
+                sub_category=record[st.SUB_CATEGORY_KEY],
+                source_name=record[st.SOURCE_NAME_KEY],
+                process_type=record[st.PROCESS_TYPE_KEY],
+            )
+            for record in self.db_cursor.execute(select_statement)
+        ]
+
     def _remove_existing_aggregation_telemetry(self, telemetry: TelemetryModel) -> None:
         """
         Removes any already existing aggregations for a specific telemetry
@@ -170,14 +243,14 @@ class TelemetryInMemoryStorage(AbstractTelemetryStorage):
             raise exceptions.StorageNotInitialized
 
         select_statement = (
-            "DELETE * FROM telemetry WHERE "
+            "DELETE FROM telemetry WHERE "
             f"telemetry_type='{telemetry_type}' AND "
             f"category='{category}' AND "
             f"sub_category='{sub_category}' AND "
             f"source_name='{source_name}' AND "
             f"process_type='{process_type}' AND "
-            f"start_date_time > '{from_date_time}' AND "
-            f"start_date_time < '{to_date_time}'"
+            f"start_date_time >= '{from_date_time.isoformat()}' AND "
+            f"start_date_time < '{to_date_time.isoformat()}'"
         )
 
         self.db_cursor.execute(select_statement)
@@ -14,9 +14,10 @@ mongoDB instance.
 """
 
 from datetime import datetime
-from typing import Any, Dict, Iterator
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from mongoengine import (
+    BooleanField,
     DateTimeField,
     DictField,
     Document,
@@ -24,10 +25,24 @@ from mongoengine import (
     StringField,
     connect,
 )
+from pymongo import ReplaceOne
 
-from ..data_classes import TelemetryModel
+from ..data_classes import TelemetryModel, TelemetrySelector
 from ..settings import settings as st
-from .generic import AbstractTelemetryStorage
+from ..settings.date_ranges import DateTimeRange
+from .generic import AbstractTelemetryStorage, chunked
+from .mongo_aggregation import (
+    AGGREGATION_INDEX,
+    AGGREGATION_INDEX_FILTER,
+    RECORD_COUNT,
+    SELECTOR_INDEX,
+    add_pipeline_result_to_telemetry,
+    aggregated_telemetry_document,
+    aggregated_telemetry_filter,
+    aggregation_count_pipeline,
+    distinct_selectors_pipeline,
+    telemetry_aggregation_pipeline,
+)
 from .mongo_connection import MONGO_ACCESS_PARAMS
 
 connect(alias="telemetry", **MONGO_ACCESS_PARAMS)
@@ -48,6 +63,8 @@ class TelemetryMongoModel(Document):
     telemetry_type = StringField()
     io_time_in_seconds = FloatField(default=0)
     telemetry = DictField(default=None)
+    watermark = DateTimeField(default=None)
+    period_aggregation = BooleanField(default=None)
 
     meta = {
         "db_alias": "telemetry",
@@ -56,6 +73,12 @@ class TelemetryMongoModel(Document):
             "sub_category",
             "source_name",
             ("category", "sub_category", "source_name", "process_type"),
+            SELECTOR_INDEX,
+            {
+                "fields": list(AGGREGATION_INDEX),
+                "unique": True,
+                "partialFilterExpression": AGGREGATION_INDEX_FILTER,
+            },
             "process_type",
             "traffic_light",
             "start_date_time",
@@ -85,15 +108,78 @@ class TelemetryMongoStorage(AbstractTelemetryStorage):
     """
 
     def store_aggregated_telemetry(self, telemetry: TelemetryModel) -> None:
-        """public method to persist telemetry object"""
-        self._remove_existing_aggregation_telemetry(telemetry)
-        self.store_telemetry(telemetry)
+        """
+        Public method to persist an aggregated telemetry object. The existing
+        aggregation for the same selector and aggregation period is replaced
+        with a single atomic upsert. The start_date_time of the stored
+        aggregation is set to the start of the aggregation period.
+        """
+        aggregation_filter, telemetry_document = self._aggregated_telemetry_replacement(
+            telemetry
+        )
+        TelemetryMongoModel._get_collection().replace_one(
+            aggregation_filter, telemetry_document, upsert=True
+        )
+
+    def store_aggregated_telemetry_batch(
+        self,
+        telemetry_list: Iterable[TelemetryModel],
+        batch_size: int = st.DEFAULT_STORE_BATCH_SIZE,
+    ) -> None:
+        """
+        Public method to persist multiple aggregated telemetry objects with
+        unordered bulk writes of upserts, one bulk write per batch_size
+        telemetry objects. Existing aggregations are replaced as in
+        store_aggregated_telemetry.
+        """
+        collection = TelemetryMongoModel._get_collection()
+        for telemetry_chunk in chunked(telemetry_list, batch_size):
+            requests = [
+                ReplaceOne(
+                    *self._aggregated_telemetry_replacement(telemetry), upsert=True
+                )
+                for telemetry in telemetry_chunk
+            ]
+            collection.bulk_write(requests, ordered=False)
+
+    def _aggregated_telemetry_replacement(
+        self, telemetry: TelemetryModel
+    ) -> Tuple[dict, dict]:
+        """
+        Returns the filter that selects the stored aggregation of telemetry and
+        the document that replaces it, see aggregated_telemetry_document.
+        """
+        query_params_exist_aggr = self._get_aggr_telem_query_params(telemetry)
+        telemetry_document = aggregated_telemetry_document(
+            self._telemetry_model_kwargs(telemetry), query_params_exist_aggr
+        )
+        return aggregated_telemetry_filter(query_params_exist_aggr), telemetry_document
 
     def store_telemetry(self, telemetry: TelemetryModel) -> None:
         """public method to persist telemetry object"""
         telemetry_mongo_kwargs = self._telemetry_model_kwargs(telemetry)
         TelemetryMongoModel(**telemetry_mongo_kwargs).save()
 
+    def store_telemetry_batch(
+        self,
+        telemetry_list: Iterable[TelemetryModel],
+        batch_size: int = st.DEFAULT_STORE_BATCH_SIZE,
+    ) -> None:
+        """
+        Public method to persist multiple telemetry objects with unordered
+        insert_many calls on the mongo collection, one call per batch_size
+        telemetry objects.
+
+        The documents are inserted without creating and validating a
+        TelemetryMongoModel instance for each telemetry object.
+        """
+        collection = TelemetryMongoModel._get_collection()
+        for telemetry_chunk in chunked(telemetry_list, batch_size):
+            documents = [
+                self._telemetry_model_kwargs(telemetry) for telemetry in telemetry_chunk
+            ]
+            collection.insert_many(documents, ordered=False)
+
     def _remove_existing_aggregation_telemetry(self, telemetry: TelemetryModel) -> None:
         """
         Removes any already existing aggregations for a specific telemetry
@@ -124,6 +210,7 @@ class TelemetryMongoStorage(AbstractTelemetryStorage):
         run_time_in_seconds = getattr(telemetry, st.RUN_TIME)
         traffic_light = getattr(telemetry, st.TRAFFIC_LIGHT_KEY)
         io_time_in_seconds = getattr(telemetry, st.IO_TIME_KEY)
+        watermark = getattr(telemetry, st.WATERMARK_KEY)
         telemetry_data = {
             k: v.__dict__ for k, v in getattr(telemetry, st.TELEMETRY_FIELD_KEY).items()
         }
@@ -139,6 +226,7 @@ class TelemetryMongoStorage(AbstractTelemetryStorage):
             st.TRAFFIC_LIGHT_KEY: traffic_light,
             st.TELEMETRY_FIELD_KEY: telemetry_data,
             st.IO_TIME_KEY: io_time_in_seconds,
+            st.WATERMARK_KEY: watermark,
         }
 
     def select_records(
@@ -169,6 +257,130 @@ class TelemetryMongoStorage(AbstractTelemetryStorage):
             **query_details,
         )
 
+    def aggregation_count(
+        self,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> int:
+        """
+        Returns the base counter of the aggregation stats of the aggregation of
+        the selected telemetry records, i.e. the number of records plus the
+        number of records aggregated in them, counted with a MongoDB
+        aggregation pipeline.
+        The telemetry records are selected as in select_records.
+        """
+        pipeline = aggregation_count_pipeline(
+            telemetry_type=telemetry_type,
+            category=category,
+            sub_category=sub_category,
+            source_name=source_name,
+            process_type=process_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        )
+        collection = TelemetryMongoModel._get_collection()
+        for pipeline_result in collection.aggregate(pipeline):
+            return pipeline_result[RECORD_COUNT]
+        return 0
+
+    def aggregate_telemetry(
+        self,
+        telemetry: TelemetryModel,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> TelemetryModel:
+        """
+        Adds up the selected telemetry records with a MongoDB aggregation
+        pipeline and adds the result to telemetry. Only the aggregated counters
+        are retrieved from the database.
+        The telemetry records are selected as in select_records.
+        """
+        pipeline = telemetry_aggregation_pipeline(
+            telemetry_type=telemetry_type,
+            category=category,
+            sub_category=sub_category,
+            source_name=source_name,
+            process_type=process_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        )
+        collection = TelemetryMongoModel._get_collection()
+        for pipeline_result in collection.aggregate(pipeline):
+            add_pipeline_result_to_telemetry([telemetry], pipeline_result)
+        return telemetry
+
+    def aggregate_telemetry_per_date_time_range(
+        self,
+        telemetry: TelemetryModel,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        date_time_ranges: List[DateTimeRange],
+    ) -> List[TelemetryModel]:
+        """
+        Adds up the selected telemetry records per date time range with a single
+        MongoDB aggregation pipeline. The date time ranges must be consecutive.
+
+        Returns:
+            List[TelemetryModel]:
+                copy of telemetry with the aggregation result for each date
+                time range
+        """
+        telemetry_list = [telemetry.telemetry_copy() for _ in date_time_ranges]
+        if not date_time_ranges:
+            return telemetry_list
+
+        pipeline = telemetry_aggregation_pipeline(
+            telemetry_type=telemetry_type,
+            category=category,
+            sub_category=sub_category,
+            source_name=source_name,
+            process_type=process_type,
+            from_date_time=date_time_ranges[0].from_date,
+            to_date_time=date_time_ranges[-1].to_date,
+            bucket_boundaries=[
+                date_time_range.from_date for date_time_range in date_time_ranges
+            ],
+        )
+        collection = TelemetryMongoModel._get_collection()
+        for pipeline_result in collection.aggregate(pipeline):
+            add_pipeline_result_to_telemetry(telemetry_list, pipeline_result)
+        return telemetry_list
+
+    def distinct_selectors(
+        self,
+        telemetry_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> List[TelemetrySelector]:
+        """
+        Returns the distinct telemetry selectors of the telemetry records of
+        telemetry_type in a specific time period with an aggregation pipeline
+        that is covered by the SELECTOR_INDEX index.
+        """
+        pipeline = distinct_selectors_pipeline(
+            telemetry_type=telemetry_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        )
+        collection = TelemetryMongoModel._get_collection()
+        return [
+            TelemetrySelector(**selector["_id"])
+            for selector in collection.aggregate(pipeline)
+        ]
+
     @staticmethod
     def _db_object_to_dict(db_object: Any) -> Dict:
         """Returns a db object as a dict object."""
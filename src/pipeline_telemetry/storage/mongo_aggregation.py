@@ -0,0 +1,418 @@
+"""
+Module to provide a MongoDB aggregation pipeline that adds up telemetry
+documents on the database server.
+
+The pipeline returns the same totals as adding TelemetryModel instances (see
+TelemetryModel.__add__) but only the summed counters are transferred from the
+database. The telemetry documents can be split in buckets of consecutive date
+time ranges in which case the totals are returned per bucket. The result is
+added to the target telemetry objects with add_pipeline_result_to_telemetry.
+
+methods:
+- telemetry_aggregation_pipeline: returns the aggregation pipeline
+- add_pipeline_result_to_telemetry: adds the pipeline result to telemetry objects
+- aggregation_count_pipeline: returns the pipeline that counts the telemetry
+  documents as the aggregation stats of their aggregation would
+- distinct_selectors_pipeline: returns the pipeline that selects the distinct
+  telemetry selectors, covered by the SELECTOR_INDEX index
+- aggregated_telemetry_document: returns the document of an aggregated
+  telemetry object that replaces the stored aggregation
+- aggregated_telemetry_filter: returns the filter that selects the unique
+  document of an aggregated telemetry object
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from ..data_classes import TelemetryModel
+from ..settings import settings as st
+from .generic import UniqueAggregatedTelemetryKeys
+
+# keys used in the documents returned by the aggregation pipeline
+STATS_FACET = "stats"
+TRAFFIC_LIGHT_FACET = "traffic_lights"
+SUB_PROCESS_FACET = "sub_processes"
+COUNTERS_FACET = "counters"
+RECORD_COUNT = "record_count"
+SUB_PROCESS = "sub_process"
+COUNTER_TYPE = "counter_type"
+COUNTER_KEY = "counter_key"
+VALUE = "value"
+BUCKET = "bucket"
+
+# fields of a telemetry selector
+SELECTOR_KEYS = [
+    st.CATEGORY_KEY,
+    st.SUB_CATEGORY_KEY,
+    st.SOURCE_NAME_KEY,
+    st.PROCESS_TYPE_KEY,
+]
+# compound index that covers the distinct selectors pipeline
+SELECTOR_INDEX = (st.TELEMETRY_TYPE_KEY, st.START_TIME, *SELECTOR_KEYS)
+# unique compound index on the aggregated telemetry documents, i.e. only one
+# aggregation per telemetry type, selector and aggregation period start. The
+# partial filter restricts the index to the documents of the aggregation
+# telemetry types, which are stored with PERIOD_AGGREGATION_KEY set to True. An
+# equality filter works on MongoDB 3.2 or later, $in would require MongoDB 6.0.
+AGGREGATION_INDEX = (st.TELEMETRY_TYPE_KEY, *SELECTOR_KEYS, st.START_TIME)
+AGGREGATION_INDEX_FILTER = {st.PERIOD_AGGREGATION_KEY: True}
+
+
+def _counter_dict_entries(counter_type: str) -> dict:
+    """
+    Returns pipeline expression that converts a counter dict (errors or
+    counters) of a sub process into a list of counter entries.
+    """
+    return {
+        "$map": {
+            "input": {
+                "$objectToArray": {"$ifNull": [f"$telemetry.v.{counter_type}", {}]}
+            },
+            "as": "counter",
+            "in": {
+                COUNTER_TYPE: counter_type,
+                COUNTER_KEY: "$$counter.k",
+                VALUE: "$$counter.v",
+            },
+        }
+    }
+
+
+def _unwind_sub_processes_stages() -> List[dict]:
+    """
+    Returns the pipeline stages that return one document per sub process
+    in the telemetry field, with the sub process name in `telemetry.k` and the
+    sub process data in `telemetry.v`.
+    """
+    return [
+        {
+            "$project": {
+                BUCKET: f"${BUCKET}",
+                "telemetry": {"$objectToArray": "$telemetry"},
+            }
+        },
+        {"$unwind": "$telemetry"},
+    ]
+
+
+def _sub_process_stages() -> List[dict]:
+    """
+    Returns the pipeline stages that sum the base and fail counters per sub
+    process.
+    """
+    return _unwind_sub_processes_stages() + [
+        {
+            "$group": {
+                "_id": {BUCKET: f"${BUCKET}", SUB_PROCESS: "$telemetry.k"},
+                st.BASE_COUNT_KEY: {"$sum": f"$telemetry.v.{st.BASE_COUNT_KEY}"},
+                st.FAIL_COUNT_KEY: {"$sum": f"$telemetry.v.{st.FAIL_COUNT_KEY}"},
+            }
+        }
+    ]
+
+
+def _counters_stages() -> List[dict]:
+    """
+    Returns the pipeline stages that sum the error and custom counters per sub
+    process. Each resulting document holds the total for one counter.
+    """
+    counter_entries = {
+        "$concatArrays": [
+            _counter_dict_entries(st.ERRORS_KEY),
+            _counter_dict_entries(st.COUNTERS_KEY),
+        ]
+    }
+    return _unwind_sub_processes_stages() + [
+        {
+            "$project": {
+                BUCKET: f"${BUCKET}",
+                SUB_PROCESS: "$telemetry.k",
+                "entries": counter_entries,
+            }
+        },
+        {"$unwind": "$entries"},
+        {
+            "$group": {
+                "_id": {
+                    BUCKET: f"${BUCKET}",
+                    SUB_PROCESS: f"${SUB_PROCESS}",
+                    COUNTER_TYPE: f"$entries.{COUNTER_TYPE}",
+                    COUNTER_KEY: f"$entries.{COUNTER_KEY}",
+                },
+                VALUE: {"$sum": f"$entries.{VALUE}"},
+            }
+        },
+    ]
+
+
+def _bucket_expression(bucket_boundaries: Optional[List[datetime]]) -> dict:
+    """
+    Returns pipeline expression for the index of the bucket a telemetry
+    document belongs to, i.e. the nr of bucket boundaries up to and including
+    the start_date_time of the document minus 1.
+    Without bucket boundaries all documents are in bucket 0.
+    """
+    if not bucket_boundaries:
+        return {"$literal": 0}
+
+    boundaries_before_start = {
+        "$filter": {
+            "input": bucket_boundaries,
+            "as": "boundary",
+            "cond": {"$lte": ["$$boundary", f"${st.START_TIME}"]},
+        }
+    }
+    return {"$subtract": [{"$size": boundaries_before_start}, 1]}
+
+
+def _match_stage(
+    telemetry_type: str,
+    category: str,
+    sub_category: str,
+    source_name: str,
+    process_type: str,
+    from_date_time: datetime,
+    to_date_time: datetime,
+) -> dict:
+    """
+    Returns the pipeline stage that selects the telemetry documents unique to
+    a single process, source category and sub category for a specific time
+    period.
+    """
+    return {
+        "$match": {
+            st.TELEMETRY_TYPE_KEY: telemetry_type,
+            st.CATEGORY_KEY: category,
+            st.SUB_CATEGORY_KEY: sub_category,
+            st.SOURCE_NAME_KEY: source_name,
+            st.PROCESS_TYPE_KEY: process_type,
+            st.START_TIME: {"$gte": from_date_time, "$lt": to_date_time},
+        }
+    }
+
+
+def telemetry_aggregation_pipeline(
+    telemetry_type: str,
+    category: str,
+    sub_category: str,
+    source_name: str,
+    process_type: str,
+    from_date_time: datetime,
+    to_date_time: datetime,
+    bucket_boundaries: Optional[List[datetime]] = None,
+) -> List[dict]:
+    """
+    Returns the aggregation pipeline that selects the telemetry documents
+    unique to a single process, source category and sub category for a
+    specific time period and adds up all their counters.
+
+    When bucket_boundaries (the sorted start date times of consecutive date
+    time ranges) are provided the counters are added up per bucket.
+
+    The pipeline returns a single document with the facets:
+    - stats: nr of selected documents, the summed rounded io and run times and
+      the latest start date time (the watermark)
+    - traffic_lights: nr of selected documents per traffic light color
+    - sub_processes: summed base and fail counter per sub process
+    - counters: summed error and custom counters per sub process
+    All totals are grouped per bucket.
+    """
+    run_time = {"$toDouble": {"$ifNull": [f"${st.RUN_TIME}", 0]}}
+    io_time = {"$ifNull": [f"${st.IO_TIME_KEY}", 0]}
+    return [
+        _match_stage(
+            telemetry_type=telemetry_type,
+            category=category,
+            sub_category=sub_category,
+            source_name=source_name,
+            process_type=process_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        ),
+        {"$addFields": {BUCKET: _bucket_expression(bucket_boundaries)}},
+        {
+            "$facet": {
+                STATS_FACET: [
+                    {
+                        "$group": {
+                            "_id": f"${BUCKET}",
+                            RECORD_COUNT: {"$sum": 1},
+                            st.IO_TIME_KEY: {"$sum": {"$round": [io_time, 0]}},
+                            st.RUN_TIME: {"$sum": {"$round": [run_time, 0]}},
+                            st.WATERMARK_KEY: {"$max": f"${st.START_TIME}"},
+                        }
+                    }
+                ],
+                TRAFFIC_LIGHT_FACET: [
+                    {
+                        "$group": {
+                            "_id": {
+                                BUCKET: f"${BUCKET}",
+                                st.TRAFFIC_LIGHT_KEY: f"${st.TRAFFIC_LIGHT_KEY}",
+                            },
+                            RECORD_COUNT: {"$sum": 1},
+                        }
+                    }
+                ],
+                SUB_PROCESS_FACET: _sub_process_stages(),
+                COUNTERS_FACET: _counters_stages(),
+            }
+        },
+    ]
+
+
+def add_pipeline_result_to_telemetry(
+    telemetry_list: List[TelemetryModel], pipeline_result: Dict[str, List[dict]]
+) -> List[TelemetryModel]:
+    """
+    Adds the result of the telemetry aggregation pipeline to the telemetry
+    objects in the same way as TelemetryModel.__add__ would have added the
+    selected telemetry objects one by one. The totals of bucket n are added
+    to telemetry_list[n].
+
+    Args:
+        telemetry_list (List[TelemetryModel]):
+            telemetry object for each bucket to add the result to
+        pipeline_result (dict): the document returned by the pipeline
+
+    Returns:
+        List[TelemetryModel]: telemetry_list with the aggregation result added
+    """
+    for stats in pipeline_result[STATS_FACET]:
+        aggregation_data = telemetry_list[stats["_id"]].get_sub_process_data(
+            sub_process=st.AGGREGATION_KEY
+        )
+        aggregation_data.increase_base_count(increment=stats[RECORD_COUNT])
+        aggregation_data.increase_custom_count(
+            increment=int(stats[st.IO_TIME_KEY]), counter=st.IO_TIME_KEY
+        )
+        aggregation_data.increase_custom_count(
+            increment=int(stats[st.RUN_TIME]), counter=st.RUN_TIME
+        )
+        telemetry_list[stats["_id"]].update_watermark(stats[st.WATERMARK_KEY])
+
+    for sub_process in pipeline_result[SUB_PROCESS_FACET]:
+        sub_process_id = sub_process["_id"]
+        telemetry = telemetry_list[sub_process_id[BUCKET]]
+        sub_process_data = telemetry.get_sub_process_data(sub_process_id[SUB_PROCESS])
+        sub_process_data.increase_base_count(int(sub_process[st.BASE_COUNT_KEY]))
+        sub_process_data.increase_fail_count(int(sub_process[st.FAIL_COUNT_KEY]))
+
+    for counter in pipeline_result[COUNTERS_FACET]:
+        counter_id = counter["_id"]
+        telemetry = telemetry_list[counter_id[BUCKET]]
+        sub_process_data = telemetry.get_sub_process_data(counter_id[SUB_PROCESS])
+        if counter_id[COUNTER_TYPE] == st.ERRORS_KEY:
+            sub_process_data._increase_error_count(
+                increment=int(counter[VALUE]), error_code_key=counter_id[COUNTER_KEY]
+            )
+        else:
+            sub_process_data.increase_custom_count(
+                increment=int(counter[VALUE]), counter=counter_id[COUNTER_KEY]
+            )
+
+    for traffic_light in pipeline_result[TRAFFIC_LIGHT_FACET]:
+        traffic_light_id = traffic_light["_id"]
+        telemetry = telemetry_list[traffic_light_id[BUCKET]]
+        telemetry.get_sub_process_data(st.AGGREGATION_KEY).increase_custom_count(
+            increment=traffic_light[RECORD_COUNT],
+            counter=traffic_light_id[st.TRAFFIC_LIGHT_KEY],
+        )
+
+    return telemetry_list
+
+
+def aggregation_count_pipeline(
+    telemetry_type: str,
+    category: str,
+    sub_category: str,
+    source_name: str,
+    process_type: str,
+    from_date_time: datetime,
+    to_date_time: datetime,
+) -> List[dict]:
+    """
+    Returns the aggregation pipeline that returns the base counter of the
+    aggregation stats of the aggregation of the selected telemetry documents
+    as record_count. Each document counts as one plus the base counter of its
+    own aggregation stats, as in TelemetryModel.__add__.
+    """
+    aggregated_count = {
+        "$ifNull": [f"$telemetry.{st.AGGREGATION_KEY}.{st.BASE_COUNT_KEY}", 0]
+    }
+    return [
+        _match_stage(
+            telemetry_type=telemetry_type,
+            category=category,
+            sub_category=sub_category,
+            source_name=source_name,
+            process_type=process_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        ),
+        {
+            "$group": {
+                "_id": None,
+                RECORD_COUNT: {"$sum": {"$add": [1, aggregated_count]}},
+            }
+        },
+    ]
+
+
+def distinct_selectors_pipeline(
+    telemetry_type: str, from_date_time: datetime, to_date_time: datetime
+) -> List[dict]:
+    """
+    Returns the aggregation pipeline that selects the distinct combinations of
+    category, sub category, source name and process type of the telemetry
+    documents of telemetry_type in a specific time period.
+
+    All fields used in the pipeline are in SELECTOR_INDEX, so the documents
+    are not fetched and the query is answered from the index only.
+    Each resulting document holds one selector in the `_id` field.
+    """
+    return [
+        {
+            "$match": {
+                st.TELEMETRY_TYPE_KEY: telemetry_type,
+                st.START_TIME: {"$gte": from_date_time, "$lt": to_date_time},
+            }
+        },
+        {"$project": {"_id": 0, **{key: 1 for key in SELECTOR_KEYS}}},
+        {"$group": {"_id": {key: f"${key}" for key in SELECTOR_KEYS}}},
+        {"$sort": {f"_id.{key}": 1 for key in SELECTOR_KEYS}},
+    ]
+
+
+def aggregated_telemetry_document(
+    telemetry_document: dict, query_params: UniqueAggregatedTelemetryKeys
+) -> dict:
+    """
+    Returns the document that replaces the stored aggregation. The
+    start_date_time is set to the start of the aggregation period and the
+    documents of the aggregation telemetry types are marked with
+    PERIOD_AGGREGATION_KEY, so they are in the AGGREGATION_INDEX.
+    """
+    telemetry_document = telemetry_document | {
+        st.START_TIME: query_params["from_date_time"]
+    }
+    if query_params["telemetry_type"] in st.AGGR_DATE_TIME_RANGE_METHODS:
+        telemetry_document[st.PERIOD_AGGREGATION_KEY] = True
+    return telemetry_document
+
+
+def aggregated_telemetry_filter(query_params: UniqueAggregatedTelemetryKeys) -> dict:
+    """
+    Returns the filter that selects the aggregated telemetry document for the
+    unique aggregated telemetry keys. Aggregated telemetry documents are
+    stored with the start of their aggregation period as start_date_time, so
+    the filter is an equality match on all fields of AGGREGATION_INDEX.
+    """
+    return {
+        st.TELEMETRY_TYPE_KEY: query_params["telemetry_type"],
+        st.CATEGORY_KEY: query_params["category"],
+        st.SUB_CATEGORY_KEY: query_params["sub_category"],
+        st.SOURCE_NAME_KEY: query_params["source_name"],
+        st.PROCESS_TYPE_KEY: query_params["process_type"],
+        st.START_TIME: query_params["from_date_time"],
+    }
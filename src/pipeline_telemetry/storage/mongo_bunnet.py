@@ -1,14 +1,24 @@
 """Module to provide a storage class for using Bunnet."""
 
 from datetime import datetime
-from typing import Annotated, Iterator, Optional, Sequence, Type
+from typing import Annotated, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
 
 from bunnet import Document, Indexed, init_bunnet
-from pymongo import MongoClient
+from pymongo import ASCENDING, IndexModel, MongoClient, ReplaceOne
 
-from ..data_classes import TelemetryModel
+from ..data_classes import TelemetryModel, TelemetrySelector
 from ..settings import settings as st
-from .generic import AbstractTelemetryStorage
+from .generic import AbstractTelemetryStorage, chunked
+from .mongo_aggregation import (
+    AGGREGATION_INDEX,
+    AGGREGATION_INDEX_FILTER,
+    RECORD_COUNT,
+    SELECTOR_INDEX,
+    aggregated_telemetry_document,
+    aggregated_telemetry_filter,
+    aggregation_count_pipeline,
+    distinct_selectors_pipeline,
+)
 
 DEFAULT_DB_NAME = "GeoDataGardenTelemetry"
 DEFAULT_DB_ALIAS = "geo_datagarden"
@@ -29,6 +39,18 @@ class TelemetryBunnetModel(Document):
     telemetry_type: str
     io_time_in_seconds: float = 0
     telemetry: Optional[dict] = None
+    watermark: Optional[datetime] = None
+    period_aggregation: Optional[bool] = None
+
+    class Settings:
+        indexes = [
+            IndexModel([(key, ASCENDING) for key in SELECTOR_INDEX]),
+            IndexModel(
+                [(key, ASCENDING) for key in AGGREGATION_INDEX],
+                unique=True,
+                partialFilterExpression=AGGREGATION_INDEX_FILTER,
+            ),
+        ]
 
     # meta = {
     #     "db_alias": "telemetry",
@@ -66,9 +88,52 @@ class TelemetryBunnetStorage(AbstractTelemetryStorage):
     """
 
     def store_aggregated_telemetry(self, telemetry: TelemetryModel) -> None:
-        """public method to persist telemetry object"""
-        self._remove_existing_aggregation_telemetry(telemetry)
-        self.store_telemetry(telemetry)
+        """
+        Public method to persist an aggregated telemetry object. The existing
+        aggregation for the same selector and aggregation period is replaced
+        with a single atomic upsert. The start_date_time of the stored
+        aggregation is set to the start of the aggregation period.
+        """
+        aggregation_filter, telemetry_document = self._aggregated_telemetry_replacement(
+            telemetry
+        )
+        TelemetryBunnetModel.get_motor_collection().replace_one(
+            aggregation_filter, telemetry_document, upsert=True
+        )
+
+    def store_aggregated_telemetry_batch(
+        self,
+        telemetry_list: Iterable[TelemetryModel],
+        batch_size: int = st.DEFAULT_STORE_BATCH_SIZE,
+    ) -> None:
+        """
+        Public method to persist multiple aggregated telemetry objects with
+        unordered bulk writes of upserts, one bulk write per batch_size
+        telemetry objects. Existing aggregations are replaced as in
+        store_aggregated_telemetry.
+        """
+        collection = TelemetryBunnetModel.get_motor_collection()
+        for telemetry_chunk in chunked(telemetry_list, batch_size):
+            requests = [
+                ReplaceOne(
+                    *self._aggregated_telemetry_replacement(telemetry), upsert=True
+                )
+                for telemetry in telemetry_chunk
+            ]
+            collection.bulk_write(requests, ordered=False)
+
+    def _aggregated_telemetry_replacement(
+        self, telemetry: TelemetryModel
+    ) -> Tuple[dict, dict]:
+        """
+        Returns the filter that selects the stored aggregation of telemetry and
+        the document that replaces it, see aggregated_telemetry_document.
+        """
+        query_params_exist_aggr = self._get_aggr_telem_query_params(telemetry)
+        telemetry_document = aggregated_telemetry_document(
+            self._telemetry_model_kwargs(telemetry), query_params_exist_aggr
+        )
+        return aggregated_telemetry_filter(query_params_exist_aggr), telemetry_document
 
     def store_telemetry(self, telemetry: TelemetryModel) -> None:
         """public method to persist telemetry object"""
@@ -105,6 +170,7 @@ class TelemetryBunnetStorage(AbstractTelemetryStorage):
         run_time_in_seconds = getattr(telemetry, st.RUN_TIME)
         traffic_light = getattr(telemetry, st.TRAFFIC_LIGHT_KEY)
         io_time_in_seconds = getattr(telemetry, st.IO_TIME_KEY)
+        watermark = getattr(telemetry, st.WATERMARK_KEY)
         telemetry_data = {
             k: v.__dict__ for k, v in getattr(telemetry, st.TELEMETRY_FIELD_KEY).items()
         }
@@ -120,6 +186,7 @@ class TelemetryBunnetStorage(AbstractTelemetryStorage):
             st.TRAFFIC_LIGHT_KEY: traffic_light,
             st.TELEMETRY_FIELD_KEY: telemetry_data,
             st.IO_TIME_KEY: io_time_in_seconds,
+            st.WATERMARK_KEY: watermark,
         }
 
     def select_records(
@@ -150,6 +217,55 @@ class TelemetryBunnetStorage(AbstractTelemetryStorage):
             **query_details,
         )
 
+    def aggregation_count(
+        self,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> int:
+        """
+        Returns the base counter of the aggregation stats of the aggregation of
+        the selected telemetry records, counted with a MongoDB aggregation
+        pipeline. The telemetry records are selected as in select_records.
+        """
+        pipeline = aggregation_count_pipeline(
+            telemetry_type=telemetry_type,
+            category=category,
+            sub_category=sub_category,
+            source_name=source_name,
+            process_type=process_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        )
+        for pipeline_result in TelemetryBunnetModel.aggregate(pipeline).to_list():
+            return pipeline_result[RECORD_COUNT]
+        return 0
+
+    def distinct_selectors(
+        self,
+        telemetry_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> List[TelemetrySelector]:
+        """
+        Returns the distinct telemetry selectors of the telemetry records of
+        telemetry_type in a specific time period with an aggregation pipeline
+        that is covered by the SELECTOR_INDEX index.
+        """
+        pipeline = distinct_selectors_pipeline(
+            telemetry_type=telemetry_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        )
+        return [
+            TelemetrySelector(**selector["_id"])
+            for selector in TelemetryBunnetModel.aggregate(pipeline).to_list()
+        ]
+
     @staticmethod
     def _db_object_to_dict(db_object: Document) -> dict:
         """Returns a db object as a dict object."""
@@ -0,0 +1,482 @@
+"""Module to provide write behind storage classes.
+
+A write behind storage class does not persist a telemetry object when
+`store_telemetry` is called but puts it on a bounded queue. A background worker
+thread drains the queue and persists the telemetry objects in batches with
+the wrapped storage class. Closing a telemetry object with `save_and_close`
+then only costs a queue insert on the pipeline's hot path.
+
+Usage
+
+>>> from pipeline_telemetry import TelemetryMongoWriteBehindStorage, add_telemetry
+>>> @add_telemetry(
+        telemetry_params | {"storage_class": TelemetryMongoWriteBehindStorage})
+    def decorated_method(self):
+        ...
+>>> # wait until all queued telemetry objects have been written
+>>> TelemetryMongoWriteBehindStorage.flush()
+
+Custom write behind storage classes can be defined by subclassing
+AbstractWriteBehindStorage and setting the STORAGE_CLASS attribute. Each
+subclass has its own queue and worker thread. The wrapped storage class is
+instantiated once and used from the worker thread so it must support being
+used from a thread other than the one that created it.
+
+Queued telemetry objects are flushed when the python interpreter exits. The
+worker thread logs and counts the telemetry objects it fails to persist and
+keeps running.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime
+from queue import Empty, Full, Queue
+from typing import Iterator, List, NamedTuple, Optional, Type
+
+from pymongo.errors import BulkWriteError
+
+from ..data_classes import TelemetryModel, TelemetrySelector
+from ..settings import exceptions
+from ..settings import settings as st
+from .generic import AbstractTelemetryStorage
+from .mongo import TelemetryMongoStorage
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindStats(NamedTuple):
+    """Named tuple with the counters of a write behind queue.
+
+    - queued: nr of telemetry objects accepted on the queue
+    - written: nr of telemetry objects persisted by the storage class
+    - dropped: nr of telemetry objects dropped because the queue was full
+    - failed: nr of telemetry objects for which persisting raised an exception
+    - pending: nr of telemetry objects queued but not yet processed
+    """
+
+    queued: int
+    written: int
+    dropped: int
+    failed: int
+    pending: int
+
+
+class TelemetryWriteBehindQueue:
+    """
+    Bounded queue with a worker thread that persists telemetry objects with
+    the provided storage class.
+
+    public methods:
+    - put: add a telemetry object to the queue
+    - flush: wait until all queued telemetry objects are processed
+    - drain: wait a limited time until all queued telemetry objects are processed
+    - close: drain the queue and stop the worker thread
+    - stats: return the queue counters
+    """
+
+    def __init__(
+        self,
+        storage_class: Type[AbstractTelemetryStorage],
+        max_queue_size: int = st.DEFAULT_WRITE_BEHIND_QUEUE_SIZE,
+        overflow_policy: str = st.DEFAULT_OVERFLOW_POLICY,
+        batch_size: int = st.DEFAULT_STORE_BATCH_SIZE,
+    ) -> None:
+        if overflow_policy not in st.OVERFLOW_POLICIES:
+            raise exceptions.UnknownOverflowPolicy(
+                overflow_policy, st.OVERFLOW_POLICIES
+            )
+        self._storage_class = storage_class
+        self._overflow_policy = overflow_policy
+        self._batch_size = batch_size
+        self._queue: Queue[Optional[TelemetryModel]] = Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        # serializes adding to the queue with queueing the stop sentinel, so
+        # nothing is queued after the sentinel and it is never dropped
+        self._put_lock = threading.Lock()
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+        self._queued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._storage: Optional[AbstractTelemetryStorage] = None
+
+    @property
+    def overflow_policy(self) -> str:
+        """Overflow_policy property."""
+        return self._overflow_policy
+
+    def stats(self) -> WriteBehindStats:
+        """Returns the counters of the write behind queue."""
+        with self._lock:
+            return WriteBehindStats(
+                queued=self._queued,
+                written=self._written,
+                dropped=self._dropped,
+                failed=self._failed,
+                pending=self._queue.unfinished_tasks,
+            )
+
+    def put(self, telemetry: TelemetryModel) -> bool:
+        """
+        Adds a telemetry object to the queue. What happens when the queue is
+        full depends on the overflow policy:
+
+        - block: wait until the worker has made room on the queue
+        - drop_newest: drop the telemetry object that is being added
+        - drop_oldest: drop the oldest telemetry object on the queue
+
+        Telemetry objects put after the queue is closed are dropped.
+
+        Returns:
+            bool: True if telemetry object was queued, False if it was dropped
+        """
+        with self._put_lock:
+            if self._closed:
+                self._increase_counter("_dropped")
+                return False
+
+            self._start_worker()
+            if self._overflow_policy == st.OVERFLOW_POLICY_BLOCK:
+                self._queue.put(telemetry)
+            elif self._overflow_policy == st.OVERFLOW_POLICY_DROP_NEWEST:
+                try:
+                    self._queue.put_nowait(telemetry)
+                except Full:
+                    self._increase_counter("_dropped")
+                    return False
+            else:
+                self._put_dropping_oldest(telemetry)
+
+        self._increase_counter("_queued")
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all queued telemetry objects have been processed. When
+        timeout is None flush waits as long as the worker thread is running.
+
+        Returns:
+            bool: True if the queue was drained, False if timeout expired.
+
+        Raises:
+            WriteBehindWorkerStopped: when the worker thread stopped while
+                telemetry objects are pending
+        """
+        end_time = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                self._raise_exception_if_worker_stopped()
+                remaining = st.WRITE_BEHIND_WORKER_CHECK_INTERVAL
+                if end_time is not None:
+                    remaining = min(remaining, end_time - time.monotonic())
+                    if remaining <= 0:
+                        return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def drain(self, timeout: float) -> bool:
+        """
+        Waits at most timeout seconds until all queued telemetry objects have
+        been processed.
+
+        Returns:
+            bool: True if the queue was drained, False if timeout expired.
+        """
+        return self.flush(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Drains the queue and stops the worker thread. When timeout is None
+        close waits until all queued telemetry objects are processed. The
+        queue does not accept telemetry objects after close.
+
+        Returns:
+            bool: True if the queue was drained, False if timeout expired.
+        """
+        with self._put_lock:
+            worker = self._worker
+            if not self._closed and worker and worker.is_alive():
+                # Sentinel to stop the worker once all queued telemetry is written
+                self._queue.put(None)
+            self._closed = True
+        if not worker:
+            return True
+
+        worker.join(timeout)
+        if worker.is_alive():
+            return False
+
+        with self._lock:
+            self._worker = None
+        atexit.unregister(self.close)
+        return True
+
+    def _start_worker(self) -> None:
+        """
+        Starts the worker thread if it is not yet running. The queue is closed
+        when the python interpreter exits while the worker is running.
+        """
+        if self._worker:
+            return
+        with self._lock:
+            if not self._worker:
+                self._worker = threading.Thread(
+                    target=self._run, name="telemetry-write-behind", daemon=True
+                )
+                self._worker.start()
+                atexit.register(self.close)
+
+    def _raise_exception_if_worker_stopped(self) -> None:
+        """Raises an exception if the worker thread died with pending work."""
+        worker = self._worker
+        if worker and not worker.is_alive():
+            raise exceptions.WriteBehindWorkerStopped(self._queue.unfinished_tasks)
+
+    def _put_dropping_oldest(self, telemetry: TelemetryModel) -> None:
+        """Adds telemetry to queue, removing the oldest entries if queue is full."""
+        while True:
+            try:
+                self._queue.put_nowait(telemetry)
+                return
+            except Full:
+                pass
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                continue
+            self._queue.task_done()
+            self._increase_counter("_dropped")
+
+    def _run(self) -> None:
+        """
+        Worker loop to persist the queued telemetry objects. All telemetry
+        objects waiting on the queue (up to batch_size) are persisted with a
+        single store_telemetry_batch call.
+        """
+        stop_worker = False
+        while not stop_worker:
+            batch = self._next_batch()
+            telemetry_batch = [
+                telemetry for telemetry in batch if telemetry is not None
+            ]
+            stop_worker = len(telemetry_batch) < len(batch)
+            try:
+                if telemetry_batch:
+                    self._store(telemetry_batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _next_batch(self) -> List[Optional[TelemetryModel]]:
+        """Waits for the next entry on the queue and returns all waiting entries."""
+        batch = [self._queue.get()]
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except Empty:
+                break
+        return batch
+
+    def _store(self, telemetry_batch: List[TelemetryModel]) -> None:
+        """
+        Persists a batch of telemetry objects and updates the counters. The
+        storage class is instantiated on first use, a failing instantiation
+        counts the batch as failed.
+        """
+        try:
+            if self._storage is None:
+                self._storage = self._storage_class()
+            self._storage.store_telemetry_batch(
+                telemetry_batch, batch_size=self._batch_size
+            )
+        except BulkWriteError as err:
+            # an unordered bulk write inserts the documents without write errors
+            nr_written = err.details.get("nInserted", 0)
+            logger.exception(
+                "Write behind storage failed to store %s of %s telemetry objects",
+                len(err.details.get("writeErrors", [])),
+                len(telemetry_batch),
+            )
+            self._increase_counter("_written", nr_written)
+            self._increase_counter("_failed", len(telemetry_batch) - nr_written)
+            return
+        except Exception:
+            logger.exception("Write behind storage failed to store telemetry")
+            self._increase_counter("_failed", len(telemetry_batch))
+            return
+        self._increase_counter("_written", len(telemetry_batch))
+
+    def _increase_counter(self, counter: str, increment: int = 1) -> None:
+        """Thread safe increment of one of the queue counters."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + increment)
+
+
+class AbstractWriteBehindStorage(AbstractTelemetryStorage):
+    """
+    Abstract storage class that queues telemetry objects and persists them in
+    a background thread with STORAGE_CLASS.
+
+    class attributes:
+    - STORAGE_CLASS: storage class used by the worker to persist telemetry
+    - MAX_QUEUE_SIZE: max nr of telemetry objects waiting on the queue
+    - OVERFLOW_POLICY: one of `block`, `drop_newest` or `drop_oldest`
+    - BATCH_SIZE: max nr of telemetry objects the worker stores in one call
+
+    Queries are passed on to STORAGE_CLASS after the queue has been flushed so
+    that all stored telemetry objects are included in the results.
+    """
+
+    STORAGE_CLASS: Type[AbstractTelemetryStorage]
+    MAX_QUEUE_SIZE: int = st.DEFAULT_WRITE_BEHIND_QUEUE_SIZE
+    OVERFLOW_POLICY: str = st.DEFAULT_OVERFLOW_POLICY
+    BATCH_SIZE: int = st.DEFAULT_STORE_BATCH_SIZE
+
+    _write_behind_queue: Optional[TelemetryWriteBehindQueue] = None
+    __queue_creation_lock = threading.Lock()
+
+    @classmethod
+    def write_behind_queue(cls) -> TelemetryWriteBehindQueue:
+        """Returns the write behind queue for this storage class."""
+        # each subclass gets its own queue, so look in the class dict only
+        queue = cls.__dict__.get("_write_behind_queue")
+        if queue:
+            return queue
+
+        with cls.__queue_creation_lock:
+            queue = cls.__dict__.get("_write_behind_queue")
+            if not queue:
+                queue = TelemetryWriteBehindQueue(
+                    storage_class=cls.STORAGE_CLASS,
+                    max_queue_size=cls.MAX_QUEUE_SIZE,
+                    overflow_policy=cls.OVERFLOW_POLICY,
+                    batch_size=cls.BATCH_SIZE,
+                )
+                cls._write_behind_queue = queue
+        return queue
+
+    @classmethod
+    def flush(cls, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all queued telemetry objects have been processed, or at
+        most timeout seconds. Returns False if timeout expired.
+        """
+        return cls.write_behind_queue().flush(timeout)
+
+    @classmethod
+    def drain(cls, timeout: float) -> bool:
+        """
+        Waits at most timeout seconds until all queued telemetry objects have
+        been processed. Returns False if timeout expired.
+        """
+        return cls.write_behind_queue().drain(timeout)
+
+    @classmethod
+    def stats(cls) -> WriteBehindStats:
+        """Returns the queued, written, dropped, failed and pending counters."""
+        return cls.write_behind_queue().stats()
+
+    def store_telemetry(self, telemetry: TelemetryModel) -> None:
+        """public method to queue telemetry object for persistance"""
+        self.write_behind_queue().put(telemetry)
+
+    def store_aggregated_telemetry(self, telemetry: TelemetryModel) -> None:
+        """
+        Public method to persist an aggregated telemetry object. Aggregated
+        telemetry replaces the existing aggregation so it is stored directly
+        with STORAGE_CLASS after the queued telemetry has been written.
+        """
+        self.flush()
+        self.STORAGE_CLASS().store_aggregated_telemetry(telemetry)
+
+    def select_records(
+        self,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> Iterator:
+        """
+        Select telemetry records unique to a single process, source category
+        and sub category for as specific time period.
+        """
+        self.flush()
+        return self.STORAGE_CLASS().select_records(
+            telemetry_type=telemetry_type,
+            category=category,
+            sub_category=sub_category,
+            source_name=source_name,
+            process_type=process_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        )
+
+    def telemetry_list(
+        self,
+        telemetry_type: str,
+        category: str,
+        sub_category: str,
+        source_name: str,
+        process_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> Iterator[TelemetryModel]:
+        """
+        Method to return an iteraror TelemetryModel instances retrieved
+        from a database query with the provided arguments.
+        """
+        self.flush()
+        return self.STORAGE_CLASS().telemetry_list(
+            telemetry_type=telemetry_type,
+            category=category,
+            sub_category=sub_category,
+            source_name=source_name,
+            process_type=process_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        )
+
+    def distinct_selectors(
+        self,
+        telemetry_type: str,
+        from_date_time: datetime,
+        to_date_time: datetime,
+    ) -> List[TelemetrySelector]:
+        """
+        Returns the distinct telemetry selectors of the telemetry records of
+        telemetry_type in a specific time period via STORAGE_CLASS.
+        """
+        self.flush()
+        return self.STORAGE_CLASS().distinct_selectors(
+            telemetry_type=telemetry_type,
+            from_date_time=from_date_time,
+            to_date_time=to_date_time,
+        )
+
+    def _remove_existing_aggregation_telemetry(self, telemetry: TelemetryModel) -> None:
+        """
+        Removes any already existing aggregations for a specific telemetry
+        aggregation via STORAGE_CLASS.
+
+        Args:
+            telemetry (TelemetryModel): The new telemetry aggregation object
+        """
+        self.flush()
+        self.STORAGE_CLASS()._remove_existing_aggregation_telemetry(telemetry)
+
+
+class TelemetryMongoWriteBehindStorage(AbstractWriteBehindStorage):
+    """
+    Write behind storage class that persists telemetry objects in MongoDB
+    using TelemetryMongoStorage from a background thread.
+    This class can be used as storage_class argument when creating
+    an instance of Telemetry.
+    """
+
+    STORAGE_CLASS = TelemetryMongoStorage
@@ -0,0 +1,131 @@
+"""
+Module to switch telemetry off.
+
+Telemetry can be disabled globally or per process type. The decorators of a
+disabled process type call the decorated method directly, without creating a
+Telemetry object. While telemetry is disabled the helper functions and
+TelemetryMixin methods of an instance without telemetry resolve to the
+NULL_TELEMETRY object, so they do nothing without raising NoActiveTelemetry.
+
+functions:
+    - disable_telemetry: disables telemetry globally or for a process type
+    - enable_telemetry: enables telemetry globally or for a process type
+    - is_telemetry_enabled: checks if telemetry is enabled for a process type
+    - is_any_telemetry_disabled: checks if telemetry is disabled at all
+    - telemetry_disabled: context manager that disables telemetry
+
+Usage
+
+>>> disable_telemetry(ProcessTypes.CREATE_DATA_FROM_API)
+>>> with telemetry_disabled():
+...     run_load_test()
+
+Telemetry objects created directly with Telemetry(...) are not affected by the
+switch.
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, FrozenSet, Iterator, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .settings.data_class import ProcessType
+
+# disabled process types, None disables all process types. The set is replaced
+# and never changed, so the decorators can read it without a lock.
+_disabled_process_types: FrozenSet[Optional["ProcessType"]] = frozenset()
+
+
+def disable_telemetry(process_type: Optional["ProcessType"] = None) -> None:
+    """
+    Disables telemetry for process_type, or for all process types when no
+    process_type is given.
+    """
+    global _disabled_process_types
+    _disabled_process_types = _disabled_process_types | {process_type}
+
+
+def enable_telemetry(process_type: Optional["ProcessType"] = None) -> None:
+    """
+    Enables telemetry for process_type, or for all process types when no
+    process_type is given. Enabling all process types also enables the
+    process types that were disabled one by one.
+    """
+    global _disabled_process_types
+    if process_type is None:
+        _disabled_process_types = frozenset()
+    else:
+        _disabled_process_types = _disabled_process_types - {process_type}
+
+
+def is_telemetry_enabled(process_type: Optional["ProcessType"] = None) -> bool:
+    """
+    Returns False when telemetry is disabled for all process types or for
+    process_type.
+    """
+    disabled_process_types = _disabled_process_types
+    return not disabled_process_types or not (
+        None in disabled_process_types or process_type in disabled_process_types
+    )
+
+
+def is_any_telemetry_disabled() -> bool:
+    """
+    Returns True when telemetry is disabled for all process types or for at
+    least one process type.
+    """
+    return bool(_disabled_process_types)
+
+
+@contextmanager
+def telemetry_disabled(process_type: Optional["ProcessType"] = None) -> Iterator[None]:
+    """
+    Context manager to disable telemetry for process_type, or for all process
+    types. The previous switch settings are restored on exit.
+    """
+    global _disabled_process_types
+    previous_disabled_process_types = _disabled_process_types
+    disable_telemetry(process_type)
+    try:
+        yield
+    finally:
+        _disabled_process_types = previous_disabled_process_types
+
+
+class NullTelemetry:
+    """
+    Null implementation of Telemetry used when telemetry is disabled. All
+    methods that add telemetry do nothing and the closing methods return None.
+    """
+
+    closed = False
+    concurrent = False
+
+    def _do_nothing(self, *args, **kwargs) -> None:
+        """Accepts the arguments of a Telemetry method and does nothing."""
+
+    add = _do_nothing
+    add_many = _do_nothing
+    add_telemetry_counter = _do_nothing
+    increase_io_time = _do_nothing
+    increase_sub_process_base_count = _do_nothing
+    increase_sub_process_fail_count = _do_nothing
+    increase_sub_process_error_count = _do_nothing
+    increase_sub_process_custom_count = _do_nothing
+    set_orange_traffic_light = _do_nothing
+    set_red_traffic_light = _do_nothing
+    merge_shards = _do_nothing
+    save_and_close = _do_nothing
+    close_as_shard = _do_nothing
+    get = _do_nothing
+
+    async def async_save_and_close(self) -> None:
+        """Does nothing, there is no telemetry to store."""
+
+    @property
+    def telemetry(self) -> SimpleNamespace:
+        """Returns a new namespace, values set on it are discarded."""
+        return SimpleNamespace()
+
+
+NULL_TELEMETRY = NullTelemetry()
@@ -1,8 +1,41 @@
 """ """
 
-from .dict_validator import DictValidator
+from .columnar import (
+    ColumnExists,
+    ColumnNotNull,
+    ColumnRowCount,
+    ColumnValuesInRange,
+    ColumnValuesInSet,
+)
+from .dict_validator import CompiledRuleSet, DictValidator
 from .entries_have_key import EntriesHaveKey
+from .evaluation_context import EvaluationContext, FieldPath
 from .has_key import HasKey
+from .parallel import ParallelValidation
+from .sampling import (
+    AbstractSamplingPolicy,
+    FirstThenRateSampling,
+    FixedRateSampling,
+    ReservoirSampling,
+)
 from .validate_entries import ValidateEntries
 
-__all__ = ["DictValidator", "EntriesHaveKey", "HasKey", "ValidateEntries"]
+__all__ = [
+    "AbstractSamplingPolicy",
+    "ColumnExists",
+    "ColumnNotNull",
+    "ColumnRowCount",
+    "ColumnValuesInRange",
+    "ColumnValuesInSet",
+    "CompiledRuleSet",
+    "DictValidator",
+    "EntriesHaveKey",
+    "EvaluationContext",
+    "FieldPath",
+    "FirstThenRateSampling",
+    "FixedRateSampling",
+    "HasKey",
+    "ParallelValidation",
+    "ReservoirSampling",
+    "ValidateEntries",
+]
@@ -1,20 +1,27 @@
 """Module to define abstract validator class"""
 
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass
-from typing import List, Type
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Sequence, Type
 
 from errors import ErrorCode
 
+from .evaluation_context import EvaluationContext, FieldPath
+
 
 @dataclass(frozen=True)
 class BaseValidatorInstructionRuleData:
     field_name: str
+    # compiled field path of field_name
+    field_expression: FieldPath = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not isinstance(self.field_name, str):
             raise TypeError("Field 'field_name' must be of type 'str'.")
 
+        object.__setattr__(self, "field_expression", FieldPath(self.field_name))
+
 
 class AbstractValidatorInstruction(metaclass=ABCMeta):
     """Abstract Validator Instruction class"""
@@ -24,6 +31,9 @@ class AbstractValidatorInstruction(metaclass=ABCMeta):
     )
     INSTRUCTION = "instruction_name"
     FIELDNAME = "field_name"
+    # instructions that validate each entry of the list in field_name and
+    # implement count_entry_errors, these can validate the entries in chunks
+    VALIDATES_ENTRIES = False
 
     def __new__(cls):
         """make this a singleton class"""
@@ -45,8 +55,80 @@ class AbstractValidatorInstruction(metaclass=ABCMeta):
         Raise:
             FieldNameMandatory: when field name not defined in rule
         """
-        rule_data = cls.RULE_DATA_CLASS(**rule_dict)
-        return cls._validate(dict_to_validate, rule_data)
+        return cls._validate(dict_to_validate, cls.compile_rule(rule_dict))
+
+    @classmethod
+    def compile_rule(cls, rule_dict: dict) -> BaseValidatorInstructionRuleData:
+        """
+        Public method to validate the rule and return the rule data with the
+        compiled field paths.
+
+        Raise:
+            TypeError: when the rule data is not valid
+        """
+        return cls.RULE_DATA_CLASS(**rule_dict)
+
+    @classmethod
+    def validate_compiled(
+        cls, dict_to_validate: dict, rule_data: BaseValidatorInstructionRuleData
+    ) -> list[ErrorCode]:
+        """
+        Public method to run the validation with rule data returned by
+        compile_rule.
+        """
+        return cls.validate_in_context(EvaluationContext(dict_to_validate), rule_data)
+
+    @classmethod
+    def validate_in_context(
+        cls, context: EvaluationContext, rule_data: BaseValidatorInstructionRuleData
+    ) -> list[ErrorCode]:
+        """
+        Public method to run the validation of the record of an evaluation
+        context that is shared with the other rules for the record.
+
+        Instructions should override this method to resolve their fields
+        with the context. By default the record is validated with _validate.
+        """
+        return cls._validate(context.record, rule_data)
+
+    @classmethod
+    def count_errors(
+        cls,
+        contexts: Sequence[EvaluationContext],
+        rule_data: BaseValidatorInstructionRuleData,
+    ) -> Dict[str, int]:
+        """
+        Public method to run the validation for the evaluation contexts of a
+        batch of records with rule data returned by compile_rule.
+
+        Instructions should override this method to count the errors without
+        creating an ErrorCode for each error. By default each record is
+        validated with validate_in_context.
+
+        Returns:
+            Dict[str, int]: number of errors per error code key
+        """
+        error_counts: Dict[str, int] = defaultdict(int)
+        for context in contexts:
+            for error in cls.validate_in_context(context, rule_data):
+                error_counts[error.code] += 1
+        return error_counts
+
+    @classmethod
+    def count_entry_errors(
+        cls, entries: Sequence, rule_data: BaseValidatorInstructionRuleData
+    ) -> Dict[str, int]:
+        """
+        Public method to count the errors of (a chunk of) the entries of the
+        list in field_name. Only implemented by instructions with
+        VALIDATES_ENTRIES, the checks of the field itself are not included.
+
+        Returns:
+            Dict[str, int]: number of errors per error code key
+        """
+        raise NotImplementedError(
+            f"Instruction `{cls.INSTRUCTION}` does not validate entries."
+        )
 
     @classmethod
     @abstractmethod
@@ -67,9 +149,51 @@ class AbstractValidatorInstruction(metaclass=ABCMeta):
         """
         return getattr(rule_data, cls.FIELDNAME)
 
+    @staticmethod
+    def _get_field_value(
+        context: EvaluationContext, rule_data: BaseValidatorInstructionRuleData
+    ) -> Any:
+        """
+        Retrieves the value of the field in scope from the evaluation context.
+        """
+        return context.resolve(rule_data.field_expression)
+
+    @classmethod
+    def _error_code_key(cls, error_code: ErrorCode, fieldname: str) -> str:
+        """
+        Returns the key of the error counter for an error, i.e. the code of
+        the ErrorCode returned by _validation_error.
+        """
+        return cls._validation_error(error_code, fieldname)[0].code
+
     @staticmethod
     @abstractmethod
     def _validation_error(error_code: ErrorCode, fieldname: str) -> list[ErrorCode]:
         """
         Customize the errors and their content for the specific validation rule.
         """
+
+
+class CompiledRule(NamedTuple):
+    """Named tuple with a validator instruction and its compiled rule data."""
+
+    instruction_class: Type[AbstractValidatorInstruction]
+    rule_data: BaseValidatorInstructionRuleData
+
+    def validate(self, dict_to_validate: dict) -> list[ErrorCode]:
+        """Runs the validation of the rule."""
+        return self.instruction_class.validate_compiled(
+            dict_to_validate, self.rule_data
+        )
+
+    def validate_in_context(self, context: EvaluationContext) -> list[ErrorCode]:
+        """Runs the validation of the rule for an evaluation context."""
+        return self.instruction_class.validate_in_context(context, self.rule_data)
+
+    def count_errors(self, contexts: Sequence[EvaluationContext]) -> Dict[str, int]:
+        """Runs the validation of the rule for a batch of evaluation contexts."""
+        return self.instruction_class.count_errors(contexts, self.rule_data)
+
+    def count_entry_errors(self, entries: Sequence) -> Dict[str, int]:
+        """Runs the validation of the rule for a chunk of entries."""
+        return self.instruction_class.count_entry_errors(entries, self.rule_data)
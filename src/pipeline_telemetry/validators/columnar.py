@@ -0,0 +1,550 @@
+"""
+Module to define the columnar validator instructions.
+
+Columnar instructions validate a table that is provided as a column batch:
+a dict of equal-length lists, a pandas DataFrame or a pyarrow Table. Each
+rule is evaluated on a whole column at once, with NumPy when it is installed
+and with a single pass over the column otherwise.
+
+classes:
+    - ColumnExists: validate the column batch has a column
+    - ColumnNotNull: validate a column has no null values
+    - ColumnRowCount: validate the column batch has the expected nr of rows
+    - ColumnValuesInSet: validate the values of a column are in a set
+    - ColumnValuesInRange: validate the numeric values of a column are in a range
+
+Each row with an invalid value counts as an error. A column that is not a
+sequence of values (like a number or a string) and a dict of columns with
+unequal lengths are counted as one error. The field_name of the rule
+is the field with the column batch, use "@" when the record itself is the
+column batch::
+
+    telemetry_rules = {
+        'DATA_CONVERSION': {
+            'column_not_null': {'field_name': 'table', 'column': 'id'},
+        }
+    }
+"""
+
+from abc import abstractmethod
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from errors import ErrorCode, ListErrors
+
+from ..settings import exceptions
+from .abstract_validator_instruction import (
+    AbstractValidatorInstruction,
+    BaseValidatorInstructionRuleData,
+)
+from .evaluation_context import EvaluationContext
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+# error code, field name for the error code key and the nr of errors
+ErrorCount = Tuple[ErrorCode, str, int]
+
+
+def is_column_batch(value: Any) -> bool:
+    """Returns True for a dict of columns, a DataFrame or a pyarrow Table."""
+    return (
+        isinstance(value, Mapping)
+        or hasattr(value, "column_names")
+        or (hasattr(value, "columns") and hasattr(value, "__getitem__"))
+    )
+
+
+def is_column(value: Any) -> bool:
+    """
+    Returns True for a one dimensional sequence of values, like a list, a
+    NumPy array, a pandas Series or a pyarrow array. Strings are not columns.
+    """
+    if isinstance(value, (str, bytes, bytearray, Mapping)):
+        return False
+    return (
+        hasattr(value, "__len__")
+        and hasattr(value, "__iter__")
+        and getattr(value, "ndim", 1) == 1
+    )
+
+
+def has_equal_column_lengths(column_batch: Any) -> bool:
+    """
+    Returns False for a dict of columns with unequal lengths, the columns of
+    a DataFrame or pyarrow Table always have equal lengths.
+    """
+    if not isinstance(column_batch, Mapping):
+        return True
+    return (
+        len({len(values) for values in column_batch.values() if is_column(values)}) <= 1
+    )
+
+
+def column_names(column_batch: Any) -> Sequence[str]:
+    """Returns the column names of a column batch."""
+    if hasattr(column_batch, "column_names"):
+        return column_batch.column_names
+    return list(column_batch.keys())
+
+
+def num_rows(column_batch: Any) -> int:
+    """Returns the nr of rows of a column batch."""
+    if hasattr(column_batch, "num_rows"):
+        return column_batch.num_rows
+    if isinstance(column_batch, Mapping):
+        return next(
+            (len(values) for values in column_batch.values() if is_column(values)), 0
+        )
+    return len(column_batch)
+
+
+def _to_list(values: Sequence) -> Sequence:
+    """Returns the values as python values, i.e. converts pyarrow arrays."""
+    if hasattr(values, "to_pylist"):
+        return values.to_pylist()
+    return values
+
+
+def _to_array(values: Sequence) -> Any:
+    """
+    Returns the values as a one dimensional NumPy array. Values that are not
+    numbers (or dates) are kept as python objects.
+    """
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        array = None
+    if array is None or array.ndim != 1 or array.dtype.kind not in "biufcmM":
+        values = _to_list(values)
+        array = np.fromiter(values, dtype=object, count=len(values))
+    return array
+
+
+def _is_null(value: Any) -> bool:
+    """Returns True for None and NaN values."""
+    return value is None or value != value
+
+
+def count_nulls(values: Sequence) -> int:
+    """Returns the nr of null (None or NaN) values."""
+    if np is None:
+        return sum(1 for value in _to_list(values) if _is_null(value))
+
+    array = _to_array(values)
+    if array.dtype.kind in "fc":
+        return int(np.count_nonzero(np.isnan(array)))
+    if array.dtype.kind in "mM":
+        return int(np.count_nonzero(np.isnat(array)))
+    if array.dtype.kind == "O":
+        return int(np.count_nonzero(np.equal(array, np.array(None)) | (array != array)))
+    return 0
+
+
+def count_not_in_set(values: Sequence, allowed_values: FrozenSet) -> int:
+    """Returns the nr of values that are not in allowed_values."""
+    if np is not None and all(
+        isinstance(value, (int, float)) for value in allowed_values
+    ):
+        array = _to_array(values)
+        if array.dtype.kind in "biuf":
+            return int(np.count_nonzero(~np.isin(array, list(allowed_values))))
+
+    return sum(1 for value in _to_list(values) if not _is_in_set(value, allowed_values))
+
+
+def _is_in_set(value: Any, allowed_values: FrozenSet) -> bool:
+    """Returns True if value is in allowed_values, unhashable values are not."""
+    try:
+        return value in allowed_values
+    except TypeError:
+        return False
+
+
+def count_out_of_range(
+    values: Sequence,
+    min_value: Optional[Union[int, float]],
+    max_value: Optional[Union[int, float]],
+) -> int:
+    """
+    Returns the nr of values that are not a number or not from min_value up to
+    and including max_value. Null values are not counted.
+    """
+    if np is not None:
+        array = _to_array(values)
+        if array.dtype.kind in "biuf":
+            out_of_range = np.zeros(len(array), dtype=bool)
+            if min_value is not None:
+                out_of_range |= array < min_value
+            if max_value is not None:
+                out_of_range |= array > max_value
+            return int(np.count_nonzero(out_of_range))
+
+    out_of_range_count = 0
+    for value in _to_list(values):
+        if _is_null(value):
+            continue
+        if (
+            not isinstance(value, (int, float))
+            or (min_value is not None and value < min_value)
+            or (max_value is not None and value > max_value)
+        ):
+            out_of_range_count += 1
+    return out_of_range_count
+
+
+@dataclass(frozen=True)
+class ColumnRuleData(BaseValidatorInstructionRuleData):
+    column: str
+
+    def __post_init__(self):
+        if not isinstance(self.column, str):
+            raise TypeError("Field 'column' must be of type 'str'.")
+
+        super().__post_init__()
+
+
+@dataclass(frozen=True)
+class ColumnRowCountRuleData(BaseValidatorInstructionRuleData):
+    expected_count: int
+
+    def __post_init__(self):
+        if not isinstance(self.expected_count, int):
+            raise TypeError("Field 'expected_count' must be of type 'int'.")
+
+        if self.expected_count < 0:
+            raise exceptions.ExpectedCountMustBePositiveInt
+
+        super().__post_init__()
+
+
+@dataclass(frozen=True)
+class ColumnValuesInSetRuleData(ColumnRuleData):
+    values: list
+    # the values as a set for the membership test
+    allowed_values: FrozenSet = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.values, (list, tuple, set, frozenset)):
+            raise TypeError("Field 'values' must be of type 'list'.")
+
+        super().__post_init__()
+        object.__setattr__(self, "allowed_values", frozenset(self.values))
+
+
+@dataclass(frozen=True)
+class ColumnValuesInRangeRuleData(ColumnRuleData):
+    min_value: Optional[Union[int, float]] = None
+    max_value: Optional[Union[int, float]] = None
+
+    def __post_init__(self):
+        for name in ["min_value", "max_value"]:
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, (int, float)):
+                raise TypeError(f"Field '{name}' must be of type 'int' or 'float'.")
+
+        super().__post_init__()
+
+
+class AbstractColumnInstruction(AbstractValidatorInstruction):
+    """
+    Abstract class for the columnar instructions. The column batch is
+    validated once per rule, the errors of all rows are counted at once.
+    """
+
+    RULE_DATA_CLASS: Type[BaseValidatorInstructionRuleData] = ColumnRuleData
+    COLUMN = "column"
+
+    @classmethod
+    def _validate(
+        cls, dict_to_validate: dict, rule_data: BaseValidatorInstructionRuleData
+    ) -> list[ErrorCode]:
+        """
+        method to do the actual validation
+
+        returns:
+            - list of errorcodes, one for each invalid row
+        """
+        return cls.validate_in_context(EvaluationContext(dict_to_validate), rule_data)
+
+    @classmethod
+    def validate_in_context(
+        cls, context: EvaluationContext, rule_data: BaseValidatorInstructionRuleData
+    ) -> list[ErrorCode]:
+        """
+        method to validate the column batch of the evaluation context
+
+        returns:
+            - list of errorcodes, one for each invalid row
+        """
+        errors = []
+        for error_code, fieldname, count in cls._count_batch_errors(
+            cls._get_field_value(context, rule_data), rule_data
+        ):
+            errors.extend(cls._validation_error(error_code, fieldname) * count)
+        return errors
+
+    @classmethod
+    def count_errors(
+        cls,
+        contexts: Sequence[EvaluationContext],
+        rule_data: BaseValidatorInstructionRuleData,
+    ) -> Dict[str, int]:
+        """
+        method to count the errors of the column batches of a batch of records
+
+        returns:
+            - number of errors per error code key
+        """
+        field_path = rule_data.field_expression
+        error_counts: Dict[str, int] = defaultdict(int)
+        for context in contexts:
+            for error_code, fieldname, count in cls._count_batch_errors(
+                context.resolve(field_path), rule_data
+            ):
+                error_counts[cls._error_code_key(error_code, fieldname)] += count
+        return error_counts
+
+    @classmethod
+    def _count_batch_errors(
+        cls, column_batch: Any, rule_data: BaseValidatorInstructionRuleData
+    ) -> List[ErrorCount]:
+        """
+        method to count the errors of a column batch, first checks the column
+        batch and the column, then counts the errors of the column values
+
+        returns:
+            - list with error code, field name and count of each error
+        """
+        fieldname = cls._get_field_name(rule_data)
+        if not is_column_batch(column_batch):
+            return [(ListErrors.COLUMN_BATCH_NOT_FOUND, fieldname, 1)]
+
+        if not has_equal_column_lengths(column_batch):
+            return [(ListErrors.COLUMNS_OF_UNEQUAL_LENGTH, fieldname, 1)]
+
+        column = cls._get_column(rule_data)
+        column_fieldname = fieldname + "__" + column
+        if column not in column_names(column_batch):
+            return [(ListErrors.COLUMN_NOT_FOUND, column_fieldname, 1)]
+
+        values = column_batch[column]
+        if not is_column(values):
+            return [(ListErrors.COLUMN_OF_WRONG_TYPE, column_fieldname, 1)]
+
+        return cls._count_column_errors(values, column_fieldname, rule_data)
+
+    @classmethod
+    def _count_column_errors(
+        cls,
+        values: Sequence,
+        column_fieldname: str,
+        rule_data: BaseValidatorInstructionRuleData,
+    ) -> List[ErrorCount]:
+        """
+        method to count the errors of the values of an existing column, the
+        column has no errors unless the instruction validates its values
+
+        returns:
+            - list with error code, field name and count of each error
+        """
+        return []
+
+    @classmethod
+    def _get_column(cls, rule_data: BaseValidatorInstructionRuleData) -> str:
+        """
+        retrieves the column in scope of the rule content
+        """
+        return getattr(rule_data, cls.COLUMN)
+
+    @staticmethod
+    def _validation_error(error_code: ErrorCode, fieldname: str) -> list[ErrorCode]:
+        """returns error code object in list with fieldname in the code"""
+        key_specific_error = error_code.code + "@KEY_<" + fieldname + ">"
+        return [ErrorCode(code=key_specific_error, description=error_code.description)]
+
+
+class ColumnExists(AbstractColumnInstruction):
+    """
+    class to define the column exists instruction, validates the column batch
+    has the column.
+
+    rule_data needs to contain:
+        - field_name (str): field with the column batch
+        - column (str): name of the column
+    """
+
+    INSTRUCTION = "column_exists"
+
+
+class AbstractColumnValuesInstruction(AbstractColumnInstruction):
+    """
+    Abstract class for the columnar instructions that validate the values of
+    a column, each row with an invalid value is an error.
+    """
+
+    @classmethod
+    def _count_column_errors(
+        cls,
+        values: Sequence,
+        column_fieldname: str,
+        rule_data: BaseValidatorInstructionRuleData,
+    ) -> List[ErrorCount]:
+        if row_error_count := cls._count_row_errors(values, rule_data):
+            return [(cls._row_error(), column_fieldname, row_error_count)]
+        return []
+
+    @classmethod
+    @abstractmethod
+    def _count_row_errors(
+        cls, values: Sequence, rule_data: BaseValidatorInstructionRuleData
+    ) -> int:
+        """
+        method to count the rows with an invalid value in the column
+
+        returns:
+            - nr of invalid rows
+        """
+
+    @staticmethod
+    @abstractmethod
+    def _row_error() -> ErrorCode:
+        """returns the error code for a row with an invalid value"""
+
+
+class ColumnNotNull(AbstractColumnValuesInstruction):
+    """
+    class to define the column not null instruction, each None or NaN value in
+    the column is an error.
+
+    rule_data needs to contain:
+        - field_name (str): field with the column batch
+        - column (str): name of the column
+    """
+
+    INSTRUCTION = "column_not_null"
+
+    @classmethod
+    def _count_row_errors(
+        cls, values: Sequence, rule_data: BaseValidatorInstructionRuleData
+    ) -> int:
+        return count_nulls(values)
+
+    @staticmethod
+    def _row_error() -> ErrorCode:
+        return ListErrors.NULL_VALUE_IN_COLUMN
+
+
+class ColumnRowCount(AbstractColumnInstruction):
+    """
+    class to define the column row count instruction, validates the column
+    batch has the expected nr of rows.
+
+    rule_data needs to contain:
+        - field_name (str): field with the column batch
+        - expected_count (int): expected nr of rows
+    """
+
+    RULE_DATA_CLASS = ColumnRowCountRuleData
+    INSTRUCTION = "column_row_count"
+    expected_count_field = "expected_count"
+
+    @classmethod
+    def _count_batch_errors(
+        cls, column_batch: Any, rule_data: BaseValidatorInstructionRuleData
+    ) -> List[ErrorCount]:
+        fieldname = cls._get_field_name(rule_data)
+        if not is_column_batch(column_batch):
+            return [(ListErrors.COLUMN_BATCH_NOT_FOUND, fieldname, 1)]
+
+        if isinstance(column_batch, Mapping):
+            if wrong_type_columns := [
+                column
+                for column, values in column_batch.items()
+                if not is_column(values)
+            ]:
+                return [
+                    (ListErrors.COLUMN_OF_WRONG_TYPE, fieldname + "__" + column, 1)
+                    for column in wrong_type_columns
+                ]
+
+        if not has_equal_column_lengths(column_batch):
+            return [(ListErrors.COLUMNS_OF_UNEQUAL_LENGTH, fieldname, 1)]
+
+        if num_rows(column_batch) != getattr(rule_data, cls.expected_count_field):
+            return [(ListErrors.UNEXPECTED_NR_OF_ROWS, fieldname, 1)]
+
+        return []
+
+
+class ColumnValuesInSet(AbstractColumnValuesInstruction):
+    """
+    class to define the column values in set instruction, each value in the
+    column that is not one of the values is an error.
+
+    rule_data needs to contain:
+        - field_name (str): field with the column batch
+        - column (str): name of the column
+        - values (list): the allowed values
+    """
+
+    RULE_DATA_CLASS = ColumnValuesInSetRuleData
+    INSTRUCTION = "column_values_in_set"
+    allowed_values_field = "allowed_values"
+
+    @classmethod
+    def _count_row_errors(
+        cls, values: Sequence, rule_data: BaseValidatorInstructionRuleData
+    ) -> int:
+        return count_not_in_set(values, getattr(rule_data, cls.allowed_values_field))
+
+    @staticmethod
+    def _row_error() -> ErrorCode:
+        return ListErrors.VALUE_NOT_IN_SET
+
+
+class ColumnValuesInRange(AbstractColumnValuesInstruction):
+    """
+    class to define the column values in range instruction, each value in the
+    column that is not a number or is outside the range is an error. Null
+    values are not validated.
+
+    rule_data needs to contain:
+        - field_name (str): field with the column batch
+        - column (str): name of the column
+        - min_value (int, float, optional): minimum value (included)
+        - max_value (int, float, optional): maximum value (included)
+    """
+
+    RULE_DATA_CLASS = ColumnValuesInRangeRuleData
+    INSTRUCTION = "column_values_in_range"
+    min_value_field = "min_value"
+    max_value_field = "max_value"
+
+    @classmethod
+    def _count_row_errors(
+        cls, values: Sequence, rule_data: BaseValidatorInstructionRuleData
+    ) -> int:
+        return count_out_of_range(
+            values,
+            min_value=getattr(rule_data, cls.min_value_field),
+            max_value=getattr(rule_data, cls.max_value_field),
+        )
+
+    @staticmethod
+    def _row_error() -> ErrorCode:
+        return ListErrors.VALUE_OUT_OF_RANGE
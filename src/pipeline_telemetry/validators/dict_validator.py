@@ -3,9 +3,11 @@ Module to define the DictValidator class
 
 classes:
     - DictValidator
+    - CompiledRuleSet
 """
 
-from typing import Dict, List, Type
+from collections import defaultdict
+from typing import Dict, List, Sequence, Type
 
 from errors import ErrorCode
 
@@ -14,7 +16,9 @@ from ..settings.exceptions import (
     RuleCanHaveOnlyOneInstruction,
     UnknownInstruction,
 )
-from .abstract_validator_instruction import AbstractValidatorInstruction
+from .abstract_validator_instruction import AbstractValidatorInstruction, CompiledRule
+from .evaluation_context import EvaluationContext
+from .parallel import ParallelValidation
 
 
 class DictValidator:
@@ -26,6 +30,15 @@ class DictValidator:
     public methods:
         - validate():
             method to run the validate of a dict
+        - compile_rules():
+            method to compile validation rules once for repeated validation
+        - validate_compiled():
+            method to run the validate of a dict with compiled rules
+        - validate_many():
+            method to count the validation errors of a batch of dicts
+        - validate_parallel():
+            method to count the validation errors of a dict with large list
+            fields in an executor
     """
 
     _instructions: Dict[str, Type[AbstractValidatorInstruction]] = {}
@@ -63,17 +76,123 @@ class DictValidator:
         Returns:
             list: [description]
         """
-        instruction = cls._instruction_from_rule(rule)
-        if instruction not in cls._instructions:
-            raise UnknownInstruction(instruction)
-        validation_rule = cls._instructions.get(instruction)
+        validation_rule = cls._instruction_class_from_rule(rule)
+        return validation_rule.validate(
+            dict_to_validate=dict_to_validate, rule_dict=rule[1]
+        )
+
+    @classmethod
+    def compile_rules(cls, validation_rules: dict) -> List[CompiledRule]:
+        """Public class method to compile the validation rules.
 
-        if validation_rule:
-            return validation_rule.validate(
-                dict_to_validate=dict_to_validate, rule_dict=rule[1]
+        The instruction of each rule is resolved and the rule data is
+        validated and compiled once, so that validate_compiled only has to
+        run the instructions.
+
+        :param validation_rules: validation rules for a data object
+        :type validation_rules: dict
+
+        :returns: List of CompiledRules
+        """
+        return [
+            CompiledRule(
+                instruction_class=(
+                    instruction_class := cls._instruction_class_from_rule(rule)
+                ),
+                rule_data=instruction_class.compile_rule(rule[1]),
             )
+            for rule in validation_rules.items()
+        ]
 
-        return []
+    @staticmethod
+    def validate_compiled(
+        dict_to_validate: dict, compiled_rules: List[CompiledRule]
+    ) -> List[ErrorCode]:
+        """Public method to run the validation with compiled rules.
+
+        :param dict_to_validate: data dict to be validated
+        :type dict_to_validate: dict
+        :param compiled_rules: rules returned by compile_rules
+        :type compiled_rules: list
+
+        :returns: List of ErrorCodes. List is empty if no Errors are found
+        """
+        # all rules share the resolved field paths of the dict
+        context = EvaluationContext(dict_to_validate)
+        errors = []
+        for compiled_rule in compiled_rules:
+            errors.extend(compiled_rule.validate_in_context(context))
+        return errors
+
+    @classmethod
+    def validate_many(
+        cls, records: Sequence[dict], validation_rules: dict
+    ) -> Dict[str, int]:
+        """Public class method to run the validation for a batch of dicts.
+
+        Each rule is evaluated across the whole batch and only the number of
+        errors per error code key is returned, no ErrorCode is created for
+        each error.
+
+        :param records: data dicts to be validated
+        :type records: list
+        :param validation_rules: validation rules for these data objects
+        :type validation_rules: dict
+
+        :returns: Dict with the number of errors per error code key
+        """
+        return cls.validate_many_compiled(records, cls.compile_rules(validation_rules))
+
+    @staticmethod
+    def validate_many_compiled(
+        records: Sequence[dict], compiled_rules: List[CompiledRule]
+    ) -> Dict[str, int]:
+        """Public method to run the validation for a batch of dicts with
+        compiled rules.
+
+        :returns: Dict with the number of errors per error code key
+        """
+        contexts = [EvaluationContext(record) for record in records]
+        error_counts: Dict[str, int] = defaultdict(int)
+        for compiled_rule in compiled_rules:
+            for error_code_key, count in compiled_rule.count_errors(contexts).items():
+                error_counts[error_code_key] += count
+        return dict(error_counts)
+
+    @staticmethod
+    def validate_parallel(
+        dict_to_validate: dict,
+        compiled_rules: List[CompiledRule],
+        parallel_validation: ParallelValidation,
+    ) -> Dict[str, int]:
+        """Public method to run the validation with compiled rules where the
+        entries of large list fields are validated in chunks in the executor
+        of parallel_validation.
+
+        :param dict_to_validate: data dict to be validated
+        :type dict_to_validate: dict
+        :param compiled_rules: rules returned by compile_rules
+        :type compiled_rules: list
+        :param parallel_validation: executor, size threshold and chunk size
+        :type parallel_validation: ParallelValidation
+
+        :returns: Dict with the number of errors per error code key
+        """
+        return parallel_validation.count_errors(dict_to_validate, compiled_rules)
+
+    @classmethod
+    def _instruction_class_from_rule(
+        cls, rule: tuple
+    ) -> Type[AbstractValidatorInstruction]:
+        """Returns the registered instruction class for the rule
+
+        Raises:
+            UnknownInstruction: if the instruction is not registered
+        """
+        instruction = cls._instruction_from_rule(rule)
+        if instruction not in cls._instructions:
+            raise UnknownInstruction(instruction)
+        return cls._instructions[instruction]
 
     @classmethod
     def register_instruction(
@@ -110,3 +229,72 @@ class DictValidator:
         if not (isinstance(rule, tuple) and len(rule) == 2):
             raise RuleCanHaveOnlyOneInstruction(rule)
         return rule[0]
+
+
+class CompiledRuleSet:
+    """Class with the telemetry rules of all sub processes compiled once.
+
+    The rules are compiled with DictValidator.compile_rules when the class is
+    instantiated so that unknown instructions and invalid rule data are
+    reported before any data is validated.
+
+    public methods:
+        - validate():
+            method to run the validate of a dict for a sub process
+        - validate_many():
+            method to count the validation errors of a batch of dicts for a
+            sub process
+        - validate_parallel():
+            method to count the validation errors of a dict for a sub process
+            with large list fields validated in an executor
+    """
+
+    __compiled_rules: Dict[str, List[CompiledRule]]
+
+    def __init__(self, telemetry_rules: dict) -> None:
+        """
+        :param telemetry_rules: validation rules per sub process
+        :type telemetry_rules: dict
+        """
+        self.__compiled_rules = {
+            sub_process: DictValidator.compile_rules(validation_rules)
+            for sub_process, validation_rules in telemetry_rules.items()
+        }
+
+    def rules(self, sub_process: str) -> List[CompiledRule]:
+        """Returns the compiled rules of a sub process."""
+        return self.__compiled_rules.get(sub_process, [])
+
+    def validate(self, sub_process: str, dict_to_validate: dict) -> List[ErrorCode]:
+        """Public method to run the validation for a sub process.
+
+        :returns: List of ErrorCodes. List is empty if no Errors are found
+        """
+        return DictValidator.validate_compiled(
+            dict_to_validate, self.rules(sub_process)
+        )
+
+    def validate_many(
+        self, sub_process: str, records: Sequence[dict]
+    ) -> Dict[str, int]:
+        """Public method to run the validation for a batch of dicts for a sub
+        process.
+
+        :returns: Dict with the number of errors per error code key
+        """
+        return DictValidator.validate_many_compiled(records, self.rules(sub_process))
+
+    def validate_parallel(
+        self,
+        sub_process: str,
+        dict_to_validate: dict,
+        parallel_validation: ParallelValidation,
+    ) -> Dict[str, int]:
+        """Public method to run the validation for a sub process with large
+        list fields validated in chunks in an executor.
+
+        :returns: Dict with the number of errors per error code key
+        """
+        return DictValidator.validate_parallel(
+            dict_to_validate, self.rules(sub_process), parallel_validation
+        )
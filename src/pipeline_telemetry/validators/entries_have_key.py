@@ -1,19 +1,32 @@
 """Module to define EntriesHaveKey class validator"""
 
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Sequence, Tuple
 
-import jmespath
 from errors import ErrorCode, ListErrors
 
 from .abstract_validator_instruction import (
     AbstractValidatorInstruction,
     BaseValidatorInstructionRuleData,
 )
+from .evaluation_context import EvaluationContext, FieldPath
 
 
 @dataclass(frozen=True)
 class EntriesHaveKeyRuleData(BaseValidatorInstructionRuleData):
     must_have_key: str
+    # compiled field path of must_have_key
+    must_have_key_expression: FieldPath = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.must_have_key, str):
+            raise TypeError("Field 'must_have_key' must be of type 'str'.")
+
+        super().__post_init__()
+        object.__setattr__(
+            self, "must_have_key_expression", FieldPath(self.must_have_key)
+        )
 
 
 class EntriesHaveKey(AbstractValidatorInstruction):
@@ -34,6 +47,7 @@ class EntriesHaveKey(AbstractValidatorInstruction):
 
     RULE_DATA_CLASS = EntriesHaveKeyRuleData
     INSTRUCTION = "entries_have_key"
+    VALIDATES_ENTRIES = True
     must_have_key = "must_have_key"
 
     @classmethod
@@ -43,23 +57,149 @@ class EntriesHaveKey(AbstractValidatorInstruction):
         """
         method to do the actual validation
 
+        returns:
+            - list of errorcodes
+        """
+        return cls.validate_in_context(EvaluationContext(dict_to_validate), rule_data)
+
+    @classmethod
+    def validate_in_context(
+        cls, context: EvaluationContext, rule_data: BaseValidatorInstructionRuleData
+    ) -> list[ErrorCode]:
+        """
+        method to validate the record of the evaluation context, the entries
+        field is resolved only once
+
         returns:
             - list of errorcodes
         """
         # if entries does not exist stop validation
-        if error := cls._validate_field_exists(dict_to_validate, rule_data):
+        if error := cls._validate_field_exists(context, rule_data):
             return error
 
         # if entries field is not a list stop validation
-        if error := cls._validate_type_entries_field(dict_to_validate, rule_data):
+        if error := cls._validate_type_entries_field(context, rule_data):
             return error
 
         # return the errors per entry
-        return cls._validate_entries_have_key(dict_to_validate, rule_data)
+        return cls._validate_entries_have_key(context, rule_data)
+
+    @classmethod
+    def count_errors(
+        cls,
+        contexts: Sequence[EvaluationContext],
+        rule_data: BaseValidatorInstructionRuleData,
+    ) -> Dict[str, int]:
+        """
+        method to count the errors of a batch of records
+
+        returns:
+            - number of errors per error code key
+        """
+        field_path = rule_data.field_expression
+        must_have_key_search = cls._get_must_have_key_expression(rule_data).search
+
+        field_not_found_count = 0
+        wrong_type_count = 0
+        not_a_dict_count = 0
+        missing_key_count = 0
+        for context in contexts:
+            entries = context.resolve(field_path)
+            if not entries:
+                field_not_found_count += 1
+                continue
+
+            if not isinstance(entries, list):
+                wrong_type_count += 1
+                continue
+
+            entry_counts = cls._count_entry_errors(entries, must_have_key_search)
+            not_a_dict_count += entry_counts[0]
+            missing_key_count += entry_counts[1]
+
+        return cls._error_counts(
+            rule_data,
+            field_not_found_count=field_not_found_count,
+            wrong_type_count=wrong_type_count,
+            not_a_dict_count=not_a_dict_count,
+            missing_key_count=missing_key_count,
+        )
+
+    @classmethod
+    def count_entry_errors(
+        cls, entries: Sequence, rule_data: BaseValidatorInstructionRuleData
+    ) -> Dict[str, int]:
+        """
+        method to count the errors of (a chunk of) the entries of a record
+
+        returns:
+            - number of errors per error code key
+        """
+        not_a_dict_count, missing_key_count = cls._count_entry_errors(
+            entries, cls._get_must_have_key_expression(rule_data).search
+        )
+        return cls._error_counts(
+            rule_data,
+            not_a_dict_count=not_a_dict_count,
+            missing_key_count=missing_key_count,
+        )
+
+    @staticmethod
+    def _count_entry_errors(
+        entries: Sequence, must_have_key_search: Callable[[Any], Any]
+    ) -> Tuple[int, int]:
+        """
+        method to count the entries that are not a dict and the entries that
+        miss the must_have_key
+
+        returns:
+            - tuple with the nr of entries that are not a dict and the nr of
+              entries without the key
+        """
+        not_a_dict_count = 0
+        missing_key_count = 0
+        for entry in entries:
+            if not isinstance(entry, dict):
+                not_a_dict_count += 1
+            elif not must_have_key_search(entry):
+                missing_key_count += 1
+        return not_a_dict_count, missing_key_count
+
+    @classmethod
+    def _error_counts(
+        cls,
+        rule_data: BaseValidatorInstructionRuleData,
+        field_not_found_count: int = 0,
+        wrong_type_count: int = 0,
+        not_a_dict_count: int = 0,
+        missing_key_count: int = 0,
+    ) -> Dict[str, int]:
+        """
+        method to return the error counts per error code key
+
+        returns:
+            - number of errors per error code key
+        """
+        fieldname = cls._get_field_name(rule_data)
+        must_have_key = cls._get_must_have_key(rule_data)
+        error_counts: Dict[str, int] = defaultdict(int)
+        for error_code, key_fieldname, count in [
+            (ListErrors.ENTRIES_FIELD_NOT_FOUND, fieldname, field_not_found_count),
+            (ListErrors.ENTRIES_FIELD_OF_WRONG_TYPE, fieldname, wrong_type_count),
+            (ListErrors.ENTRY_IS_NOT_A_DICT, fieldname, not_a_dict_count),
+            (
+                ListErrors.KEY_NOT_FOUND_IN_ENTRY,
+                fieldname + "__" + must_have_key,
+                missing_key_count,
+            ),
+        ]:
+            if count:
+                error_counts[cls._error_code_key(error_code, key_fieldname)] += count
+        return error_counts
 
     @classmethod
     def _validate_entries_have_key(
-        cls, dict_to_validate: dict, rule_data: BaseValidatorInstructionRuleData
+        cls, context: EvaluationContext, rule_data: BaseValidatorInstructionRuleData
     ) -> list[ErrorCode]:
         """
         method to check if the values in the entry have a specific key
@@ -70,6 +210,7 @@ class EntriesHaveKey(AbstractValidatorInstruction):
         errors = []
         fieldname = cls._get_field_name(rule_data)
         must_have_key = cls._get_must_have_key(rule_data)
+        must_have_key_search = cls._get_must_have_key_expression(rule_data).search
 
         # prepare error messages
         entry_is_not_a_dict_error = cls._validation_error(
@@ -80,45 +221,44 @@ class EntriesHaveKey(AbstractValidatorInstruction):
         )
 
         # for each entry do a has_key validation with the `must_have_key` field
-        for entry in jmespath.search(fieldname, dict_to_validate):
+        for entry in cls._get_field_value(context, rule_data):
             if not isinstance(entry, dict):
                 errors.extend(entry_is_not_a_dict_error)
                 continue
 
-            if not jmespath.search(must_have_key, entry):
+            if not must_have_key_search(entry):
                 errors.extend(missing_key_in_entry_error)
 
         return errors
 
     @classmethod
     def _validate_field_exists(
-        cls, dict_to_validate: dict, rule_data: BaseValidatorInstructionRuleData
+        cls, context: EvaluationContext, rule_data: BaseValidatorInstructionRuleData
     ) -> list[ErrorCode]:
         """
-        method to check if entries field exists in dict_to_validate
+        method to check if entries field exists in the record
 
         returns:
             - list{ErrorCode]: Empty list in case the field does exist
         """
-        fieldname = cls._get_field_name(rule_data)
-
-        if not jmespath.search(fieldname, dict_to_validate):
+        if not cls._get_field_value(context, rule_data):
+            fieldname = cls._get_field_name(rule_data)
             return cls._validation_error(ListErrors.ENTRIES_FIELD_NOT_FOUND, fieldname)
 
         return []
 
     @classmethod
     def _validate_type_entries_field(
-        cls, dict_to_validate: dict, rule_data: BaseValidatorInstructionRuleData
+        cls, context: EvaluationContext, rule_data: BaseValidatorInstructionRuleData
     ) -> list[ErrorCode]:
         """
-        method to check if entries field in dict_to_validate is a list
+        method to check if entries field in the record is a list
 
         returns:
             - list[ErrorCode]: Empty list in case the field holds a list
         """
         fieldname = cls._get_field_name(rule_data)
-        entries = jmespath.search(fieldname, dict_to_validate)
+        entries = cls._get_field_value(context, rule_data)
         if not isinstance(entries, (list)):
             return cls._validation_error(
                 ListErrors.ENTRIES_FIELD_OF_WRONG_TYPE, fieldname
@@ -133,6 +273,15 @@ class EntriesHaveKey(AbstractValidatorInstruction):
         """
         return getattr(rule_data, cls.must_have_key)
 
+    @classmethod
+    def _get_must_have_key_expression(
+        cls, rule_data: BaseValidatorInstructionRuleData
+    ) -> FieldPath:
+        """
+        retrieves the compiled field path of the must_have_key
+        """
+        return getattr(rule_data, cls.must_have_key + "_expression")
+
     @staticmethod
     def _validation_error(error_code: ErrorCode, fieldname: str) -> list[ErrorCode]:
         """returns error code object in list with fieldname as error data"""
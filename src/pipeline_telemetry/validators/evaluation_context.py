@@ -0,0 +1,88 @@
+"""
+Module to define the field paths and the evaluation context used by the
+validator instructions.
+
+classes:
+    - FieldPath
+    - EvaluationContext
+"""
+
+import re
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import jmespath
+
+# a field path of identifiers separated by dots, like `data.items`, can be
+# resolved with dict lookups without jmespath
+SIMPLE_DOTTED_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*")
+
+
+def search_dotted_key(keys: Tuple[str, ...], data: Any) -> Optional[Any]:
+    """
+    Returns the value of the nested keys in data, or None when a key is not
+    found or a value on the path is not a dict, like jmespath does.
+    """
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+class FieldPath:
+    """Class with a compiled field path.
+
+    Simple dotted keys are resolved with dict lookups, other field paths are
+    searched with a pre-compiled jmespath expression.
+
+    attributes:
+        - expression: the field path
+        - search: method that returns the value of the field path in a dict
+    """
+
+    expression: str
+    search: Callable[[Any], Any]
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        if SIMPLE_DOTTED_KEY.fullmatch(expression):
+            keys = tuple(expression.split("."))
+            self.search = lambda data: search_dotted_key(keys, data)
+        else:
+            self.search = jmespath.compile(expression).search
+
+    def __reduce__(self):
+        """the search method can not be pickled, a copy is compiled again"""
+        return (FieldPath, (self.expression,))
+
+    def __repr__(self) -> str:
+        return f"FieldPath({self.expression!r})"
+
+
+class EvaluationContext:
+    """Class with the evaluation context of a single record.
+
+    The context is shared by all rules that validate the record. The value
+    of each field path is resolved once and reused by the other rules that
+    use the same field path.
+
+    public methods:
+        - resolve(): returns the value of a field path in the record
+    """
+
+    record: dict
+    __values: Dict[str, Any]
+
+    def __init__(self, record: dict) -> None:
+        self.record = record
+        self.__values = {}
+
+    def resolve(self, field_path: FieldPath) -> Any:
+        """Returns the (memoized) value of the field path in the record."""
+        try:
+            return self.__values[field_path.expression]
+        except KeyError:
+            value = self.__values[field_path.expression] = field_path.search(
+                self.record
+            )
+            return value
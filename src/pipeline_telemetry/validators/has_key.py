@@ -1,12 +1,14 @@
 """Module to define HasKey class validator"""
 
-import jmespath
+from typing import Dict, Sequence
+
 from errors import ErrorCode, ListErrors
 
 from .abstract_validator_instruction import (
     AbstractValidatorInstruction,
     BaseValidatorInstructionRuleData,
 )
+from .evaluation_context import EvaluationContext
 
 
 class HasKey(AbstractValidatorInstruction):
@@ -27,12 +29,46 @@ class HasKey(AbstractValidatorInstruction):
         returns:
             - error in case
         """
-        fieldname = cls._get_field_name(rule_data)
-        if not jmespath.search(fieldname, dict_to_validate):
+        return cls.validate_in_context(EvaluationContext(dict_to_validate), rule_data)
+
+    @classmethod
+    def validate_in_context(
+        cls, context: EvaluationContext, rule_data: BaseValidatorInstructionRuleData
+    ) -> list[ErrorCode]:
+        """
+        method to validate the record of the evaluation context
+
+        returns:
+            - error in case
+        """
+        if not cls._get_field_value(context, rule_data):
+            fieldname = cls._get_field_name(rule_data)
             return cls._validation_error(ListErrors.KEY_NOT_FOUND, fieldname)
 
         return []
 
+    @classmethod
+    def count_errors(
+        cls,
+        contexts: Sequence[EvaluationContext],
+        rule_data: BaseValidatorInstructionRuleData,
+    ) -> Dict[str, int]:
+        """
+        method to count the records without the key
+
+        returns:
+            - number of errors per error code key
+        """
+        field_path = rule_data.field_expression
+        missing_count = sum(
+            1 for context in contexts if not context.resolve(field_path)
+        )
+        if not missing_count:
+            return {}
+
+        fieldname = cls._get_field_name(rule_data)
+        return {cls._error_code_key(ListErrors.KEY_NOT_FOUND, fieldname): missing_count}
+
     @staticmethod
     def _validation_error(error_code: ErrorCode, fieldname: str) -> list[ErrorCode]:
         """returns error code object in list with fieldname as error data"""
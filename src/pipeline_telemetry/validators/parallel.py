@@ -0,0 +1,133 @@
+"""
+Module to define the ParallelValidation class.
+
+With parallel validation the entries of large list fields (for example the
+items of a multi-MB API response) are validated in chunks in an executor,
+instead of on the thread that adds the data to the telemetry. Rules on small
+fields and on fields that are not a list are validated inline.
+
+Only instructions with VALIDATES_ENTRIES (like EntriesHaveKey) validate the
+entries of a list, the other instructions are always validated inline.
+
+Usage
+
+>>> with ProcessPoolExecutor(max_workers=4) as executor:
+...     telemetry = Telemetry(
+            parallel_validation=ParallelValidation(executor), **telemetry_params
+        )
+...     telemetry.add("RETRIEVE_RAW_DATA", api_response, errors=[])
+
+The executor is not shut down by ParallelValidation. When using a process
+pool the data and compiled rules are pickled, so custom instructions must be
+defined at module level.
+"""
+
+from collections import defaultdict
+from concurrent.futures import Executor, Future
+from typing import Any, Dict, Iterator, List, Sequence
+
+from ..settings import settings as st
+from .abstract_validator_instruction import CompiledRule
+from .evaluation_context import EvaluationContext
+
+
+def count_entry_errors(
+    compiled_rule: CompiledRule, entries: Sequence
+) -> Dict[str, int]:
+    """
+    Returns the error counts of a chunk of entries for a compiled rule.
+    Defined at module level to allow it to be run in a process pool.
+    """
+    return compiled_rule.count_entry_errors(entries)
+
+
+def _chunks(entries: Sequence, chunk_size: int) -> Iterator[Sequence]:
+    """Returns the consecutive chunks of entries with at most chunk_size entries."""
+    for start in range(0, len(entries), chunk_size):
+        end = start + chunk_size
+        yield entries[start:end]
+
+
+class ParallelValidation:
+    """
+    Class to validate the entries of large list fields in chunks in an
+    executor.
+
+    public methods:
+    - count_errors: returns the validation error counts of a dict
+    """
+
+    __executor: Executor
+    __size_threshold: int
+    __chunk_size: int
+
+    def __init__(
+        self,
+        executor: Executor,
+        size_threshold: int = st.DEFAULT_PARALLEL_VALIDATION_THRESHOLD,
+        chunk_size: int = st.DEFAULT_VALIDATION_CHUNK_SIZE,
+    ) -> None:
+        """
+        Args:
+            executor: thread or process pool to validate the chunks
+            size_threshold:
+                min nr of entries in a list field to validate the entries in
+                the executor, smaller lists are validated inline
+            chunk_size: max nr of entries validated in a single task
+        """
+        self.__executor = executor
+        self.__size_threshold = size_threshold
+        self.__chunk_size = chunk_size
+
+    @property
+    def size_threshold(self) -> int:
+        return self.__size_threshold
+
+    @property
+    def chunk_size(self) -> int:
+        return self.__chunk_size
+
+    def count_errors(
+        self, dict_to_validate: dict, compiled_rules: List[CompiledRule]
+    ) -> Dict[str, int]:
+        """
+        Returns the number of errors per error code key of dict_to_validate.
+        The chunks are submitted to the executor first, rules that are
+        validated inline run while the chunks are validated.
+        """
+        context = EvaluationContext(dict_to_validate)
+        futures: List[Future] = []
+        inline_rules: List[CompiledRule] = []
+        for compiled_rule in compiled_rules:
+            entries = context.resolve(compiled_rule.rule_data.field_expression)
+            if self._validate_in_chunks(compiled_rule, entries):
+                futures.extend(
+                    self.__executor.submit(count_entry_errors, compiled_rule, chunk)
+                    for chunk in _chunks(entries, self.__chunk_size)
+                )
+            else:
+                inline_rules.append(compiled_rule)
+
+        error_counts: Dict[str, int] = defaultdict(int)
+        for compiled_rule in inline_rules:
+            self._merge(error_counts, compiled_rule.count_errors([context]))
+        for future in futures:
+            self._merge(error_counts, future.result())
+        return dict(error_counts)
+
+    def _validate_in_chunks(self, compiled_rule: CompiledRule, entries: Any) -> bool:
+        """
+        Returns True when the entries of the field of the rule are validated in
+        chunks in the executor.
+        """
+        return (
+            compiled_rule.instruction_class.VALIDATES_ENTRIES
+            and isinstance(entries, list)
+            and len(entries) >= self.__size_threshold
+        )
+
+    @staticmethod
+    def _merge(error_counts: Dict[str, int], counts_to_add: Dict[str, int]) -> None:
+        """Adds counts_to_add to error_counts."""
+        for error_code_key, count in counts_to_add.items():
+            error_counts[error_code_key] += count
@@ -0,0 +1,168 @@
+"""
+Module to define the sampling policies for the validation of high volume sub
+processes.
+
+A sampling policy decides which records added to a sub process are validated
+with the telemetry rules. The error counts of the validated records are
+extrapolated to all records: the errors of a record that is validated with
+probability p are counted 1 / p times.
+
+classes:
+    - AbstractSamplingPolicy
+    - FixedRateSampling: validate a fixed fraction of the records
+    - ReservoirSampling: validate (about) a fixed nr of records
+    - FirstThenRateSampling: validate the first records, then a fraction
+    - Sampler: applies a sampling policy to the records of a sub process
+
+Usage
+
+>>> telemetry = Telemetry(
+        sampling_policies={"RETRIEVE_RAW_DATA": FixedRateSampling(rate=0.01)},
+        **telemetry_params,
+    )
+"""
+
+import random
+from abc import ABCMeta, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from ..settings import exceptions
+
+
+def _validate_rate(rate: float) -> None:
+    """Raises InvalidSamplingPolicy when rate is not in (0, 1]."""
+    if not isinstance(rate, (int, float)) or not 0 < rate <= 1:
+        raise exceptions.InvalidSamplingPolicy(
+            f"rate must be larger than 0 and at most 1, got `{rate}`"
+        )
+
+
+def _validate_count(name: str, count: int) -> None:
+    """Raises InvalidSamplingPolicy when count is not a positive int."""
+    if not isinstance(count, int) or count < 1:
+        raise exceptions.InvalidSamplingPolicy(
+            f"{name} must be a positive int, got `{count}`"
+        )
+
+
+class AbstractSamplingPolicy(metaclass=ABCMeta):
+    """Abstract sampling policy class.
+
+    A sampling policy holds no state, the same policy can be used by many
+    Telemetry objects.
+    """
+
+    @abstractmethod
+    def inclusion_probability(self, record_number: int) -> float:
+        """
+        Returns the probability that the record with record_number (starting
+        at 1) of a sub process is validated.
+        """
+
+
+@dataclass(frozen=True)
+class FixedRateSampling(AbstractSamplingPolicy):
+    """Validates each record with probability rate."""
+
+    rate: float
+
+    def __post_init__(self):
+        _validate_rate(self.rate)
+
+    def inclusion_probability(self, record_number: int) -> float:
+        return self.rate
+
+
+@dataclass(frozen=True)
+class ReservoirSampling(AbstractSamplingPolicy):
+    """
+    Validates all of the first size records, after that record n is validated
+    with probability size / n like in reservoir sampling. Validated records
+    are not replaced, so the nr of validated records only grows
+    logarithmically with the nr of records.
+    """
+
+    size: int
+
+    def __post_init__(self):
+        _validate_count("size", self.size)
+
+    def inclusion_probability(self, record_number: int) -> float:
+        return min(1.0, self.size / record_number)
+
+
+@dataclass(frozen=True)
+class FirstThenRateSampling(AbstractSamplingPolicy):
+    """Validates all of the first records, then each record with probability rate."""
+
+    first: int
+    rate: float
+
+    def __post_init__(self):
+        _validate_count("first", self.first)
+        _validate_rate(self.rate)
+
+    def inclusion_probability(self, record_number: int) -> float:
+        return 1.0 if record_number <= self.first else self.rate
+
+
+class Sampler:
+    """Class to apply a sampling policy to the records of a sub process.
+
+    public methods:
+        - sample(): returns the weight of the next record when it is sampled
+        - extrapolate(): returns the extrapolated increments of error counts
+    """
+
+    __sampling_policy: AbstractSamplingPolicy
+    __random: random.Random
+    __record_number: int
+    __weighted_error_counts: Dict[str, float]
+
+    def __init__(
+        self, sampling_policy: AbstractSamplingPolicy, seed: Optional[int] = None
+    ) -> None:
+        if not isinstance(sampling_policy, AbstractSamplingPolicy):
+            raise exceptions.InvalidSamplingPolicy(
+                "policy must be of class AbstractSamplingPolicy"
+            )
+        self.__sampling_policy = sampling_policy
+        self.__random = random.Random(seed)
+        self.__record_number = 0
+        self.__weighted_error_counts = defaultdict(float)
+
+    @property
+    def sampling_policy(self) -> AbstractSamplingPolicy:
+        return self.__sampling_policy
+
+    def sample(self) -> Optional[float]:
+        """
+        Returns the weight (1 / inclusion probability) of the next record when
+        it should be validated, None otherwise.
+        """
+        self.__record_number += 1
+        probability = self.__sampling_policy.inclusion_probability(self.__record_number)
+        if probability >= 1:
+            return 1.0
+        if self.__random.random() < probability:
+            return 1 / probability
+        return None
+
+    def extrapolate(
+        self, error_counts: Dict[str, int], weight: float
+    ) -> Dict[str, int]:
+        """
+        Returns the increments of the extrapolated error counts for the error
+        counts of sampled records with weight. The weighted error counts are
+        summed and rounded, so rounding errors do not add up.
+        """
+        increments = {}
+        for error_code_key, count in error_counts.items():
+            previous = round(self.__weighted_error_counts[error_code_key])
+            self.__weighted_error_counts[error_code_key] += count * weight
+            increment = round(self.__weighted_error_counts[error_code_key]) - previous
+            if increment:
+                increments[error_code_key] = increment
+        return increments
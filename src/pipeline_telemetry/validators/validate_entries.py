@@ -1,9 +1,9 @@
 """Module to define validate entries validator class"""
 
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Sequence
 
-import jmespath
 from errors import ErrorCode, ListErrors, add_error_data
 
 from ..settings import exceptions
@@ -11,6 +11,7 @@ from .abstract_validator_instruction import (
     AbstractValidatorInstruction,
     BaseValidatorInstructionRuleData,
 )
+from .evaluation_context import EvaluationContext
 
 
 @dataclass(frozen=True)
@@ -46,12 +47,24 @@ class ValidateEntries(AbstractValidatorInstruction):
         """
         method to do the actual validation
 
+        returns:
+            - error in case
+        """
+        return cls.validate_in_context(EvaluationContext(dict_to_validate), rule_data)
+
+    @classmethod
+    def validate_in_context(
+        cls, context: EvaluationContext, rule_data: BaseValidatorInstructionRuleData
+    ) -> list[ErrorCode]:
+        """
+        method to validate the record of the evaluation context
+
         returns:
             - error in case
         """
         fieldname = cls._get_field_name(rule_data)
 
-        field_to_validate = jmespath.search(fieldname, dict_to_validate)
+        field_to_validate = cls._get_field_value(context, rule_data)
 
         if not field_to_validate:
             return cls._validation_error(ListErrors.FIELD_NOT_FOUND, fieldname)
@@ -64,6 +77,32 @@ class ValidateEntries(AbstractValidatorInstruction):
 
         return []
 
+    @classmethod
+    def count_errors(
+        cls,
+        contexts: Sequence[EvaluationContext],
+        rule_data: BaseValidatorInstructionRuleData,
+    ) -> Dict[str, int]:
+        """
+        method to count the errors of a batch of records
+
+        returns:
+            - number of errors per error code key
+        """
+        field_path = rule_data.field_expression
+        expected_count = cls._get_expected_count(rule_data)
+        error_counts: Dict[str, int] = defaultdict(int)
+        for context in contexts:
+            field_to_validate = context.resolve(field_path)
+            if not field_to_validate:
+                error_counts[ListErrors.FIELD_NOT_FOUND.code] += 1
+            elif not isinstance(field_to_validate, (list, dict)):
+                error_counts[ListErrors.WRONG_TYPE_IN_FIELD.code] += 1
+            elif len(field_to_validate) != expected_count:
+                error_counts[ListErrors.UNEXPECTED_NR_OF_ITEMS.code] += 1
+
+        return error_counts
+
     @classmethod
     def _get_expected_count(
         cls, rule_data: BaseValidatorInstructionRuleData
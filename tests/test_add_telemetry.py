@@ -4,7 +4,7 @@ import pytest
 from errors.error import ListErrors
 from test_data import DEFAULT_TELEMETRY_PARAMS, TEST_TELEMETRY_RULES
 
-from pipeline_telemetry import Telemetry
+from pipeline_telemetry import FixedRateSampling, ReservoirSampling, Telemetry
 from pipeline_telemetry.settings import exceptions
 from pipeline_telemetry.settings import settings as st
 
@@ -40,26 +40,95 @@ def test_add_errors_method_adds_errors_to_sub_process():
     )
 
 
-def test_validate_data_method():
-    """Test _validate_data_method returns list of errors."""
+def test_count_validation_errors_method():
+    """Test _count_validation_errors returns the error count per error code."""
     telemetry = Telemetry(
         telemetry_rules=TEST_TELEMETRY_RULES, **DEFAULT_TELEMETRY_PARAMS
     )
-    telemetry.increase_sub_process_base_count("RETRIEVE_RAW_DATA")
-    errors = telemetry._validate_data(sub_process="RETRIEVE_RAW_DATA", data={})
-    assert ListErrors.KEY_NOT_FOUND.code in str(errors[0])
-    assert "@KEY_<items>" in str(errors[0])
+    error_counts = telemetry._count_validation_errors(
+        sub_process="RETRIEVE_RAW_DATA", data={}
+    )
+    assert error_counts == {ListErrors.KEY_NOT_FOUND.code + "@KEY_<items>": 1}
 
 
-def test_validate_data_method_returns_empty_list():
+def test_count_validation_errors_method_returns_empty_dict():
     """
-    Test _validate_data_method returns empty list when no errors are found.
+    Test _count_validation_errors returns empty dict when no errors are found.
     """
     telemetry = Telemetry(
         telemetry_rules=TEST_TELEMETRY_RULES, **DEFAULT_TELEMETRY_PARAMS
     )
-    telemetry.increase_sub_process_base_count("RETRIEVE_RAW_DATA")
-    errors = telemetry._validate_data(
+    error_counts = telemetry._count_validation_errors(
         sub_process="RETRIEVE_RAW_DATA", data={"items": [1, 2, 3]}
     )
-    assert errors == []
+    assert not error_counts
+
+
+def test_add_many_adds_error_counts_to_sub_process():
+    """Test add_many adds the validation error counts of all records."""
+    telemetry = Telemetry(
+        telemetry_rules=TEST_TELEMETRY_RULES, **DEFAULT_TELEMETRY_PARAMS
+    )
+    telemetry.add_many("RETRIEVE_RAW_DATA", [{}, {"items": [1]}, {"items": []}])
+    sub_process_telemetry = telemetry.get("RETRIEVE_RAW_DATA")
+    assert sub_process_telemetry.errors == {
+        ListErrors.KEY_NOT_FOUND.code + "@KEY_<items>": 2
+    }
+    assert sub_process_telemetry.base_counter == 0
+
+
+def test_add_many_raises_exception_when_telemetry_closed():
+    """Test add_many raises an exception when the telemetry is closed."""
+    telemetry = Telemetry(**DEFAULT_TELEMETRY_PARAMS)
+    telemetry.save_and_close()
+    with pytest.raises(exceptions.TelemetryObjectAlreadyClosed):
+        telemetry.add_many("RETRIEVE_RAW_DATA", [{}])
+
+
+@pytest.mark.parametrize("random_value, sampled", [(0.25, True), (0.75, False)])
+def test_add_with_sampling_policy_extrapolates_errors(mocker, random_value, sampled):
+    """
+    Test add only validates sampled data and adds the extrapolated validation
+    errors and the sample counts to the sub process.
+    """
+    mocker.patch("random.Random.random", return_value=random_value)
+    telemetry = Telemetry(
+        telemetry_rules=TEST_TELEMETRY_RULES,
+        sampling_policies={"RETRIEVE_RAW_DATA": FixedRateSampling(rate=0.5)},
+        **DEFAULT_TELEMETRY_PARAMS,
+    )
+    for _ in range(3):
+        telemetry.add("RETRIEVE_RAW_DATA", {}, [ListErrors.KEY_NOT_FOUND])
+
+    sub_process_telemetry = telemetry.get("RETRIEVE_RAW_DATA")
+    assert sub_process_telemetry.sampling_base_count == 3
+    assert sub_process_telemetry.sampled_count == (3 if sampled else 0)
+    expected_errors = {ListErrors.KEY_NOT_FOUND.code: 3}
+    if sampled:
+        expected_errors[ListErrors.KEY_NOT_FOUND.code + "@KEY_<items>"] = 6
+    assert sub_process_telemetry.errors == expected_errors
+
+
+def test_add_many_with_sampling_policy_extrapolates_errors():
+    """Test add_many only validates the sampled records."""
+    telemetry = Telemetry(
+        telemetry_rules=TEST_TELEMETRY_RULES,
+        sampling_policies={"RETRIEVE_RAW_DATA": ReservoirSampling(size=2)},
+        **DEFAULT_TELEMETRY_PARAMS,
+    )
+    telemetry.add_many("RETRIEVE_RAW_DATA", [{}, {"items": [1]}])
+    sub_process_telemetry = telemetry.get("RETRIEVE_RAW_DATA")
+    assert sub_process_telemetry.sampling_base_count == 2
+    assert sub_process_telemetry.sampled_count == 2
+    assert sub_process_telemetry.errors == {
+        ListErrors.KEY_NOT_FOUND.code + "@KEY_<items>": 1
+    }
+
+
+def test_sampling_policy_for_invalid_sub_process_raises_exception():
+    """Test a sampling policy for an unknown sub process raises an exception."""
+    with pytest.raises(exceptions.InvalidSubProcess):
+        Telemetry(
+            sampling_policies={"UNKNOWN": FixedRateSampling(rate=0.5)},
+            **DEFAULT_TELEMETRY_PARAMS,
+        )
@@ -1,5 +1,5 @@
 from datetime import date, datetime, timedelta
-from typing import Iterator, List
+from typing import Iterable, Iterator, List
 
 from test_data import DEFAULT_TELEMETRY_MODEL_PARAMS, DEFAULT_TELEMETRY_SELECTOR_PARAMS
 
@@ -53,3 +53,47 @@ class TelemetryTestList:
         if not hasattr(self, "stored_telemetry"):
             self.stored_telemetry = []
         self.stored_telemetry.append(telemetry)
+
+    def store_aggregated_telemetry(self, telemetry: TelemetryModel) -> None:
+        """public method to persist and replace an aggregated telemetry object"""
+        self.store_telemetry(telemetry)
+
+
+class DatedTelemetryTestList(TelemetryTestList):
+    """
+    Test storage returning a telemetry model for yesterday and two for the day
+    before yesterday. Keeps track of the queries and of the batch writes.
+    """
+
+    queries: List[dict]
+    stored_batches: List[List[TelemetryModel]]
+
+    def __init__(self) -> None:
+        self.queries = []
+        self.stored_batches = []
+        self.__telemetry_models = []
+        for day, base_counter in [
+            (YESTERDAY, 1),
+            (DAY_BEFORE_YESTERDAY, 2),
+            (DAY_BEFORE_YESTERDAY, 3),
+        ]:
+            telemetry_model = TelemetryModel(
+                **DEFAULT_TELEMETRY_MODEL_PARAMS,
+                start_date_time=datetime(*day.timetuple()[:3], 12),
+            )
+            telemetry_model.telemetry.update(
+                {"DATA_STORAGE": TelemetryData(base_counter=base_counter)}
+            )
+            self.__telemetry_models.append(telemetry_model)
+
+    def telemetry_list(self, **kwargs) -> Iterator[TelemetryModel]:
+        self.queries.append(kwargs)
+        for telemetry_model in self.__telemetry_models:
+            if kwargs["from_date_time"] <= telemetry_model.start_date_time:
+                if telemetry_model.start_date_time < kwargs["to_date_time"]:
+                    yield telemetry_model
+
+    def store_aggregated_telemetry_batch(
+        self, telemetry_list: Iterable[TelemetryModel]
+    ) -> None:
+        self.stored_batches.append(list(telemetry_list))
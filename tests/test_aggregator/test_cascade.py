@@ -0,0 +1,273 @@
+"""Module to test the RollupCascade class."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from test_data import DEFAULT_TELEMETRY_MODEL_PARAMS, DEFAULT_TELEMETRY_SELECTOR_PARAMS
+
+from pipeline_telemetry import (
+    DailyAggregator,
+    MonthlyAggregator,
+    PartialToSingleAggregator,
+    QuarterlyAggregator,
+    RollupCascade,
+    TelemetryAggregator,
+    TelemetrySelector,
+    WeeklyAggregator,
+)
+from pipeline_telemetry.aggregator.cascade import (
+    CascadeStorage,
+    order_aggregator_classes,
+)
+from pipeline_telemetry.data_classes import TelemetryData, TelemetryModel
+from pipeline_telemetry.settings import exceptions
+from pipeline_telemetry.settings import settings as st
+from pipeline_telemetry.storage.memory import TelemetryInMemoryStorage
+
+# monday
+FIRST_DAY = date(2022, 10, 3)
+LAST_DAY = FIRST_DAY + timedelta(days=14)
+TEST_TELEMETRY_SELECTOR = TelemetrySelector(**DEFAULT_TELEMETRY_SELECTOR_PARAMS)
+
+
+def new_telemetry_model(start_date_time, base_counter, telemetry_type=None):
+    """Returns a telemetry model with a DATA_STORAGE sub process."""
+    telemetry_model_params = dict(DEFAULT_TELEMETRY_MODEL_PARAMS)
+    if telemetry_type:
+        telemetry_model_params[st.TELEMETRY_TYPE_KEY] = telemetry_type
+    telemetry_model = TelemetryModel(
+        **telemetry_model_params, start_date_time=start_date_time
+    )
+    telemetry_model.telemetry["DATA_STORAGE"] = TelemetryData(
+        base_counter=base_counter, fail_counter=1
+    )
+    return telemetry_model
+
+
+@pytest.fixture
+def storage():
+    """
+    Returns in memory storage with two SINGLE TELEMETRY objects for each day
+    of two weeks and two PARTIAL AGGREGATION objects on the first day.
+    """
+    storage = TelemetryInMemoryStorage()
+    TelemetryInMemoryStorage._define_db_table(TelemetryInMemoryStorage.db_cursor)
+    first_date_time = datetime(*FIRST_DAY.timetuple()[:3])
+    for day in range(14):
+        for hour in [6, 18]:
+            storage.store_telemetry(
+                new_telemetry_model(
+                    first_date_time + timedelta(days=day, hours=hour), day
+                )
+            )
+    for hour in [8, 9]:
+        storage.store_telemetry(
+            new_telemetry_model(
+                first_date_time + timedelta(hours=hour),
+                10,
+                telemetry_type=st.PARTIAL_AGGR_TELEMETRY_TYPE,
+            )
+        )
+    return storage
+
+
+def stored_aggregations(storage, telemetry_type):
+    """Returns the telemetry objects of telemetry_type in the storage."""
+    return list(
+        storage.telemetry_list(
+            **DEFAULT_TELEMETRY_SELECTOR_PARAMS,
+            telemetry_type=telemetry_type,
+            from_date_time=datetime(2022, 1, 1),
+            to_date_time=datetime(2023, 1, 1),
+        )
+    )
+
+
+def test_order_aggregator_classes():
+    """Test aggregators are ordered on their from and to telemetry type."""
+    assert order_aggregator_classes(
+        [QuarterlyAggregator, WeeklyAggregator, DailyAggregator]
+    ) == [DailyAggregator, QuarterlyAggregator, WeeklyAggregator]
+    assert RollupCascade(TelemetryInMemoryStorage()).aggregator_classes[:2] == [
+        PartialToSingleAggregator,
+        DailyAggregator,
+    ]
+
+
+def test_order_aggregator_classes_raises_for_circular_dependency():
+    """Test aggregators that depend on each other raise an exception."""
+
+    class SingleToDailyAggregator(DailyAggregator):
+        FROM_TELEMETRY_TYPE = st.DAILY_AGGR_TELEMETRY_TYPE
+        TO_TELEMETRY_TYPE = st.SINGLE_TELEMETRY_TYPE
+
+    with pytest.raises(exceptions.CircularAggregatorDependency):
+        order_aggregator_classes([SingleToDailyAggregator, DailyAggregator])
+
+
+def test_cascade_equals_aggregation_of_all_telemetry(storage):
+    """
+    Test the weekly, monthly and quarterly aggregations of the cascade equal
+    the aggregation of all SINGLE TELEMETRY objects, including the single
+    aggregation of the PARTIAL AGGREGATION objects.
+    """
+    (result,) = RollupCascade(storage).run(
+        [TEST_TELEMETRY_SELECTOR], FIRST_DAY, LAST_DAY
+    )
+
+    assert result.telemetry_selector == TEST_TELEMETRY_SELECTOR
+    assert len(result.aggregations[st.SINGLE_TELEMETRY_TYPE]) == 1
+    assert len(result.aggregations[st.DAILY_AGGR_TELEMETRY_TYPE]) == 14
+    assert len(result.aggregations[st.WEEKLY_AGGR_TELEMETRY_TYPE]) == 2
+    single_telemetry = stored_aggregations(storage, st.SINGLE_TELEMETRY_TYPE)
+    assert len(single_telemetry) == 29
+
+    (monthly,) = stored_aggregations(storage, st.MONTHLY_AGGR_TELEMETRY_TYPE)
+    (quarterly,) = stored_aggregations(storage, st.QUARTERLY_AGGR_TELEMETRY_TYPE)
+    expected = TelemetryAggregator(
+        TelemetryModel(
+            **DEFAULT_TELEMETRY_SELECTOR_PARAMS,
+            telemetry_type=st.MONTHLY_AGGR_TELEMETRY_TYPE,
+        )
+    ).aggregate(single_telemetry)
+    assert monthly.telemetry == expected.telemetry
+    assert quarterly.telemetry == expected.telemetry
+    assert monthly.watermark == max(
+        telemetry.watermark or telemetry.start_date_time
+        for telemetry in single_telemetry
+    )
+
+
+def test_cascade_rolls_up_weeks_from_memory(storage, mocker):
+    """
+    Test the weekly roll up uses the daily aggregations of the cascade and
+    does not read them from the storage.
+    """
+    telemetry_list_spy = mocker.spy(storage, "telemetry_list")
+    RollupCascade(storage).run([TEST_TELEMETRY_SELECTOR], FIRST_DAY, LAST_DAY)
+
+    daily_queries = [
+        call.kwargs
+        for call in telemetry_list_spy.call_args_list
+        if call.kwargs[st.TELEMETRY_TYPE_KEY] == st.DAILY_AGGR_TELEMETRY_TYPE
+    ]
+    assert daily_queries
+    assert not [
+        query
+        for query in daily_queries
+        if query["to_date_time"] - query["from_date_time"] == timedelta(days=7)
+    ]
+
+
+def test_cascade_storage_keeps_aggregations_per_aggregation_filter(storage):
+    """
+    Test aggregations of the same period with another category are kept apart
+    and are not returned for the category of the query.
+    """
+    cascade_storage = CascadeStorage(storage)
+    first_date_time = datetime(*FIRST_DAY.timetuple()[:3])
+    aggregation = new_telemetry_model(
+        first_date_time, 1, telemetry_type=st.DAILY_AGGR_TELEMETRY_TYPE
+    )
+    other_aggregation = aggregation.model_copy(update={"category": "other"})
+    cascade_storage.store_aggregated_telemetry_batch([aggregation, other_aggregation])
+
+    assert cascade_storage.aggregations == {
+        st.DAILY_AGGR_TELEMETRY_TYPE: [aggregation, other_aggregation]
+    }
+    assert list(
+        cascade_storage.telemetry_list(
+            **DEFAULT_TELEMETRY_SELECTOR_PARAMS,
+            telemetry_type=st.DAILY_AGGR_TELEMETRY_TYPE,
+            from_date_time=first_date_time,
+            to_date_time=first_date_time + timedelta(days=1),
+        )
+    ) == [aggregation]
+
+
+def test_cascade_without_new_telemetry_stores_nothing(storage, mocker):
+    """Test a second run without new telemetry does not store aggregations."""
+    cascade = RollupCascade(storage)
+    cascade.run([TEST_TELEMETRY_SELECTOR], FIRST_DAY, LAST_DAY)
+
+    store_aggregated_telemetry_spy = mocker.spy(storage, "store_aggregated_telemetry")
+    (result,) = cascade.run([TEST_TELEMETRY_SELECTOR], FIRST_DAY, LAST_DAY)
+    assert not store_aggregated_telemetry_spy.called
+    assert result.aggregations == {}
+
+
+def test_cascade_only_recomputes_changed_periods(storage):
+    """
+    Test new telemetry only recomputes the aggregations of the periods that
+    contain the new telemetry.
+    """
+    cascade = RollupCascade(storage)
+    cascade.run([TEST_TELEMETRY_SELECTOR], FIRST_DAY, LAST_DAY)
+
+    new_date_time = datetime(*FIRST_DAY.timetuple()[:3]) + timedelta(days=8, hours=20)
+    storage.store_telemetry(new_telemetry_model(new_date_time, 100))
+    (result,) = cascade.run([TEST_TELEMETRY_SELECTOR], FIRST_DAY, LAST_DAY)
+
+    assert {
+        telemetry_type: [telemetry.start_date_time for telemetry in aggregations]
+        for telemetry_type, aggregations in result.aggregations.items()
+    } == {
+        st.DAILY_AGGR_TELEMETRY_TYPE: [datetime(2022, 10, 11)],
+        st.WEEKLY_AGGR_TELEMETRY_TYPE: [datetime(2022, 10, 10)],
+        st.MONTHLY_AGGR_TELEMETRY_TYPE: [datetime(2022, 10, 1)],
+        st.QUARTERLY_AGGR_TELEMETRY_TYPE: [datetime(2022, 10, 1)],
+    }
+    (second_week,) = [
+        telemetry
+        for telemetry in stored_aggregations(storage, st.WEEKLY_AGGR_TELEMETRY_TYPE)
+        if telemetry.start_date_time == datetime(2022, 10, 10)
+    ]
+    assert second_week.telemetry["DATA_STORAGE"].base_counter == 2 * 70 + 100
+    assert second_week.watermark == datetime(2022, 10, 16, 18)
+
+
+def test_cascade_recomputes_day_of_new_partial_telemetry(storage):
+    """
+    Test new partial telemetry replaces the single aggregation of the day and
+    recomputes the daily aggregation in full.
+    """
+    cascade = RollupCascade(storage)
+    cascade.run([TEST_TELEMETRY_SELECTOR], FIRST_DAY, LAST_DAY)
+
+    storage.store_telemetry(
+        new_telemetry_model(
+            datetime(*FIRST_DAY.timetuple()[:3]) + timedelta(hours=10),
+            5,
+            telemetry_type=st.PARTIAL_AGGR_TELEMETRY_TYPE,
+        )
+    )
+    (result,) = cascade.run([TEST_TELEMETRY_SELECTOR], FIRST_DAY, LAST_DAY)
+
+    assert len(result.aggregations[st.SINGLE_TELEMETRY_TYPE]) == 1
+    assert len(stored_aggregations(storage, st.SINGLE_TELEMETRY_TYPE)) == 29
+    (first_day,) = [
+        telemetry
+        for telemetry in stored_aggregations(storage, st.DAILY_AGGR_TELEMETRY_TYPE)
+        if telemetry.start_date_time == datetime(*FIRST_DAY.timetuple()[:3])
+    ]
+    assert first_day.telemetry["DATA_STORAGE"].base_counter == 25
+    # two single telemetry objects, the single aggregation and its three partials
+    assert first_day.telemetry[st.AGGREGATION_KEY].base_counter == 6
+    (first_week,) = [
+        telemetry
+        for telemetry in result.aggregations[st.WEEKLY_AGGR_TELEMETRY_TYPE]
+        if telemetry.start_date_time == datetime(2022, 10, 3)
+    ]
+    assert first_week.telemetry["DATA_STORAGE"].base_counter == 2 * 21 + 25
+
+
+def test_cascade_with_rollup_aggregators_only(storage):
+    """Test a cascade of roll ups aggregates the daily aggregations in storage."""
+    DailyAggregator(
+        telemetry_selector=TEST_TELEMETRY_SELECTOR, telemetry_storage=storage
+    ).aggregate(FIRST_DAY, LAST_DAY)
+    (result,) = RollupCascade(storage, [MonthlyAggregator, WeeklyAggregator]).run(
+        [TEST_TELEMETRY_SELECTOR], FIRST_DAY, LAST_DAY
+    )
+    assert len(result.aggregations[st.WEEKLY_AGGR_TELEMETRY_TYPE]) == 2
+    assert len(result.aggregations[st.MONTHLY_AGGR_TELEMETRY_TYPE]) == 1
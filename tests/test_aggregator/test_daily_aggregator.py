@@ -1,17 +1,22 @@
 """Module to test the DailyAggregator class."""
 
+from datetime import datetime, timedelta
+
 from test_aggregator_data import (
     DAY_BEFORE_YESTERDAY,
     TODAY,
     YESTERDAY,
+    DatedTelemetryTestList,
     TelemetryTestList,
 )
+from test_data import DEFAULT_TELEMETRY_MODEL_PARAMS, DEFAULT_TELEMETRY_SELECTOR_PARAMS
 
 from pipeline_telemetry import DailyAggregator, TelemetrySelector
 from pipeline_telemetry.aggregator.helper import TelemetryListArgs
-from pipeline_telemetry.data_classes import TelemetryModel
+from pipeline_telemetry.data_classes import TelemetryData, TelemetryModel
 from pipeline_telemetry.settings import settings as st
 from pipeline_telemetry.settings.date_ranges import get_daily_date_range_yesterday
+from pipeline_telemetry.storage.memory import TelemetryInMemoryStorage
 
 keys_in_telemetry_list_params = [
     "telemetry_type",
@@ -130,3 +135,144 @@ def test_run_aggregation_for_two_days():
     second_telemetry = storage.stored_telemetry[1]
     assert first_telemetry.start_date_time.date() == DAY_BEFORE_YESTERDAY
     assert second_telemetry.start_date_time.date() == YESTERDAY
+
+
+def test_single_query_aggregation_matches_aggregation_per_day():
+    """
+    Test aggregating with a single query stores the same aggregations as
+    aggregating with a query per day, using one query and one batch write.
+    """
+    telemetry_selector = TelemetrySelector(
+        category="test",
+        sub_category="sub_test",
+        source_name="source",
+        process_type="process_type",
+    )
+    start_date = DAY_BEFORE_YESTERDAY - timedelta(days=1)
+    storage = DatedTelemetryTestList()
+    aggr = DailyAggregator(
+        telemetry_selector=telemetry_selector, telemetry_storage=storage
+    )
+    aggr.aggregate(start_date, TODAY)
+    aggregations_per_day = storage.stored_telemetry
+
+    single_query_storage = DatedTelemetryTestList()
+    aggr = DailyAggregator(
+        telemetry_selector=telemetry_selector, telemetry_storage=single_query_storage
+    )
+    aggr.aggregate(start_date, TODAY, single_query=True)
+
+    assert len(single_query_storage.queries) == 1
+    assert len(single_query_storage.stored_batches) == 1
+    single_query_aggregations = single_query_storage.stored_batches[0]
+    assert len(single_query_aggregations) == 3
+    for aggregation, expected_aggregation in zip(
+        single_query_aggregations, aggregations_per_day
+    ):
+        assert aggregation.start_date_time == expected_aggregation.start_date_time
+        assert aggregation.telemetry == expected_aggregation.telemetry
+    assert single_query_aggregations[0].telemetry == {}
+    assert single_query_aggregations[1].telemetry["DATA_STORAGE"].base_counter == 5
+    assert single_query_aggregations[2].telemetry["DATA_STORAGE"].base_counter == 1
+
+
+def test_single_query_aggregation_without_date_ranges():
+    """Test aggregating an empty period does not query or store telemetry."""
+    telemetry_selector = TelemetrySelector(
+        category="test",
+        sub_category="sub_test",
+        source_name="source",
+        process_type="process_type",
+    )
+    storage = DatedTelemetryTestList()
+    aggr = DailyAggregator(
+        telemetry_selector=telemetry_selector, telemetry_storage=storage
+    )
+    aggr.aggregate(TODAY, TODAY, single_query=True)
+    assert not storage.queries
+    assert not storage.stored_batches
+
+
+def store_single_telemetry(storage, start_date_time, base_counter):
+    """Stores a SINGLE TELEMETRY object with a DATA_STORAGE base counter."""
+    telemetry_model = TelemetryModel(
+        **DEFAULT_TELEMETRY_MODEL_PARAMS, start_date_time=start_date_time
+    )
+    telemetry_model.telemetry["DATA_STORAGE"] = TelemetryData(base_counter=base_counter)
+    storage.store_telemetry(telemetry_model)
+
+
+def daily_aggregations(storage):
+    """Returns all DAILY AGGREGATION objects in the storage."""
+    return list(
+        storage.telemetry_list(
+            **DEFAULT_TELEMETRY_SELECTOR_PARAMS,
+            telemetry_type=st.DAILY_AGGR_TELEMETRY_TYPE,
+            from_date_time=datetime(*DAY_BEFORE_YESTERDAY.timetuple()[:3]),
+            to_date_time=datetime(*TODAY.timetuple()[:3]),
+        )
+    )
+
+
+def test_incremental_aggregation_adds_new_telemetry_to_aggregation(mocker):
+    """
+    Test the incremental aggregation only adds the telemetry objects after the
+    watermark to the existing aggregation and replaces the stored aggregation.
+    """
+    storage = TelemetryInMemoryStorage()
+    TelemetryInMemoryStorage._define_db_table(TelemetryInMemoryStorage.db_cursor)
+    yesterday = datetime(*YESTERDAY.timetuple()[:3])
+    store_single_telemetry(storage, yesterday + timedelta(hours=1), 1)
+    store_single_telemetry(storage, yesterday + timedelta(hours=2), 2)
+    aggr = DailyAggregator(
+        telemetry_selector=TelemetrySelector(**DEFAULT_TELEMETRY_SELECTOR_PARAMS),
+        telemetry_storage=storage,
+    )
+
+    aggr.aggregate(YESTERDAY, TODAY, incremental=True)
+    (aggregation,) = daily_aggregations(storage)
+    assert aggregation.start_date_time == yesterday
+    assert aggregation.watermark == yesterday + timedelta(hours=2)
+    assert aggregation.telemetry["DATA_STORAGE"].base_counter == 3
+
+    store_single_telemetry(storage, yesterday + timedelta(hours=3), 4)
+    telemetry_list_spy = mocker.spy(storage, "telemetry_list")
+    aggregation_count_spy = mocker.spy(storage, "aggregation_count")
+    aggr.aggregate(YESTERDAY, TODAY, incremental=True)
+    (aggregation,) = daily_aggregations(storage)
+    assert aggregation.watermark == yesterday + timedelta(hours=3)
+    assert aggregation.telemetry["DATA_STORAGE"].base_counter == 7
+    assert aggregation.telemetry[st.AGGREGATION_KEY].base_counter == 3
+    # the telemetry up to the watermark is counted by the storage
+    assert aggregation_count_spy.spy_return == 2
+    new_telemetry_query = telemetry_list_spy.call_args_list[1].kwargs
+    assert new_telemetry_query["from_date_time"] > yesterday + timedelta(hours=2)
+
+    store_aggregated_telemetry_spy = mocker.spy(storage, "store_aggregated_telemetry")
+    aggr.aggregate(YESTERDAY, TODAY, incremental=True)
+    assert not store_aggregated_telemetry_spy.called
+    assert len(daily_aggregations(storage)) == 1
+
+
+def test_incremental_aggregation_adds_late_telemetry_before_watermark():
+    """
+    Test the incremental aggregation runs the full aggregation again when
+    telemetry with a start_date_time before the watermark is stored late.
+    """
+    storage = TelemetryInMemoryStorage()
+    TelemetryInMemoryStorage._define_db_table(TelemetryInMemoryStorage.db_cursor)
+    yesterday = datetime(*YESTERDAY.timetuple()[:3])
+    store_single_telemetry(storage, yesterday + timedelta(hours=2), 2)
+    aggr = DailyAggregator(
+        telemetry_selector=TelemetrySelector(**DEFAULT_TELEMETRY_SELECTOR_PARAMS),
+        telemetry_storage=storage,
+    )
+    aggr.aggregate(YESTERDAY, TODAY, incremental=True)
+
+    store_single_telemetry(storage, yesterday + timedelta(hours=1), 1)
+    aggr.aggregate(YESTERDAY, TODAY, incremental=True)
+
+    (aggregation,) = daily_aggregations(storage)
+    assert aggregation.watermark == yesterday + timedelta(hours=2)
+    assert aggregation.telemetry["DATA_STORAGE"].base_counter == 3
+    assert aggregation.telemetry[st.AGGREGATION_KEY].base_counter == 2
@@ -1,9 +1,36 @@
 """Module to test the momgo Aggregators."""
 
-from test_aggregator_data import TEST_TELEMETRY_SELECTOR
+from datetime import timedelta
+from typing import Dict, List, Tuple
 
-from pipeline_telemetry import DailyAggregator, DailyMongoAggregator
+import pytest
+from pymongo import ReplaceOne
+from pymongo.errors import DuplicateKeyError
+from test_aggregator_data import (
+    DAY_BEFORE_YESTERDAY,
+    TEST_TELEMETRY_SELECTOR,
+    TODAY,
+    YESTERDAY,
+)
+from test_data import DEFAULT_TELEMETRY_MODEL_PARAMS
+
+from pipeline_telemetry import (
+    DailyAggregator,
+    DailyMongoAggregator,
+    PartialToSingleAggregator,
+    PartialToSingleMongoAggregator,
+)
+from pipeline_telemetry.aggregator.aggregator import WATERMARK_STEP
+from pipeline_telemetry.aggregator.mongo_aggregator import (
+    DailyMongoPipelineAggregator,
+    PartialToSingleMongoPipelineAggregator,
+)
+from pipeline_telemetry.data_classes import TelemetryModel
+from pipeline_telemetry.settings import settings as st
+from pipeline_telemetry.settings.date_ranges import get_daily_date_range_yesterday
 from pipeline_telemetry.storage import TelemetryMongoStorage
+from pipeline_telemetry.storage.mongo import TelemetryMongoModel
+from pipeline_telemetry.storage.mongo_aggregation import AGGREGATION_INDEX
 
 
 def test_daily_mongo_aggregator_class_exists():
@@ -19,3 +46,176 @@ def test_daily_mongo_aggregator_returns_daily_telemerty_class():
     aggregator = DailyMongoAggregator(TEST_TELEMETRY_SELECTOR)
     assert isinstance(aggregator, DailyAggregator)
     assert isinstance(aggregator.storage_class, TelemetryMongoStorage)
+
+
+def test_daily_mongo_aggregator_runs_aggregation_in_database(mocker):
+    """
+    Test that DailyMongoAggregator uses the aggregate_telemetry method of
+    the storage class to run the aggregation.
+    """
+    aggregate_telemetry_mock = mocker.patch.object(
+        TelemetryMongoStorage,
+        "aggregate_telemetry",
+        side_effect=lambda telemetry, **kwargs: telemetry,
+    )
+    aggregator = DailyMongoAggregator(TEST_TELEMETRY_SELECTOR)
+    date_time_range = next(get_daily_date_range_yesterday())
+    result = aggregator._run_aggregation(date_time_range)
+
+    assert isinstance(aggregator, DailyMongoPipelineAggregator)
+    assert aggregate_telemetry_mock.call_args.kwargs["telemetry_type"] == (
+        st.SINGLE_TELEMETRY_TYPE
+    )
+    assert result.telemetry_type == st.DAILY_AGGR_TELEMETRY_TYPE
+    assert result.start_date_time == date_time_range.from_date
+
+
+def test_partial_to_single_mongo_aggregator_runs_aggregation_in_database():
+    """
+    Test that PartialToSingleMongoAggregator returns a PartialToSingleAggregator
+    that runs the aggregation in the database.
+    """
+    aggregator = PartialToSingleMongoAggregator(TEST_TELEMETRY_SELECTOR)
+    assert isinstance(aggregator, PartialToSingleAggregator)
+    assert isinstance(aggregator, PartialToSingleMongoPipelineAggregator)
+
+
+def test_daily_mongo_aggregator_single_query_uses_bucketed_aggregation(mocker):
+    """
+    Test that the single query mode of DailyMongoAggregator aggregates all
+    date time ranges in one database aggregation and one batch write.
+    """
+    aggregate_mock = mocker.patch.object(
+        TelemetryMongoStorage,
+        "aggregate_telemetry_per_date_time_range",
+        side_effect=lambda telemetry, date_time_ranges, **kwargs: [
+            telemetry.telemetry_copy() for _ in date_time_ranges
+        ],
+    )
+    store_batch_mock = mocker.patch.object(
+        TelemetryMongoStorage, "store_aggregated_telemetry_batch"
+    )
+    aggregator = DailyMongoAggregator(TEST_TELEMETRY_SELECTOR)
+    aggregator.aggregate(DAY_BEFORE_YESTERDAY, TODAY, single_query=True)
+
+    assert aggregate_mock.call_count == 1
+    assert len(aggregate_mock.call_args.kwargs["date_time_ranges"]) == 2
+    stored_telemetry = list(store_batch_mock.call_args.args[0])
+    assert [telemetry.start_date_time.date() for telemetry in stored_telemetry] == [
+        DAY_BEFORE_YESTERDAY,
+        YESTERDAY,
+    ]
+
+
+def test_daily_mongo_aggregator_incremental_aggregation(mocker):
+    """
+    Test the incremental aggregation of DailyMongoAggregator adds the telemetry
+    after the watermark to the existing aggregation in the database.
+    """
+    date_time_range = next(get_daily_date_range_yesterday())
+    watermark = date_time_range.from_date + timedelta(hours=2)
+    existing_telemetry = TelemetryModel(
+        **DEFAULT_TELEMETRY_MODEL_PARAMS
+        | {
+            "telemetry_type": st.DAILY_AGGR_TELEMETRY_TYPE,
+            "start_date_time": date_time_range.from_date,
+            "watermark": watermark,
+        }
+    )
+    mocker.patch.object(
+        TelemetryMongoStorage, "telemetry_list", return_value=iter([existing_telemetry])
+    )
+
+    def add_new_telemetry(telemetry, **kwargs):
+        telemetry.update_watermark(watermark + timedelta(hours=1))
+        return telemetry
+
+    aggregate_telemetry_mock = mocker.patch.object(
+        TelemetryMongoStorage, "aggregate_telemetry", side_effect=add_new_telemetry
+    )
+    aggregation_count_mock = mocker.patch.object(
+        TelemetryMongoStorage, "aggregation_count", return_value=0
+    )
+    store_mock = mocker.patch.object(
+        TelemetryMongoStorage, "store_aggregated_telemetry"
+    )
+
+    DailyMongoAggregator(TEST_TELEMETRY_SELECTOR).aggregate(
+        YESTERDAY, TODAY, incremental=True
+    )
+
+    count_kwargs = aggregation_count_mock.call_args.kwargs
+    assert count_kwargs["from_date_time"] == date_time_range.from_date
+    assert count_kwargs["to_date_time"] == watermark + WATERMARK_STEP
+    aggregate_kwargs = aggregate_telemetry_mock.call_args.kwargs
+    assert aggregate_kwargs["telemetry"] is existing_telemetry
+    assert aggregate_kwargs["from_date_time"] == watermark + WATERMARK_STEP
+    assert aggregate_kwargs["to_date_time"] == date_time_range.to_date
+    stored_telemetry = store_mock.call_args.args[0]
+    assert stored_telemetry.start_date_time == date_time_range.from_date
+    assert stored_telemetry.watermark == watermark + timedelta(hours=1)
+
+
+class UniqueAggregationCollection:
+    """
+    In memory mongo collection with the unique aggregation index of
+    TelemetryMongoModel, inserting an existing aggregation raises a
+    DuplicateKeyError.
+    """
+
+    documents: Dict[Tuple, dict]
+
+    def __init__(self) -> None:
+        self.documents = {}
+
+    @staticmethod
+    def _index_key(document: dict) -> Tuple:
+        return tuple(document[key] for key in AGGREGATION_INDEX)
+
+    def insert_many(self, documents: List[dict], ordered: bool = True) -> None:
+        for document in documents:
+            if self._index_key(document) in self.documents:
+                raise DuplicateKeyError("E11000 duplicate key error")
+            self.documents[self._index_key(document)] = document
+
+    def replace_one(self, filter: dict, replacement: dict, upsert: bool) -> None:
+        assert upsert
+        assert self._index_key(filter) == self._index_key(replacement)
+        self.documents[self._index_key(replacement)] = replacement
+
+    def bulk_write(self, requests: List[ReplaceOne], ordered: bool = True) -> None:
+        for request in requests:
+            self.replace_one(
+                request._filter, request._doc, upsert=bool(request._upsert)
+            )
+
+
+@pytest.mark.parametrize("single_query", [False, True])
+def test_daily_mongo_aggregation_can_run_twice(mocker, single_query):
+    """
+    Test that running the same DailyMongoAggregator aggregation twice replaces
+    the stored aggregations instead of violating the unique aggregation index.
+    """
+    collection = UniqueAggregationCollection()
+    mocker.patch.object(TelemetryMongoModel, "_get_collection", return_value=collection)
+    mocker.patch.object(
+        TelemetryMongoStorage,
+        "aggregate_telemetry",
+        side_effect=lambda telemetry, **kwargs: telemetry,
+    )
+    mocker.patch.object(
+        TelemetryMongoStorage,
+        "aggregate_telemetry_per_date_time_range",
+        side_effect=lambda telemetry, date_time_ranges, **kwargs: [
+            telemetry.telemetry_copy() for _ in date_time_ranges
+        ],
+    )
+
+    aggregator = DailyMongoAggregator(TEST_TELEMETRY_SELECTOR)
+    for _ in range(2):
+        aggregator.aggregate(DAY_BEFORE_YESTERDAY, TODAY, single_query=single_query)
+
+    stored_dates = sorted(
+        document[st.START_TIME].date() for document in collection.documents.values()
+    )
+    assert stored_dates == [DAY_BEFORE_YESTERDAY, YESTERDAY]
@@ -0,0 +1,171 @@
+"""Module to test the weekly, monthly and quarterly rollup aggregators."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from test_data import DEFAULT_TELEMETRY_MODEL_PARAMS, DEFAULT_TELEMETRY_SELECTOR_PARAMS
+
+from pipeline_telemetry import (
+    DailyAggregator,
+    MonthlyAggregator,
+    MonthlyMongoAggregator,
+    QuarterlyAggregator,
+    TelemetryAggregator,
+    TelemetrySelector,
+    WeeklyAggregator,
+)
+from pipeline_telemetry.data_classes import TelemetryData, TelemetryModel
+from pipeline_telemetry.settings import settings as st
+from pipeline_telemetry.storage import TelemetryMongoStorage
+from pipeline_telemetry.storage.memory import TelemetryInMemoryStorage
+
+# monday
+FIRST_DAY = date(2022, 10, 3)
+
+
+@pytest.fixture
+def storage_with_daily_aggregations():
+    """
+    Returns in memory storage with SINGLE TELEMETRY objects for 10 days and
+    their daily aggregations, and the list of the SINGLE TELEMETRY objects.
+    """
+    storage = TelemetryInMemoryStorage()
+    TelemetryInMemoryStorage._define_db_table(TelemetryInMemoryStorage.db_cursor)
+    telemetry_models = []
+    for day in range(10):
+        for hour in [6, 18]:
+            telemetry_model = TelemetryModel(
+                **DEFAULT_TELEMETRY_MODEL_PARAMS,
+                start_date_time=datetime(*FIRST_DAY.timetuple()[:3])
+                + timedelta(days=day, hours=hour),
+                run_time_in_seconds=day + 1,
+                traffic_light=st.TRAFIC_LIGHT_COLOR_RED
+                if day % 3
+                else st.TRAFIC_LIGHT_COLOR_GREEN,
+            )
+            telemetry_model.telemetry["DATA_STORAGE"] = TelemetryData(
+                base_counter=day, fail_counter=1, errors={"ERR_001": 1}
+            )
+            storage.store_telemetry(telemetry_model)
+            telemetry_models.append(telemetry_model)
+    DailyAggregator(
+        telemetry_selector=TelemetrySelector(**DEFAULT_TELEMETRY_SELECTOR_PARAMS),
+        telemetry_storage=storage,
+    ).aggregate(FIRST_DAY, FIRST_DAY + timedelta(days=10))
+    return storage, telemetry_models
+
+
+def stored_aggregations(storage, telemetry_type):
+    """Returns the aggregations of telemetry_type in the storage."""
+    return list(
+        storage.telemetry_list(
+            **DEFAULT_TELEMETRY_SELECTOR_PARAMS,
+            telemetry_type=telemetry_type,
+            from_date_time=datetime(2022, 1, 1),
+            to_date_time=datetime(2023, 1, 1),
+        )
+    )
+
+
+def test_weekly_aggregator_rolls_up_daily_aggregations(
+    storage_with_daily_aggregations,
+):
+    """
+    Test the weekly aggregation of the daily aggregations equals the
+    aggregation of all SINGLE TELEMETRY objects of the week.
+    """
+    storage, telemetry_models = storage_with_daily_aggregations
+    aggregator = WeeklyAggregator(
+        telemetry_selector=TelemetrySelector(**DEFAULT_TELEMETRY_SELECTOR_PARAMS),
+        telemetry_storage=storage,
+    )
+    aggregator.aggregate(FIRST_DAY, FIRST_DAY + timedelta(days=10))
+
+    first_week, second_week = stored_aggregations(
+        storage, st.WEEKLY_AGGR_TELEMETRY_TYPE
+    )
+    expected = TelemetryAggregator(aggregator.target_telemetry.telemetry_copy())
+    expected_first_week = expected.aggregate(telemetry_models[:14])
+    assert first_week.start_date_time == datetime(2022, 10, 3)
+    assert second_week.start_date_time == datetime(2022, 10, 10)
+    assert first_week.telemetry == expected_first_week.telemetry
+    assert first_week.watermark == telemetry_models[13].start_date_time
+    assert second_week.telemetry[st.AGGREGATION_KEY].base_counter == 6
+
+
+def test_monthly_and_quarterly_aggregators(storage_with_daily_aggregations):
+    """Test monthly and quarterly aggregations roll up all daily aggregations."""
+    storage, telemetry_models = storage_with_daily_aggregations
+    for aggregator_class, telemetry_type in [
+        (MonthlyAggregator, st.MONTHLY_AGGR_TELEMETRY_TYPE),
+        (QuarterlyAggregator, st.QUARTERLY_AGGR_TELEMETRY_TYPE),
+    ]:
+        aggregator = aggregator_class(
+            telemetry_selector=TelemetrySelector(**DEFAULT_TELEMETRY_SELECTOR_PARAMS),
+            telemetry_storage=storage,
+        )
+        aggregator.aggregate(FIRST_DAY, FIRST_DAY + timedelta(days=1))
+        (aggregation,) = stored_aggregations(storage, telemetry_type)
+        expected = TelemetryAggregator(aggregator.target_telemetry.telemetry_copy())
+        assert aggregation.telemetry == expected.aggregate(telemetry_models).telemetry
+    assert aggregation.start_date_time == datetime(2022, 10, 1)
+
+
+def test_incremental_rollup_skips_unchanged_periods(
+    storage_with_daily_aggregations, mocker
+):
+    """
+    Test an incremental roll up only stores the periods for which the daily
+    aggregations changed.
+    """
+    storage, _ = storage_with_daily_aggregations
+    aggregator = WeeklyAggregator(
+        telemetry_selector=TelemetrySelector(**DEFAULT_TELEMETRY_SELECTOR_PARAMS),
+        telemetry_storage=storage,
+    )
+    aggregator.aggregate(FIRST_DAY, FIRST_DAY + timedelta(days=10), incremental=True)
+    assert len(stored_aggregations(storage, st.WEEKLY_AGGR_TELEMETRY_TYPE)) == 2
+
+    store_aggregated_telemetry_spy = mocker.spy(storage, "store_aggregated_telemetry")
+    aggregator.aggregate(FIRST_DAY, FIRST_DAY + timedelta(days=10), incremental=True)
+    assert not store_aggregated_telemetry_spy.called
+
+
+def test_incremental_rollup_updates_periods_with_changed_counters(
+    storage_with_daily_aggregations,
+):
+    """
+    Test an incremental roll up stores a period again when late telemetry
+    changed the counters of a daily aggregation but not its watermark.
+    """
+    storage, _ = storage_with_daily_aggregations
+    aggregator = WeeklyAggregator(
+        telemetry_selector=TelemetrySelector(**DEFAULT_TELEMETRY_SELECTOR_PARAMS),
+        telemetry_storage=storage,
+    )
+    aggregator.aggregate(FIRST_DAY, FIRST_DAY + timedelta(days=10), incremental=True)
+
+    late_telemetry = TelemetryModel(
+        **DEFAULT_TELEMETRY_MODEL_PARAMS,
+        start_date_time=datetime(*FIRST_DAY.timetuple()[:3]) + timedelta(hours=12),
+    )
+    late_telemetry.telemetry["DATA_STORAGE"] = TelemetryData(base_counter=100)
+    storage.store_telemetry(late_telemetry)
+    DailyAggregator(
+        telemetry_selector=TelemetrySelector(**DEFAULT_TELEMETRY_SELECTOR_PARAMS),
+        telemetry_storage=storage,
+    ).aggregate(FIRST_DAY, FIRST_DAY + timedelta(days=1))
+    aggregator.aggregate(FIRST_DAY, FIRST_DAY + timedelta(days=10), incremental=True)
+
+    first_week, _ = stored_aggregations(storage, st.WEEKLY_AGGR_TELEMETRY_TYPE)
+    # the daily aggregations hold 0 to 6 for both telemetry objects of a day
+    assert first_week.telemetry["DATA_STORAGE"].base_counter == 142
+
+
+def test_monthly_mongo_aggregator_returns_monthly_aggregator():
+    """Test MonthlyMongoAggregator returns a MonthlyAggregator for MongoDB."""
+    aggregator = MonthlyMongoAggregator(
+        TelemetrySelector(**DEFAULT_TELEMETRY_SELECTOR_PARAMS)
+    )
+    assert isinstance(aggregator, MonthlyAggregator)
+    assert isinstance(aggregator.storage_class, TelemetryMongoStorage)
@@ -0,0 +1,145 @@
+"""Module to test the AggregationRunner class."""
+
+from datetime import datetime
+
+from test_aggregator_data import (
+    DAY_BEFORE_YESTERDAY,
+    TEST_TELEMETRY_SELECTOR,
+    TODAY,
+    DatedTelemetryTestList,
+)
+
+from pipeline_telemetry import AggregationResult, AggregationRunner, DailyAggregator
+from pipeline_telemetry.aggregator.runner import run_aggregation
+from pipeline_telemetry.settings import settings as st
+
+OTHER_TELEMETRY_SELECTOR = TEST_TELEMETRY_SELECTOR._replace(source_name="other")
+
+
+class FailingTelemetryTestList(DatedTelemetryTestList):
+    """Test storage that fails to retrieve telemetry."""
+
+    def telemetry_list(self, **kwargs):
+        raise ValueError("query failed")
+
+
+def test_run_aggregation_returns_aggregation_result():
+    """Test run_aggregation runs the aggregator and returns its run time."""
+    result = run_aggregation(
+        DailyAggregator,
+        DatedTelemetryTestList,
+        TEST_TELEMETRY_SELECTOR,
+        DAY_BEFORE_YESTERDAY,
+        TODAY,
+        False,
+    )
+    assert isinstance(result, AggregationResult)
+    assert result.telemetry_selector == TEST_TELEMETRY_SELECTOR
+    assert result.run_time_in_seconds >= 0
+    assert result.error is None
+
+
+def test_run_aggregation_without_storage_class(mocker):
+    """
+    Test run_aggregation only passes the selector when no storage class is
+    provided, as for the storage specific aggregators.
+    """
+    aggregator_class = mocker.Mock()
+    run_aggregation(
+        aggregator_class,
+        None,
+        TEST_TELEMETRY_SELECTOR,
+        DAY_BEFORE_YESTERDAY,
+        TODAY,
+        True,
+    )
+    aggregator_class.assert_called_once_with(telemetry_selector=TEST_TELEMETRY_SELECTOR)
+    aggregator_class.return_value.aggregate.assert_called_once_with(
+        start_date=DAY_BEFORE_YESTERDAY,
+        end_date=TODAY,
+        single_query=True,
+        incremental=False,
+    )
+
+
+def test_run_aggregation_reports_error():
+    """Test an exception in the aggregation is returned as error text."""
+    result = run_aggregation(
+        DailyAggregator,
+        FailingTelemetryTestList,
+        TEST_TELEMETRY_SELECTOR,
+        DAY_BEFORE_YESTERDAY,
+        TODAY,
+        False,
+    )
+    assert result.error == "ValueError: query failed"
+
+
+def test_runner_returns_result_per_selector_in_order():
+    """Test the runner returns a result per selector in the order of selectors."""
+    runner = AggregationRunner(
+        DailyAggregator, storage_class=DatedTelemetryTestList, max_workers=2
+    )
+    telemetry_selectors = [TEST_TELEMETRY_SELECTOR, OTHER_TELEMETRY_SELECTOR]
+    results = runner.aggregate(telemetry_selectors, DAY_BEFORE_YESTERDAY, TODAY)
+    assert [result.telemetry_selector for result in results] == telemetry_selectors
+    assert all(result.error is None for result in results)
+
+
+def test_runner_continues_after_failing_selector(mocker):
+    """Test a failing aggregation does not stop the other aggregations."""
+    aggregator_class = mocker.Mock()
+    aggregator_class.return_value.aggregate.side_effect = [ValueError("failed"), None]
+    runner = AggregationRunner(aggregator_class, max_workers=1)
+    results = runner.aggregate(
+        [TEST_TELEMETRY_SELECTOR, OTHER_TELEMETRY_SELECTOR], DAY_BEFORE_YESTERDAY, TODAY
+    )
+    assert [result.error for result in results] == ["ValueError: failed", None]
+
+
+def test_runner_passes_incremental_to_aggregator(mocker):
+    """Test the runner runs the incremental aggregation when requested."""
+    aggregator_class = mocker.Mock()
+    runner = AggregationRunner(aggregator_class, max_workers=1)
+    runner.aggregate(
+        [TEST_TELEMETRY_SELECTOR], DAY_BEFORE_YESTERDAY, TODAY, incremental=True
+    )
+    aggregator_class.return_value.aggregate.assert_called_once_with(
+        start_date=DAY_BEFORE_YESTERDAY,
+        end_date=TODAY,
+        single_query=False,
+        incremental=True,
+    )
+
+
+def test_runner_with_process_pool():
+    """Test the runner can run the aggregations on a process pool."""
+    runner = AggregationRunner(
+        DailyAggregator,
+        storage_class=DatedTelemetryTestList,
+        max_workers=2,
+        use_processes=True,
+    )
+    results = runner.aggregate([TEST_TELEMETRY_SELECTOR], DAY_BEFORE_YESTERDAY, TODAY)
+    assert results[0].error is None
+
+
+def test_runner_aggregate_all_uses_distinct_selectors(mocker):
+    """
+    Test aggregate_all runs the aggregation for the selectors returned by the
+    distinct_selectors method of the storage.
+    """
+    telemetry_storage = mocker.Mock()
+    telemetry_storage.distinct_selectors.return_value = [OTHER_TELEMETRY_SELECTOR]
+    runner = AggregationRunner(DailyAggregator, storage_class=DatedTelemetryTestList)
+    results = runner.aggregate_all(
+        telemetry_storage, st.SINGLE_TELEMETRY_TYPE, DAY_BEFORE_YESTERDAY, TODAY
+    )
+    assert [result.telemetry_selector for result in results] == [
+        OTHER_TELEMETRY_SELECTOR
+    ]
+    telemetry_storage.distinct_selectors.assert_called_once_with(
+        telemetry_type=st.SINGLE_TELEMETRY_TYPE,
+        from_date_time=datetime(*DAY_BEFORE_YESTERDAY.timetuple()[:3]),
+        to_date_time=datetime(*TODAY.timetuple()[:3]),
+    )
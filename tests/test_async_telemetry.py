@@ -0,0 +1,166 @@
+"""Module to test the async telemetry decorators."""
+
+import asyncio
+from typing import List
+
+import pytest
+from test_data import DEFAULT_TELEMETRY_PARAMS
+
+from pipeline_telemetry import Telemetry
+from pipeline_telemetry.data_classes import TelemetryModel
+from pipeline_telemetry.decorator import (
+    add_async_single_usage_telemetry,
+    add_async_telemetry,
+    add_single_usage_telemetry,
+    add_telemetry,
+)
+from pipeline_telemetry.settings import exceptions
+from pipeline_telemetry.storage.asynchronous import AbstractAsyncTelemetryStorage
+
+
+class AsyncListStorage(AbstractAsyncTelemetryStorage):
+    """Async storage class that stores telemetry in a class level list."""
+
+    stored_telemetry: List[TelemetryModel] = []
+
+    async def store_telemetry(self, telemetry: TelemetryModel) -> None:
+        await asyncio.sleep(0)
+        self.stored_telemetry.append(telemetry)
+
+
+@pytest.fixture(autouse=True)
+def clear_async_list_storage():
+    AsyncListStorage.stored_telemetry.clear()
+    yield
+    AsyncListStorage.stored_telemetry.clear()
+
+
+ASYNC_TELEMETRY_PARAMS = DEFAULT_TELEMETRY_PARAMS | {"storage_class": AsyncListStorage}
+
+
+def test_async_decorator_closes_telemetry_after_coroutine():
+    """
+    Test that the telemetry object is stored after the decorated coroutine
+    has finished and not when the coroutine is created.
+    """
+
+    class DecoratorTest:
+        @add_async_telemetry(ASYNC_TELEMETRY_PARAMS)
+        async def decorated_method(self):
+            await asyncio.sleep(0)
+            assert not AsyncListStorage.stored_telemetry
+            self._telemetry.increase_sub_process_base_count(
+                sub_process="RETRIEVE_RAW_DATA"
+            )
+            return "method result"
+
+    class_instance = DecoratorTest()
+    assert asyncio.run(class_instance.decorated_method()) == "method result"
+    assert class_instance._telemetry is None
+    assert len(AsyncListStorage.stored_telemetry) == 1
+    telemetry = AsyncListStorage.stored_telemetry[0]
+    assert telemetry.telemetry["RETRIEVE_RAW_DATA"].base_counter == 1
+    assert telemetry.run_time_in_seconds is not None
+
+
+def test_async_decorator_within_async_decorated_method():
+    """
+    Test that the active telemetry object is used by a decorated coroutine
+    that is awaited from another decorated coroutine.
+    """
+
+    class DecoratorTest:
+        @add_async_telemetry(ASYNC_TELEMETRY_PARAMS)
+        async def decorated_method(self):
+            telemetry = self._telemetry
+            await self.sub_method()
+            assert self._telemetry is telemetry
+
+        @add_async_telemetry(ASYNC_TELEMETRY_PARAMS | {"category": "OTHER"})
+        async def sub_method(self):
+            self._telemetry.increase_sub_process_base_count(
+                sub_process="RETRIEVE_RAW_DATA"
+            )
+
+    asyncio.run(DecoratorTest().decorated_method())
+    assert len(AsyncListStorage.stored_telemetry) == 1
+    assert AsyncListStorage.stored_telemetry[0].category == "WEATHER"
+
+
+def test_async_decorator_with_sync_storage_class():
+    """Test that a synchronous storage class can be used by async decorators."""
+
+    class DecoratorTest:
+        @add_async_telemetry(DEFAULT_TELEMETRY_PARAMS)
+        async def decorated_method(self):
+            return self._telemetry
+
+    telemetry = asyncio.run(DecoratorTest().decorated_method())
+    assert telemetry.run_time
+
+
+def test_async_single_usage_decorator():
+    """
+    Test that the single usage decorator creates and stores a telemetry
+    object for each call and presets the sub process counter.
+    """
+
+    class DecoratorTest:
+        TELEMETRY_PARAMS = DEFAULT_TELEMETRY_PARAMS
+
+        @add_async_single_usage_telemetry(
+            sub_process="RETRIEVE_RAW_DATA", storage_class=AsyncListStorage
+        )
+        async def decorated_method(self):
+            await asyncio.sleep(0)
+            return self._telemetry.storage_class
+
+    async def run_twice():
+        class_instance = DecoratorTest()
+        return [
+            await class_instance.decorated_method(),
+            await class_instance.decorated_method(),
+        ]
+
+    assert asyncio.run(run_twice()) == [AsyncListStorage, AsyncListStorage]
+    assert len(AsyncListStorage.stored_telemetry) == 2
+    for telemetry in AsyncListStorage.stored_telemetry:
+        assert telemetry.telemetry["RETRIEVE_RAW_DATA"].base_counter == 1
+
+
+def test_async_single_usage_decorator_raises_params_not_def_exc():
+    class DecoratorTest:
+        @add_async_single_usage_telemetry()
+        async def decorated_method(self):
+            pass
+
+    with pytest.raises(exceptions.ClassTelemetryParamsNotDefined):
+        asyncio.run(DecoratorTest().decorated_method())
+
+
+@pytest.mark.parametrize(
+    "decorator",
+    [add_telemetry(DEFAULT_TELEMETRY_PARAMS), add_single_usage_telemetry()],
+)
+def test_sync_decorator_raises_exception_for_coroutine_method(decorator):
+    with pytest.raises(exceptions.CoroutineMethodNotSupported):
+
+        class DecoratorTest:
+            @decorator
+            async def decorated_method(self):
+                pass
+
+
+def test_save_and_close_with_async_storage_class_raises_exception():
+    telemetry = Telemetry(**ASYNC_TELEMETRY_PARAMS)
+    with pytest.raises(exceptions.AsyncStorageClassRequiresAwait):
+        telemetry.save_and_close()
+    assert not telemetry.run_time
+
+
+def test_async_save_and_close_of_closed_telemetry_raises_exception():
+    telemetry = Telemetry(**ASYNC_TELEMETRY_PARAMS)
+    asyncio.run(telemetry.async_save_and_close())
+    with pytest.raises(exceptions.TelemetryObjectAlreadyClosed):
+        asyncio.run(telemetry.async_save_and_close())
+    assert len(AsyncListStorage.stored_telemetry) == 1
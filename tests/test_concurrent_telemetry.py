@@ -0,0 +1,87 @@
+"""Module to define tests for the concurrent mode of the Telemetry class"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from errors.error import ListErrors
+from test_data import DEFAULT_TELEMETRY_PARAMS, TEST_TELEMETRY_RULES
+
+from pipeline_telemetry import Telemetry
+
+# pylint: disable=protected-access
+
+NR_OF_THREADS = 8
+NR_OF_INCREMENTS = 2_000
+
+
+def add_counters(telemetry):
+    """Increases all kinds of counters of the telemetry object."""
+    for _ in range(NR_OF_INCREMENTS):
+        telemetry.increase_sub_process_base_count("RETRIEVE_RAW_DATA")
+        telemetry.increase_sub_process_fail_count("RETRIEVE_RAW_DATA")
+        telemetry.increase_sub_process_custom_count(
+            custom_counter="pages", sub_process="RETRIEVE_RAW_DATA"
+        )
+        telemetry.add("RETRIEVE_RAW_DATA", {}, [ListErrors.KEY_NOT_FOUND])
+        telemetry.increase_io_time(0.5)
+
+
+def test_concurrent_telemetry_merges_thread_shards():
+    """Test the counters of all threads are merged at save_and_close."""
+    telemetry = Telemetry(
+        telemetry_rules=TEST_TELEMETRY_RULES,
+        concurrent=True,
+        **DEFAULT_TELEMETRY_PARAMS,
+    )
+    with ThreadPoolExecutor(max_workers=NR_OF_THREADS) as executor:
+        for future in [
+            executor.submit(add_counters, telemetry) for _ in range(NR_OF_THREADS)
+        ]:
+            future.result()
+
+    expected_count = NR_OF_THREADS * NR_OF_INCREMENTS
+    assert 1 < len(telemetry._thread_shards) <= NR_OF_THREADS
+    assert telemetry.get("RETRIEVE_RAW_DATA").base_counter == expected_count
+    assert telemetry.io_time_in_seconds == expected_count * 0.5
+    # the counters of the thread shards are materialised before the shards are
+    # merged at save_and_close
+    assert telemetry.telemetry_data["RETRIEVE_RAW_DATA"].base_counter == expected_count
+    assert telemetry.telemetry.io_time_in_seconds == expected_count * 0.5
+
+    telemetry_model = telemetry.save_and_close()
+    sub_process_data = telemetry_model.telemetry["RETRIEVE_RAW_DATA"]
+    assert sub_process_data.base_counter == expected_count
+    assert sub_process_data.fail_counter == expected_count
+    assert sub_process_data.counters == {"pages": expected_count}
+    assert sub_process_data.errors == {
+        ListErrors.KEY_NOT_FOUND.code: expected_count,
+        ListErrors.KEY_NOT_FOUND.code + "@KEY_<items>": expected_count,
+    }
+    assert telemetry_model.io_time_in_seconds == expected_count * 0.5
+    assert telemetry._thread_shards == []
+
+
+def test_get_returns_copy_in_concurrent_mode():
+    """Test get returns a merged copy that is not changed by new counts."""
+    telemetry = Telemetry(concurrent=True, **DEFAULT_TELEMETRY_PARAMS)
+    telemetry.increase_sub_process_base_count("RETRIEVE_RAW_DATA")
+    sub_process_data = telemetry.get("RETRIEVE_RAW_DATA")
+    telemetry.increase_sub_process_base_count("RETRIEVE_RAW_DATA")
+
+    assert sub_process_data.base_counter == 1
+    assert telemetry.get("RETRIEVE_RAW_DATA").base_counter == 2
+
+
+def test_changes_to_materialised_counters_are_kept_in_concurrent_mode():
+    """
+    Test changes made to the telemetry data returned by get are written back
+    and added to the counters of the thread shards.
+    """
+    telemetry = Telemetry(concurrent=True, **DEFAULT_TELEMETRY_PARAMS)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        executor.submit(add_counters, telemetry).result()
+    telemetry.get("RETRIEVE_RAW_DATA").increase_base_count(3)
+
+    telemetry_model = telemetry.save_and_close()
+    assert telemetry_model.telemetry["RETRIEVE_RAW_DATA"].base_counter == (
+        NR_OF_INCREMENTS + 3
+    )
@@ -0,0 +1,193 @@
+"""Module to test switching telemetry off."""
+
+import asyncio
+from typing import Iterator, List
+
+import pytest
+from test_data import DEFAULT_TELEMETRY_PARAMS
+
+from pipeline_telemetry import (
+    NULL_TELEMETRY,
+    ProcessTypes,
+    Telemetry,
+    TelemetryCounter,
+    TelemetryMixin,
+    add_async_telemetry,
+    add_single_usage_telemetry,
+    add_telemetry,
+    disable_telemetry,
+    enable_telemetry,
+    get_active_telemetry,
+    increase_base_count,
+    increase_fail_count,
+    is_telemetry_enabled,
+    telemetry_disabled,
+)
+from pipeline_telemetry.data_classes import TelemetryModel
+from pipeline_telemetry.settings.exceptions import NoActiveTelemetry
+from pipeline_telemetry.storage.generic import AbstractTelemetryStorage
+
+SUB_PROCESS = "RETRIEVE_RAW_DATA"
+
+
+class ListStorage(AbstractTelemetryStorage):
+    """Storage class that stores telemetry in a class level list."""
+
+    stored_telemetry: List[TelemetryModel] = []
+
+    def store_telemetry(self, telemetry: TelemetryModel) -> None:
+        self.stored_telemetry.append(telemetry)
+
+    def select_records(self, **kwargs) -> Iterator:
+        return iter(telemetry.model_dump() for telemetry in self.stored_telemetry)
+
+    def _remove_existing_aggregation_telemetry(self, telemetry: TelemetryModel) -> None:
+        pass
+
+
+TELEMETRY_PARAMS = DEFAULT_TELEMETRY_PARAMS | {"storage_class": ListStorage}
+UPLOAD_TELEMETRY_PARAMS = TELEMETRY_PARAMS | {"process_type": ProcessTypes.UPLOAD_DATA}
+
+COUNTER = TelemetryCounter(
+    process_type=ProcessTypes.CREATE_DATA_FROM_URL,
+    sub_process=SUB_PROCESS,
+    counter_name="test_counter",
+)
+
+
+@pytest.fixture(autouse=True)
+def enable_all_telemetry():
+    ListStorage.stored_telemetry.clear()
+    yield
+    enable_telemetry()
+    ListStorage.stored_telemetry.clear()
+
+
+class Pipeline(TelemetryMixin):
+    """Pipeline that uses the helper functions and mixin methods."""
+
+    TELEMETRY_PARAMS = TELEMETRY_PARAMS
+
+    @add_telemetry(TELEMETRY_PARAMS)
+    def run(self) -> str:
+        increase_base_count(self, SUB_PROCESS)
+        increase_fail_count(self, SUB_PROCESS)
+        self.process_telemetry_counters_from_list([COUNTER])
+        self.set_telemetry_source_name("other_source")
+        self._telemetry.add(SUB_PROCESS, {}, errors=[])
+        return "result"
+
+    @add_telemetry(UPLOAD_TELEMETRY_PARAMS)
+    def upload(self) -> str:
+        increase_base_count(self, "DATA_UPLOAD")
+        return "uploaded"
+
+    @add_single_usage_telemetry(sub_process=SUB_PROCESS)
+    def call_api(self) -> str:
+        increase_fail_count(self, SUB_PROCESS)
+        return "response"
+
+    @add_async_telemetry(TELEMETRY_PARAMS)
+    async def run_async(self) -> str:
+        increase_base_count(self, SUB_PROCESS)
+        return "result"
+
+    @add_telemetry(TELEMETRY_PARAMS)
+    def active_telemetry(self):
+        return get_active_telemetry(self)
+
+
+def test_telemetry_is_enabled_by_default():
+    assert is_telemetry_enabled()
+    assert is_telemetry_enabled(ProcessTypes.CREATE_DATA_FROM_URL)
+
+
+def test_disable_telemetry_for_all_process_types():
+    disable_telemetry()
+    assert not is_telemetry_enabled()
+    assert not is_telemetry_enabled(ProcessTypes.UPLOAD_DATA)
+    enable_telemetry()
+    assert is_telemetry_enabled(ProcessTypes.UPLOAD_DATA)
+
+
+def test_disable_telemetry_for_a_process_type():
+    disable_telemetry(ProcessTypes.CREATE_DATA_FROM_URL)
+    assert not is_telemetry_enabled(ProcessTypes.CREATE_DATA_FROM_URL)
+    assert is_telemetry_enabled(ProcessTypes.UPLOAD_DATA)
+    enable_telemetry(ProcessTypes.CREATE_DATA_FROM_URL)
+    assert is_telemetry_enabled(ProcessTypes.CREATE_DATA_FROM_URL)
+
+
+def test_telemetry_disabled_restores_the_switch():
+    disable_telemetry(ProcessTypes.UPLOAD_DATA)
+    with telemetry_disabled():
+        assert not is_telemetry_enabled(ProcessTypes.CREATE_DATA_FROM_URL)
+    assert is_telemetry_enabled(ProcessTypes.CREATE_DATA_FROM_URL)
+    assert not is_telemetry_enabled(ProcessTypes.UPLOAD_DATA)
+
+
+def test_disabled_decorator_uses_null_telemetry():
+    pipeline = Pipeline()
+    with telemetry_disabled():
+        assert pipeline.run() == "result"
+        assert pipeline.active_telemetry() is NULL_TELEMETRY
+    assert pipeline._telemetry is None
+    assert not ListStorage.stored_telemetry
+
+
+def test_disabled_decorator_keeps_the_preassigned_telemetry():
+    pipeline = Pipeline()
+    pipeline._telemetry = preassigned = Telemetry(**TELEMETRY_PARAMS)
+    with telemetry_disabled():
+        assert pipeline.run() == "result"
+        assert asyncio.run(pipeline.run_async()) == "result"
+    assert pipeline._telemetry is preassigned
+    assert not preassigned.closed
+    assert not ListStorage.stored_telemetry
+
+
+def test_disabled_process_type_does_not_disable_other_process_types():
+    pipeline = Pipeline()
+    with telemetry_disabled(ProcessTypes.CREATE_DATA_FROM_URL):
+        assert pipeline.run() == "result"
+        assert pipeline.upload() == "uploaded"
+    assert len(ListStorage.stored_telemetry) == 1
+    assert ListStorage.stored_telemetry[0].process_type == "upload_data"
+
+
+def test_disabled_single_usage_decorator():
+    pipeline = Pipeline()
+    with telemetry_disabled(ProcessTypes.CREATE_DATA_FROM_URL):
+        assert pipeline.call_api() == "response"
+    assert not ListStorage.stored_telemetry
+
+
+def test_disabled_async_decorator():
+    pipeline = Pipeline()
+    with telemetry_disabled():
+        assert asyncio.run(pipeline.run_async()) == "result"
+    assert not ListStorage.stored_telemetry
+
+
+def test_enabled_telemetry_is_stored_after_disabled_call():
+    pipeline = Pipeline()
+    with telemetry_disabled():
+        pipeline.run()
+    pipeline.run()
+    assert len(ListStorage.stored_telemetry) == 1
+    assert ListStorage.stored_telemetry[0].telemetry[SUB_PROCESS].base_counter == 1
+
+
+def test_disabled_decorator_does_not_set_the_telemetry_attribute():
+    pipeline = Pipeline()
+    with telemetry_disabled():
+        assert pipeline.active_telemetry() is NULL_TELEMETRY
+        assert "_telemetry" not in pipeline.__dict__
+
+
+def test_helpers_raise_exception_without_telemetry_when_enabled():
+    with telemetry_disabled():
+        assert get_active_telemetry(Pipeline()) is NULL_TELEMETRY
+    with pytest.raises(NoActiveTelemetry):
+        get_active_telemetry(Pipeline())
+    assert Pipeline()._telemetry is None
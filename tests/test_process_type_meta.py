@@ -51,3 +51,13 @@ def test_class_from_metaclass_issubclass_process_types_class():
     class NewClass(TestTypesOne, TestTypesTwo, metaclass=ProcessTypesMeta): ...  # noqa: E701
 
     assert issubclass(NewClass, ProcessTypes)
+
+
+def test_meta_class_methods_delegate_to_process_types():
+    class NewClass(TestTypesOne, TestTypesTwo, metaclass=ProcessTypesMeta): ...  # noqa: E701
+
+    assert NewClass.get_by_key("FLOW_ONE") is TestTypesOne.FLOW_ONE
+    assert ProcessTypesMeta.get_by_key("FLOW_ONE") is TestTypesOne.FLOW_ONE
+    assert ProcessTypesMeta.get_by_name("F2") is TestTypesTwo.FLOW_TWO
+    assert ProcessTypesMeta.is_registered(TestTypesTwo.FLOW_TWO)
+    assert ProcessTypesMeta.get_by_key("UNKNOWN") is None
@@ -1,9 +1,12 @@
 """Module to test processtype logic."""
 
+import pickle
+
 import pytest
 from test_data import TEST_PROCESS_TYPE
 
 from pipeline_telemetry.settings import exceptions
+from pipeline_telemetry.settings.data_class import ProcessType
 from pipeline_telemetry.settings.process_type import ProcessTypes
 from pipeline_telemetry.settings.settings import DEFAULT_CREATE_DATA_SUB_PROCESS_TYPES
 
@@ -75,3 +78,38 @@ def test_registering_process_types_with_wrong_class_raises_exception():
     """
     with pytest.raises(exceptions.ProcessTypesMustBeOfClassBaseEnumertor):
         ProcessTypes.register_process_types(str)
+
+
+def test_process_type_has_sub_process():
+    """Test that has_sub_process checks the subtypes of a process type."""
+    assert ProcessTypes.CREATE_DATA_FROM_URL.has_sub_process(
+        DEFAULT_CREATE_DATA_SUB_PROCESS_TYPES[0]
+    )
+    assert not ProcessTypes.CREATE_DATA_FROM_URL.has_sub_process("invalid")
+
+
+def test_equal_process_types_are_registered():
+    """Test that an equal copy of a registered process type is registered."""
+    process_type = ProcessType(
+        process_type=ProcessTypes.CREATE_DATA_FROM_URL.name,
+        subtypes=list(DEFAULT_CREATE_DATA_SUB_PROCESS_TYPES),
+    )
+    assert ProcessTypes.is_registered(process_type)
+    assert hash(process_type) == hash(ProcessTypes.CREATE_DATA_FROM_URL)
+
+
+def test_get_process_type_by_key_and_name():
+    """Test that registered process types can be looked up by key and name."""
+    process_type = ProcessTypes.CREATE_DATA_FROM_URL
+    assert ProcessTypes.get_by_key("CREATE_DATA_FROM_URL") is process_type
+    assert ProcessTypes.get_by_name(process_type.name) is process_type
+    assert ProcessTypes.get_by_key("NOT_REGISTERED") is None
+    assert ProcessTypes.get_by_name("not_registered") is None
+
+
+def test_unpickled_process_type_is_registered():
+    """Test that a pickled process type is resolved again when unpickled."""
+    process_type = pickle.loads(pickle.dumps(ProcessTypes.CREATE_DATA_FROM_URL))
+    assert process_type == ProcessTypes.CREATE_DATA_FROM_URL
+    assert process_type.subtype_set == ProcessTypes.CREATE_DATA_FROM_URL.subtype_set
+    assert ProcessTypes.is_registered(process_type)
@@ -10,7 +10,11 @@ from pipeline_telemetry.settings.date_ranges import (
     get_daily_date_range_yesterday,
     get_daily_date_ranges,
     get_monthly_date_range_for_single_date,
+    get_monthly_date_ranges,
+    get_quarterly_date_range_for_single_date,
+    get_quarterly_date_ranges,
     get_weekly_date_range_for_single_date,
+    get_weekly_date_ranges,
 )
 
 
@@ -141,3 +145,52 @@ def test_get_weekly_date_range_for_single_date():
     assert isinstance(single_weekly_date_range, DateTimeRange)
     assert single_weekly_date_range.from_date == first_day_of_week
     assert single_weekly_date_range.to_date == first_day_of_next_week
+
+
+def test_get_quarterly_date_range_for_single_date():
+    """
+    Test get_quarterly_date_range_for_single_date returns a single
+    DateTimeRange for the quarter of the date.
+    """
+    for input_date, first_day, first_day_next_quarter in [
+        ("2022-02-11", "2022-01-01", "2022-04-01"),
+        ("2022-06-30", "2022-04-01", "2022-07-01"),
+        ("2022-12-31", "2022-10-01", "2023-01-01"),
+    ]:
+        quarterly_date_range = get_quarterly_date_range_for_single_date(
+            date=str_to_date(input_date)
+        )
+        assert quarterly_date_range == DateTimeRange(
+            str_to_date_time(first_day), str_to_date_time(first_day_next_quarter)
+        )
+
+
+def test_period_date_range_generators():
+    """
+    Test the weekly, monthly and quarterly generators return the consecutive
+    periods from the period of start_date up to the period of the day before
+    end_date.
+    """
+    start_date, end_date = str_to_date("2022-10-05"), str_to_date("2022-11-01")
+    weekly_from_dates = [
+        date_range.from_date
+        for date_range in get_weekly_date_ranges(start_date, end_date)
+    ]
+    assert weekly_from_dates == [
+        str_to_date_time(day)
+        for day in [
+            "2022-10-03",
+            "2022-10-10",
+            "2022-10-17",
+            "2022-10-24",
+            "2022-10-31",
+        ]
+    ]
+    assert list(get_monthly_date_ranges(start_date, end_date)) == [
+        get_monthly_date_range_for_single_date(start_date)
+    ]
+    assert list(get_quarterly_date_ranges(start_date, str_to_date("2023-01-02"))) == [
+        get_quarterly_date_range_for_single_date(start_date),
+        get_quarterly_date_range_for_single_date(str_to_date("2023-01-01")),
+    ]
+    assert list(get_weekly_date_ranges(start_date, start_date)) == []
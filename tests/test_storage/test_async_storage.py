@@ -0,0 +1,86 @@
+"""Module to test the async storage module."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
+
+from test_storage_data import DEFAULT_TELEMETRY_PARAMS
+
+from pipeline_telemetry import Telemetry
+from pipeline_telemetry.data_classes import TelemetryModel
+from pipeline_telemetry.storage.asynchronous import (
+    AbstractAsyncExecutorStorage,
+    TelemetryMongoAsyncStorage,
+)
+from pipeline_telemetry.storage.generic import AbstractTelemetryStorage
+from pipeline_telemetry.storage.mongo import TelemetryMongoStorage
+
+
+class ThreadListStorage(AbstractTelemetryStorage):
+    """
+    Storage class that stores telemetry and the name of the storing thread in
+    class level lists.
+    """
+
+    stored_telemetry: List[TelemetryModel] = []
+    thread_names: List[str] = []
+
+    def store_telemetry(self, telemetry: TelemetryModel) -> None:
+        self.stored_telemetry.append(telemetry)
+        self.thread_names.append(threading.current_thread().name)
+
+    def select_records(self, **kwargs) -> Iterator:
+        return iter(telemetry.model_dump() for telemetry in self.stored_telemetry)
+
+    def _remove_existing_aggregation_telemetry(self, telemetry: TelemetryModel) -> None:
+        pass
+
+
+class ThreadListAsyncStorage(AbstractAsyncExecutorStorage):
+    STORAGE_CLASS = ThreadListStorage
+    EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="async_storage")
+
+
+def setup_function():
+    ThreadListStorage.stored_telemetry.clear()
+    ThreadListStorage.thread_names.clear()
+
+
+def test_async_save_and_close_stores_telemetry_in_executor():
+    telemetry = Telemetry(
+        **DEFAULT_TELEMETRY_PARAMS | {"storage_class": ThreadListAsyncStorage}
+    )
+    assert telemetry.has_async_storage_class
+    result = asyncio.run(telemetry.async_save_and_close())
+
+    assert ThreadListStorage.stored_telemetry == [result]
+    assert ThreadListStorage.thread_names[0].startswith("async_storage")
+
+
+def test_store_telemetry_batch_in_executor():
+    telemetry_list = []
+    for _ in range(3):
+        telemetry = Telemetry(**DEFAULT_TELEMETRY_PARAMS)
+        telemetry.save_and_close()
+        telemetry_list.append(telemetry.telemetry)
+
+    asyncio.run(ThreadListAsyncStorage().store_telemetry_batch(iter(telemetry_list), 2))
+    assert ThreadListStorage.stored_telemetry == telemetry_list
+    assert all(
+        name.startswith("async_storage") for name in ThreadListStorage.thread_names
+    )
+
+
+def test_mongo_async_storage_class(mocker):
+    mongo_module_path = "pipeline_telemetry.storage.mongo."
+    save = mocker.patch(
+        mongo_module_path + "TelemetryMongoModel.save", return_value=None
+    )
+    assert TelemetryMongoAsyncStorage.STORAGE_CLASS is TelemetryMongoStorage
+
+    telemetry = Telemetry(
+        **DEFAULT_TELEMETRY_PARAMS | {"storage_class": TelemetryMongoAsyncStorage}
+    )
+    asyncio.run(telemetry.async_save_and_close())
+    save.assert_called_once()
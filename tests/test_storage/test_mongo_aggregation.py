@@ -0,0 +1,293 @@
+"""Module to test the MongoDB telemetry aggregation pipeline module."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from test_storage_data import DEFAULT_TELEMETRY_MODEL_PARAMS
+
+from pipeline_telemetry.aggregator.helper import TelemetryAggregator
+from pipeline_telemetry.data_classes import TelemetryData, TelemetryModel
+from pipeline_telemetry.settings import settings as st
+from pipeline_telemetry.storage.mongo_aggregation import (
+    AGGREGATION_INDEX,
+    SELECTOR_INDEX,
+    SELECTOR_KEYS,
+    add_pipeline_result_to_telemetry,
+    aggregated_telemetry_document,
+    aggregated_telemetry_filter,
+    aggregation_count_pipeline,
+    distinct_selectors_pipeline,
+    telemetry_aggregation_pipeline,
+)
+
+FROM_DATE_TIME = datetime(2022, 10, 10)
+TO_DATE_TIME = FROM_DATE_TIME + timedelta(days=1)
+
+
+def telemetry_models():
+    """Returns list of telemetry models matching the PIPELINE_RESULT."""
+    models = []
+    for index in range(4):
+        model = TelemetryModel(
+            **DEFAULT_TELEMETRY_MODEL_PARAMS,
+            start_date_time=FROM_DATE_TIME + timedelta(hours=index),
+            run_time_in_seconds=1.5 + index,
+            io_time_in_seconds=0.5 * index,
+            traffic_light=st.TRAFIC_LIGHT_COLOR_GREEN
+            if index % 2
+            else st.TRAFIC_LIGHT_COLOR_RED,
+        )
+        model.telemetry["DATA_STORAGE"] = TelemetryData(
+            base_counter=index,
+            fail_counter=1,
+            errors={"ERR_001": index},
+            counters={"custom": 2},
+        )
+        if index == 2:
+            model.telemetry["DATA_CONVERSION"] = TelemetryData()
+        models.append(model)
+    return models
+
+
+# result of running the aggregation pipeline on the telemetry_models
+PIPELINE_RESULT = {
+    "stats": [
+        {
+            "_id": 0,
+            "record_count": 4,
+            "io_time_in_seconds": 3.0,
+            "run_time_in_seconds": 12.0,
+            "watermark": FROM_DATE_TIME + timedelta(hours=3),
+        }
+    ],
+    "traffic_lights": [
+        {"_id": {"bucket": 0, "traffic_light": "GREEN"}, "record_count": 2},
+        {"_id": {"bucket": 0, "traffic_light": "RED"}, "record_count": 2},
+    ],
+    "sub_processes": [
+        {
+            "_id": {"bucket": 0, "sub_process": "DATA_STORAGE"},
+            "base_counter": 6,
+            "fail_counter": 4,
+        },
+        {
+            "_id": {"bucket": 0, "sub_process": "DATA_CONVERSION"},
+            "base_counter": 0,
+            "fail_counter": 0,
+        },
+    ],
+    "counters": [
+        {
+            "_id": {
+                "bucket": 0,
+                "sub_process": "DATA_STORAGE",
+                "counter_type": "errors",
+                "counter_key": "ERR_001",
+            },
+            "value": 6,
+        },
+        {
+            "_id": {
+                "bucket": 0,
+                "sub_process": "DATA_STORAGE",
+                "counter_type": "counters",
+                "counter_key": "custom",
+            },
+            "value": 8,
+        },
+    ],
+}
+
+
+def test_pipeline_matches_selected_records():
+    """Test the pipeline $match stage selects on all TelemetryListArgs."""
+    pipeline = telemetry_aggregation_pipeline(
+        **DEFAULT_TELEMETRY_MODEL_PARAMS,
+        from_date_time=FROM_DATE_TIME,
+        to_date_time=TO_DATE_TIME,
+    )
+    assert pipeline[0]["$match"] == DEFAULT_TELEMETRY_MODEL_PARAMS | {
+        "start_date_time": {"$gte": FROM_DATE_TIME, "$lt": TO_DATE_TIME}
+    }
+    assert pipeline[1]["$addFields"] == {"bucket": {"$literal": 0}}
+    assert set(pipeline[2]["$facet"]) == {
+        "stats",
+        "traffic_lights",
+        "sub_processes",
+        "counters",
+    }
+
+
+def test_pipeline_result_equals_python_aggregation():
+    """
+    Test adding the pipeline result gives the same telemetry as adding the
+    telemetry models one by one.
+    """
+    target_telemetry = TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS)
+    expected_telemetry = TelemetryAggregator(target_telemetry.telemetry_copy())
+    expected = expected_telemetry.aggregate(telemetry_models())
+
+    (result,) = add_pipeline_result_to_telemetry([target_telemetry], PIPELINE_RESULT)
+
+    assert result is target_telemetry
+    assert result.telemetry == expected.telemetry
+    assert result.watermark == expected.watermark
+    assert isinstance(result.telemetry[st.AGGREGATION_KEY].counters[st.RUN_TIME], int)
+
+
+def test_empty_pipeline_result_leaves_telemetry_unchanged():
+    """Test a pipeline result without selected records adds nothing."""
+    telemetry = TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS)
+    empty_result = {
+        "stats": [],
+        "traffic_lights": [],
+        "sub_processes": [],
+        "counters": [],
+    }
+    (result,) = add_pipeline_result_to_telemetry([telemetry], empty_result)
+    assert result.telemetry == {}
+
+
+def test_pipeline_with_bucket_boundaries_adds_bucket_index():
+    """
+    Test the bucket field is calculated from the bucket boundaries when they
+    are provided.
+    """
+    bucket_boundaries = [FROM_DATE_TIME, TO_DATE_TIME]
+    pipeline = telemetry_aggregation_pipeline(
+        **DEFAULT_TELEMETRY_MODEL_PARAMS,
+        from_date_time=FROM_DATE_TIME,
+        to_date_time=TO_DATE_TIME + timedelta(days=1),
+        bucket_boundaries=bucket_boundaries,
+    )
+    bucket_expression = pipeline[1]["$addFields"]["bucket"]
+    boundary_filter = bucket_expression["$subtract"][0]["$size"]["$filter"]
+    assert boundary_filter["input"] == bucket_boundaries
+
+
+def test_pipeline_result_is_added_per_bucket():
+    """Test the totals of each bucket are added to the matching telemetry."""
+    telemetry_list = [
+        TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS) for _ in range(3)
+    ]
+    pipeline_result = {
+        "stats": [
+            {
+                "_id": 0,
+                "record_count": 1,
+                "io_time_in_seconds": 0,
+                "run_time_in_seconds": 1,
+                "watermark": FROM_DATE_TIME,
+            },
+            {
+                "_id": 2,
+                "record_count": 2,
+                "io_time_in_seconds": 0,
+                "run_time_in_seconds": 1,
+                "watermark": TO_DATE_TIME,
+            },
+        ],
+        "traffic_lights": [
+            {"_id": {"bucket": 0, "traffic_light": "GREEN"}, "record_count": 1},
+            {"_id": {"bucket": 2, "traffic_light": "GREEN"}, "record_count": 2},
+        ],
+        "sub_processes": [
+            {
+                "_id": {"bucket": 2, "sub_process": "DATA_STORAGE"},
+                "base_counter": 5,
+                "fail_counter": 0,
+            },
+        ],
+        "counters": [],
+    }
+    first, second, third = add_pipeline_result_to_telemetry(
+        telemetry_list, pipeline_result
+    )
+    assert first.telemetry[st.AGGREGATION_KEY].base_counter == 1
+    assert "DATA_STORAGE" not in first.telemetry
+    assert second.telemetry == {}
+    assert third.telemetry[st.AGGREGATION_KEY].base_counter == 2
+    assert third.telemetry["DATA_STORAGE"].base_counter == 5
+    assert (first.watermark, second.watermark) == (FROM_DATE_TIME, None)
+    assert third.watermark == TO_DATE_TIME
+
+
+def test_aggregation_count_pipeline_counts_aggregated_records():
+    """
+    Test the aggregation count pipeline selects the records as the aggregation
+    pipeline and counts each record plus the records aggregated in it.
+    """
+    query_params = DEFAULT_TELEMETRY_MODEL_PARAMS | {
+        "from_date_time": FROM_DATE_TIME,
+        "to_date_time": TO_DATE_TIME,
+    }
+    match, group = aggregation_count_pipeline(**query_params)
+    assert match == telemetry_aggregation_pipeline(**query_params)[0]
+    assert group["$group"]["_id"] is None
+    assert group["$group"]["record_count"] == {
+        "$sum": {
+            "$add": [
+                1,
+                {"$ifNull": ["$telemetry.telemetry_aggregation_stats.base_counter", 0]},
+            ]
+        }
+    }
+
+
+def test_distinct_selectors_pipeline_only_uses_indexed_fields():
+    """
+    Test the distinct selectors pipeline only filters and projects fields in
+    SELECTOR_INDEX (so the query can be covered by the index) and groups on
+    the selector fields.
+    """
+    pipeline = distinct_selectors_pipeline(
+        telemetry_type=st.SINGLE_TELEMETRY_TYPE,
+        from_date_time=FROM_DATE_TIME,
+        to_date_time=TO_DATE_TIME,
+    )
+    match, project, group, _ = pipeline
+    assert set(match["$match"]) <= set(SELECTOR_INDEX)
+    assert project["$project"]["_id"] == 0
+    assert set(project["$project"]) - {"_id"} <= set(SELECTOR_INDEX)
+    assert list(group["$group"]["_id"]) == SELECTOR_KEYS
+
+
+def test_aggregated_telemetry_filter_matches_aggregation_index():
+    """
+    Test the aggregated telemetry filter is an equality match on the fields of
+    the unique aggregation index with the start of the aggregation period.
+    """
+    query_params = DEFAULT_TELEMETRY_MODEL_PARAMS | {
+        "from_date_time": FROM_DATE_TIME,
+        "to_date_time": TO_DATE_TIME,
+    }
+    aggregation_filter = aggregated_telemetry_filter(query_params)
+    assert list(aggregation_filter) == list(AGGREGATION_INDEX)
+    assert aggregation_filter[st.START_TIME] == FROM_DATE_TIME
+
+
+@pytest.mark.parametrize(
+    "telemetry_type, is_period_aggregation",
+    [
+        (st.DAILY_AGGR_TELEMETRY_TYPE, True),
+        (st.QUARTERLY_AGGR_TELEMETRY_TYPE, True),
+        (st.SINGLE_TELEMETRY_TYPE, False),
+    ],
+)
+def test_aggregated_telemetry_document_marks_period_aggregations(
+    telemetry_type, is_period_aggregation
+):
+    """
+    Test only the documents of the aggregation telemetry types are marked as
+    period aggregation, so only they are in the unique aggregation index.
+    """
+    query_params = DEFAULT_TELEMETRY_MODEL_PARAMS | {
+        "telemetry_type": telemetry_type,
+        "from_date_time": FROM_DATE_TIME,
+        "to_date_time": TO_DATE_TIME,
+    }
+    document = aggregated_telemetry_document(
+        {st.START_TIME: FROM_DATE_TIME + timedelta(hours=12)}, query_params
+    )
+    assert document[st.START_TIME] == FROM_DATE_TIME
+    assert (st.PERIOD_AGGREGATION_KEY in document) is is_period_aggregation
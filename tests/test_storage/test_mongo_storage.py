@@ -1,16 +1,24 @@
 """Module to test storage module."""
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
+from pymongo import ReplaceOne
 from test_data import DEFAULT_TELEMETRY_MODEL_PARAMS
 
-from pipeline_telemetry.data_classes import TelemetryModel
+from pipeline_telemetry.data_classes import TelemetryModel, TelemetrySelector
+from pipeline_telemetry.settings.date_ranges import get_daily_date_ranges
 from pipeline_telemetry.settings.settings import (
+    DAILY_AGGR_TELEMETRY_TYPE,
     DEFAULT_TRAFIC_LIGHT_COLOR,
+    PERIOD_AGGREGATION_KEY,
     RUN_TIME,
     SINGLE_TELEMETRY_TYPE,
 )
 from pipeline_telemetry.storage.mongo import TelemetryMongoModel, TelemetryMongoStorage
+from pipeline_telemetry.storage.mongo_aggregation import (
+    AGGREGATION_INDEX,
+    SELECTOR_INDEX,
+)
 from pipeline_telemetry.storage.mongo_connection import get_mongo_db_port
 
 
@@ -48,8 +56,7 @@ def test_store_telemetry_method_processes_and_saves_telemetry(mocker):
     )
     _telemetry_mongo_model_new_spy = mocker.spy(TelemetryMongoModel, "__new__")
     _telemetry_mongo_model_save_spy = mocker.spy(TelemetryMongoModel, "save")
-    TelemetryMongoStorage().store_telemetry(telemetry={
-        "source_name": "test"})  # type: ignore
+    TelemetryMongoStorage().store_telemetry(telemetry={"source_name": "test"})  # type: ignore
     assert _telemetry_model_kwargs_spy.called
     assert _telemetry_mongo_model_new_spy.called
     assert _telemetry_mongo_model_save_spy.called
@@ -85,6 +92,7 @@ def test_telemetry_model_kwargs_method():
         "io_time_in_seconds": 1.1,
         "telemetry": {},
         "traffic_light": DEFAULT_TRAFIC_LIGHT_COLOR,
+        "watermark": None,
     }
 
 
@@ -119,3 +127,245 @@ def test_mongo_model_to_dict():
     assert isinstance(telemetry_to_dict, dict)
     assert isinstance(getattr(telemetry, RUN_TIME), str)
     assert isinstance(telemetry_to_dict[RUN_TIME], float)
+
+
+def test_store_telemetry_batch_uses_unordered_insert_many(mocker):
+    """
+    Test store_telemetry_batch inserts the telemetry objects in chunks with
+    unordered insert_many calls without creating mongo model instances.
+    """
+    collection = mocker.MagicMock()
+    mocker.patch.object(TelemetryMongoModel, "_get_collection", return_value=collection)
+    _telemetry_mongo_model_new_spy = mocker.spy(TelemetryMongoModel, "__new__")
+    telemetry_list = (
+        TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS) for _ in range(5)
+    )
+    TelemetryMongoStorage().store_telemetry_batch(telemetry_list, batch_size=2)
+
+    assert collection.insert_many.call_count == 3
+    chunk_sizes = [len(call.args[0]) for call in collection.insert_many.call_args_list]
+    assert chunk_sizes == [2, 2, 1]
+    assert all(
+        call.kwargs == {"ordered": False}
+        for call in collection.insert_many.call_args_list
+    )
+    first_document = collection.insert_many.call_args_list[0].args[0][0]
+    assert first_document["source_name"] == "load_weather_data"
+    assert not _telemetry_mongo_model_new_spy.called
+
+
+def test_store_telemetry_batch_with_empty_list(mocker):
+    """Test store_telemetry_batch does not call insert_many without telemetry."""
+    collection = mocker.MagicMock()
+    mocker.patch.object(TelemetryMongoModel, "_get_collection", return_value=collection)
+    TelemetryMongoStorage().store_telemetry_batch([])
+    assert not collection.insert_many.called
+
+
+def test_aggregate_telemetry_runs_aggregation_pipeline(mocker):
+    """
+    Test aggregate_telemetry runs the aggregation pipeline on the collection and
+    adds the result to the provided telemetry.
+    """
+    collection = mocker.MagicMock()
+    collection.aggregate.return_value = iter(
+        [
+            {
+                "stats": [
+                    {
+                        "_id": 0,
+                        "record_count": 2,
+                        "io_time_in_seconds": 0,
+                        "run_time_in_seconds": 1,
+                        "watermark": datetime(2022, 10, 10, 12),
+                    }
+                ],
+                "traffic_lights": [
+                    {"_id": {"bucket": 0, "traffic_light": "GREEN"}, "record_count": 2}
+                ],
+                "sub_processes": [
+                    {
+                        "_id": {"bucket": 0, "sub_process": "DATA_STORAGE"},
+                        "base_counter": 3,
+                        "fail_counter": 1,
+                    }
+                ],
+                "counters": [],
+            }
+        ]
+    )
+    mocker.patch.object(TelemetryMongoModel, "_get_collection", return_value=collection)
+    telemetry = TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS)
+
+    result = TelemetryMongoStorage().aggregate_telemetry(
+        telemetry=telemetry, **telemetry_query_params()
+    )
+
+    assert result is telemetry
+    pipeline = collection.aggregate.call_args.args[0]
+    assert pipeline[0]["$match"]["source_name"] == "load_weather_data"
+    assert result.telemetry["DATA_STORAGE"].base_counter == 3
+    assert result.telemetry["telemetry_aggregation_stats"].base_counter == 2
+
+
+def test_aggregation_count_runs_aggregation_count_pipeline(mocker):
+    """
+    Test aggregation_count returns the record count of the aggregation count
+    pipeline and 0 when no records are selected.
+    """
+    collection = mocker.MagicMock()
+    collection.aggregate.return_value = iter([{"_id": None, "record_count": 5}])
+    mocker.patch.object(TelemetryMongoModel, "_get_collection", return_value=collection)
+
+    assert TelemetryMongoStorage().aggregation_count(**telemetry_query_params()) == 5
+    pipeline = collection.aggregate.call_args.args[0]
+    assert pipeline[0]["$match"]["source_name"] == "load_weather_data"
+
+    collection.aggregate.return_value = iter([])
+    assert TelemetryMongoStorage().aggregation_count(**telemetry_query_params()) == 0
+
+
+def test_aggregate_telemetry_per_date_time_range(mocker):
+    """
+    Test aggregate_telemetry_per_date_time_range runs a single aggregation
+    pipeline for all date time ranges and returns a telemetry per range.
+    """
+    collection = mocker.MagicMock()
+    collection.aggregate.return_value = iter(
+        [{"stats": [], "traffic_lights": [], "sub_processes": [], "counters": []}]
+    )
+    mocker.patch.object(TelemetryMongoModel, "_get_collection", return_value=collection)
+    date_time_ranges = list(get_daily_date_ranges(date(2022, 10, 1), date(2022, 10, 4)))
+    query_params = DEFAULT_TELEMETRY_MODEL_PARAMS.copy()
+    query_params.pop("telemetry_type")
+
+    result = TelemetryMongoStorage().aggregate_telemetry_per_date_time_range(
+        telemetry=TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS),
+        telemetry_type=SINGLE_TELEMETRY_TYPE,
+        date_time_ranges=date_time_ranges,
+        **query_params,
+    )
+
+    assert len(result) == 3
+    assert collection.aggregate.call_count == 1
+    pipeline = collection.aggregate.call_args.args[0]
+    assert pipeline[0]["$match"]["start_date_time"] == {
+        "$gte": datetime(2022, 10, 1),
+        "$lt": datetime(2022, 10, 4),
+    }
+
+
+def test_distinct_selectors_runs_distinct_selectors_pipeline(mocker):
+    """
+    Test distinct_selectors runs the distinct selectors pipeline and returns
+    a TelemetrySelector for each resulting document.
+    """
+    selector_params = {
+        key: DEFAULT_TELEMETRY_MODEL_PARAMS[key] for key in TelemetrySelector._fields
+    }
+    collection = mocker.MagicMock()
+    collection.aggregate.return_value = iter([{"_id": selector_params}])
+    mocker.patch.object(TelemetryMongoModel, "_get_collection", return_value=collection)
+    query_params = telemetry_query_params()
+
+    selectors = TelemetryMongoStorage().distinct_selectors(
+        telemetry_type=query_params["telemetry_type"],
+        from_date_time=query_params["from_date_time"],
+        to_date_time=query_params["to_date_time"],
+    )
+
+    assert selectors == [TelemetrySelector(**selector_params)]
+    pipeline = collection.aggregate.call_args.args[0]
+    assert pipeline[0]["$match"]["telemetry_type"] == "SINGLE TELEMETRY"
+
+
+def test_mongo_model_has_selector_index():
+    """Test the index covering the distinct selectors pipeline is defined."""
+    assert SELECTOR_INDEX in TelemetryMongoModel._meta["indexes"]
+
+
+def test_store_aggregated_telemetry_replaces_with_upsert(mocker):
+    """
+    Test store_aggregated_telemetry replaces the existing aggregation with a
+    single replace_one upsert keyed on the unique aggregation fields.
+    """
+    collection = mocker.MagicMock()
+    mocker.patch.object(TelemetryMongoModel, "_get_collection", return_value=collection)
+    telemetry = TelemetryModel(
+        **DEFAULT_TELEMETRY_MODEL_PARAMS
+        | {
+            "telemetry_type": DAILY_AGGR_TELEMETRY_TYPE,
+            "start_date_time": datetime(2022, 10, 10, 12),
+        }
+    )
+
+    TelemetryMongoStorage().store_aggregated_telemetry(telemetry)
+
+    filter_, document = collection.replace_one.call_args.args
+    assert collection.replace_one.call_args.kwargs == {"upsert": True}
+    assert filter_ == DEFAULT_TELEMETRY_MODEL_PARAMS | {
+        "telemetry_type": DAILY_AGGR_TELEMETRY_TYPE,
+        "start_date_time": datetime(2022, 10, 10),
+    }
+    assert document["start_date_time"] == datetime(2022, 10, 10)
+    assert document[PERIOD_AGGREGATION_KEY] is True
+    assert not collection.delete_one.called
+
+
+def test_store_aggregated_telemetry_batch_uses_unordered_bulk_upserts(mocker):
+    """
+    Test store_aggregated_telemetry_batch replaces the existing aggregations
+    with unordered bulk writes of replace_one upserts, one per chunk.
+    """
+    collection = mocker.MagicMock()
+    mocker.patch.object(TelemetryMongoModel, "_get_collection", return_value=collection)
+    telemetry_list = [
+        TelemetryModel(
+            **DEFAULT_TELEMETRY_MODEL_PARAMS
+            | {
+                "telemetry_type": DAILY_AGGR_TELEMETRY_TYPE,
+                "start_date_time": datetime(2022, 10, day, 12),
+            }
+        )
+        for day in range(10, 13)
+    ]
+
+    TelemetryMongoStorage().store_aggregated_telemetry_batch(
+        telemetry_list, batch_size=2
+    )
+
+    assert collection.bulk_write.call_count == 2
+    assert all(
+        call.kwargs == {"ordered": False}
+        for call in collection.bulk_write.call_args_list
+    )
+    requests = [
+        request
+        for call in collection.bulk_write.call_args_list
+        for request in call.args[0]
+    ]
+    assert all(isinstance(request, ReplaceOne) for request in requests)
+    assert [request._filter["start_date_time"] for request in requests] == [
+        datetime(2022, 10, day) for day in range(10, 13)
+    ]
+    assert all(request._upsert for request in requests)
+    assert not collection.insert_many.called
+
+
+def test_mongo_model_has_unique_aggregation_index():
+    """
+    Test the unique index on aggregated telemetry is restricted to the
+    documents marked as period aggregation, with a partial filter that MongoDB
+    versions before 6.0 accept.
+    """
+    (aggregation_index,) = [
+        index
+        for index in TelemetryMongoModel._meta["index_specs"]
+        if index.get("unique")
+    ]
+    assert [field for field, _ in aggregation_index["fields"]] == list(
+        AGGREGATION_INDEX
+    )
+    assert aggregation_index["partialFilterExpression"] == {
+        PERIOD_AGGREGATION_KEY: True
+    }
@@ -8,10 +8,14 @@ from freezegun import freeze_time
 from test_storage_data import DEFAULT_TELEMETRY_MODEL_PARAMS, DEFAULT_TELEMETRY_PARAMS
 
 from pipeline_telemetry import Telemetry
-from pipeline_telemetry.data_classes import TelemetryModel
+from pipeline_telemetry.data_classes import (
+    TelemetryData,
+    TelemetryModel,
+    TelemetrySelector,
+)
 from pipeline_telemetry.settings import DateTimeRange, exceptions
 from pipeline_telemetry.settings import settings as st
-from pipeline_telemetry.storage.generic import AbstractTelemetryStorage
+from pipeline_telemetry.storage.generic import AbstractTelemetryStorage, chunked
 from pipeline_telemetry.storage.memory import TelemetryInMemoryStorage
 
 
@@ -350,3 +354,108 @@ def test_delete_telemetry_deletes_telemetry_record():
     telemetry = in_memory_storage._telemetry_storage_to_object(in_memory_record)
     for key, value in DEFAULT_TELEMETRY_MODEL_PARAMS.items():
         assert getattr(telemetry, key) == value
+
+
+def test_chunked_returns_lists_of_chunk_size():
+    """Test chunked splits an iterable in lists of chunk_size."""
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+
+
+def test_store_telemetry_batch_stores_all_objects():
+    """
+    Test default store_telemetry_batch implementation stores each telemetry
+    object.
+    """
+    # Table reset for each test is needed as the table is a class property
+    TelemetryInMemoryStorage._define_db_table(TelemetryInMemoryStorage.db_cursor)
+    in_memory_storage = TelemetryInMemoryStorage()
+    in_memory_storage.store_telemetry_batch(
+        TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS) for _ in range(3)
+    )
+    all_in_memory_objects = in_memory_storage.db_cursor.execute(
+        "SELECT * FROM telemetry "
+    )
+    assert len(all_in_memory_objects.fetchall()) == 3
+
+
+def test_distinct_selectors_returns_sorted_distinct_selectors():
+    """
+    Test distinct_selectors returns each selector once for the telemetry type
+    and period, sorted on the selector fields.
+    """
+    TelemetryInMemoryStorage._define_db_table(TelemetryInMemoryStorage.db_cursor)
+    in_memory_storage = TelemetryInMemoryStorage()
+    for params in [
+        {},
+        {},
+        {st.SOURCE_NAME_KEY: "a_source"},
+        {st.TELEMETRY_TYPE_KEY: st.DAILY_AGGR_TELEMETRY_TYPE},
+        {st.START_TIME: datetime.now() - timedelta(days=2)},
+    ]:
+        in_memory_storage.store_telemetry(
+            TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS | params)
+        )
+    query_params = telemetry_query_params()
+    selectors = in_memory_storage.distinct_selectors(
+        telemetry_type=query_params[st.TELEMETRY_TYPE_KEY],
+        from_date_time=query_params["from_date_time"],
+        to_date_time=query_params["to_date_time"],
+    )
+    selector_params = {
+        key: DEFAULT_TELEMETRY_MODEL_PARAMS[key] for key in TelemetrySelector._fields
+    }
+    assert selectors == [
+        TelemetrySelector(**selector_params | {st.SOURCE_NAME_KEY: "a_source"}),
+        TelemetrySelector(**selector_params),
+    ]
+
+
+def test_distinct_selectors_query_uses_covering_index():
+    """Test the distinct selectors query is answered from the index only."""
+    in_memory_storage = TelemetryInMemoryStorage()
+    query_plan = in_memory_storage.db_cursor.execute(
+        "EXPLAIN QUERY PLAN SELECT DISTINCT category, sub_category, source_name, "
+        "process_type FROM telemetry WHERE telemetry_type='SINGLE TELEMETRY' AND "
+        "start_date_time >= '2022-10-10' AND start_date_time < '2022-10-11'"
+    ).fetchall()
+    assert "COVERING INDEX telemetry_selector" in str(query_plan)
+
+
+def test_distinct_selectors_not_implemented():
+    """Test distinct_selectors raises NotImplementedError by default."""
+
+    class NoDistinctStorage(TelemetryInMemoryStorage):
+        distinct_selectors = AbstractTelemetryStorage.distinct_selectors
+
+    with pytest.raises(NotImplementedError):
+        NoDistinctStorage().distinct_selectors(
+            telemetry_type=st.SINGLE_TELEMETRY_TYPE,
+            from_date_time=datetime.now(),
+            to_date_time=datetime.now(),
+        )
+
+
+def test_aggregation_count_counts_records_and_aggregated_records():
+    """
+    Test aggregation_count counts each selected record plus the base counter
+    of its aggregation stats, as the generic count over telemetry_list.
+    """
+    TelemetryInMemoryStorage._define_db_table(TelemetryInMemoryStorage.db_cursor)
+    in_memory_storage = TelemetryInMemoryStorage()
+    assert in_memory_storage.aggregation_count(**telemetry_query_params()) == 0
+
+    aggregated_telemetry = TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS)
+    aggregated_telemetry.telemetry[st.AGGREGATION_KEY] = TelemetryData(base_counter=4)
+    for telemetry in [
+        TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS),
+        aggregated_telemetry,
+        TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS | {"source_name": "other"}),
+    ]:
+        in_memory_storage.store_telemetry(telemetry)
+
+    aggregation_count = in_memory_storage.aggregation_count(**telemetry_query_params())
+    assert aggregation_count == 6
+    assert aggregation_count == AbstractTelemetryStorage.aggregation_count(
+        in_memory_storage, **telemetry_query_params()
+    )
@@ -0,0 +1,371 @@
+"""Module to test the write behind storage module."""
+
+import threading
+from datetime import datetime, timedelta
+from typing import Iterator, List
+
+import pytest
+from pymongo.errors import BulkWriteError
+from test_storage_data import DEFAULT_TELEMETRY_MODEL_PARAMS, DEFAULT_TELEMETRY_PARAMS
+
+from pipeline_telemetry import Telemetry
+from pipeline_telemetry.data_classes import TelemetryModel
+from pipeline_telemetry.settings import exceptions
+from pipeline_telemetry.settings import settings as st
+from pipeline_telemetry.storage.generic import AbstractTelemetryStorage
+from pipeline_telemetry.storage.mongo import TelemetryMongoStorage
+from pipeline_telemetry.storage.write_behind import (
+    AbstractWriteBehindStorage,
+    TelemetryMongoWriteBehindStorage,
+    TelemetryWriteBehindQueue,
+    WriteBehindStats,
+)
+
+
+class ListStorage(AbstractTelemetryStorage):
+    """Storage class that stores telemetry in a class level list."""
+
+    stored_telemetry: List[TelemetryModel] = []
+    release = threading.Event()
+    # set when the worker took telemetry from the queue to store it
+    storing = threading.Event()
+
+    def store_telemetry(self, telemetry: TelemetryModel) -> None:
+        self.storing.set()
+        self.release.wait(timeout=5)
+        self.stored_telemetry.append(telemetry)
+
+    def select_records(self, **kwargs) -> Iterator:
+        return iter(telemetry.model_dump() for telemetry in self.stored_telemetry)
+
+    def _remove_existing_aggregation_telemetry(self, telemetry: TelemetryModel) -> None:
+        pass
+
+
+class FailingStorage(ListStorage):
+    """Storage class that fails to store telemetry."""
+
+    def store_telemetry(self, telemetry: TelemetryModel) -> None:
+        raise ValueError("store failed")
+
+
+class PartiallyFailingStorage(ListStorage):
+    """Storage class of which the bulk write fails for the first document."""
+
+    def store_telemetry_batch(self, telemetry_list, batch_size=1) -> None:
+        self.storing.set()
+        self.release.wait(timeout=5)
+        raise BulkWriteError(
+            {
+                "nInserted": len(telemetry_list) - 1,
+                "writeErrors": [{"index": 0, "code": 11000, "errmsg": "duplicate"}],
+            }
+        )
+
+
+@pytest.fixture
+def list_storage():
+    ListStorage.stored_telemetry = []
+    ListStorage.release.set()
+    ListStorage.storing.clear()
+    yield ListStorage
+    ListStorage.release.set()
+
+
+def new_telemetry_model() -> TelemetryModel:
+    return TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS)
+
+
+def test_unknown_overflow_policy_raises_exception():
+    """Test an invalid overflow policy raises UnknownOverflowPolicy."""
+    with pytest.raises(exceptions.UnknownOverflowPolicy):
+        TelemetryWriteBehindQueue(ListStorage, overflow_policy="invalid")
+
+
+def test_queue_writes_telemetry_in_background(list_storage):
+    """Test queued telemetry objects are written by the worker thread."""
+    queue = TelemetryWriteBehindQueue(list_storage)
+    for _ in range(3):
+        assert queue.put(new_telemetry_model())
+    queue.flush()
+    assert len(list_storage.stored_telemetry) == 3
+    assert queue.stats() == WriteBehindStats(
+        queued=3, written=3, dropped=0, failed=0, pending=0
+    )
+    assert queue.close()
+
+
+def test_drain_returns_false_when_timeout_expires(list_storage):
+    """Test drain returns False while the worker is still busy."""
+    list_storage.release.clear()
+    queue = TelemetryWriteBehindQueue(list_storage)
+    queue.put(new_telemetry_model())
+    assert not queue.drain(timeout=0.05)
+    list_storage.release.set()
+    assert queue.drain(timeout=5)
+    assert queue.stats().written == 1
+    queue.close()
+
+
+def test_drop_newest_overflow_policy(list_storage):
+    """Test drop_newest policy drops the telemetry that is added to a full queue."""
+    list_storage.release.clear()
+    queue = TelemetryWriteBehindQueue(
+        list_storage,
+        max_queue_size=1,
+        overflow_policy=st.OVERFLOW_POLICY_DROP_NEWEST,
+    )
+    first, second, third = [new_telemetry_model() for _ in range(3)]
+    queue.put(first)
+    # wait for worker to pick up the first telemetry object
+    assert list_storage.storing.wait(timeout=5)
+    assert queue.put(second)
+    assert not queue.put(third)
+    list_storage.release.set()
+    queue.flush()
+    assert list_storage.stored_telemetry == [first, second]
+    assert queue.stats().dropped == 1
+    queue.close()
+
+
+def test_drop_oldest_overflow_policy(list_storage):
+    """Test drop_oldest policy drops the oldest telemetry on a full queue."""
+    list_storage.release.clear()
+    queue = TelemetryWriteBehindQueue(
+        list_storage,
+        max_queue_size=1,
+        overflow_policy=st.OVERFLOW_POLICY_DROP_OLDEST,
+    )
+    first, second, third = [new_telemetry_model() for _ in range(3)]
+    queue.put(first)
+    assert list_storage.storing.wait(timeout=5)
+    assert queue.put(second)
+    assert queue.put(third)
+    list_storage.release.set()
+    queue.flush()
+    assert list_storage.stored_telemetry == [first, third]
+    assert queue.stats() == WriteBehindStats(
+        queued=3, written=2, dropped=1, failed=0, pending=0
+    )
+    queue.close()
+
+
+def test_failed_writes_are_counted(list_storage):
+    """Test exceptions in the storage class are counted and do not stop worker."""
+    queue = TelemetryWriteBehindQueue(FailingStorage)
+    queue.put(new_telemetry_model())
+    queue.put(new_telemetry_model())
+    queue.flush()
+    assert queue.stats().failed == 2
+    assert queue.close()
+
+
+def test_partially_failed_bulk_writes_are_counted(list_storage):
+    """Test only the documents with write errors of a bulk write are failed."""
+    list_storage.release.clear()
+    queue = TelemetryWriteBehindQueue(PartiallyFailingStorage, batch_size=3)
+    queue.put(new_telemetry_model())
+    assert list_storage.storing.wait(timeout=5)
+    for _ in range(3):
+        queue.put(new_telemetry_model())
+    list_storage.release.set()
+    queue.flush()
+    # batches of 1 and 3 telemetry objects with one write error each
+    assert queue.stats() == WriteBehindStats(
+        queued=4, written=2, dropped=0, failed=2, pending=0
+    )
+    assert queue.close()
+
+
+def test_worker_stores_waiting_telemetry_in_batches(list_storage, mocker):
+    """Test the worker stores all waiting telemetry with store_telemetry_batch."""
+    list_storage.release.clear()
+    store_telemetry_batch_spy = mocker.spy(list_storage, "store_telemetry_batch")
+    queue = TelemetryWriteBehindQueue(list_storage, batch_size=3)
+    queue.put(new_telemetry_model())
+    assert list_storage.storing.wait(timeout=5)
+    for _ in range(4):
+        queue.put(new_telemetry_model())
+    list_storage.release.set()
+    queue.flush()
+    batch_sizes = [len(call.args[1]) for call in store_telemetry_batch_spy.mock_calls]
+    assert batch_sizes == [1, 3, 1]
+    assert queue.stats().written == 5
+    queue.close()
+
+
+def test_failing_storage_class_instantiation_is_counted(list_storage, mocker):
+    """Test the worker counts telemetry as failed when the storage class fails."""
+    mocker.patch.object(list_storage, "__init__", side_effect=ValueError("no db"))
+    queue = TelemetryWriteBehindQueue(list_storage)
+    queue.put(new_telemetry_model())
+    assert queue.flush(timeout=5)
+    assert queue.stats().failed == 1
+    mocker.stopall()
+    queue.put(new_telemetry_model())
+    assert queue.flush(timeout=5)
+    assert queue.stats().written == 1
+    assert queue.close()
+
+
+def test_flush_returns_false_when_timeout_expires(list_storage):
+    """Test flush with a timeout returns False while the worker is busy."""
+    list_storage.release.clear()
+    queue = TelemetryWriteBehindQueue(list_storage)
+    queue.put(new_telemetry_model())
+    assert not queue.flush(timeout=0.05)
+    list_storage.release.set()
+    assert queue.flush()
+    queue.close()
+
+
+def test_flush_raises_exception_when_worker_stopped(list_storage, mocker):
+    """Test flush does not wait forever when the worker thread died."""
+    queue = TelemetryWriteBehindQueue(list_storage)
+    mocker.patch.object(queue, "_run")
+    queue.put(new_telemetry_model())
+    queue._worker.join()
+    with pytest.raises(exceptions.WriteBehindWorkerStopped):
+        queue.flush()
+
+
+def test_atexit_close_is_registered_while_worker_runs(list_storage, mocker):
+    """Test queues only register close at exit while their worker is running."""
+    register = mocker.patch("atexit.register")
+    unregister = mocker.patch("atexit.unregister")
+    queue = TelemetryWriteBehindQueue(list_storage)
+    assert not register.called
+    queue.put(new_telemetry_model())
+    queue.put(new_telemetry_model())
+    register.assert_called_once_with(queue.close)
+    assert queue.close()
+    unregister.assert_called_once_with(queue.close)
+
+
+def test_close_racing_with_put_on_full_drop_oldest_queue(list_storage):
+    """
+    Test a put while close waits to queue the stop sentinel on a full
+    drop_oldest queue neither drops the sentinel nor starts a second worker.
+    """
+    list_storage.release.clear()
+    queue = TelemetryWriteBehindQueue(
+        list_storage,
+        max_queue_size=1,
+        overflow_policy=st.OVERFLOW_POLICY_DROP_OLDEST,
+    )
+    queue.put(new_telemetry_model())
+    assert list_storage.storing.wait(timeout=5)
+    queue.put(new_telemetry_model())
+    worker = queue._worker
+
+    close_results = []
+    close_thread = threading.Thread(target=lambda: close_results.append(queue.close()))
+    close_thread.start()
+    put_thread = threading.Thread(target=queue.put, args=(new_telemetry_model(),))
+    put_thread.start()
+    list_storage.release.set()
+    close_thread.join(timeout=5)
+    put_thread.join(timeout=5)
+
+    assert close_results == [True]
+    assert not worker.is_alive()
+    assert queue._worker is None
+    # either the second telemetry object is dropped for the third one, or the
+    # third one is dropped as the queue is closed
+    assert queue.stats()._replace(queued=0) == WriteBehindStats(
+        queued=0, written=2, dropped=1, failed=0, pending=0
+    )
+
+
+def test_put_after_close_drops_telemetry(list_storage):
+    """Test a closed queue drops telemetry and does not start a worker."""
+    queue = TelemetryWriteBehindQueue(list_storage)
+    queue.put(new_telemetry_model())
+    assert queue.close()
+    assert not queue.put(new_telemetry_model())
+    assert queue._worker is None
+    assert queue.stats() == WriteBehindStats(
+        queued=1, written=1, dropped=1, failed=0, pending=0
+    )
+
+
+def test_close_without_worker_returns_true():
+    """Test closing a queue that was never used."""
+    assert TelemetryWriteBehindQueue(ListStorage).close()
+
+
+def test_mongo_write_behind_storage_wraps_mongo_storage():
+    """Test TelemetryMongoWriteBehindStorage uses TelemetryMongoStorage."""
+    assert TelemetryMongoWriteBehindStorage.STORAGE_CLASS is TelemetryMongoStorage
+
+
+def test_write_behind_storage_with_telemetry(list_storage):
+    """
+    Test Telemetry.save_and_close with a write behind storage class queues
+    the telemetry and each storage subclass has its own queue.
+    """
+
+    class ListWriteBehindStorage(AbstractWriteBehindStorage):
+        STORAGE_CLASS = list_storage
+
+    class OtherWriteBehindStorage(AbstractWriteBehindStorage):
+        STORAGE_CLASS = list_storage
+
+    telemetry = Telemetry(
+        **DEFAULT_TELEMETRY_PARAMS, storage_class=ListWriteBehindStorage
+    )
+    telemetry.increase_sub_process_base_count("RETRIEVE_RAW_DATA")
+    telemetry.save_and_close()
+    ListWriteBehindStorage.flush()
+    assert list_storage.stored_telemetry == [telemetry.telemetry]
+    assert ListWriteBehindStorage.stats().written == 1
+    assert ListWriteBehindStorage.drain(timeout=1)
+    assert (
+        ListWriteBehindStorage.write_behind_queue()
+        is not OtherWriteBehindStorage.write_behind_queue()
+    )
+    telemetry_list = ListWriteBehindStorage().telemetry_list(
+        **DEFAULT_TELEMETRY_MODEL_PARAMS,
+        from_date_time=datetime.now() - timedelta(days=1),
+        to_date_time=datetime.now() + timedelta(days=1),
+    )
+    assert len(list(telemetry_list)) == 1
+    ListWriteBehindStorage.write_behind_queue().close()
+    OtherWriteBehindStorage.write_behind_queue().close()
+
+
+def test_write_behind_storage_distinct_selectors(mocker):
+    """Test distinct_selectors is delegated to the wrapped storage class."""
+    distinct_selectors = mocker.patch.object(
+        TelemetryMongoStorage, "distinct_selectors", return_value=[]
+    )
+    mocker.patch.object(TelemetryMongoWriteBehindStorage, "flush")
+    from_date_time = datetime.now()
+    assert (
+        TelemetryMongoWriteBehindStorage().distinct_selectors(
+            telemetry_type=st.SINGLE_TELEMETRY_TYPE,
+            from_date_time=from_date_time,
+            to_date_time=from_date_time,
+        )
+        == []
+    )
+    distinct_selectors.assert_called_once_with(
+        telemetry_type=st.SINGLE_TELEMETRY_TYPE,
+        from_date_time=from_date_time,
+        to_date_time=from_date_time,
+    )
+
+
+def test_write_behind_storage_stores_aggregated_telemetry_directly(mocker):
+    """
+    Test aggregated telemetry is stored with the wrapped storage class after
+    flushing the queue.
+    """
+    store_aggregated_telemetry = mocker.patch.object(
+        TelemetryMongoStorage, "store_aggregated_telemetry"
+    )
+    flush = mocker.patch.object(TelemetryMongoWriteBehindStorage, "flush")
+    telemetry = new_telemetry_model()
+    TelemetryMongoWriteBehindStorage().store_aggregated_telemetry(telemetry)
+    assert flush.called
+    store_aggregated_telemetry.assert_called_once_with(telemetry)
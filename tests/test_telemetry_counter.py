@@ -2,6 +2,8 @@
 Module to test telemetry counter login for pipeline telemetry module.
 """
 
+import pickle
+
 import pytest
 import test_data as TD
 
@@ -88,6 +90,7 @@ def test_add_telemetry_counter_with_icrement_2_to_telemetry(telemetry_inst):
     telemetry_data = telemetry_inst.get("RETRIEVE_RAW_DATA")
     assert getattr(telemetry_data, st.COUNTERS_KEY)["test_counter"] == 1
     telemetry_inst.add_telemetry_counter(TD.TEST_TELEMETRY_COUNTER_INC_2)
+    telemetry_data = telemetry_inst.get("RETRIEVE_RAW_DATA")
     assert getattr(telemetry_data, st.COUNTERS_KEY)["test_counter"] == 3
 
 
@@ -277,3 +280,32 @@ def test_tc_hash_does_include_sub_process_field():
         not TD.TEST_TELEMETRY_COUNTER.__hash__()
         == TD.TEST_TELEMETRY_COUNTER_3.__hash__()
     )
+
+
+def test_tc_hash_equals_for_equal_counters():
+    """Test that equal telemetry counters have the same cached hash."""
+    counter = TelemetryCounter(
+        process_type=TD.TEST_PROCESS_TYPE,
+        sub_process="RETRIEVE_RAW_DATA",
+        counter_name="test_counter",
+    )
+    assert counter == TD.TEST_TELEMETRY_COUNTER
+    assert hash(counter) == hash(TD.TEST_TELEMETRY_COUNTER)
+
+
+def test_invalid_counter_does_not_change_telemetry(telemetry_inst):
+    """
+    Check an invalid telemetry counter raises an exception before any counter
+    of the telemetry object is increased.
+    """
+    with pytest.raises(exceptions.InvalidSubProcessForProcessType):
+        telemetry_inst.add_telemetry_counter(TD.TEST_INV_TELEMETRY_COUNTER)
+    assert "invalid_sub_process" not in telemetry_inst.telemetry.telemetry
+
+
+def test_unpickled_telemetry_counter_equals_counter():
+    """Test that a pickled telemetry counter is resolved again when unpickled."""
+    counter = pickle.loads(pickle.dumps(TD.TEST_ERROR_TELEMETRY_COUNTER))
+    assert counter == TD.TEST_ERROR_TELEMETRY_COUNTER
+    assert hash(counter) == hash(TD.TEST_ERROR_TELEMETRY_COUNTER)
+    assert counter.counter_key == TD.TEST_ERROR_TELEMETRY_COUNTER.counter_key
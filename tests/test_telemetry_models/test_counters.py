@@ -0,0 +1,106 @@
+"""
+Module to test the counter store of open telemetry objects.
+"""
+
+import pytest
+from test_data import DEFAULT_TELEMETRY_PARAMS, TEST_ERROR_CODE
+
+from pipeline_telemetry import Telemetry
+from pipeline_telemetry.data_classes import TelemetryData, TelemetryShard
+from pipeline_telemetry.data_classes.counters import CounterStore, SubProcessCounters
+from pipeline_telemetry.settings import settings as st
+
+
+def test_sub_process_counters_have_no_instance_dict():
+    with pytest.raises(AttributeError):
+        SubProcessCounters().unknown_counter = 1
+
+
+def test_sub_process_counters_to_telemetry_data():
+    counters = SubProcessCounters()
+    counters.increase_base_count(2)
+    counters.increase_fail_count(1)
+    counters.increase_custom_count(increment=3, counter="pages")
+    counters.increase_error_count(increment=1, error_code_key=TEST_ERROR_CODE.code)
+    counters.increase_sample_counts(base_increment=4, sampled_increment=1)
+
+    telemetry_data = counters.to_telemetry_data()
+    assert telemetry_data == TelemetryData(
+        base_counter=2,
+        fail_counter=1,
+        counters={"pages": 3, st.SAMPLING_BASE_COUNT_KEY: 4, st.SAMPLED_COUNT_KEY: 1},
+        errors={TEST_ERROR_CODE.code: 1},
+    )
+    # the telemetry data holds a copy of the counters
+    counters.increase_custom_count(increment=1, counter="pages")
+    assert telemetry_data.counters["pages"] == 3
+
+
+def test_counter_store_adds_store_and_shard():
+    store = CounterStore()
+    store.get_sub_process_counters("RETRIEVE_RAW_DATA").increase_base_count(1)
+    other_store = CounterStore()
+    other_store.get_sub_process_counters("RETRIEVE_RAW_DATA").increase_base_count(2)
+    other_store.increase_io_time(0.5)
+    shard = TelemetryShard(
+        telemetry={"RETRIEVE_RAW_DATA": TelemetryData(errors={"ERR": 1})},
+        io_time_in_seconds=1.0,
+    )
+
+    store.add(other_store)
+    store.add(shard)
+    assert store.to_telemetry_data() == {
+        "RETRIEVE_RAW_DATA": TelemetryData(base_counter=3, errors={"ERR": 1})
+    }
+    assert store.io_time_in_seconds == 1.5
+
+
+def test_open_telemetry_materialises_counters_on_access():
+    telemetry = Telemetry(**DEFAULT_TELEMETRY_PARAMS)
+    telemetry.increase_sub_process_base_count("RETRIEVE_RAW_DATA")
+    telemetry.increase_io_time(0.5)
+
+    assert telemetry.telemetry.telemetry["RETRIEVE_RAW_DATA"].base_counter == 1
+    assert telemetry.telemetry.io_time_in_seconds == 0.5
+    telemetry.increase_sub_process_base_count("RETRIEVE_RAW_DATA")
+    assert telemetry.telemetry_data["RETRIEVE_RAW_DATA"].base_counter == 2
+    assert not telemetry.closed
+
+    telemetry_model = telemetry.save_and_close()
+    assert telemetry.closed
+    assert telemetry_model.telemetry["RETRIEVE_RAW_DATA"].base_counter == 2
+    assert (
+        telemetry.get("RETRIEVE_RAW_DATA")
+        is telemetry_model.telemetry["RETRIEVE_RAW_DATA"]
+    )
+
+
+def test_sub_process_counters_add_changes():
+    counters = SubProcessCounters()
+    counters.increase_base_count(1)
+    counters.increase_error_count(1, "ERR")
+    materialised = counters.copy()
+    telemetry_data = materialised.to_telemetry_data()
+    telemetry_data.increase_base_count(2)
+    telemetry_data.increase_custom_count(1, "pages")
+    counters.increase_base_count(1)
+
+    counters.add_changes(telemetry_data, materialised)
+    assert counters.to_telemetry_data() == TelemetryData(
+        base_counter=4, counters={"pages": 1}, errors={"ERR": 1}
+    )
+
+
+def test_changes_to_open_telemetry_data_are_kept():
+    telemetry = Telemetry(**DEFAULT_TELEMETRY_PARAMS)
+    telemetry.increase_sub_process_base_count("RETRIEVE_RAW_DATA")
+    telemetry.get("RETRIEVE_RAW_DATA").increase_fail_count(2)
+    telemetry.telemetry.telemetry["RETRIEVE_RAW_DATA"].increase_base_count(3)
+    telemetry.telemetry.io_time_in_seconds += 0.5
+    telemetry.increase_sub_process_base_count("RETRIEVE_RAW_DATA")
+
+    assert telemetry.get("RETRIEVE_RAW_DATA").fail_counter == 2
+    telemetry_model = telemetry.save_and_close()
+    assert telemetry_model.telemetry["RETRIEVE_RAW_DATA"].base_counter == 5
+    assert telemetry_model.telemetry["RETRIEVE_RAW_DATA"].fail_counter == 2
+    assert telemetry_model.io_time_in_seconds == 0.5
@@ -2,6 +2,8 @@
 Module to test telemetry model class for pipeline telemetry module.
 """
 
+from datetime import datetime, timedelta
+
 import pytest
 from test_data import DEFAULT_TELEMETRY_MODEL_PARAMS
 
@@ -172,3 +174,51 @@ def test_telemetry_model_addition_aggregates_run_time():
     aggregation_data_counters = getattr(aggregation_data, st.COUNTERS_KEY)
     assert "run_time_in_seconds" in aggregation_data_counters
     assert aggregation_data_counters["run_time_in_seconds"] == 3
+
+
+def test_telemetry_model_addition_sets_watermark():
+    """
+    Test that adding up telemetry model instances sets the watermark to the
+    latest start_date_time of the added instances.
+    """
+    start_date_time = datetime(2022, 10, 10, 12)
+    tel_model_added = TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS)
+    assert tel_model_added.watermark is None
+    for hours in [2, 5, 1]:
+        tel_model_added += TelemetryModel(
+            **DEFAULT_TELEMETRY_MODEL_PARAMS,
+            start_date_time=start_date_time + timedelta(hours=hours),
+        )
+    assert tel_model_added.watermark == start_date_time + timedelta(hours=5)
+
+
+def test_telemetry_model_add_aggregated_telemetry():
+    """
+    Test that adding aggregated telemetry model instances gives the same
+    telemetry as adding all underlying telemetry model instances.
+    """
+    start_date_time = datetime(2022, 10, 10, 12)
+    tel_models = [
+        TelemetryModel(
+            **DEFAULT_TELEMETRY_MODEL_PARAMS,
+            start_date_time=start_date_time + timedelta(days=day),
+            run_time_in_seconds=day + 1,
+        )
+        for day in range(4)
+    ]
+    expected = TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS)
+    for tel_model in tel_models:
+        expected += tel_model
+
+    first_aggregation = TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS)
+    second_aggregation = TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS)
+    for tel_model in tel_models[:2]:
+        first_aggregation += tel_model
+    for tel_model in tel_models[2:]:
+        second_aggregation += tel_model
+    rolled_up = TelemetryModel(**DEFAULT_TELEMETRY_MODEL_PARAMS)
+    rolled_up.add_aggregated_telemetry(first_aggregation)
+    rolled_up.add_aggregated_telemetry(second_aggregation)
+
+    assert rolled_up.telemetry == expected.telemetry
+    assert rolled_up.watermark == start_date_time + timedelta(days=3)
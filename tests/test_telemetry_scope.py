@@ -0,0 +1,160 @@
+"""Module to test the active telemetry scope."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
+
+import pytest
+from test_data import DEFAULT_TELEMETRY_PARAMS
+
+from pipeline_telemetry import (
+    Telemetry,
+    TelemetryMixin,
+    add_async_telemetry,
+    add_telemetry,
+    get_active_telemetry,
+    increase_base_count,
+    telemetry_scope,
+)
+from pipeline_telemetry.data_classes import TelemetryModel
+from pipeline_telemetry.settings import exceptions
+from pipeline_telemetry.storage.generic import AbstractTelemetryStorage
+
+SUB_PROCESS = "RETRIEVE_RAW_DATA"
+
+
+class ListStorage(AbstractTelemetryStorage):
+    """Storage class that stores telemetry in a class level list."""
+
+    stored_telemetry: List[TelemetryModel] = []
+    lock = threading.Lock()
+
+    def store_telemetry(self, telemetry: TelemetryModel) -> None:
+        with self.lock:
+            self.stored_telemetry.append(telemetry)
+
+    def select_records(self, **kwargs) -> Iterator:
+        return iter(telemetry.model_dump() for telemetry in self.stored_telemetry)
+
+    def _remove_existing_aggregation_telemetry(self, telemetry: TelemetryModel) -> None:
+        pass
+
+
+TELEMETRY_PARAMS = DEFAULT_TELEMETRY_PARAMS | {"storage_class": ListStorage}
+
+
+@pytest.fixture(autouse=True)
+def clear_list_storage():
+    ListStorage.stored_telemetry.clear()
+    yield
+    ListStorage.stored_telemetry.clear()
+
+
+def base_counts() -> List[int]:
+    return sorted(
+        telemetry.telemetry[SUB_PROCESS].base_counter
+        for telemetry in ListStorage.stored_telemetry
+    )
+
+
+class SharedPipeline(TelemetryMixin):
+    """Pipeline object that is shared by concurrent calls."""
+
+    def __init__(self, nr_of_calls: int) -> None:
+        self.barrier = threading.Barrier(nr_of_calls)
+
+    @add_telemetry(TELEMETRY_PARAMS)
+    def run(self, increment: int) -> Telemetry:
+        telemetry = self._telemetry
+        # all calls are running at the same time after the barrier
+        self.barrier.wait(timeout=5)
+        increase_base_count(self, SUB_PROCESS, increment)
+        self.sub_step()
+        assert self._telemetry is telemetry
+        return telemetry
+
+    @add_telemetry(TELEMETRY_PARAMS)
+    def sub_step(self) -> None:
+        increase_base_count(self, SUB_PROCESS)
+
+    @add_async_telemetry(TELEMETRY_PARAMS)
+    async def run_async(self, increment: int) -> Telemetry:
+        telemetry = self._telemetry
+        await asyncio.sleep(0)
+        increase_base_count(self, SUB_PROCESS, increment)
+        await asyncio.sleep(0)
+        assert self._telemetry is telemetry
+        return telemetry
+
+
+def test_concurrent_threads_on_shared_object_have_isolated_telemetry():
+    pipeline = SharedPipeline(nr_of_calls=4)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        telemetry_list = list(executor.map(pipeline.run, [1, 2, 3, 4]))
+
+    assert len({id(telemetry) for telemetry in telemetry_list}) == 4
+    assert base_counts() == [2, 3, 4, 5]
+    assert pipeline._telemetry is None
+
+
+def test_concurrent_tasks_on_shared_object_have_isolated_telemetry():
+    pipeline = SharedPipeline(nr_of_calls=1)
+
+    async def run_concurrently():
+        return await asyncio.gather(*(pipeline.run_async(i) for i in [1, 2, 3]))
+
+    telemetry_list = asyncio.run(run_concurrently())
+    assert len({id(telemetry) for telemetry in telemetry_list}) == 3
+    assert base_counts() == [1, 2, 3]
+
+
+def test_telemetry_scope_is_restored_on_exit():
+    pipeline = SharedPipeline(nr_of_calls=1)
+    outer = Telemetry(**TELEMETRY_PARAMS)
+    inner = Telemetry(**TELEMETRY_PARAMS)
+    with telemetry_scope(pipeline, outer):
+        with telemetry_scope(pipeline, inner):
+            increase_base_count(pipeline, SUB_PROCESS)
+            assert get_active_telemetry(pipeline) is inner
+        assert get_active_telemetry(pipeline) is outer
+
+    assert inner.get(SUB_PROCESS).base_counter == 1
+    assert not outer.telemetry_data
+    with pytest.raises(exceptions.NoActiveTelemetry):
+        get_active_telemetry(pipeline)
+
+
+def test_telemetry_attribute_is_used_without_scope():
+    class PlainObject:
+        _telemetry = Telemetry(**TELEMETRY_PARAMS)
+
+    obj = PlainObject()
+    increase_base_count(obj, SUB_PROCESS)
+    assert get_active_telemetry(obj) is PlainObject._telemetry
+    assert PlainObject._telemetry.get(SUB_PROCESS).base_counter == 1
+
+
+def test_scope_is_reset_when_decorated_method_raises_exception():
+    class FailingPipeline:
+        @add_telemetry(TELEMETRY_PARAMS)
+        def run(self):
+            raise ValueError("pipeline failed")
+
+    pipeline = FailingPipeline()
+    with pytest.raises(ValueError):
+        pipeline.run()
+    assert pipeline._telemetry is None
+    with pytest.raises(exceptions.NoActiveTelemetry):
+        get_active_telemetry(pipeline)
+
+
+def test_preassigned_telemetry_attribute_is_restored_after_decorated_call():
+    pipeline = SharedPipeline(nr_of_calls=1)
+    preassigned = Telemetry(**TELEMETRY_PARAMS)
+    pipeline._telemetry = preassigned
+
+    telemetry = pipeline.run(1)
+    assert telemetry is not preassigned
+    assert pipeline._telemetry is preassigned
+    assert not preassigned.telemetry_data
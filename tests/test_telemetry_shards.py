@@ -0,0 +1,96 @@
+"""Module to test merging telemetry shards of child processes."""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from errors.error import ListErrors
+from test_data import DEFAULT_TELEMETRY_PARAMS, TEST_TELEMETRY_RULES
+
+from pipeline_telemetry import Telemetry
+from pipeline_telemetry.data_classes import TelemetryShard
+from pipeline_telemetry.settings import exceptions
+from pipeline_telemetry.settings import settings as st
+
+SUB_PROCESS = "RETRIEVE_RAW_DATA"
+
+
+def run_child_process(nr_of_records: int) -> TelemetryShard:
+    """Collects the telemetry of a part of the records in a child process."""
+    telemetry = Telemetry(
+        telemetry_rules=TEST_TELEMETRY_RULES, **DEFAULT_TELEMETRY_PARAMS
+    )
+    for _ in range(nr_of_records):
+        telemetry.increase_sub_process_base_count(SUB_PROCESS)
+        telemetry.add(SUB_PROCESS, {}, [ListErrors.KEY_NOT_FOUND])
+    telemetry.increase_io_time(0.5)
+    if nr_of_records > 2:
+        telemetry.set_orange_traffic_light()
+    return telemetry.close_as_shard()
+
+
+def test_close_as_shard_returns_picklable_shard():
+    shard = run_child_process(2)
+    copied_shard = pickle.loads(pickle.dumps(shard))
+
+    assert copied_shard == shard
+    assert copied_shard.telemetry[SUB_PROCESS].base_counter == 2
+    assert (
+        copied_shard.telemetry[SUB_PROCESS].errors[ListErrors.KEY_NOT_FOUND.code] == 2
+    )
+    assert copied_shard.io_time_in_seconds == 0.5
+    assert copied_shard.traffic_light == st.TRAFIC_LIGHT_COLOR_GREEN
+
+
+def test_close_as_shard_closes_telemetry():
+    telemetry = Telemetry(**DEFAULT_TELEMETRY_PARAMS)
+    telemetry.close_as_shard()
+    with pytest.raises(exceptions.TelemetryObjectAlreadyClosed):
+        telemetry.save_and_close()
+
+
+def test_merge_shards_of_child_processes():
+    """
+    Test the shards of the child processes are merged into a single telemetry
+    object without increasing the aggregation counters.
+    """
+    telemetry = Telemetry(**DEFAULT_TELEMETRY_PARAMS)
+    telemetry.increase_sub_process_base_count(SUB_PROCESS)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        telemetry.merge_shards(executor.map(run_child_process, [1, 2, 3]))
+
+    telemetry_model = telemetry.save_and_close()
+    sub_process_data = telemetry_model.telemetry[SUB_PROCESS]
+    assert sub_process_data.base_counter == 7
+    assert sub_process_data.errors == {
+        ListErrors.KEY_NOT_FOUND.code: 6,
+        ListErrors.KEY_NOT_FOUND.code + "@KEY_<items>": 6,
+    }
+    assert telemetry_model.io_time_in_seconds == 1.5
+    assert telemetry_model.traffic_light == st.TRAFIC_LIGHT_COLOR_ORANGE
+    assert st.AGGREGATION_KEY not in telemetry_model.telemetry
+
+
+def test_merge_shards_does_not_lower_traffic_light():
+    telemetry = Telemetry(**DEFAULT_TELEMETRY_PARAMS)
+    telemetry.set_red_traffic_light()
+    telemetry.merge_shards([TelemetryShard(traffic_light=st.TRAFIC_LIGHT_COLOR_ORANGE)])
+    assert telemetry.traffic_light == st.TRAFIC_LIGHT_COLOR_RED
+
+
+def test_merge_shards_with_invalid_sub_process_raises_exception():
+    telemetry = Telemetry(**DEFAULT_TELEMETRY_PARAMS)
+    valid_shard = run_child_process(1)
+    invalid_shard = TelemetryShard()
+    invalid_shard.get_sub_process_data("UNKNOWN_SUB_PROCESS").increase_base_count(1)
+
+    with pytest.raises(exceptions.InvalidSubProcess):
+        telemetry.merge_shards([valid_shard, invalid_shard])
+    assert not telemetry.telemetry_data
+
+
+def test_merge_shards_into_closed_telemetry_raises_exception():
+    telemetry = Telemetry(**DEFAULT_TELEMETRY_PARAMS)
+    telemetry.save_and_close()
+    with pytest.raises(exceptions.TelemetryObjectAlreadyClosed):
+        telemetry.merge_shards([run_child_process(1)])
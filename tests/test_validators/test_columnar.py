@@ -0,0 +1,257 @@
+"""
+module to test the columnar validator instructions
+"""
+
+from collections import Counter
+
+import pytest
+from errors import ListErrors
+
+from pipeline_telemetry.validators import (
+    ColumnExists,
+    ColumnNotNull,
+    ColumnRowCount,
+    ColumnValuesInRange,
+    ColumnValuesInSet,
+    DictValidator,
+    columnar,
+)
+
+# pylint: disable=protected-access
+
+COLUMNAR_INSTRUCTIONS = [
+    ColumnExists,
+    ColumnNotNull,
+    ColumnRowCount,
+    ColumnValuesInRange,
+    ColumnValuesInSet,
+]
+RECORD = {
+    "table": {
+        "id": [1, 2, None, 4, float("nan")],
+        "status": ["new", "done", "new", "unknown", None],
+        "amount": [10, -1, 5.5, 200, 50],
+        "mixed": [1, "a", None, 3, [1]],
+    }
+}
+
+
+def error_key(error_code, fieldname):
+    """returns the error code key of a columnar error"""
+    return error_code.code + "@KEY_<" + fieldname + ">"
+
+
+@pytest.fixture(autouse=True)
+def registered_instructions(monkeypatch):
+    """ensure the columnar instructions are registered"""
+    monkeypatch.setattr(
+        DictValidator,
+        "_instructions",
+        {instruction.INSTRUCTION: instruction for instruction in COLUMNAR_INSTRUCTIONS},
+    )
+
+
+@pytest.fixture(params=["numpy", "python"], autouse=True)
+def column_operations(request, monkeypatch):
+    """run the tests with and without NumPy"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "rule, expected",
+    [
+        ({"column_exists": {"field_name": "table", "column": "id"}}, {}),
+        (
+            {"column_exists": {"field_name": "table", "column": "name"}},
+            {error_key(ListErrors.COLUMN_NOT_FOUND, "table__name"): 1},
+        ),
+        (
+            {"column_not_null": {"field_name": "table", "column": "id"}},
+            {error_key(ListErrors.NULL_VALUE_IN_COLUMN, "table__id"): 2},
+        ),
+        (
+            {"column_not_null": {"field_name": "table", "column": "mixed"}},
+            {error_key(ListErrors.NULL_VALUE_IN_COLUMN, "table__mixed"): 1},
+        ),
+        ({"column_row_count": {"field_name": "table", "expected_count": 5}}, {}),
+        (
+            {"column_row_count": {"field_name": "table", "expected_count": 4}},
+            {error_key(ListErrors.UNEXPECTED_NR_OF_ROWS, "table"): 1},
+        ),
+        (
+            {
+                "column_values_in_set": {
+                    "field_name": "table",
+                    "column": "status",
+                    "values": ["new", "done"],
+                }
+            },
+            {error_key(ListErrors.VALUE_NOT_IN_SET, "table__status"): 2},
+        ),
+        (
+            {
+                "column_values_in_set": {
+                    "field_name": "table",
+                    "column": "amount",
+                    "values": [10, 50],
+                }
+            },
+            {error_key(ListErrors.VALUE_NOT_IN_SET, "table__amount"): 3},
+        ),
+        (
+            {
+                "column_values_in_range": {
+                    "field_name": "table",
+                    "column": "amount",
+                    "min_value": 0,
+                    "max_value": 100,
+                }
+            },
+            {error_key(ListErrors.VALUE_OUT_OF_RANGE, "table__amount"): 2},
+        ),
+        (
+            {
+                "column_values_in_range": {
+                    "field_name": "table",
+                    "column": "mixed",
+                    "min_value": 2,
+                }
+            },
+            {error_key(ListErrors.VALUE_OUT_OF_RANGE, "table__mixed"): 3},
+        ),
+        (
+            {"column_not_null": {"field_name": "no_table", "column": "id"}},
+            {error_key(ListErrors.COLUMN_BATCH_NOT_FOUND, "no_table"): 1},
+        ),
+        (
+            {"column_row_count": {"field_name": "table.id", "expected_count": 5}},
+            {error_key(ListErrors.COLUMN_BATCH_NOT_FOUND, "table.id"): 1},
+        ),
+    ],
+)
+def test_columnar_instructions(rule, expected):
+    """test the error counts of the columnar instructions"""
+    assert DictValidator.validate_many([RECORD], rule) == expected
+    errors = DictValidator.validate(RECORD, rule)
+    assert Counter(error.code for error in errors) == expected
+
+
+@pytest.mark.parametrize(
+    "record, rule, expected",
+    [
+        (
+            {"table": {"id": 5}},
+            {"column_not_null": {"field_name": "table", "column": "id"}},
+            {error_key(ListErrors.COLUMN_OF_WRONG_TYPE, "table__id"): 1},
+        ),
+        (
+            {"table": {"id": 5}},
+            {"column_values_in_range": {"field_name": "table", "column": "id"}},
+            {error_key(ListErrors.COLUMN_OF_WRONG_TYPE, "table__id"): 1},
+        ),
+        (
+            {"table": {"id": 5}},
+            {
+                "column_values_in_set": {
+                    "field_name": "table",
+                    "column": "id",
+                    "values": [5],
+                }
+            },
+            {error_key(ListErrors.COLUMN_OF_WRONG_TYPE, "table__id"): 1},
+        ),
+        (
+            {"table": {"id": 5}},
+            {"column_row_count": {"field_name": "table", "expected_count": 1}},
+            {error_key(ListErrors.COLUMN_OF_WRONG_TYPE, "table__id"): 1},
+        ),
+        (
+            {"table": {"status": "done"}},
+            {"column_row_count": {"field_name": "table", "expected_count": 4}},
+            {error_key(ListErrors.COLUMN_OF_WRONG_TYPE, "table__status"): 1},
+        ),
+        (
+            {"table": {"status": b"done"}},
+            {"column_not_null": {"field_name": "table", "column": "status"}},
+            {error_key(ListErrors.COLUMN_OF_WRONG_TYPE, "table__status"): 1},
+        ),
+        (
+            {"table": {"id": None}},
+            {"column_exists": {"field_name": "table", "column": "id"}},
+            {error_key(ListErrors.COLUMN_OF_WRONG_TYPE, "table__id"): 1},
+        ),
+        (
+            {"table": {"id": [1, 2], "status": ["new"]}},
+            {"column_exists": {"field_name": "table", "column": "id"}},
+            {error_key(ListErrors.COLUMNS_OF_UNEQUAL_LENGTH, "table"): 1},
+        ),
+        (
+            {"table": {"id": [1, 2], "status": ["new"]}},
+            {"column_row_count": {"field_name": "table", "expected_count": 2}},
+            {error_key(ListErrors.COLUMNS_OF_UNEQUAL_LENGTH, "table"): 1},
+        ),
+        (
+            RECORD,
+            {
+                "column_values_in_set": {
+                    "field_name": "table",
+                    "column": "mixed",
+                    "values": [1, 3],
+                }
+            },
+            {error_key(ListErrors.VALUE_NOT_IN_SET, "table__mixed"): 3},
+        ),
+    ],
+)
+def test_columnar_instructions_with_wrong_shape(record, rule, expected):
+    """test column batches with the wrong shape are counted as errors"""
+    assert DictValidator.validate_many([record], rule) == expected
+    errors = DictValidator.validate(record, rule)
+    assert Counter(error.code for error in errors) == expected
+
+
+def test_record_is_column_batch():
+    """test the field name `@` validates the record as column batch"""
+    rule = {"column_not_null": {"field_name": "@", "column": "id"}}
+    assert DictValidator.validate_many([RECORD["table"]], rule) == {
+        error_key(ListErrors.NULL_VALUE_IN_COLUMN, "@__id"): 2
+    }
+
+
+def test_columnar_instructions_with_numpy_arrays():
+    """test columns that are NumPy arrays are validated"""
+    np = pytest.importorskip("numpy")
+    record = {"table": {"amount": np.array([1.0, np.nan, 3.0, 300.0])}}
+    assert DictValidator.validate_many(
+        [record],
+        {
+            "column_not_null": {"field_name": "table", "column": "amount"},
+            "column_values_in_range": {
+                "field_name": "table",
+                "column": "amount",
+                "max_value": 100,
+            },
+        },
+    ) == {
+        error_key(ListErrors.NULL_VALUE_IN_COLUMN, "table__amount"): 1,
+        error_key(ListErrors.VALUE_OUT_OF_RANGE, "table__amount"): 1,
+    }
+
+
+@pytest.mark.parametrize(
+    "instruction, rule_dict",
+    [
+        (ColumnNotNull, {"field_name": "table", "column": 1}),
+        (ColumnRowCount, {"field_name": "table", "expected_count": "5"}),
+        (ColumnValuesInSet, {"field_name": "table", "column": "a", "values": "a"}),
+        (ColumnValuesInRange, {"field_name": "t", "column": "a", "min_value": "1"}),
+    ],
+)
+def test_invalid_rule_data_raises_exception(instruction, rule_dict):
+    """test invalid columnar rule data is reported when compiling the rule"""
+    with pytest.raises(TypeError):
+        instruction.compile_rule(rule_dict)
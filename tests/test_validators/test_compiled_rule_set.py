@@ -0,0 +1,114 @@
+"""
+module to test the compiled rules of the DictValidator
+"""
+
+import pytest
+from errors import ListErrors
+from test_data import DEFAULT_TELEMETRY_PARAMS
+
+from pipeline_telemetry import Telemetry
+from pipeline_telemetry.settings import exceptions
+from pipeline_telemetry.validators import (
+    CompiledRuleSet,
+    DictValidator,
+    EntriesHaveKey,
+    HasKey,
+    ValidateEntries,
+)
+
+# pylint: disable=protected-access
+
+VALIDATION_RULES = {
+    "has_key": {"field_name": "data.items"},
+    "validate_entries": {"field_name": "data.items", "expected_count": 2},
+    "entries_have_key": {"field_name": "data.items", "must_have_key": "id"},
+}
+
+
+@pytest.fixture(autouse=True)
+def registered_instructions(monkeypatch):
+    """ensure the default instructions are registered"""
+    monkeypatch.setattr(
+        DictValidator,
+        "_instructions",
+        {
+            instruction.INSTRUCTION: instruction
+            for instruction in [HasKey, ValidateEntries, EntriesHaveKey]
+        },
+    )
+
+
+def test_compile_rules_resolves_instructions():
+    """
+    test compile_rules returns the instruction class and the rule data with
+    pre-compiled jmespath expressions
+    """
+    compiled_rules = DictValidator.compile_rules(VALIDATION_RULES)
+    assert [rule.instruction_class for rule in compiled_rules] == [
+        HasKey,
+        ValidateEntries,
+        EntriesHaveKey,
+    ]
+    entries_have_key_rule_data = compiled_rules[2].rule_data
+    assert entries_have_key_rule_data.field_expression.expression == "data.items"
+    assert entries_have_key_rule_data.must_have_key_expression.search({"id": 1}) == 1
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"data": {"items": [{"id": 1}, {"id": 2}]}},
+        {"data": {"items": [{"id": 1}, {"name": 2}, 3]}},
+        {"data": {"items": "no list"}},
+    ],
+)
+def test_validate_compiled_equals_validate(data):
+    """test validation with compiled rules returns the same errors"""
+    compiled_errors = CompiledRuleSet({"SUB_PROCESS": VALIDATION_RULES}).validate(
+        "SUB_PROCESS", data
+    )
+    assert compiled_errors == DictValidator.validate(data, VALIDATION_RULES)
+
+
+def test_compiled_rule_set_without_rules_for_sub_process():
+    """test a sub process without rules has no validation errors"""
+    assert CompiledRuleSet({}).validate("SUB_PROCESS", {}) == []
+
+
+def test_compiled_rule_set_raises_exception_for_unknown_instruction():
+    """test unknown instructions are reported when compiling the rules"""
+    with pytest.raises(exceptions.UnknownInstruction):
+        CompiledRuleSet({"SUB_PROCESS": {"unknown_rule": {"field_name": "items"}}})
+
+
+def test_compiled_rule_set_raises_exception_for_invalid_rule_data():
+    """test invalid rule data is reported when compiling the rules"""
+    with pytest.raises(TypeError):
+        CompiledRuleSet(
+            {"SUB_PROCESS": {"entries_have_key": {"field_name": "items", "x": 1}}}
+        )
+    with pytest.raises(TypeError):
+        CompiledRuleSet(
+            {
+                "SUB_PROCESS": {
+                    "entries_have_key": {"field_name": "items", "must_have_key": 1}
+                }
+            }
+        )
+
+
+def test_telemetry_add_does_not_compile_rules(mocker):
+    """test the telemetry rules are compiled once when creating telemetry"""
+    compile_rule_spy = mocker.spy(HasKey, "compile_rule")
+    telemetry = Telemetry(
+        telemetry_rules={"RETRIEVE_RAW_DATA": {"has_key": {"field_name": "items"}}},
+        **DEFAULT_TELEMETRY_PARAMS,
+    )
+    for _ in range(3):
+        telemetry.add("RETRIEVE_RAW_DATA", {}, [])
+
+    assert compile_rule_spy.call_count == 1
+    assert telemetry.get("RETRIEVE_RAW_DATA").errors == {
+        ListErrors.KEY_NOT_FOUND.code + "@KEY_<items>": 3
+    }
@@ -6,6 +6,7 @@ from pipeline_telemetry.validators.entries_have_key import (
     EntriesHaveKey,
     EntriesHaveKeyRuleData,
 )
+from pipeline_telemetry.validators.evaluation_context import EvaluationContext
 
 # pylint: disable=protected-access
 
@@ -54,7 +55,12 @@ def test_validate_field_exists():
         **{"field_name": "items", "must_have_key": "key"}
     )
 
-    assert EntriesHaveKey._validate_field_exists(dict_to_validate, rule_data) == []
+    assert (
+        EntriesHaveKey._validate_field_exists(
+            EvaluationContext(dict_to_validate), rule_data
+        )
+        == []
+    )
 
 
 def test_validate_field_exists_returns_error():
@@ -66,7 +72,9 @@ def test_validate_field_exists_returns_error():
     rule_content = EntriesHaveKeyRuleData(
         **{"field_name": "items", "must_have_key": "key"}
     )
-    errors = EntriesHaveKey._validate_field_exists(dict_to_validate, rule_content)
+    errors = EntriesHaveKey._validate_field_exists(
+        EvaluationContext(dict_to_validate), rule_content
+    )
 
     assert len(errors) == 1
     assert "Entries field does not exist" in errors[0].description
@@ -83,7 +91,10 @@ def test_validate_entries_have_key():
     )
 
     assert (
-        EntriesHaveKey._validate_entries_have_key(dict_to_validate, rule_content) == []
+        EntriesHaveKey._validate_entries_have_key(
+            EvaluationContext(dict_to_validate), rule_content
+        )
+        == []
     )
 
 
@@ -98,7 +109,10 @@ def test_validate_entries_have_nested_key():
     )
 
     assert (
-        EntriesHaveKey._validate_entries_have_key(dict_to_validate, rule_content) == []
+        EntriesHaveKey._validate_entries_have_key(
+            EvaluationContext(dict_to_validate), rule_content
+        )
+        == []
     )
 
 
@@ -112,7 +126,9 @@ def test_validate_entries_have_key_with_missing_key():
         **{"field_name": "items", "must_have_key": "key"}
     )
 
-    errors = EntriesHaveKey._validate_entries_have_key(dict_to_validate, rule_content)
+    errors = EntriesHaveKey._validate_entries_have_key(
+        EvaluationContext(dict_to_validate), rule_content
+    )
 
     assert len(errors) == 1
     assert "Key missing in entry" in errors[0].description
@@ -128,7 +144,9 @@ def test_validate_entries_have_key_with_non_dict_items():
         **{"field_name": "items", "must_have_key": "key"}
     )
 
-    errors = EntriesHaveKey._validate_entries_have_key(dict_to_validate, rule_content)
+    errors = EntriesHaveKey._validate_entries_have_key(
+        EvaluationContext(dict_to_validate), rule_content
+    )
 
     assert len(errors) == 1
     assert "Entry that needs to have a key is not a dict" in errors[0].description
@@ -144,7 +162,9 @@ def test_validate_entries_have_keys_with_missing_key():
         **{"field_name": "items", "must_have_key": "key"}
     )
 
-    errors = EntriesHaveKey._validate_entries_have_key(dict_to_validate, rule_content)
+    errors = EntriesHaveKey._validate_entries_have_key(
+        EvaluationContext(dict_to_validate), rule_content
+    )
 
     assert len(errors) == 2
 
@@ -0,0 +1,101 @@
+"""
+module to test the field paths and the evaluation context of the validators
+"""
+
+import jmespath
+import pytest
+
+from pipeline_telemetry.validators import (
+    DictValidator,
+    EntriesHaveKey,
+    EvaluationContext,
+    FieldPath,
+    HasKey,
+    ValidateEntries,
+)
+from pipeline_telemetry.validators.evaluation_context import search_dotted_key
+
+RECORD = {
+    "items": [{"id": 1}, {"id": 2}],
+    "data": {"items": [{"id": 1}], "name": "name", "count": 0},
+    "no_dict": "a string",
+    "none": None,
+}
+
+
+@pytest.fixture(autouse=True)
+def registered_instructions(monkeypatch):
+    """ensure the default instructions are registered"""
+    monkeypatch.setattr(
+        DictValidator,
+        "_instructions",
+        {
+            instruction.INSTRUCTION: instruction
+            for instruction in [HasKey, ValidateEntries, EntriesHaveKey]
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "items",
+        "data.items",
+        "data.count",
+        "data.missing",
+        "missing.items",
+        "no_dict.items",
+        "none.items",
+        "items.id",
+        "items[0].id",
+        "data.items[*].id",
+    ],
+)
+def test_field_path_search_equals_jmespath(expression):
+    """test the field path returns the same value as jmespath"""
+    assert FieldPath(expression).search(RECORD) == jmespath.search(expression, RECORD)
+
+
+def test_field_path_uses_jmespath_only_for_complex_expressions(mocker):
+    """test simple dotted keys are not compiled with jmespath"""
+    compile_spy = mocker.spy(jmespath, "compile")
+    FieldPath("data.items")
+    assert not compile_spy.called
+    FieldPath("items[0].id")
+    assert compile_spy.call_count == 1
+
+
+def test_evaluation_context_resolves_field_path_once(mocker):
+    """test the value of a field path is resolved once per record"""
+    field_path = FieldPath("data.items")
+    search_spy = mocker.spy(field_path, "search")
+    context = EvaluationContext(RECORD)
+
+    assert context.resolve(field_path) == [{"id": 1}]
+    assert context.resolve(FieldPath("data.items")) == [{"id": 1}]
+    assert search_spy.call_count == 1
+
+
+def test_rules_share_evaluation_context(mocker):
+    """
+    test the rules of a record that use the same field path share the resolved
+    value of the field path
+    """
+    compiled_rules = DictValidator.compile_rules(
+        {
+            "has_key": {"field_name": "data.items"},
+            "validate_entries": {"field_name": "data.items", "expected_count": 1},
+            "entries_have_key": {"field_name": "data.items", "must_have_key": "id"},
+        }
+    )
+    search_spy = mocker.patch(
+        "pipeline_telemetry.validators.evaluation_context.search_dotted_key",
+        wraps=search_dotted_key,
+    )
+
+    assert DictValidator.validate_compiled(RECORD, compiled_rules) == []
+    # data.items is resolved once, id is resolved for the single entry
+    assert [call.args[0] for call in search_spy.call_args_list] == [
+        ("data", "items"),
+        ("id",),
+    ]
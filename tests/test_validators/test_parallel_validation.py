@@ -0,0 +1,135 @@
+"""
+module to test the parallel validation of large list fields
+"""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from test_data import DEFAULT_TELEMETRY_PARAMS
+
+from pipeline_telemetry import Telemetry
+from pipeline_telemetry.validators import (
+    CompiledRuleSet,
+    DictValidator,
+    EntriesHaveKey,
+    FieldPath,
+    HasKey,
+    ParallelValidation,
+    ValidateEntries,
+)
+
+VALIDATION_RULES = {
+    "has_key": {"field_name": "data.items"},
+    "validate_entries": {"field_name": "data.items", "expected_count": 2},
+    "entries_have_key": {"field_name": "data.items", "must_have_key": "id"},
+}
+LARGE_RECORD = {
+    "data": {"items": [{"id": 1}, {"name": 2}, 3, {"id": None}, {"id": 5}] * 20}
+}
+
+
+@pytest.fixture(autouse=True)
+def registered_instructions(monkeypatch):
+    """ensure the default instructions are registered"""
+    monkeypatch.setattr(
+        DictValidator,
+        "_instructions",
+        {
+            instruction.INSTRUCTION: instruction
+            for instruction in [HasKey, ValidateEntries, EntriesHaveKey]
+        },
+    )
+
+
+def test_field_path_can_be_pickled():
+    """test compiled field paths can be sent to a process pool"""
+    for expression in ["data.items", "items[0].id"]:
+        field_path = pickle.loads(pickle.dumps(FieldPath(expression)))
+        assert field_path.expression == expression
+        assert field_path.search({"data": {"items": 1}, "items": [{"id": 2}]})
+
+
+def test_count_entry_errors_equals_count_errors_of_entries():
+    """test the entry errors of the chunks add up to the errors of the list"""
+    (compiled_rule,) = DictValidator.compile_rules(
+        {"entries_have_key": VALIDATION_RULES["entries_have_key"]}
+    )
+    entries = LARGE_RECORD["data"]["items"]
+    assert compiled_rule.count_entry_errors(entries) == DictValidator.validate_many(
+        [LARGE_RECORD], {"entries_have_key": VALIDATION_RULES["entries_have_key"]}
+    )
+
+
+def test_count_entry_errors_not_implemented_for_other_instructions():
+    """test instructions without VALIDATES_ENTRIES do not count entry errors"""
+    (compiled_rule,) = DictValidator.compile_rules({"has_key": {"field_name": "a"}})
+    with pytest.raises(NotImplementedError):
+        compiled_rule.count_entry_errors([])
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_validate_parallel_equals_validate_many(executor_class):
+    """test the parallel validation returns the errors of the inline validation"""
+    compiled_rules = DictValidator.compile_rules(VALIDATION_RULES)
+    with executor_class(max_workers=2) as executor:
+        error_counts = DictValidator.validate_parallel(
+            LARGE_RECORD,
+            compiled_rules,
+            ParallelValidation(executor, size_threshold=10, chunk_size=30),
+        )
+    assert error_counts == DictValidator.validate_many_compiled(
+        [LARGE_RECORD], compiled_rules
+    )
+
+
+@pytest.mark.parametrize(
+    "record, submitted",
+    [
+        (LARGE_RECORD, 4),
+        ({"data": {"items": [{"id": 1}] * 9}}, 0),
+        ({"data": {"items": "no list" * 20}}, 0),
+        ({}, 0),
+    ],
+)
+def test_validate_parallel_falls_back_to_inline_validation(mocker, record, submitted):
+    """
+    test only the entries of list fields from the size threshold are validated
+    in chunks in the executor
+    """
+    compiled_rule_set = CompiledRuleSet({"SUB_PROCESS": VALIDATION_RULES})
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        submit_spy = mocker.spy(executor, "submit")
+        error_counts = compiled_rule_set.validate_parallel(
+            "SUB_PROCESS",
+            record,
+            ParallelValidation(executor, size_threshold=10, chunk_size=30),
+        )
+    assert submit_spy.call_count == submitted
+    assert error_counts == compiled_rule_set.validate_many("SUB_PROCESS", [record])
+
+
+def test_telemetry_add_with_parallel_validation():
+    """test add merges the error counts of the parallel validation"""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        telemetry = Telemetry(
+            telemetry_rules={
+                "RETRIEVE_RAW_DATA": {
+                    "entries_have_key": VALIDATION_RULES["entries_have_key"]
+                }
+            },
+            parallel_validation=ParallelValidation(
+                executor, size_threshold=10, chunk_size=30
+            ),
+            **DEFAULT_TELEMETRY_PARAMS,
+        )
+        telemetry.add("RETRIEVE_RAW_DATA", LARGE_RECORD, [])
+        telemetry.add("RETRIEVE_RAW_DATA", LARGE_RECORD, [])
+
+    assert telemetry.get("RETRIEVE_RAW_DATA").errors == {
+        key: 2 * count
+        for key, count in DictValidator.validate_many(
+            [LARGE_RECORD],
+            {"entries_have_key": VALIDATION_RULES["entries_have_key"]},
+        ).items()
+    }
@@ -0,0 +1,88 @@
+"""
+module to test the sampling policies and the sampler
+"""
+
+import pytest
+
+from pipeline_telemetry.settings import exceptions
+from pipeline_telemetry.validators import (
+    FirstThenRateSampling,
+    FixedRateSampling,
+    ReservoirSampling,
+)
+from pipeline_telemetry.validators.sampling import Sampler
+
+
+def test_inclusion_probabilities():
+    """test the inclusion probability of the records for each policy"""
+    assert FixedRateSampling(rate=0.1).inclusion_probability(1) == 0.1
+    assert [
+        ReservoirSampling(size=2).inclusion_probability(record_number)
+        for record_number in [1, 2, 4, 10]
+    ] == [1.0, 1.0, 0.5, 0.2]
+    assert [
+        FirstThenRateSampling(first=2, rate=0.1).inclusion_probability(record_number)
+        for record_number in [1, 2, 3]
+    ] == [1.0, 1.0, 0.1]
+
+
+@pytest.mark.parametrize(
+    "create_policy",
+    [
+        lambda: FixedRateSampling(rate=0),
+        lambda: FixedRateSampling(rate=1.5),
+        lambda: FixedRateSampling(rate="0.1"),
+        lambda: ReservoirSampling(size=0),
+        lambda: FirstThenRateSampling(first=1.5, rate=0.1),
+        lambda: FirstThenRateSampling(first=10, rate=-1),
+    ],
+)
+def test_invalid_sampling_policy_raises_exception(create_policy):
+    """test invalid policy parameters raise an exception"""
+    with pytest.raises(exceptions.InvalidSamplingPolicy):
+        create_policy()
+
+
+def test_sampler_raises_exception_for_invalid_policy():
+    """test the sampler only accepts sampling policies"""
+    with pytest.raises(exceptions.InvalidSamplingPolicy):
+        Sampler({"rate": 0.1})
+
+
+def test_sampler_samples_all_records_with_probability_one():
+    """test records with inclusion probability one are sampled with weight 1"""
+    sampler = Sampler(FirstThenRateSampling(first=3, rate=0.5), seed=1)
+    assert [sampler.sample() for _ in range(3)] == [1.0, 1.0, 1.0]
+    assert {sampler.sample() for _ in range(100)} == {None, 2.0}
+
+
+@pytest.mark.parametrize(
+    "sampling_policy",
+    [
+        FixedRateSampling(rate=0.1),
+        ReservoirSampling(size=500),
+        FirstThenRateSampling(first=1000, rate=0.1),
+    ],
+)
+def test_sampler_extrapolates_error_counts(sampling_policy):
+    """
+    test the extrapolated error counts of the sampled records approximate the
+    error counts of all records
+    """
+    sampler = Sampler(sampling_policy, seed=3)
+    error_count = 0
+    sampled = 0
+    for _ in range(20_000):
+        if (weight := sampler.sample()) is not None:
+            sampled += 1
+            error_count += sampler.extrapolate({"ERROR": 1}, weight).get("ERROR", 0)
+
+    assert sampled < 5_000
+    assert error_count == pytest.approx(20_000, rel=0.1)
+
+
+def test_sampler_extrapolate_rounds_summed_error_counts():
+    """test rounding errors of the extrapolated error counts do not add up"""
+    sampler = Sampler(FixedRateSampling(rate=0.3))
+    increments = [sampler.extrapolate({"ERROR": 1}, 1 / 0.3) for _ in range(3)]
+    assert increments == [{"ERROR": 3}, {"ERROR": 4}, {"ERROR": 3}]
@@ -0,0 +1,96 @@
+"""
+module to test the batch validation of the DictValidator
+"""
+
+from collections import Counter
+
+import pytest
+
+from pipeline_telemetry.validators import (
+    CompiledRuleSet,
+    DictValidator,
+    EntriesHaveKey,
+    EvaluationContext,
+    HasKey,
+    ValidateEntries,
+)
+from pipeline_telemetry.validators.abstract_validator_instruction import (
+    AbstractValidatorInstruction,
+)
+
+# pylint: disable=protected-access
+
+RECORDS = [
+    {},
+    {"data": {"items": [{"id": 1}, {"id": 2}]}},
+    {"data": {"items": [{"id": 1}, {"name": 2}, 3]}},
+    {"data": {"items": "no list"}},
+    {"data": {"items": {"id": 1}}},
+]
+
+
+@pytest.fixture(autouse=True)
+def registered_instructions(monkeypatch):
+    """ensure the default instructions are registered"""
+    monkeypatch.setattr(
+        DictValidator,
+        "_instructions",
+        {
+            instruction.INSTRUCTION: instruction
+            for instruction in [HasKey, ValidateEntries, EntriesHaveKey]
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "validation_rules",
+    [
+        {"has_key": {"field_name": "data.items"}},
+        {"validate_entries": {"field_name": "data.items", "expected_count": 2}},
+        {"entries_have_key": {"field_name": "data.items", "must_have_key": "id"}},
+    ],
+)
+def test_validate_many_counts_validate_errors(validation_rules):
+    """
+    test validate_many returns the number of errors per error code of
+    validating each record
+    """
+    expected = Counter(
+        error.code
+        for record in RECORDS
+        for error in DictValidator.validate(record, validation_rules)
+    )
+    assert expected
+    assert DictValidator.validate_many(RECORDS, validation_rules) == expected
+
+
+def test_validate_many_without_errors():
+    """test validate_many returns an empty dict when there are no errors"""
+    assert (
+        DictValidator.validate_many(RECORDS[1:3], {"has_key": {"field_name": "data"}})
+        == {}
+    )
+
+
+def test_count_errors_default_implementation():
+    """
+    test count_errors of an instruction without own implementation counts the
+    errors of validate_in_context
+    """
+    rule_data = HasKey.compile_rule({"field_name": "data.items"})
+    contexts = [EvaluationContext(record) for record in RECORDS]
+    default_count_errors = AbstractValidatorInstruction.count_errors.__func__
+    assert default_count_errors(HasKey, contexts, rule_data) == HasKey.count_errors(
+        contexts, rule_data
+    )
+
+
+def test_compiled_rule_set_validate_many():
+    """test validate_many of the compiled rules of a sub process"""
+    compiled_rule_set = CompiledRuleSet(
+        {"SUB_PROCESS": {"has_key": {"field_name": "data.items"}}}
+    )
+    assert compiled_rule_set.validate_many("SUB_PROCESS", RECORDS) == {
+        "HAS_KEY_ERR_0001@KEY_<data.items>": 1
+    }
+    assert compiled_rule_set.validate_many("OTHER_SUB_PROCESS", RECORDS) == {}